@@ -2,7 +2,12 @@ from chronoton.cython_backtester import (
     run_single_backtest,
     cython_available,
     cython_import_error,
+    numba_available,
+    numba_import_error,
+    numba_precompile,
 )
+from chronoton.optimizer import run_optimization
+from chronoton.monte_carlo import run_monte_carlo
 from chronoton.backtester import (
     Result,
     # Field-index constants
@@ -19,6 +24,11 @@ __all__ = [
     "run_single_backtest",
     "cython_available",
     "cython_import_error",
+    "numba_available",
+    "numba_import_error",
+    "numba_precompile",
+    "run_optimization",
+    "run_monte_carlo",
     "Result",
     "F_DIRECTION", "F_ENTRY_BAR", "F_ENTRY_TIME", "F_ENTRY_PRICE",
     "F_EXIT_BAR", "F_EXIT_TIME", "F_EXIT_PRICE", "F_SIZE",
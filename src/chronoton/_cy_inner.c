@@ -11,10 +11,12 @@
         ],
         "depends": [],
         "extra_compile_args": [
-            "/O2"
+            "-O3",
+            "-ffunction-sections",
+            "-fdata-sections"
         ],
         "include_dirs": [
-            "C:\\Users\\malha\\Documents\\Projects\\GeneralProjects\\.venv\\Lib\\site-packages\\numpy\\_core\\include"
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include"
         ],
         "name": "chronoton._cy_inner",
         "sources": [
@@ -1623,7 +1625,7 @@ struct __pyx_MemviewEnum_obj;
 struct __pyx_memoryview_obj;
 struct __pyx_memoryviewslice_obj;
 
-/* "chronoton/_cy_inner.pyx":54
+/* "chronoton/_cy_inner.pyx":63
  * # Using `cdef enum` so these become C ints at compile time. The values are
  * # duplicated from the Python module; tests verify they stay in sync.
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -1654,7 +1656,7 @@ enum  {
   __pyx_e_9chronoton_9_cy_inner_N_FIELDS = 20
 };
 
-/* "chronoton/_cy_inner.pyx":77
+/* "chronoton/_cy_inner.pyx":86
  *     N_FIELDS        = 20
  * 
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -1670,10 +1672,24 @@ enum  {
   __pyx_e_9chronoton_9_cy_inner_EXIT_END_OF_DATA = 5
 };
 
-/* "chronoton/_cy_inner.pyx":85
+/* "chronoton/_cy_inner.pyx":94
  *     EXIT_END_OF_DATA  = 5
  * 
  * cdef enum:             # <<<<<<<<<<<<<<
+ *     SIG_LONG_ENTRY   = 1
+ *     SIG_LONG_EXIT    = 2
+*/
+enum  {
+  __pyx_e_9chronoton_9_cy_inner_SIG_LONG_ENTRY = 1,
+  __pyx_e_9chronoton_9_cy_inner_SIG_LONG_EXIT = 2,
+  __pyx_e_9chronoton_9_cy_inner_SIG_SHORT_ENTRY = 4,
+  __pyx_e_9chronoton_9_cy_inner_SIG_SHORT_EXIT = 8
+};
+
+/* "chronoton/_cy_inner.pyx":100
+ *     SIG_SHORT_EXIT   = 8
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
  *     SIZING_PERCENT_EQUITY  = 0
  *     SIZING_VALUE           = 1
 */
@@ -2796,22 +2812,25 @@ static int __Pyx_ValidateAndInit_memviewslice(
                 PyObject *original_obj);
 
 /* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(PyObject *, int writable_flag);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(PyObject *, int writable_flag);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_unsigned_char__const__(PyObject *, int writable_flag);
 
 /* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(PyObject *, int writable_flag);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_double(PyObject *, int writable_flag);
 
 /* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_double(PyObject *, int writable_flag);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(PyObject *, int writable_flag);
 
 /* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_double(PyObject *, int writable_flag);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_unsigned_char(PyObject *, int writable_flag);
 
 /* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char(PyObject *, int writable_flag);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dcd__double(PyObject *, int writable_flag);
 
 /* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_int(PyObject *, int writable_flag);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_int(PyObject *, int writable_flag);
 
 /* MemviewSliceCopy.proto */
 static __Pyx_memviewslice
@@ -2960,6 +2979,7 @@ static PyObject *indirect_contiguous = 0;
 static int __pyx_memoryview_thread_locks_used;
 static PyThread_type_lock __pyx_memoryview_thread_locks[8];
 static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__find_free_slot(__Pyx_memviewslice, Py_ssize_t); /*proto*/
+static CYTHON_INLINE int __pyx_f_9chronoton_9_cy_inner__no_open_slots(__Pyx_memviewslice, Py_ssize_t); /*proto*/
 static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize_t, double, Py_ssize_t, double, double, double, double, double, double, double, double, double, __Pyx_memviewslice, __Pyx_memviewslice); /*proto*/
 static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_ssize_t, Py_ssize_t, double, double, double, double, double, double, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, Py_ssize_t, Py_ssize_t, __Pyx_memviewslice); /*proto*/
 static int __pyx_array_allocate_buffer(struct __pyx_array_obj *); /*proto*/
@@ -3017,7 +3037,7 @@ static PyObject *__pyx_builtin_id;
 static const char __pyx_k_c[] = "c";
 static const char __pyx_k_name[] = "name";
 static const char __pyx_k_fortran[] = "fortran";
-static const char __pyx_k_cy_inner_pyx_fast_path_inner_l[] = "\n_cy_inner.pyx \342\200\224 fast-path inner loop and slot helpers (private compiled helper).\n\nCompile with:\n    python setup.py build_ext --inplace\n\nProduces `_cy_inner.so` (Linux/Mac) or `_cy_inner.pyd` (Windows). Users\nnever import this directly; they import the public dispatcher\n`cython_backtester`, which routes to this module for the fast path and\nto the pure-Python `_inner_loop` in `backtester` for the custom-sizer\nfallback.\n\nSemantics must match backtester.py::_inner_loop exactly \342\200\224 see\nbacktester_docs.md \302\2472\342\200\223\302\2473. Any divergence is a bug.\n\nIMPORTANT \342\200\224 what this file does NOT handle:\n    - position_sizing='custom' (callable). The Python dispatcher falls\n      back to the pure-Python `_inner_loop` in backtester.py for that\n      case because a Python callable cannot be called from a nogil block\n      without re-acquiring the GIL, which defeats the point.\n\nField layout (matches F_* in the Python module):\n    0  DIRECTION        10 TS_DIST\n    1  ENTRY_BAR        11 TS_PEAK\n    2  ENTRY_TIME       12 COMMISSION\n    3  ENTRY_PRICE      13 SPREAD_COST\n    4  EXIT_BAR         14 SLIPPAGE_COST\n    5  EXIT_TIME        15 OVERNIGHT\n    6  EXIT_PRICE       16 MAE\n    7  SIZE             17 MFE\n    8  SL               18 EXIT_REASON\n    9  TP               19 BARS_HELD\n\nExit reason codes (must match Python):\n    0 SIGNAL, 1 SL, 2 TP, 3 TS, 4 LIQUIDATION, 5 END_OF_DATA\n\nSizing method codes (must match Python; note: custom=3 is NOT handled here):\n    0 PERCENT_EQUITY, 1 VALUE, 2 PRECOMPUTED\n";
+static const char __pyx_k_cy_inner_pyx_fast_path_inner_l[] = "\n_cy_inner.pyx \342\200\224 fast-path inner loop and slot helpers (private compiled helper).\n\nCompile with:\n    python setup.py build_ext --inplace\n\nProduces `_cy_inner.so` (Linux/Mac) or `_cy_inner.pyd` (Windows). Users\nnever import this directly; they import the public dispatcher\n`cython_backtester`, which routes to this module for the fast path and\nto the pure-Python `_inner_loop` in `backtester` for the custom-sizer\nfallback.\n\nSemantics must match backtester.py::_inner_loop exactly \342\200\224 see\nbacktester_docs.md \302\2472\342\200\223\302\2473. Any divergence is a bug.\n\nIMPORTANT \342\200\224 what this file does NOT handle:\n    - position_sizing='custom' (callable). The Python dispatcher falls\n      back to the pure-Python `_inner_loop` in backtester.py for that\n      case because a Python callable cannot be called from a nogil block\n      without re-acquiring the GIL, which defeats the point.\n\nField layout (matches F_* in the Python module):\n    0  DIRECTION        10 TS_DIST\n    1  ENTRY_BAR        11 TS_PEAK\n    2  ENTRY_TIME       12 COMMISSION\n    3  ENTRY_PRICE      13 SPREAD_COST\n    4  EXIT_BAR         14 SLIPPAGE_COST\n    5  EXIT_TIME        15 OVERNIGHT\n    6  EXIT_PRICE       16 MAE\n    7  SIZE             17 MFE\n    8  SL               18 EXIT_REASON\n    9  TP               19 BARS_HELD\n\nExit reason codes (must match Python):\n    0 SIGNAL, 1 SL, 2 TP, 3 TS, 4 LIQUIDATION, 5 END_OF_DATA\n\nSignal-flag bits (must match Python SIG_*):\n    1 LONG_ENTRY, 2 LONG_EXIT, 4 SHORT_ENTRY, 8 SHORT_EXIT\n\nSizing method codes (must match Python; note: custom=3 is NOT handled here):\n    0 PERCENT_EQUITY, 1 VALUE, 2 PRECOMPUTED\n\nMemory layout: every 1-D view is declared contiguous (``[::1]``) so element\naccess compiles to a plain pointer offset with no stride multiply.\n``open_positions`` is row-major (``[:, ::1]``); ``closed_trades`` is\ncolumn-major (``[::1, :]``), matching the order=\"F\" allocation in the\ndispatcher. C""allers must pass arrays in exactly these layouts.\n";
 /* #### Code section: decls ### */
 static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __pyx_array_obj *__pyx_v_self, PyObject *__pyx_v_shape, Py_ssize_t __pyx_v_itemsize, PyObject *__pyx_v_format, PyObject *__pyx_v_mode, int __pyx_v_allocate_buffer); /* proto */
 static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array_2__getbuffer__(struct __pyx_array_obj *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
@@ -3060,7 +3080,7 @@ static void __pyx_memoryviewslice___pyx_pf_15View_dot_MemoryView_16_memoryviewsl
 static PyObject *__pyx_pf___pyx_memoryviewslice___reduce_cython__(CYTHON_UNUSED struct __pyx_memoryviewslice_obj *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf___pyx_memoryviewslice_2__setstate_cython__(CYTHON_UNUSED struct __pyx_memoryviewslice_obj *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_pf_15View_dot_MemoryView___pyx_unpickle_Enum(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
-static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_o, __Pyx_memviewslice __pyx_v_h, __Pyx_memviewslice __pyx_v_l, __Pyx_memviewslice __pyx_v_c, CYTHON_UNUSED __Pyx_memviewslice __pyx_v_v, __Pyx_memviewslice __pyx_v_date_ns, __Pyx_memviewslice __pyx_v_long_entries_shifted, __Pyx_memviewslice __pyx_v_long_exits_shifted, __Pyx_memviewslice __pyx_v_short_entries_shifted, __Pyx_memviewslice __pyx_v_short_exits_shifted, double __pyx_v_starting_balance, int __pyx_v_sizing_method_code, double __pyx_v_sizing_static, __Pyx_memviewslice __pyx_v_sizing_array, __Pyx_memviewslice __pyx_v_sl_arr, double __pyx_v_tp, double __pyx_v_ts, double __pyx_v_leverage, double __pyx_v_commission, __Pyx_memviewslice __pyx_v_spread_arr, __Pyx_memviewslice __pyx_v_slippage_arr, __Pyx_memviewslice __pyx_v_long_fee_vec, __Pyx_memviewslice __pyx_v_short_fee_vec, int __pyx_v_hedging, __Pyx_memviewslice __pyx_v_cash_out, __Pyx_memviewslice __pyx_v_equity_out, __Pyx_memviewslice __pyx_v_open_positions, __Pyx_memviewslice __pyx_v_slot_active, __Pyx_memviewslice __pyx_v_closed_trades); /* proto */
+static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_o, __Pyx_memviewslice __pyx_v_h, __Pyx_memviewslice __pyx_v_l, __Pyx_memviewslice __pyx_v_c, CYTHON_UNUSED __Pyx_memviewslice __pyx_v_v, __Pyx_memviewslice __pyx_v_date_ns, __Pyx_memviewslice __pyx_v_signal_flags, double __pyx_v_starting_balance, int __pyx_v_sizing_method_code, double __pyx_v_sizing_static, __Pyx_memviewslice __pyx_v_sizing_array, __Pyx_memviewslice __pyx_v_sl_arr, double __pyx_v_tp, double __pyx_v_ts, double __pyx_v_leverage, double __pyx_v_commission, __Pyx_memviewslice __pyx_v_spread_arr, __Pyx_memviewslice __pyx_v_slippage_arr, __Pyx_memviewslice __pyx_v_long_fee_vec, __Pyx_memviewslice __pyx_v_short_fee_vec, int __pyx_v_hedging, __Pyx_memviewslice __pyx_v_cash_out, __Pyx_memviewslice __pyx_v_equity_out, __Pyx_memviewslice __pyx_v_open_positions, __Pyx_memviewslice __pyx_v_slot_active, __Pyx_memviewslice __pyx_v_closed_trades); /* proto */
 static PyObject *__pyx_tp_new_array(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_Enum(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_memoryview(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
@@ -3240,71 +3260,71 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 #define __pyx_n_u_func __pyx_string_tab[96]
 #define __pyx_n_u_getstate __pyx_string_tab[97]
 #define __pyx_n_u_h __pyx_string_tab[98]
-#define __pyx_n_u_hedging __pyx_string_tab[99]
-#define __pyx_n_u_i __pyx_string_tab[100]
-#define __pyx_n_u_id __pyx_string_tab[101]
-#define __pyx_n_u_import __pyx_string_tab[102]
-#define __pyx_n_u_index __pyx_string_tab[103]
-#define __pyx_n_u_inner_loop_fast __pyx_string_tab[104]
-#define __pyx_n_u_intc __pyx_string_tab[105]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[106]
-#define __pyx_n_u_items __pyx_string_tab[107]
-#define __pyx_n_u_itemsize __pyx_string_tab[108]
-#define __pyx_n_u_k __pyx_string_tab[109]
-#define __pyx_n_u_kk __pyx_string_tab[110]
-#define __pyx_n_u_l __pyx_string_tab[111]
-#define __pyx_n_u_leverage __pyx_string_tab[112]
-#define __pyx_n_u_liquidated __pyx_string_tab[113]
-#define __pyx_n_u_long_entries_shifted __pyx_string_tab[114]
-#define __pyx_n_u_long_exits_shifted __pyx_string_tab[115]
-#define __pyx_n_u_long_fee_vec __pyx_string_tab[116]
-#define __pyx_n_u_main __pyx_string_tab[117]
-#define __pyx_n_u_margin __pyx_string_tab[118]
-#define __pyx_n_u_margin_held __pyx_string_tab[119]
-#define __pyx_n_u_memview __pyx_string_tab[120]
-#define __pyx_n_u_mode __pyx_string_tab[121]
-#define __pyx_n_u_module __pyx_string_tab[122]
-#define __pyx_n_u_n __pyx_string_tab[123]
-#define __pyx_n_u_n_closed __pyx_string_tab[124]
-#define __pyx_n_u_n_slots __pyx_string_tab[125]
-#define __pyx_n_u_name __pyx_string_tab[126]
-#define __pyx_n_u_name_2 __pyx_string_tab[127]
-#define __pyx_n_u_ndim __pyx_string_tab[128]
-#define __pyx_n_u_new __pyx_string_tab[129]
-#define __pyx_n_u_notional __pyx_string_tab[130]
-#define __pyx_n_u_np __pyx_string_tab[131]
-#define __pyx_n_u_numpy __pyx_string_tab[132]
-#define __pyx_n_u_o __pyx_string_tab[133]
-#define __pyx_n_u_obj __pyx_string_tab[134]
-#define __pyx_n_u_open_positions __pyx_string_tab[135]
-#define __pyx_n_u_overflow_flag __pyx_string_tab[136]
-#define __pyx_n_u_pack __pyx_string_tab[137]
-#define __pyx_n_u_pop __pyx_string_tab[138]
-#define __pyx_n_u_price_c __pyx_string_tab[139]
-#define __pyx_n_u_price_h __pyx_string_tab[140]
-#define __pyx_n_u_price_l __pyx_string_tab[141]
-#define __pyx_n_u_price_o __pyx_string_tab[142]
-#define __pyx_n_u_proceeds __pyx_string_tab[143]
-#define __pyx_n_u_pyx_checksum __pyx_string_tab[144]
-#define __pyx_n_u_pyx_state __pyx_string_tab[145]
-#define __pyx_n_u_pyx_type __pyx_string_tab[146]
-#define __pyx_n_u_pyx_unpickle_Enum __pyx_string_tab[147]
-#define __pyx_n_u_pyx_vtable __pyx_string_tab[148]
-#define __pyx_n_u_qualname __pyx_string_tab[149]
-#define __pyx_n_u_realised_pnl __pyx_string_tab[150]
-#define __pyx_n_u_reduce __pyx_string_tab[151]
-#define __pyx_n_u_reduce_cython __pyx_string_tab[152]
-#define __pyx_n_u_reduce_ex __pyx_string_tab[153]
-#define __pyx_n_u_register __pyx_string_tab[154]
-#define __pyx_n_u_set_name __pyx_string_tab[155]
-#define __pyx_n_u_setdefault __pyx_string_tab[156]
-#define __pyx_n_u_setstate __pyx_string_tab[157]
-#define __pyx_n_u_setstate_cython __pyx_string_tab[158]
-#define __pyx_n_u_shape __pyx_string_tab[159]
-#define __pyx_n_u_share __pyx_string_tab[160]
-#define __pyx_n_u_short_entries_shifted __pyx_string_tab[161]
-#define __pyx_n_u_short_exits_shifted __pyx_string_tab[162]
-#define __pyx_n_u_short_fee_vec __pyx_string_tab[163]
+#define __pyx_n_u_has_ts __pyx_string_tab[99]
+#define __pyx_n_u_hedging __pyx_string_tab[100]
+#define __pyx_n_u_i __pyx_string_tab[101]
+#define __pyx_n_u_id __pyx_string_tab[102]
+#define __pyx_n_u_import __pyx_string_tab[103]
+#define __pyx_n_u_index __pyx_string_tab[104]
+#define __pyx_n_u_inner_loop_fast __pyx_string_tab[105]
+#define __pyx_n_u_intc __pyx_string_tab[106]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[107]
+#define __pyx_n_u_is_long __pyx_string_tab[108]
+#define __pyx_n_u_items __pyx_string_tab[109]
+#define __pyx_n_u_itemsize __pyx_string_tab[110]
+#define __pyx_n_u_j __pyx_string_tab[111]
+#define __pyx_n_u_k __pyx_string_tab[112]
+#define __pyx_n_u_kk __pyx_string_tab[113]
+#define __pyx_n_u_l __pyx_string_tab[114]
+#define __pyx_n_u_leverage __pyx_string_tab[115]
+#define __pyx_n_u_liquidated __pyx_string_tab[116]
+#define __pyx_n_u_long_fee_vec __pyx_string_tab[117]
+#define __pyx_n_u_main __pyx_string_tab[118]
+#define __pyx_n_u_margin __pyx_string_tab[119]
+#define __pyx_n_u_margin_held __pyx_string_tab[120]
+#define __pyx_n_u_memview __pyx_string_tab[121]
+#define __pyx_n_u_mode __pyx_string_tab[122]
+#define __pyx_n_u_module __pyx_string_tab[123]
+#define __pyx_n_u_n __pyx_string_tab[124]
+#define __pyx_n_u_n_closed __pyx_string_tab[125]
+#define __pyx_n_u_n_slots __pyx_string_tab[126]
+#define __pyx_n_u_name __pyx_string_tab[127]
+#define __pyx_n_u_name_2 __pyx_string_tab[128]
+#define __pyx_n_u_ndim __pyx_string_tab[129]
+#define __pyx_n_u_new __pyx_string_tab[130]
+#define __pyx_n_u_notional __pyx_string_tab[131]
+#define __pyx_n_u_np __pyx_string_tab[132]
+#define __pyx_n_u_numpy __pyx_string_tab[133]
+#define __pyx_n_u_o __pyx_string_tab[134]
+#define __pyx_n_u_obj __pyx_string_tab[135]
+#define __pyx_n_u_open_positions __pyx_string_tab[136]
+#define __pyx_n_u_overflow_flag __pyx_string_tab[137]
+#define __pyx_n_u_pack __pyx_string_tab[138]
+#define __pyx_n_u_pop __pyx_string_tab[139]
+#define __pyx_n_u_price_c __pyx_string_tab[140]
+#define __pyx_n_u_price_h __pyx_string_tab[141]
+#define __pyx_n_u_price_l __pyx_string_tab[142]
+#define __pyx_n_u_price_o __pyx_string_tab[143]
+#define __pyx_n_u_proceeds __pyx_string_tab[144]
+#define __pyx_n_u_pyx_checksum __pyx_string_tab[145]
+#define __pyx_n_u_pyx_state __pyx_string_tab[146]
+#define __pyx_n_u_pyx_type __pyx_string_tab[147]
+#define __pyx_n_u_pyx_unpickle_Enum __pyx_string_tab[148]
+#define __pyx_n_u_pyx_vtable __pyx_string_tab[149]
+#define __pyx_n_u_qualname __pyx_string_tab[150]
+#define __pyx_n_u_realised_pnl __pyx_string_tab[151]
+#define __pyx_n_u_reduce __pyx_string_tab[152]
+#define __pyx_n_u_reduce_cython __pyx_string_tab[153]
+#define __pyx_n_u_reduce_ex __pyx_string_tab[154]
+#define __pyx_n_u_register __pyx_string_tab[155]
+#define __pyx_n_u_set_name __pyx_string_tab[156]
+#define __pyx_n_u_setdefault __pyx_string_tab[157]
+#define __pyx_n_u_setstate __pyx_string_tab[158]
+#define __pyx_n_u_setstate_cython __pyx_string_tab[159]
+#define __pyx_n_u_shape __pyx_string_tab[160]
+#define __pyx_n_u_share __pyx_string_tab[161]
+#define __pyx_n_u_short_fee_vec __pyx_string_tab[162]
+#define __pyx_n_u_signal_flags __pyx_string_tab[163]
 #define __pyx_n_u_size __pyx_string_tab[164]
 #define __pyx_n_u_sizing_array __pyx_string_tab[165]
 #define __pyx_n_u_sizing_method_code __pyx_string_tab[166]
@@ -3348,7 +3368,7 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 #define __pyx_n_u_worst_px __pyx_string_tab[204]
 #define __pyx_n_u_x __pyx_string_tab[205]
 #define __pyx_n_u_zeros __pyx_string_tab[206]
-#define __pyx_kp_b_iso88591_N_q_nF_1_m6_q_F_A_q0_1_E_aq_aq __pyx_string_tab[207]
+#define __pyx_kp_b_iso88591_H_q_nF_1_m6_q_F_3fBa_q4_F_9F_A __pyx_string_tab[207]
 #define __pyx_n_b_O __pyx_string_tab[208]
 #define __pyx_int_0 __pyx_number_tab[0]
 #define __pyx_int_neg_1 __pyx_number_tab[1]
@@ -16696,12 +16716,12 @@ static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *__
   return __pyx_r;
 }
 
-/* "chronoton/_cy_inner.pyx":96
+/* "chronoton/_cy_inner.pyx":111
  * # Slot helpers  all `nogil`, pure C, no Python object interaction.
  * # ---------------------------------------------------------------------------
  * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
  * @cython.wraparound(False)
- * cdef inline Py_ssize_t _find_free_slot(const unsigned char[:] slot_active,
+ * cdef inline Py_ssize_t _find_free_slot(const unsigned char[::1] slot_active,
 */
 
 static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__find_free_slot(__Pyx_memviewslice __pyx_v_slot_active, Py_ssize_t __pyx_v_n_slots) {
@@ -16713,7 +16733,7 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__find_free_slot(__
   Py_ssize_t __pyx_t_4;
   int __pyx_t_5;
 
-  /* "chronoton/_cy_inner.pyx":102
+  /* "chronoton/_cy_inner.pyx":117
  *     """Index of first inactive slot, or -1 if full."""
  *     cdef Py_ssize_t k
  *     for k in range(n_slots):             # <<<<<<<<<<<<<<
@@ -16725,7 +16745,7 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__find_free_slot(__
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_k = __pyx_t_3;
 
-    /* "chronoton/_cy_inner.pyx":103
+    /* "chronoton/_cy_inner.pyx":118
  *     cdef Py_ssize_t k
  *     for k in range(n_slots):
  *         if slot_active[k] == 0:             # <<<<<<<<<<<<<<
@@ -16733,10 +16753,10 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__find_free_slot(__
  *     return -1
 */
     __pyx_t_4 = __pyx_v_k;
-    __pyx_t_5 = ((*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_4 * __pyx_v_slot_active.strides[0]) ))) == 0);
+    __pyx_t_5 = ((*((unsigned char const  *) ( /* dim=0 */ ((char *) (((unsigned char const  *) __pyx_v_slot_active.data) + __pyx_t_4)) ))) == 0);
     if (__pyx_t_5) {
 
-      /* "chronoton/_cy_inner.pyx":104
+      /* "chronoton/_cy_inner.pyx":119
  *     for k in range(n_slots):
  *         if slot_active[k] == 0:
  *             return k             # <<<<<<<<<<<<<<
@@ -16746,7 +16766,7 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__find_free_slot(__
       __pyx_r = __pyx_v_k;
       goto __pyx_L0;
 
-      /* "chronoton/_cy_inner.pyx":103
+      /* "chronoton/_cy_inner.pyx":118
  *     cdef Py_ssize_t k
  *     for k in range(n_slots):
  *         if slot_active[k] == 0:             # <<<<<<<<<<<<<<
@@ -16756,7 +16776,7 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__find_free_slot(__
     }
   }
 
-  /* "chronoton/_cy_inner.pyx":105
+  /* "chronoton/_cy_inner.pyx":120
  *         if slot_active[k] == 0:
  *             return k
  *     return -1             # <<<<<<<<<<<<<<
@@ -16766,12 +16786,95 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__find_free_slot(__
   __pyx_r = -1L;
   goto __pyx_L0;
 
-  /* "chronoton/_cy_inner.pyx":96
+  /* "chronoton/_cy_inner.pyx":111
  * # Slot helpers  all `nogil`, pure C, no Python object interaction.
  * # ---------------------------------------------------------------------------
  * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
  * @cython.wraparound(False)
- * cdef inline Py_ssize_t _find_free_slot(const unsigned char[:] slot_active,
+ * cdef inline Py_ssize_t _find_free_slot(const unsigned char[::1] slot_active,
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "chronoton/_cy_inner.pyx":123
+ * 
+ * 
+ * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
+ * @cython.wraparound(False)
+ * cdef inline bint _no_open_slots(const unsigned char[::1] slot_active,
+*/
+
+static CYTHON_INLINE int __pyx_f_9chronoton_9_cy_inner__no_open_slots(__Pyx_memviewslice __pyx_v_slot_active, Py_ssize_t __pyx_v_n_slots) {
+  Py_ssize_t __pyx_v_k;
+  int __pyx_r;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+
+  /* "chronoton/_cy_inner.pyx":129
+ *     """True iff every slot is inactive."""
+ *     cdef Py_ssize_t k
+ *     for k in range(n_slots):             # <<<<<<<<<<<<<<
+ *         if slot_active[k] != 0:
+ *             return 0
+*/
+  __pyx_t_1 = __pyx_v_n_slots;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_k = __pyx_t_3;
+
+    /* "chronoton/_cy_inner.pyx":130
+ *     cdef Py_ssize_t k
+ *     for k in range(n_slots):
+ *         if slot_active[k] != 0:             # <<<<<<<<<<<<<<
+ *             return 0
+ *     return 1
+*/
+    __pyx_t_4 = __pyx_v_k;
+    __pyx_t_5 = ((*((unsigned char const  *) ( /* dim=0 */ ((char *) (((unsigned char const  *) __pyx_v_slot_active.data) + __pyx_t_4)) ))) != 0);
+    if (__pyx_t_5) {
+
+      /* "chronoton/_cy_inner.pyx":131
+ *     for k in range(n_slots):
+ *         if slot_active[k] != 0:
+ *             return 0             # <<<<<<<<<<<<<<
+ *     return 1
+ * 
+*/
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "chronoton/_cy_inner.pyx":130
+ *     cdef Py_ssize_t k
+ *     for k in range(n_slots):
+ *         if slot_active[k] != 0:             # <<<<<<<<<<<<<<
+ *             return 0
+ *     return 1
+*/
+    }
+  }
+
+  /* "chronoton/_cy_inner.pyx":132
+ *         if slot_active[k] != 0:
+ *             return 0
+ *     return 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "chronoton/_cy_inner.pyx":123
+ * 
+ * 
+ * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
+ * @cython.wraparound(False)
+ * cdef inline bint _no_open_slots(const unsigned char[::1] slot_active,
 */
 
   /* function exit code */
@@ -16779,7 +16882,7 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__find_free_slot(__
   return __pyx_r;
 }
 
-/* "chronoton/_cy_inner.pyx":108
+/* "chronoton/_cy_inner.pyx":135
  * 
  * 
  * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
@@ -16791,7 +16894,7 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
   Py_ssize_t __pyx_t_1;
   Py_ssize_t __pyx_t_2;
 
-  /* "chronoton/_cy_inner.pyx":127
+  /* "chronoton/_cy_inner.pyx":154
  * ) nogil:
  *     """Populate open_positions[slot_idx] and flip slot_active on."""
  *     open_positions[slot_idx, F_DIRECTION]     = direction             # <<<<<<<<<<<<<<
@@ -16800,9 +16903,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_1 = __pyx_v_slot_idx;
   __pyx_t_2 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_direction;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )) = __pyx_v_direction;
 
-  /* "chronoton/_cy_inner.pyx":128
+  /* "chronoton/_cy_inner.pyx":155
  *     """Populate open_positions[slot_idx] and flip slot_active on."""
  *     open_positions[slot_idx, F_DIRECTION]     = direction
  *     open_positions[slot_idx, F_ENTRY_BAR]     = <double>bar_idx             # <<<<<<<<<<<<<<
@@ -16811,9 +16914,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_1 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_BAR;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_1 * __pyx_v_open_positions.strides[1]) )) = ((double)__pyx_v_bar_idx);
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_1)) )) = ((double)__pyx_v_bar_idx);
 
-  /* "chronoton/_cy_inner.pyx":129
+  /* "chronoton/_cy_inner.pyx":156
  *     open_positions[slot_idx, F_DIRECTION]     = direction
  *     open_positions[slot_idx, F_ENTRY_BAR]     = <double>bar_idx
  *     open_positions[slot_idx, F_ENTRY_TIME]    = entry_time_ns             # <<<<<<<<<<<<<<
@@ -16822,9 +16925,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_1 = __pyx_v_slot_idx;
   __pyx_t_2 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_TIME;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_entry_time_ns;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )) = __pyx_v_entry_time_ns;
 
-  /* "chronoton/_cy_inner.pyx":130
+  /* "chronoton/_cy_inner.pyx":157
  *     open_positions[slot_idx, F_ENTRY_BAR]     = <double>bar_idx
  *     open_positions[slot_idx, F_ENTRY_TIME]    = entry_time_ns
  *     open_positions[slot_idx, F_ENTRY_PRICE]   = entry_price             # <<<<<<<<<<<<<<
@@ -16833,9 +16936,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_1 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_1 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_entry_price;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_1)) )) = __pyx_v_entry_price;
 
-  /* "chronoton/_cy_inner.pyx":131
+  /* "chronoton/_cy_inner.pyx":158
  *     open_positions[slot_idx, F_ENTRY_TIME]    = entry_time_ns
  *     open_positions[slot_idx, F_ENTRY_PRICE]   = entry_price
  *     open_positions[slot_idx, F_EXIT_BAR]      = NAN             # <<<<<<<<<<<<<<
@@ -16844,9 +16947,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_1 = __pyx_v_slot_idx;
   __pyx_t_2 = __pyx_e_9chronoton_9_cy_inner_F_EXIT_BAR;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )) = NAN;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )) = NAN;
 
-  /* "chronoton/_cy_inner.pyx":132
+  /* "chronoton/_cy_inner.pyx":159
  *     open_positions[slot_idx, F_ENTRY_PRICE]   = entry_price
  *     open_positions[slot_idx, F_EXIT_BAR]      = NAN
  *     open_positions[slot_idx, F_EXIT_TIME]     = NAN             # <<<<<<<<<<<<<<
@@ -16855,9 +16958,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_1 = __pyx_e_9chronoton_9_cy_inner_F_EXIT_TIME;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_1 * __pyx_v_open_positions.strides[1]) )) = NAN;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_1)) )) = NAN;
 
-  /* "chronoton/_cy_inner.pyx":133
+  /* "chronoton/_cy_inner.pyx":160
  *     open_positions[slot_idx, F_EXIT_BAR]      = NAN
  *     open_positions[slot_idx, F_EXIT_TIME]     = NAN
  *     open_positions[slot_idx, F_EXIT_PRICE]    = NAN             # <<<<<<<<<<<<<<
@@ -16866,9 +16969,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_1 = __pyx_v_slot_idx;
   __pyx_t_2 = __pyx_e_9chronoton_9_cy_inner_F_EXIT_PRICE;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )) = NAN;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )) = NAN;
 
-  /* "chronoton/_cy_inner.pyx":134
+  /* "chronoton/_cy_inner.pyx":161
  *     open_positions[slot_idx, F_EXIT_TIME]     = NAN
  *     open_positions[slot_idx, F_EXIT_PRICE]    = NAN
  *     open_positions[slot_idx, F_SIZE]          = size             # <<<<<<<<<<<<<<
@@ -16877,9 +16980,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_1 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_1 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_size;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_1)) )) = __pyx_v_size;
 
-  /* "chronoton/_cy_inner.pyx":135
+  /* "chronoton/_cy_inner.pyx":162
  *     open_positions[slot_idx, F_EXIT_PRICE]    = NAN
  *     open_positions[slot_idx, F_SIZE]          = size
  *     open_positions[slot_idx, F_SL]            = sl_price             # <<<<<<<<<<<<<<
@@ -16888,9 +16991,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_1 = __pyx_v_slot_idx;
   __pyx_t_2 = __pyx_e_9chronoton_9_cy_inner_F_SL;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_sl_price;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )) = __pyx_v_sl_price;
 
-  /* "chronoton/_cy_inner.pyx":136
+  /* "chronoton/_cy_inner.pyx":163
  *     open_positions[slot_idx, F_SIZE]          = size
  *     open_positions[slot_idx, F_SL]            = sl_price
  *     open_positions[slot_idx, F_TP]            = tp_price             # <<<<<<<<<<<<<<
@@ -16899,9 +17002,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_1 = __pyx_e_9chronoton_9_cy_inner_F_TP;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_1 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_tp_price;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_1)) )) = __pyx_v_tp_price;
 
-  /* "chronoton/_cy_inner.pyx":137
+  /* "chronoton/_cy_inner.pyx":164
  *     open_positions[slot_idx, F_SL]            = sl_price
  *     open_positions[slot_idx, F_TP]            = tp_price
  *     open_positions[slot_idx, F_TS_DIST]       = ts_dist             # <<<<<<<<<<<<<<
@@ -16910,9 +17013,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_1 = __pyx_v_slot_idx;
   __pyx_t_2 = __pyx_e_9chronoton_9_cy_inner_F_TS_DIST;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_ts_dist;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )) = __pyx_v_ts_dist;
 
-  /* "chronoton/_cy_inner.pyx":138
+  /* "chronoton/_cy_inner.pyx":165
  *     open_positions[slot_idx, F_TP]            = tp_price
  *     open_positions[slot_idx, F_TS_DIST]       = ts_dist
  *     open_positions[slot_idx, F_TS_PEAK]       = entry_price             # <<<<<<<<<<<<<<
@@ -16921,9 +17024,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_1 = __pyx_e_9chronoton_9_cy_inner_F_TS_PEAK;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_1 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_entry_price;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_1)) )) = __pyx_v_entry_price;
 
-  /* "chronoton/_cy_inner.pyx":139
+  /* "chronoton/_cy_inner.pyx":166
  *     open_positions[slot_idx, F_TS_DIST]       = ts_dist
  *     open_positions[slot_idx, F_TS_PEAK]       = entry_price
  *     open_positions[slot_idx, F_COMMISSION]    = commission_cost             # <<<<<<<<<<<<<<
@@ -16932,9 +17035,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_1 = __pyx_v_slot_idx;
   __pyx_t_2 = __pyx_e_9chronoton_9_cy_inner_F_COMMISSION;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_commission_cost;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )) = __pyx_v_commission_cost;
 
-  /* "chronoton/_cy_inner.pyx":140
+  /* "chronoton/_cy_inner.pyx":167
  *     open_positions[slot_idx, F_TS_PEAK]       = entry_price
  *     open_positions[slot_idx, F_COMMISSION]    = commission_cost
  *     open_positions[slot_idx, F_SPREAD_COST]   = spread_cost             # <<<<<<<<<<<<<<
@@ -16943,9 +17046,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_1 = __pyx_e_9chronoton_9_cy_inner_F_SPREAD_COST;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_1 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_spread_cost;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_1)) )) = __pyx_v_spread_cost;
 
-  /* "chronoton/_cy_inner.pyx":141
+  /* "chronoton/_cy_inner.pyx":168
  *     open_positions[slot_idx, F_COMMISSION]    = commission_cost
  *     open_positions[slot_idx, F_SPREAD_COST]   = spread_cost
  *     open_positions[slot_idx, F_SLIPPAGE_COST] = slippage_cost             # <<<<<<<<<<<<<<
@@ -16954,9 +17057,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_1 = __pyx_v_slot_idx;
   __pyx_t_2 = __pyx_e_9chronoton_9_cy_inner_F_SLIPPAGE_COST;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_slippage_cost;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )) = __pyx_v_slippage_cost;
 
-  /* "chronoton/_cy_inner.pyx":142
+  /* "chronoton/_cy_inner.pyx":169
  *     open_positions[slot_idx, F_SPREAD_COST]   = spread_cost
  *     open_positions[slot_idx, F_SLIPPAGE_COST] = slippage_cost
  *     open_positions[slot_idx, F_OVERNIGHT]     = 0.0             # <<<<<<<<<<<<<<
@@ -16965,9 +17068,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_1 = __pyx_e_9chronoton_9_cy_inner_F_OVERNIGHT;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_1 * __pyx_v_open_positions.strides[1]) )) = 0.0;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_1)) )) = 0.0;
 
-  /* "chronoton/_cy_inner.pyx":143
+  /* "chronoton/_cy_inner.pyx":170
  *     open_positions[slot_idx, F_SLIPPAGE_COST] = slippage_cost
  *     open_positions[slot_idx, F_OVERNIGHT]     = 0.0
  *     open_positions[slot_idx, F_MAE]           = 0.0             # <<<<<<<<<<<<<<
@@ -16976,9 +17079,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_1 = __pyx_v_slot_idx;
   __pyx_t_2 = __pyx_e_9chronoton_9_cy_inner_F_MAE;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )) = 0.0;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )) = 0.0;
 
-  /* "chronoton/_cy_inner.pyx":144
+  /* "chronoton/_cy_inner.pyx":171
  *     open_positions[slot_idx, F_OVERNIGHT]     = 0.0
  *     open_positions[slot_idx, F_MAE]           = 0.0
  *     open_positions[slot_idx, F_MFE]           = 0.0             # <<<<<<<<<<<<<<
@@ -16987,9 +17090,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_1 = __pyx_e_9chronoton_9_cy_inner_F_MFE;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_1 * __pyx_v_open_positions.strides[1]) )) = 0.0;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_1)) )) = 0.0;
 
-  /* "chronoton/_cy_inner.pyx":145
+  /* "chronoton/_cy_inner.pyx":172
  *     open_positions[slot_idx, F_MAE]           = 0.0
  *     open_positions[slot_idx, F_MFE]           = 0.0
  *     open_positions[slot_idx, F_EXIT_REASON]   = NAN             # <<<<<<<<<<<<<<
@@ -16998,9 +17101,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_1 = __pyx_v_slot_idx;
   __pyx_t_2 = __pyx_e_9chronoton_9_cy_inner_F_EXIT_REASON;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )) = NAN;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_1 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )) = NAN;
 
-  /* "chronoton/_cy_inner.pyx":146
+  /* "chronoton/_cy_inner.pyx":173
  *     open_positions[slot_idx, F_MFE]           = 0.0
  *     open_positions[slot_idx, F_EXIT_REASON]   = NAN
  *     open_positions[slot_idx, F_BARS_HELD]     = 0.0             # <<<<<<<<<<<<<<
@@ -17009,9 +17112,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_1 = __pyx_e_9chronoton_9_cy_inner_F_BARS_HELD;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_1 * __pyx_v_open_positions.strides[1]) )) = 0.0;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_1)) )) = 0.0;
 
-  /* "chronoton/_cy_inner.pyx":147
+  /* "chronoton/_cy_inner.pyx":174
  *     open_positions[slot_idx, F_EXIT_REASON]   = NAN
  *     open_positions[slot_idx, F_BARS_HELD]     = 0.0
  *     slot_active[slot_idx] = 1             # <<<<<<<<<<<<<<
@@ -17019,9 +17122,9 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
  * 
 */
   __pyx_t_1 = __pyx_v_slot_idx;
-  *((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_1 * __pyx_v_slot_active.strides[0]) )) = 1;
+  *((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_1)) )) = 1;
 
-  /* "chronoton/_cy_inner.pyx":108
+  /* "chronoton/_cy_inner.pyx":135
  * 
  * 
  * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
@@ -17032,7 +17135,7 @@ static CYTHON_INLINE void __pyx_f_9chronoton_9_cy_inner__enter_position(Py_ssize
   /* function exit code */
 }
 
-/* "chronoton/_cy_inner.pyx":150
+/* "chronoton/_cy_inner.pyx":177
  * 
  * 
  * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
@@ -17053,7 +17156,7 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
   Py_ssize_t __pyx_t_7;
   Py_ssize_t __pyx_t_8;
 
-  /* "chronoton/_cy_inner.pyx":177
+  /* "chronoton/_cy_inner.pyx":204
  *     cdef double entry_bar_f
  * 
  *     if n_closed >= closed_capacity:             # <<<<<<<<<<<<<<
@@ -17063,7 +17166,7 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
   __pyx_t_1 = (__pyx_v_n_closed >= __pyx_v_closed_capacity);
   if (__pyx_t_1) {
 
-    /* "chronoton/_cy_inner.pyx":178
+    /* "chronoton/_cy_inner.pyx":205
  * 
  *     if n_closed >= closed_capacity:
  *         overflow_flag[0] = 1             # <<<<<<<<<<<<<<
@@ -17071,9 +17174,9 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
  * 
 */
     __pyx_t_2 = 0;
-    *((int *) ( /* dim=0 */ (__pyx_v_overflow_flag.data + __pyx_t_2 * __pyx_v_overflow_flag.strides[0]) )) = 1;
+    *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_overflow_flag.data) + __pyx_t_2)) )) = 1;
 
-    /* "chronoton/_cy_inner.pyx":179
+    /* "chronoton/_cy_inner.pyx":206
  *     if n_closed >= closed_capacity:
  *         overflow_flag[0] = 1
  *         return -1             # <<<<<<<<<<<<<<
@@ -17083,7 +17186,7 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
     __pyx_r = -1L;
     goto __pyx_L0;
 
-    /* "chronoton/_cy_inner.pyx":177
+    /* "chronoton/_cy_inner.pyx":204
  *     cdef double entry_bar_f
  * 
  *     if n_closed >= closed_capacity:             # <<<<<<<<<<<<<<
@@ -17092,7 +17195,7 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
 */
   }
 
-  /* "chronoton/_cy_inner.pyx":181
+  /* "chronoton/_cy_inner.pyx":208
  *         return -1
  * 
  *     open_positions[slot_idx, F_EXIT_BAR]       = <double>bar_idx             # <<<<<<<<<<<<<<
@@ -17101,9 +17204,9 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_3 = __pyx_e_9chronoton_9_cy_inner_F_EXIT_BAR;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_3 * __pyx_v_open_positions.strides[1]) )) = ((double)__pyx_v_bar_idx);
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_3)) )) = ((double)__pyx_v_bar_idx);
 
-  /* "chronoton/_cy_inner.pyx":182
+  /* "chronoton/_cy_inner.pyx":209
  * 
  *     open_positions[slot_idx, F_EXIT_BAR]       = <double>bar_idx
  *     open_positions[slot_idx, F_EXIT_TIME]      = exit_time_ns             # <<<<<<<<<<<<<<
@@ -17112,9 +17215,9 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
 */
   __pyx_t_3 = __pyx_v_slot_idx;
   __pyx_t_2 = __pyx_e_9chronoton_9_cy_inner_F_EXIT_TIME;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_3 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_exit_time_ns;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_3 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )) = __pyx_v_exit_time_ns;
 
-  /* "chronoton/_cy_inner.pyx":183
+  /* "chronoton/_cy_inner.pyx":210
  *     open_positions[slot_idx, F_EXIT_BAR]       = <double>bar_idx
  *     open_positions[slot_idx, F_EXIT_TIME]      = exit_time_ns
  *     open_positions[slot_idx, F_EXIT_PRICE]     = exit_price             # <<<<<<<<<<<<<<
@@ -17123,9 +17226,9 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_3 = __pyx_e_9chronoton_9_cy_inner_F_EXIT_PRICE;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_3 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_exit_price;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_3)) )) = __pyx_v_exit_price;
 
-  /* "chronoton/_cy_inner.pyx":184
+  /* "chronoton/_cy_inner.pyx":211
  *     open_positions[slot_idx, F_EXIT_TIME]      = exit_time_ns
  *     open_positions[slot_idx, F_EXIT_PRICE]     = exit_price
  *     open_positions[slot_idx, F_EXIT_REASON]    = exit_reason             # <<<<<<<<<<<<<<
@@ -17134,9 +17237,9 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
 */
   __pyx_t_3 = __pyx_v_slot_idx;
   __pyx_t_2 = __pyx_e_9chronoton_9_cy_inner_F_EXIT_REASON;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_3 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_exit_reason;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_3 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )) = __pyx_v_exit_reason;
 
-  /* "chronoton/_cy_inner.pyx":185
+  /* "chronoton/_cy_inner.pyx":212
  *     open_positions[slot_idx, F_EXIT_PRICE]     = exit_price
  *     open_positions[slot_idx, F_EXIT_REASON]    = exit_reason
  *     open_positions[slot_idx, F_COMMISSION]    += exit_commission             # <<<<<<<<<<<<<<
@@ -17145,9 +17248,9 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_3 = __pyx_e_9chronoton_9_cy_inner_F_COMMISSION;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_3 * __pyx_v_open_positions.strides[1]) )) += __pyx_v_exit_commission;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_3)) )) += __pyx_v_exit_commission;
 
-  /* "chronoton/_cy_inner.pyx":186
+  /* "chronoton/_cy_inner.pyx":213
  *     open_positions[slot_idx, F_EXIT_REASON]    = exit_reason
  *     open_positions[slot_idx, F_COMMISSION]    += exit_commission
  *     open_positions[slot_idx, F_SPREAD_COST]   += exit_spread             # <<<<<<<<<<<<<<
@@ -17156,9 +17259,9 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
 */
   __pyx_t_3 = __pyx_v_slot_idx;
   __pyx_t_2 = __pyx_e_9chronoton_9_cy_inner_F_SPREAD_COST;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_3 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )) += __pyx_v_exit_spread;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_3 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )) += __pyx_v_exit_spread;
 
-  /* "chronoton/_cy_inner.pyx":187
+  /* "chronoton/_cy_inner.pyx":214
  *     open_positions[slot_idx, F_COMMISSION]    += exit_commission
  *     open_positions[slot_idx, F_SPREAD_COST]   += exit_spread
  *     open_positions[slot_idx, F_SLIPPAGE_COST] += exit_slippage             # <<<<<<<<<<<<<<
@@ -17167,9 +17270,9 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_3 = __pyx_e_9chronoton_9_cy_inner_F_SLIPPAGE_COST;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_3 * __pyx_v_open_positions.strides[1]) )) += __pyx_v_exit_slippage;
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_3)) )) += __pyx_v_exit_slippage;
 
-  /* "chronoton/_cy_inner.pyx":188
+  /* "chronoton/_cy_inner.pyx":215
  *     open_positions[slot_idx, F_SPREAD_COST]   += exit_spread
  *     open_positions[slot_idx, F_SLIPPAGE_COST] += exit_slippage
  *     entry_bar_f = open_positions[slot_idx, F_ENTRY_BAR]             # <<<<<<<<<<<<<<
@@ -17178,9 +17281,9 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
 */
   __pyx_t_3 = __pyx_v_slot_idx;
   __pyx_t_2 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_BAR;
-  __pyx_v_entry_bar_f = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_3 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )));
+  __pyx_v_entry_bar_f = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_3 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )));
 
-  /* "chronoton/_cy_inner.pyx":189
+  /* "chronoton/_cy_inner.pyx":216
  *     open_positions[slot_idx, F_SLIPPAGE_COST] += exit_slippage
  *     entry_bar_f = open_positions[slot_idx, F_ENTRY_BAR]
  *     open_positions[slot_idx, F_BARS_HELD] = <double>(bar_idx - <Py_ssize_t>entry_bar_f)             # <<<<<<<<<<<<<<
@@ -17189,9 +17292,9 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
 */
   __pyx_t_2 = __pyx_v_slot_idx;
   __pyx_t_3 = __pyx_e_9chronoton_9_cy_inner_F_BARS_HELD;
-  *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_3 * __pyx_v_open_positions.strides[1]) )) = ((double)(__pyx_v_bar_idx - ((Py_ssize_t)__pyx_v_entry_bar_f)));
+  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_2 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_3)) )) = ((double)(__pyx_v_bar_idx - ((Py_ssize_t)__pyx_v_entry_bar_f)));
 
-  /* "chronoton/_cy_inner.pyx":192
+  /* "chronoton/_cy_inner.pyx":219
  * 
  *     # Copy row  closed_trades[n_closed]
  *     for j in range(N_FIELDS):             # <<<<<<<<<<<<<<
@@ -17203,7 +17306,7 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
   for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
     __pyx_v_j = __pyx_t_6;
 
-    /* "chronoton/_cy_inner.pyx":193
+    /* "chronoton/_cy_inner.pyx":220
  *     # Copy row  closed_trades[n_closed]
  *     for j in range(N_FIELDS):
  *         closed_trades[n_closed, j] = open_positions[slot_idx, j]             # <<<<<<<<<<<<<<
@@ -17214,10 +17317,10 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
     __pyx_t_2 = __pyx_v_j;
     __pyx_t_7 = __pyx_v_n_closed;
     __pyx_t_8 = __pyx_v_j;
-    *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_closed_trades.data + __pyx_t_7 * __pyx_v_closed_trades.strides[0]) ) + __pyx_t_8 * __pyx_v_closed_trades.strides[1]) )) = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_3 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_2 * __pyx_v_open_positions.strides[1]) )));
+    *((double *) ( /* dim=1 */ (( /* dim=0 */ ((char *) (((double *) __pyx_v_closed_trades.data) + __pyx_t_7)) ) + __pyx_t_8 * __pyx_v_closed_trades.strides[1]) )) = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_3 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_2)) )));
   }
 
-  /* "chronoton/_cy_inner.pyx":195
+  /* "chronoton/_cy_inner.pyx":222
  *         closed_trades[n_closed, j] = open_positions[slot_idx, j]
  * 
  *     slot_active[slot_idx] = 0             # <<<<<<<<<<<<<<
@@ -17225,9 +17328,9 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
  * 
 */
   __pyx_t_2 = __pyx_v_slot_idx;
-  *((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_2 * __pyx_v_slot_active.strides[0]) )) = 0;
+  *((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_2)) )) = 0;
 
-  /* "chronoton/_cy_inner.pyx":196
+  /* "chronoton/_cy_inner.pyx":223
  * 
  *     slot_active[slot_idx] = 0
  *     return n_closed + 1             # <<<<<<<<<<<<<<
@@ -17237,7 +17340,7 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
   __pyx_r = (__pyx_v_n_closed + 1);
   goto __pyx_L0;
 
-  /* "chronoton/_cy_inner.pyx":150
+  /* "chronoton/_cy_inner.pyx":177
  * 
  * 
  * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
@@ -17250,7 +17353,7 @@ static CYTHON_INLINE Py_ssize_t __pyx_f_9chronoton_9_cy_inner__exit_position(Py_
   return __pyx_r;
 }
 
-/* "chronoton/_cy_inner.pyx":204
+/* "chronoton/_cy_inner.pyx":231
  * # `closed_trades` are modified in place by the caller.
  * # ---------------------------------------------------------------------------
  * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
@@ -17281,10 +17384,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_memviewslice __pyx_v_c = { 0, 0, { 0 }, { 0 }, { 0 } };
   CYTHON_UNUSED __Pyx_memviewslice __pyx_v_v = { 0, 0, { 0 }, { 0 }, { 0 } };
   __Pyx_memviewslice __pyx_v_date_ns = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_long_entries_shifted = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_long_exits_shifted = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_short_entries_shifted = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_short_exits_shifted = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_signal_flags = { 0, 0, { 0 }, { 0 }, { 0 } };
   double __pyx_v_starting_balance;
   int __pyx_v_sizing_method_code;
   double __pyx_v_sizing_static;
@@ -17308,7 +17408,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[29] = {0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0};
+  PyObject* values[26] = {0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -17324,230 +17424,209 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_o,&__pyx_mstate_global->__pyx_n_u_h,&__pyx_mstate_global->__pyx_n_u_l,&__pyx_mstate_global->__pyx_n_u_c,&__pyx_mstate_global->__pyx_n_u_v,&__pyx_mstate_global->__pyx_n_u_date_ns,&__pyx_mstate_global->__pyx_n_u_long_entries_shifted,&__pyx_mstate_global->__pyx_n_u_long_exits_shifted,&__pyx_mstate_global->__pyx_n_u_short_entries_shifted,&__pyx_mstate_global->__pyx_n_u_short_exits_shifted,&__pyx_mstate_global->__pyx_n_u_starting_balance,&__pyx_mstate_global->__pyx_n_u_sizing_method_code,&__pyx_mstate_global->__pyx_n_u_sizing_static,&__pyx_mstate_global->__pyx_n_u_sizing_array,&__pyx_mstate_global->__pyx_n_u_sl_arr,&__pyx_mstate_global->__pyx_n_u_tp,&__pyx_mstate_global->__pyx_n_u_ts,&__pyx_mstate_global->__pyx_n_u_leverage,&__pyx_mstate_global->__pyx_n_u_commission,&__pyx_mstate_global->__pyx_n_u_spread_arr,&__pyx_mstate_global->__pyx_n_u_slippage_arr,&__pyx_mstate_global->__pyx_n_u_long_fee_vec,&__pyx_mstate_global->__pyx_n_u_short_fee_vec,&__pyx_mstate_global->__pyx_n_u_hedging,&__pyx_mstate_global->__pyx_n_u_cash_out,&__pyx_mstate_global->__pyx_n_u_equity_out,&__pyx_mstate_global->__pyx_n_u_open_positions,&__pyx_mstate_global->__pyx_n_u_slot_active,&__pyx_mstate_global->__pyx_n_u_closed_trades,0};
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_o,&__pyx_mstate_global->__pyx_n_u_h,&__pyx_mstate_global->__pyx_n_u_l,&__pyx_mstate_global->__pyx_n_u_c,&__pyx_mstate_global->__pyx_n_u_v,&__pyx_mstate_global->__pyx_n_u_date_ns,&__pyx_mstate_global->__pyx_n_u_signal_flags,&__pyx_mstate_global->__pyx_n_u_starting_balance,&__pyx_mstate_global->__pyx_n_u_sizing_method_code,&__pyx_mstate_global->__pyx_n_u_sizing_static,&__pyx_mstate_global->__pyx_n_u_sizing_array,&__pyx_mstate_global->__pyx_n_u_sl_arr,&__pyx_mstate_global->__pyx_n_u_tp,&__pyx_mstate_global->__pyx_n_u_ts,&__pyx_mstate_global->__pyx_n_u_leverage,&__pyx_mstate_global->__pyx_n_u_commission,&__pyx_mstate_global->__pyx_n_u_spread_arr,&__pyx_mstate_global->__pyx_n_u_slippage_arr,&__pyx_mstate_global->__pyx_n_u_long_fee_vec,&__pyx_mstate_global->__pyx_n_u_short_fee_vec,&__pyx_mstate_global->__pyx_n_u_hedging,&__pyx_mstate_global->__pyx_n_u_cash_out,&__pyx_mstate_global->__pyx_n_u_equity_out,&__pyx_mstate_global->__pyx_n_u_open_positions,&__pyx_mstate_global->__pyx_n_u_slot_active,&__pyx_mstate_global->__pyx_n_u_closed_trades,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 204, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 231, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
-        case 29:
-        values[28] = __Pyx_ArgRef_FASTCALL(__pyx_args, 28);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[28])) __PYX_ERR(0, 204, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case 28:
-        values[27] = __Pyx_ArgRef_FASTCALL(__pyx_args, 27);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[27])) __PYX_ERR(0, 204, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case 27:
-        values[26] = __Pyx_ArgRef_FASTCALL(__pyx_args, 26);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[26])) __PYX_ERR(0, 204, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
         case 26:
         values[25] = __Pyx_ArgRef_FASTCALL(__pyx_args, 25);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[25])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[25])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 25:
         values[24] = __Pyx_ArgRef_FASTCALL(__pyx_args, 24);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[24])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[24])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 24:
         values[23] = __Pyx_ArgRef_FASTCALL(__pyx_args, 23);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[23])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[23])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 23:
         values[22] = __Pyx_ArgRef_FASTCALL(__pyx_args, 22);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[22])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[22])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 22:
         values[21] = __Pyx_ArgRef_FASTCALL(__pyx_args, 21);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[21])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[21])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 21:
         values[20] = __Pyx_ArgRef_FASTCALL(__pyx_args, 20);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[20])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[20])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 20:
         values[19] = __Pyx_ArgRef_FASTCALL(__pyx_args, 19);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[19])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[19])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 19:
         values[18] = __Pyx_ArgRef_FASTCALL(__pyx_args, 18);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[18])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[18])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 18:
         values[17] = __Pyx_ArgRef_FASTCALL(__pyx_args, 17);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[17])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[17])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 17:
         values[16] = __Pyx_ArgRef_FASTCALL(__pyx_args, 16);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[16])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[16])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 16:
         values[15] = __Pyx_ArgRef_FASTCALL(__pyx_args, 15);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[15])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[15])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 15:
         values[14] = __Pyx_ArgRef_FASTCALL(__pyx_args, 14);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[14])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[14])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 14:
         values[13] = __Pyx_ArgRef_FASTCALL(__pyx_args, 13);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[13])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[13])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 13:
         values[12] = __Pyx_ArgRef_FASTCALL(__pyx_args, 12);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[12])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[12])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 12:
         values[11] = __Pyx_ArgRef_FASTCALL(__pyx_args, 11);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[11])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[11])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 11:
         values[10] = __Pyx_ArgRef_FASTCALL(__pyx_args, 10);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[10])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[10])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 10:
         values[9] = __Pyx_ArgRef_FASTCALL(__pyx_args, 9);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[9])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[9])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  9:
         values[8] = __Pyx_ArgRef_FASTCALL(__pyx_args, 8);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[8])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[8])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  8:
         values[7] = __Pyx_ArgRef_FASTCALL(__pyx_args, 7);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[7])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[7])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  7:
         values[6] = __Pyx_ArgRef_FASTCALL(__pyx_args, 6);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  6:
         values[5] = __Pyx_ArgRef_FASTCALL(__pyx_args, 5);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  5:
         values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  4:
         values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 204, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 231, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "inner_loop_fast", 0) < (0)) __PYX_ERR(0, 204, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 29; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("inner_loop_fast", 1, 29, 29, i); __PYX_ERR(0, 204, __pyx_L3_error) }
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "inner_loop_fast", 0) < (0)) __PYX_ERR(0, 231, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 26; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("inner_loop_fast", 1, 26, 26, i); __PYX_ERR(0, 231, __pyx_L3_error) }
       }
-    } else if (unlikely(__pyx_nargs != 29)) {
+    } else if (unlikely(__pyx_nargs != 26)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[5] = __Pyx_ArgRef_FASTCALL(__pyx_args, 5);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[6] = __Pyx_ArgRef_FASTCALL(__pyx_args, 6);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[7] = __Pyx_ArgRef_FASTCALL(__pyx_args, 7);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[7])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[7])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[8] = __Pyx_ArgRef_FASTCALL(__pyx_args, 8);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[8])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[8])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[9] = __Pyx_ArgRef_FASTCALL(__pyx_args, 9);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[9])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[9])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[10] = __Pyx_ArgRef_FASTCALL(__pyx_args, 10);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[10])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[10])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[11] = __Pyx_ArgRef_FASTCALL(__pyx_args, 11);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[11])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[11])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[12] = __Pyx_ArgRef_FASTCALL(__pyx_args, 12);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[12])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[12])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[13] = __Pyx_ArgRef_FASTCALL(__pyx_args, 13);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[13])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[13])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[14] = __Pyx_ArgRef_FASTCALL(__pyx_args, 14);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[14])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[14])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[15] = __Pyx_ArgRef_FASTCALL(__pyx_args, 15);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[15])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[15])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[16] = __Pyx_ArgRef_FASTCALL(__pyx_args, 16);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[16])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[16])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[17] = __Pyx_ArgRef_FASTCALL(__pyx_args, 17);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[17])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[17])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[18] = __Pyx_ArgRef_FASTCALL(__pyx_args, 18);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[18])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[18])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[19] = __Pyx_ArgRef_FASTCALL(__pyx_args, 19);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[19])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[19])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[20] = __Pyx_ArgRef_FASTCALL(__pyx_args, 20);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[20])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[20])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[21] = __Pyx_ArgRef_FASTCALL(__pyx_args, 21);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[21])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[21])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[22] = __Pyx_ArgRef_FASTCALL(__pyx_args, 22);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[22])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[22])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[23] = __Pyx_ArgRef_FASTCALL(__pyx_args, 23);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[23])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[23])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[24] = __Pyx_ArgRef_FASTCALL(__pyx_args, 24);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[24])) __PYX_ERR(0, 204, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[24])) __PYX_ERR(0, 231, __pyx_L3_error)
       values[25] = __Pyx_ArgRef_FASTCALL(__pyx_args, 25);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[25])) __PYX_ERR(0, 204, __pyx_L3_error)
-      values[26] = __Pyx_ArgRef_FASTCALL(__pyx_args, 26);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[26])) __PYX_ERR(0, 204, __pyx_L3_error)
-      values[27] = __Pyx_ArgRef_FASTCALL(__pyx_args, 27);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[27])) __PYX_ERR(0, 204, __pyx_L3_error)
-      values[28] = __Pyx_ArgRef_FASTCALL(__pyx_args, 28);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[28])) __PYX_ERR(0, 204, __pyx_L3_error)
-    }
-    __pyx_v_o = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(values[0], 0); if (unlikely(!__pyx_v_o.memview)) __PYX_ERR(0, 207, __pyx_L3_error)
-    __pyx_v_h = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(values[1], 0); if (unlikely(!__pyx_v_h.memview)) __PYX_ERR(0, 208, __pyx_L3_error)
-    __pyx_v_l = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(values[2], 0); if (unlikely(!__pyx_v_l.memview)) __PYX_ERR(0, 209, __pyx_L3_error)
-    __pyx_v_c = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(values[3], 0); if (unlikely(!__pyx_v_c.memview)) __PYX_ERR(0, 210, __pyx_L3_error)
-    __pyx_v_v = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(values[4], 0); if (unlikely(!__pyx_v_v.memview)) __PYX_ERR(0, 211, __pyx_L3_error)
-    __pyx_v_date_ns = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(values[5], 0); if (unlikely(!__pyx_v_date_ns.memview)) __PYX_ERR(0, 212, __pyx_L3_error)
-    __pyx_v_long_entries_shifted = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(values[6], 0); if (unlikely(!__pyx_v_long_entries_shifted.memview)) __PYX_ERR(0, 213, __pyx_L3_error)
-    __pyx_v_long_exits_shifted = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(values[7], 0); if (unlikely(!__pyx_v_long_exits_shifted.memview)) __PYX_ERR(0, 214, __pyx_L3_error)
-    __pyx_v_short_entries_shifted = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(values[8], 0); if (unlikely(!__pyx_v_short_entries_shifted.memview)) __PYX_ERR(0, 215, __pyx_L3_error)
-    __pyx_v_short_exits_shifted = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(values[9], 0); if (unlikely(!__pyx_v_short_exits_shifted.memview)) __PYX_ERR(0, 216, __pyx_L3_error)
-    __pyx_v_starting_balance = __Pyx_PyFloat_AsDouble(values[10]); if (unlikely((__pyx_v_starting_balance == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 217, __pyx_L3_error)
-    __pyx_v_sizing_method_code = __Pyx_PyLong_As_int(values[11]); if (unlikely((__pyx_v_sizing_method_code == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 218, __pyx_L3_error)
-    __pyx_v_sizing_static = __Pyx_PyFloat_AsDouble(values[12]); if (unlikely((__pyx_v_sizing_static == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 219, __pyx_L3_error)
-    __pyx_v_sizing_array = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(values[13], 0); if (unlikely(!__pyx_v_sizing_array.memview)) __PYX_ERR(0, 220, __pyx_L3_error)
-    __pyx_v_sl_arr = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(values[14], 0); if (unlikely(!__pyx_v_sl_arr.memview)) __PYX_ERR(0, 221, __pyx_L3_error)
-    __pyx_v_tp = __Pyx_PyFloat_AsDouble(values[15]); if (unlikely((__pyx_v_tp == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 222, __pyx_L3_error)
-    __pyx_v_ts = __Pyx_PyFloat_AsDouble(values[16]); if (unlikely((__pyx_v_ts == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 223, __pyx_L3_error)
-    __pyx_v_leverage = __Pyx_PyFloat_AsDouble(values[17]); if (unlikely((__pyx_v_leverage == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 224, __pyx_L3_error)
-    __pyx_v_commission = __Pyx_PyFloat_AsDouble(values[18]); if (unlikely((__pyx_v_commission == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 225, __pyx_L3_error)
-    __pyx_v_spread_arr = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(values[19], 0); if (unlikely(!__pyx_v_spread_arr.memview)) __PYX_ERR(0, 226, __pyx_L3_error)
-    __pyx_v_slippage_arr = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(values[20], 0); if (unlikely(!__pyx_v_slippage_arr.memview)) __PYX_ERR(0, 227, __pyx_L3_error)
-    __pyx_v_long_fee_vec = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(values[21], 0); if (unlikely(!__pyx_v_long_fee_vec.memview)) __PYX_ERR(0, 228, __pyx_L3_error)
-    __pyx_v_short_fee_vec = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(values[22], 0); if (unlikely(!__pyx_v_short_fee_vec.memview)) __PYX_ERR(0, 229, __pyx_L3_error)
-    __pyx_v_hedging = __Pyx_PyObject_IsTrue(values[23]); if (unlikely((__pyx_v_hedging == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 230, __pyx_L3_error)
-    __pyx_v_cash_out = __Pyx_PyObject_to_MemoryviewSlice_ds_double(values[24], PyBUF_WRITABLE); if (unlikely(!__pyx_v_cash_out.memview)) __PYX_ERR(0, 231, __pyx_L3_error)
-    __pyx_v_equity_out = __Pyx_PyObject_to_MemoryviewSlice_ds_double(values[25], PyBUF_WRITABLE); if (unlikely(!__pyx_v_equity_out.memview)) __PYX_ERR(0, 232, __pyx_L3_error)
-    __pyx_v_open_positions = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(values[26], PyBUF_WRITABLE); if (unlikely(!__pyx_v_open_positions.memview)) __PYX_ERR(0, 233, __pyx_L3_error)
-    __pyx_v_slot_active = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char(values[27], PyBUF_WRITABLE); if (unlikely(!__pyx_v_slot_active.memview)) __PYX_ERR(0, 234, __pyx_L3_error)
-    __pyx_v_closed_trades = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(values[28], PyBUF_WRITABLE); if (unlikely(!__pyx_v_closed_trades.memview)) __PYX_ERR(0, 235, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[25])) __PYX_ERR(0, 231, __pyx_L3_error)
+    }
+    __pyx_v_o = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[0], 0); if (unlikely(!__pyx_v_o.memview)) __PYX_ERR(0, 234, __pyx_L3_error)
+    __pyx_v_h = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[1], 0); if (unlikely(!__pyx_v_h.memview)) __PYX_ERR(0, 235, __pyx_L3_error)
+    __pyx_v_l = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[2], 0); if (unlikely(!__pyx_v_l.memview)) __PYX_ERR(0, 236, __pyx_L3_error)
+    __pyx_v_c = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[3], 0); if (unlikely(!__pyx_v_c.memview)) __PYX_ERR(0, 237, __pyx_L3_error)
+    __pyx_v_v = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[4], 0); if (unlikely(!__pyx_v_v.memview)) __PYX_ERR(0, 238, __pyx_L3_error)
+    __pyx_v_date_ns = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[5], 0); if (unlikely(!__pyx_v_date_ns.memview)) __PYX_ERR(0, 239, __pyx_L3_error)
+    __pyx_v_signal_flags = __Pyx_PyObject_to_MemoryviewSlice_dc_unsigned_char__const__(values[6], 0); if (unlikely(!__pyx_v_signal_flags.memview)) __PYX_ERR(0, 240, __pyx_L3_error)
+    __pyx_v_starting_balance = __Pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_starting_balance == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 241, __pyx_L3_error)
+    __pyx_v_sizing_method_code = __Pyx_PyLong_As_int(values[8]); if (unlikely((__pyx_v_sizing_method_code == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 242, __pyx_L3_error)
+    __pyx_v_sizing_static = __Pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_sizing_static == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 243, __pyx_L3_error)
+    __pyx_v_sizing_array = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[10], 0); if (unlikely(!__pyx_v_sizing_array.memview)) __PYX_ERR(0, 244, __pyx_L3_error)
+    __pyx_v_sl_arr = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[11], 0); if (unlikely(!__pyx_v_sl_arr.memview)) __PYX_ERR(0, 245, __pyx_L3_error)
+    __pyx_v_tp = __Pyx_PyFloat_AsDouble(values[12]); if (unlikely((__pyx_v_tp == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 246, __pyx_L3_error)
+    __pyx_v_ts = __Pyx_PyFloat_AsDouble(values[13]); if (unlikely((__pyx_v_ts == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 247, __pyx_L3_error)
+    __pyx_v_leverage = __Pyx_PyFloat_AsDouble(values[14]); if (unlikely((__pyx_v_leverage == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 248, __pyx_L3_error)
+    __pyx_v_commission = __Pyx_PyFloat_AsDouble(values[15]); if (unlikely((__pyx_v_commission == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 249, __pyx_L3_error)
+    __pyx_v_spread_arr = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[16], 0); if (unlikely(!__pyx_v_spread_arr.memview)) __PYX_ERR(0, 250, __pyx_L3_error)
+    __pyx_v_slippage_arr = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[17], 0); if (unlikely(!__pyx_v_slippage_arr.memview)) __PYX_ERR(0, 251, __pyx_L3_error)
+    __pyx_v_long_fee_vec = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[18], 0); if (unlikely(!__pyx_v_long_fee_vec.memview)) __PYX_ERR(0, 252, __pyx_L3_error)
+    __pyx_v_short_fee_vec = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(values[19], 0); if (unlikely(!__pyx_v_short_fee_vec.memview)) __PYX_ERR(0, 253, __pyx_L3_error)
+    __pyx_v_hedging = __Pyx_PyObject_IsTrue(values[20]); if (unlikely((__pyx_v_hedging == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 254, __pyx_L3_error)
+    __pyx_v_cash_out = __Pyx_PyObject_to_MemoryviewSlice_dc_double(values[21], PyBUF_WRITABLE); if (unlikely(!__pyx_v_cash_out.memview)) __PYX_ERR(0, 255, __pyx_L3_error)
+    __pyx_v_equity_out = __Pyx_PyObject_to_MemoryviewSlice_dc_double(values[22], PyBUF_WRITABLE); if (unlikely(!__pyx_v_equity_out.memview)) __PYX_ERR(0, 256, __pyx_L3_error)
+    __pyx_v_open_positions = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[23], PyBUF_WRITABLE); if (unlikely(!__pyx_v_open_positions.memview)) __PYX_ERR(0, 257, __pyx_L3_error)
+    __pyx_v_slot_active = __Pyx_PyObject_to_MemoryviewSlice_dc_unsigned_char(values[24], PyBUF_WRITABLE); if (unlikely(!__pyx_v_slot_active.memview)) __PYX_ERR(0, 258, __pyx_L3_error)
+    __pyx_v_closed_trades = __Pyx_PyObject_to_MemoryviewSlice_dcd__double(values[25], PyBUF_WRITABLE); if (unlikely(!__pyx_v_closed_trades.memview)) __PYX_ERR(0, 259, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("inner_loop_fast", 1, 29, 29, __pyx_nargs); __PYX_ERR(0, 204, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("inner_loop_fast", 1, 26, 26, __pyx_nargs); __PYX_ERR(0, 231, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -17560,10 +17639,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __PYX_XCLEAR_MEMVIEW(&__pyx_v_c, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_v_v, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_v_date_ns, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_long_entries_shifted, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_long_exits_shifted, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_short_entries_shifted, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_short_exits_shifted, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_signal_flags, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_v_sizing_array, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_v_sl_arr, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_v_spread_arr, 1);
@@ -17579,7 +17655,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(__pyx_self, __pyx_v_o, __pyx_v_h, __pyx_v_l, __pyx_v_c, __pyx_v_v, __pyx_v_date_ns, __pyx_v_long_entries_shifted, __pyx_v_long_exits_shifted, __pyx_v_short_entries_shifted, __pyx_v_short_exits_shifted, __pyx_v_starting_balance, __pyx_v_sizing_method_code, __pyx_v_sizing_static, __pyx_v_sizing_array, __pyx_v_sl_arr, __pyx_v_tp, __pyx_v_ts, __pyx_v_leverage, __pyx_v_commission, __pyx_v_spread_arr, __pyx_v_slippage_arr, __pyx_v_long_fee_vec, __pyx_v_short_fee_vec, __pyx_v_hedging, __pyx_v_cash_out, __pyx_v_equity_out, __pyx_v_open_positions, __pyx_v_slot_active, __pyx_v_closed_trades);
+  __pyx_r = __pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(__pyx_self, __pyx_v_o, __pyx_v_h, __pyx_v_l, __pyx_v_c, __pyx_v_v, __pyx_v_date_ns, __pyx_v_signal_flags, __pyx_v_starting_balance, __pyx_v_sizing_method_code, __pyx_v_sizing_static, __pyx_v_sizing_array, __pyx_v_sl_arr, __pyx_v_tp, __pyx_v_ts, __pyx_v_leverage, __pyx_v_commission, __pyx_v_spread_arr, __pyx_v_slippage_arr, __pyx_v_long_fee_vec, __pyx_v_short_fee_vec, __pyx_v_hedging, __pyx_v_cash_out, __pyx_v_equity_out, __pyx_v_open_positions, __pyx_v_slot_active, __pyx_v_closed_trades);
 
   /* function exit code */
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -17591,10 +17667,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __PYX_XCLEAR_MEMVIEW(&__pyx_v_c, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_v_v, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_v_date_ns, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_long_entries_shifted, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_long_exits_shifted, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_short_entries_shifted, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_short_exits_shifted, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_signal_flags, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_v_sizing_array, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_v_sl_arr, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_v_spread_arr, 1);
@@ -17610,7 +17683,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_o, __Pyx_memviewslice __pyx_v_h, __Pyx_memviewslice __pyx_v_l, __Pyx_memviewslice __pyx_v_c, CYTHON_UNUSED __Pyx_memviewslice __pyx_v_v, __Pyx_memviewslice __pyx_v_date_ns, __Pyx_memviewslice __pyx_v_long_entries_shifted, __Pyx_memviewslice __pyx_v_long_exits_shifted, __Pyx_memviewslice __pyx_v_short_entries_shifted, __Pyx_memviewslice __pyx_v_short_exits_shifted, double __pyx_v_starting_balance, int __pyx_v_sizing_method_code, double __pyx_v_sizing_static, __Pyx_memviewslice __pyx_v_sizing_array, __Pyx_memviewslice __pyx_v_sl_arr, double __pyx_v_tp, double __pyx_v_ts, double __pyx_v_leverage, double __pyx_v_commission, __Pyx_memviewslice __pyx_v_spread_arr, __Pyx_memviewslice __pyx_v_slippage_arr, __Pyx_memviewslice __pyx_v_long_fee_vec, __Pyx_memviewslice __pyx_v_short_fee_vec, int __pyx_v_hedging, __Pyx_memviewslice __pyx_v_cash_out, __Pyx_memviewslice __pyx_v_equity_out, __Pyx_memviewslice __pyx_v_open_positions, __Pyx_memviewslice __pyx_v_slot_active, __Pyx_memviewslice __pyx_v_closed_trades) {
+static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_o, __Pyx_memviewslice __pyx_v_h, __Pyx_memviewslice __pyx_v_l, __Pyx_memviewslice __pyx_v_c, CYTHON_UNUSED __Pyx_memviewslice __pyx_v_v, __Pyx_memviewslice __pyx_v_date_ns, __Pyx_memviewslice __pyx_v_signal_flags, double __pyx_v_starting_balance, int __pyx_v_sizing_method_code, double __pyx_v_sizing_static, __Pyx_memviewslice __pyx_v_sizing_array, __Pyx_memviewslice __pyx_v_sl_arr, double __pyx_v_tp, double __pyx_v_ts, double __pyx_v_leverage, double __pyx_v_commission, __Pyx_memviewslice __pyx_v_spread_arr, __Pyx_memviewslice __pyx_v_slippage_arr, __Pyx_memviewslice __pyx_v_long_fee_vec, __Pyx_memviewslice __pyx_v_short_fee_vec, int __pyx_v_hedging, __Pyx_memviewslice __pyx_v_cash_out, __Pyx_memviewslice __pyx_v_equity_out, __Pyx_memviewslice __pyx_v_open_positions, __Pyx_memviewslice __pyx_v_slot_active, __Pyx_memviewslice __pyx_v_closed_trades) {
   Py_ssize_t __pyx_v_n;
   Py_ssize_t __pyx_v_n_slots;
   Py_ssize_t __pyx_v_closed_capacity;
@@ -17618,6 +17691,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
   __Pyx_memviewslice __pyx_v_overflow_flag = { 0, 0, { 0 }, { 0 }, { 0 } };
   double __pyx_v_current_cash;
   Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
   Py_ssize_t __pyx_v_k;
   Py_ssize_t __pyx_v_kk;
   Py_ssize_t __pyx_v_slot_idx;
@@ -17637,6 +17711,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
   double __pyx_v_best_px;
   double __pyx_v_worst_pnl;
   double __pyx_v_best_pnl;
+  int __pyx_v_is_long;
   int __pyx_v_exit_reason;
   double __pyx_v_exit_px;
   double __pyx_v_exit_px_net;
@@ -17668,10 +17743,12 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
   int __pyx_v_want_short_entry;
   int __pyx_v_want_long_exit;
   int __pyx_v_want_short_exit;
+  unsigned char __pyx_v_flags;
   int __pyx_v_desired_dir;
   int __pyx_v_any_active;
   __Pyx_memviewslice __pyx_v_unrealized_by_slot = { 0, 0, { 0 }, { 0 }, { 0 } };
   int __pyx_v_liquidated;
+  int __pyx_v_has_ts;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -17683,26 +17760,24 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
   __Pyx_memviewslice __pyx_t_7 = { 0, 0, { 0 }, { 0 }, { 0 } };
   PyObject *__pyx_t_8 = NULL;
   __Pyx_memviewslice __pyx_t_9 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  Py_ssize_t __pyx_t_10;
+  int __pyx_t_10;
   Py_ssize_t __pyx_t_11;
-  Py_ssize_t __pyx_t_12;
+  int __pyx_t_12;
   Py_ssize_t __pyx_t_13;
-  int __pyx_t_14;
-  int __pyx_t_15;
+  Py_ssize_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
   Py_ssize_t __pyx_t_16;
   Py_ssize_t __pyx_t_17;
   Py_ssize_t __pyx_t_18;
-  Py_ssize_t __pyx_t_19;
+  double __pyx_t_19;
   Py_ssize_t __pyx_t_20;
-  Py_ssize_t __pyx_t_21;
-  Py_ssize_t __pyx_t_22;
-  int __pyx_t_23;
+  int __pyx_t_21;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("inner_loop_fast", 0);
 
-  /* "chronoton/_cy_inner.pyx":243
+  /* "chronoton/_cy_inner.pyx":267
  *     (n_closed == -1) so caller can raise.
  *     """
  *     cdef Py_ssize_t n = o.shape[0]             # <<<<<<<<<<<<<<
@@ -17711,7 +17786,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
   __pyx_v_n = (__pyx_v_o.shape[0]);
 
-  /* "chronoton/_cy_inner.pyx":244
+  /* "chronoton/_cy_inner.pyx":268
  *     """
  *     cdef Py_ssize_t n = o.shape[0]
  *     cdef Py_ssize_t n_slots = open_positions.shape[0]             # <<<<<<<<<<<<<<
@@ -17720,40 +17795,40 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
   __pyx_v_n_slots = (__pyx_v_open_positions.shape[0]);
 
-  /* "chronoton/_cy_inner.pyx":245
+  /* "chronoton/_cy_inner.pyx":269
  *     cdef Py_ssize_t n = o.shape[0]
  *     cdef Py_ssize_t n_slots = open_positions.shape[0]
  *     cdef Py_ssize_t closed_capacity = closed_trades.shape[0]             # <<<<<<<<<<<<<<
  *     cdef Py_ssize_t n_closed = 0
- *     cdef int[:] overflow_flag = np.zeros(1, dtype=np.intc)
+ *     cdef int[::1] overflow_flag = np.zeros(1, dtype=np.intc)
 */
   __pyx_v_closed_capacity = (__pyx_v_closed_trades.shape[0]);
 
-  /* "chronoton/_cy_inner.pyx":246
+  /* "chronoton/_cy_inner.pyx":270
  *     cdef Py_ssize_t n_slots = open_positions.shape[0]
  *     cdef Py_ssize_t closed_capacity = closed_trades.shape[0]
  *     cdef Py_ssize_t n_closed = 0             # <<<<<<<<<<<<<<
- *     cdef int[:] overflow_flag = np.zeros(1, dtype=np.intc)
+ *     cdef int[::1] overflow_flag = np.zeros(1, dtype=np.intc)
  * 
 */
   __pyx_v_n_closed = 0;
 
-  /* "chronoton/_cy_inner.pyx":247
+  /* "chronoton/_cy_inner.pyx":271
  *     cdef Py_ssize_t closed_capacity = closed_trades.shape[0]
  *     cdef Py_ssize_t n_closed = 0
- *     cdef int[:] overflow_flag = np.zeros(1, dtype=np.intc)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] overflow_flag = np.zeros(1, dtype=np.intc)             # <<<<<<<<<<<<<<
  * 
  *     cdef double current_cash = starting_balance
 */
   __pyx_t_2 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 271, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 271, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 271, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_intc); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_intc); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 271, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_6 = 1;
@@ -17770,50 +17845,50 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
   #endif
   {
     PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_mstate_global->__pyx_int_1};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 247, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 271, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_5, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 247, __pyx_L1_error)
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_5, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 271, __pyx_L1_error)
     __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 247, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 271, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
-  __pyx_t_7 = __Pyx_PyObject_to_MemoryviewSlice_ds_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_7.memview)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_7.memview)) __PYX_ERR(0, 271, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_overflow_flag = __pyx_t_7;
   __pyx_t_7.memview = NULL;
   __pyx_t_7.data = NULL;
 
-  /* "chronoton/_cy_inner.pyx":249
- *     cdef int[:] overflow_flag = np.zeros(1, dtype=np.intc)
+  /* "chronoton/_cy_inner.pyx":273
+ *     cdef int[::1] overflow_flag = np.zeros(1, dtype=np.intc)
  * 
  *     cdef double current_cash = starting_balance             # <<<<<<<<<<<<<<
  * 
- *     cdef Py_ssize_t i, k, kk, slot_idx
+ *     cdef Py_ssize_t i, j, k, kk, slot_idx
 */
   __pyx_v_current_cash = __pyx_v_starting_balance;
 
-  /* "chronoton/_cy_inner.pyx":273
+  /* "chronoton/_cy_inner.pyx":299
  *     # Per-liquidation scratch: unrealised per slot.
  *     # Allocated here so it can be reused without touching Python in the loop.
- *     cdef double[:] unrealized_by_slot = np.zeros(n_slots, dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     cdef double[::1] unrealized_by_slot = np.zeros(n_slots, dtype=np.float64)             # <<<<<<<<<<<<<<
  * 
  *     cdef bint liquidated = 0
 */
   __pyx_t_4 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 273, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 299, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 273, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 299, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyLong_FromSsize_t(__pyx_v_n_slots); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 273, __pyx_L1_error)
+  __pyx_t_3 = PyLong_FromSsize_t(__pyx_v_n_slots); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 299, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 273, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 299, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 273, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 299, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_6 = 1;
@@ -17830,39 +17905,48 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
   #endif
   {
     PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_4, __pyx_t_3};
-    __pyx_t_2 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 273, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 299, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_8, __pyx_t_2, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 273, __pyx_L1_error)
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_8, __pyx_t_2, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 299, __pyx_L1_error)
     __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_5, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_2);
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 273, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 299, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
-  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 273, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 299, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_unrealized_by_slot = __pyx_t_9;
   __pyx_t_9.memview = NULL;
   __pyx_t_9.data = NULL;
 
-  /* "chronoton/_cy_inner.pyx":275
- *     cdef double[:] unrealized_by_slot = np.zeros(n_slots, dtype=np.float64)
+  /* "chronoton/_cy_inner.pyx":301
+ *     cdef double[::1] unrealized_by_slot = np.zeros(n_slots, dtype=np.float64)
  * 
  *     cdef bint liquidated = 0             # <<<<<<<<<<<<<<
  * 
- *     with nogil:
+ *     # TS is one scalar, so whether slots carry a trailing stop is fixed for
 */
   __pyx_v_liquidated = 0;
 
-  /* "chronoton/_cy_inner.pyx":277
- *     cdef bint liquidated = 0
+  /* "chronoton/_cy_inner.pyx":305
+ *     # TS is one scalar, so whether slots carry a trailing stop is fixed for
+ *     # the whole run; test it once instead of isnan() per slot per bar.
+ *     cdef bint has_ts = not isnan(ts)             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+*/
+  __pyx_v_has_ts = (!isnan(__pyx_v_ts));
+
+  /* "chronoton/_cy_inner.pyx":307
+ *     cdef bint has_ts = not isnan(ts)
  * 
  *     with nogil:             # <<<<<<<<<<<<<<
- *         for i in range(n):
- *             price_o = o[i]
+ *         i = 0
+ *         while i < n:
 */
   {
       PyThreadState * _save;
@@ -17870,121 +17954,269 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
       __Pyx_FastGIL_Remember();
       /*try:*/ {
 
-        /* "chronoton/_cy_inner.pyx":278
+        /* "chronoton/_cy_inner.pyx":308
  * 
  *     with nogil:
- *         for i in range(n):             # <<<<<<<<<<<<<<
- *             price_o = o[i]
- *             price_h = h[i]
+ *         i = 0             # <<<<<<<<<<<<<<
+ *         while i < n:
+ *             # Flat fast-forward: with no open slot and no signal a bar
 */
-        __pyx_t_10 = __pyx_v_n;
-        __pyx_t_11 = __pyx_t_10;
-        for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
-          __pyx_v_i = __pyx_t_12;
+        __pyx_v_i = 0;
 
-          /* "chronoton/_cy_inner.pyx":279
+        /* "chronoton/_cy_inner.pyx":309
  *     with nogil:
- *         for i in range(n):
+ *         i = 0
+ *         while i < n:             # <<<<<<<<<<<<<<
+ *             # Flat fast-forward: with no open slot and no signal a bar
+ *             # changes nothing, so equity is just cash. Jump to the next bar
+*/
+        while (1) {
+          __pyx_t_10 = (__pyx_v_i < __pyx_v_n);
+          if (!__pyx_t_10) break;
+
+          /* "chronoton/_cy_inner.pyx":314
+ *             # carrying a signal and fill the gap in one pass. (Non-positive
+ *             # cash takes the normal path so liquidation still fires.)
+ *             if (signal_flags[i] == 0 and current_cash > 0.0             # <<<<<<<<<<<<<<
+ *                     and _no_open_slots(slot_active, n_slots)):
+ *                 j = i + 1
+*/
+          __pyx_t_11 = __pyx_v_i;
+          __pyx_t_12 = ((*((unsigned char const  *) ( /* dim=0 */ ((char *) (((unsigned char const  *) __pyx_v_signal_flags.data) + __pyx_t_11)) ))) == 0);
+          if (__pyx_t_12) {
+          } else {
+            __pyx_t_10 = __pyx_t_12;
+            goto __pyx_L9_bool_binop_done;
+          }
+
+          /* "chronoton/_cy_inner.pyx":315
+ *             # cash takes the normal path so liquidation still fires.)
+ *             if (signal_flags[i] == 0 and current_cash > 0.0
+ *                     and _no_open_slots(slot_active, n_slots)):             # <<<<<<<<<<<<<<
+ *                 j = i + 1
+ *                 while j < n and signal_flags[j] == 0:
+*/
+          __pyx_t_12 = (__pyx_v_current_cash > 0.0);
+          if (__pyx_t_12) {
+          } else {
+            __pyx_t_10 = __pyx_t_12;
+            goto __pyx_L9_bool_binop_done;
+          }
+          __pyx_t_12 = __pyx_f_9chronoton_9_cy_inner__no_open_slots(__pyx_v_slot_active, __pyx_v_n_slots); if (unlikely(__pyx_t_12 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 315, __pyx_L4_error)
+          __pyx_t_10 = __pyx_t_12;
+          __pyx_L9_bool_binop_done:;
+
+          /* "chronoton/_cy_inner.pyx":314
+ *             # carrying a signal and fill the gap in one pass. (Non-positive
+ *             # cash takes the normal path so liquidation still fires.)
+ *             if (signal_flags[i] == 0 and current_cash > 0.0             # <<<<<<<<<<<<<<
+ *                     and _no_open_slots(slot_active, n_slots)):
+ *                 j = i + 1
+*/
+          if (__pyx_t_10) {
+
+            /* "chronoton/_cy_inner.pyx":316
+ *             if (signal_flags[i] == 0 and current_cash > 0.0
+ *                     and _no_open_slots(slot_active, n_slots)):
+ *                 j = i + 1             # <<<<<<<<<<<<<<
+ *                 while j < n and signal_flags[j] == 0:
+ *                     j += 1
+*/
+            __pyx_v_j = (__pyx_v_i + 1);
+
+            /* "chronoton/_cy_inner.pyx":317
+ *                     and _no_open_slots(slot_active, n_slots)):
+ *                 j = i + 1
+ *                 while j < n and signal_flags[j] == 0:             # <<<<<<<<<<<<<<
+ *                     j += 1
+ *                 for kk in range(i, j):
+*/
+            while (1) {
+              __pyx_t_12 = (__pyx_v_j < __pyx_v_n);
+              if (__pyx_t_12) {
+              } else {
+                __pyx_t_10 = __pyx_t_12;
+                goto __pyx_L14_bool_binop_done;
+              }
+              __pyx_t_11 = __pyx_v_j;
+              __pyx_t_12 = ((*((unsigned char const  *) ( /* dim=0 */ ((char *) (((unsigned char const  *) __pyx_v_signal_flags.data) + __pyx_t_11)) ))) == 0);
+              __pyx_t_10 = __pyx_t_12;
+              __pyx_L14_bool_binop_done:;
+              if (!__pyx_t_10) break;
+
+              /* "chronoton/_cy_inner.pyx":318
+ *                 j = i + 1
+ *                 while j < n and signal_flags[j] == 0:
+ *                     j += 1             # <<<<<<<<<<<<<<
+ *                 for kk in range(i, j):
+ *                     cash_out[kk] = current_cash
+*/
+              __pyx_v_j = (__pyx_v_j + 1);
+            }
+
+            /* "chronoton/_cy_inner.pyx":319
+ *                 while j < n and signal_flags[j] == 0:
+ *                     j += 1
+ *                 for kk in range(i, j):             # <<<<<<<<<<<<<<
+ *                     cash_out[kk] = current_cash
+ *                     equity_out[kk] = current_cash
+*/
+            __pyx_t_13 = __pyx_v_j;
+            __pyx_t_14 = __pyx_t_13;
+            for (__pyx_t_15 = __pyx_v_i; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+              __pyx_v_kk = __pyx_t_15;
+
+              /* "chronoton/_cy_inner.pyx":320
+ *                     j += 1
+ *                 for kk in range(i, j):
+ *                     cash_out[kk] = current_cash             # <<<<<<<<<<<<<<
+ *                     equity_out[kk] = current_cash
+ *                 i = j
+*/
+              __pyx_t_11 = __pyx_v_kk;
+              *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_cash_out.data) + __pyx_t_11)) )) = __pyx_v_current_cash;
+
+              /* "chronoton/_cy_inner.pyx":321
+ *                 for kk in range(i, j):
+ *                     cash_out[kk] = current_cash
+ *                     equity_out[kk] = current_cash             # <<<<<<<<<<<<<<
+ *                 i = j
+ *                 continue
+*/
+              __pyx_t_11 = __pyx_v_kk;
+              *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_equity_out.data) + __pyx_t_11)) )) = __pyx_v_current_cash;
+            }
+
+            /* "chronoton/_cy_inner.pyx":322
+ *                     cash_out[kk] = current_cash
+ *                     equity_out[kk] = current_cash
+ *                 i = j             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+*/
+            __pyx_v_i = __pyx_v_j;
+
+            /* "chronoton/_cy_inner.pyx":323
+ *                     equity_out[kk] = current_cash
+ *                 i = j
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             price_o = o[i]
+*/
+            goto __pyx_L6_continue;
+
+            /* "chronoton/_cy_inner.pyx":314
+ *             # carrying a signal and fill the gap in one pass. (Non-positive
+ *             # cash takes the normal path so liquidation still fires.)
+ *             if (signal_flags[i] == 0 and current_cash > 0.0             # <<<<<<<<<<<<<<
+ *                     and _no_open_slots(slot_active, n_slots)):
+ *                 j = i + 1
+*/
+          }
+
+          /* "chronoton/_cy_inner.pyx":325
+ *                 continue
+ * 
  *             price_o = o[i]             # <<<<<<<<<<<<<<
  *             price_h = h[i]
  *             price_l = l[i]
 */
-          __pyx_t_13 = __pyx_v_i;
-          __pyx_v_price_o = (*((double const  *) ( /* dim=0 */ (__pyx_v_o.data + __pyx_t_13 * __pyx_v_o.strides[0]) )));
+          __pyx_t_11 = __pyx_v_i;
+          __pyx_v_price_o = (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_o.data) + __pyx_t_11)) )));
 
-          /* "chronoton/_cy_inner.pyx":280
- *         for i in range(n):
+          /* "chronoton/_cy_inner.pyx":326
+ * 
  *             price_o = o[i]
  *             price_h = h[i]             # <<<<<<<<<<<<<<
  *             price_l = l[i]
  *             price_c = c[i]
 */
-          __pyx_t_13 = __pyx_v_i;
-          __pyx_v_price_h = (*((double const  *) ( /* dim=0 */ (__pyx_v_h.data + __pyx_t_13 * __pyx_v_h.strides[0]) )));
+          __pyx_t_11 = __pyx_v_i;
+          __pyx_v_price_h = (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_h.data) + __pyx_t_11)) )));
 
-          /* "chronoton/_cy_inner.pyx":281
+          /* "chronoton/_cy_inner.pyx":327
  *             price_o = o[i]
  *             price_h = h[i]
  *             price_l = l[i]             # <<<<<<<<<<<<<<
  *             price_c = c[i]
  *             t_ns = date_ns[i]
 */
-          __pyx_t_13 = __pyx_v_i;
-          __pyx_v_price_l = (*((double const  *) ( /* dim=0 */ (__pyx_v_l.data + __pyx_t_13 * __pyx_v_l.strides[0]) )));
+          __pyx_t_11 = __pyx_v_i;
+          __pyx_v_price_l = (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_l.data) + __pyx_t_11)) )));
 
-          /* "chronoton/_cy_inner.pyx":282
+          /* "chronoton/_cy_inner.pyx":328
  *             price_h = h[i]
  *             price_l = l[i]
  *             price_c = c[i]             # <<<<<<<<<<<<<<
  *             t_ns = date_ns[i]
  * 
 */
-          __pyx_t_13 = __pyx_v_i;
-          __pyx_v_price_c = (*((double const  *) ( /* dim=0 */ (__pyx_v_c.data + __pyx_t_13 * __pyx_v_c.strides[0]) )));
+          __pyx_t_11 = __pyx_v_i;
+          __pyx_v_price_c = (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_c.data) + __pyx_t_11)) )));
 
-          /* "chronoton/_cy_inner.pyx":283
+          /* "chronoton/_cy_inner.pyx":329
  *             price_l = l[i]
  *             price_c = c[i]
  *             t_ns = date_ns[i]             # <<<<<<<<<<<<<<
  * 
  *             # (1) Overnight financing ------------------------------------
 */
-          __pyx_t_13 = __pyx_v_i;
-          __pyx_v_t_ns = (*((double const  *) ( /* dim=0 */ (__pyx_v_date_ns.data + __pyx_t_13 * __pyx_v_date_ns.strides[0]) )));
+          __pyx_t_11 = __pyx_v_i;
+          __pyx_v_t_ns = (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_date_ns.data) + __pyx_t_11)) )));
 
-          /* "chronoton/_cy_inner.pyx":286
+          /* "chronoton/_cy_inner.pyx":332
  * 
  *             # (1) Overnight financing ------------------------------------
  *             if long_fee_vec[i] != 0.0 or short_fee_vec[i] != 0.0:             # <<<<<<<<<<<<<<
  *                 for k in range(n_slots):
  *                     if slot_active[k] == 0:
 */
-          __pyx_t_13 = __pyx_v_i;
-          __pyx_t_15 = ((*((double const  *) ( /* dim=0 */ (__pyx_v_long_fee_vec.data + __pyx_t_13 * __pyx_v_long_fee_vec.strides[0]) ))) != 0.0);
-          if (!__pyx_t_15) {
+          __pyx_t_11 = __pyx_v_i;
+          __pyx_t_12 = ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_long_fee_vec.data) + __pyx_t_11)) ))) != 0.0);
+          if (!__pyx_t_12) {
           } else {
-            __pyx_t_14 = __pyx_t_15;
-            goto __pyx_L9_bool_binop_done;
+            __pyx_t_10 = __pyx_t_12;
+            goto __pyx_L19_bool_binop_done;
           }
-          __pyx_t_13 = __pyx_v_i;
-          __pyx_t_15 = ((*((double const  *) ( /* dim=0 */ (__pyx_v_short_fee_vec.data + __pyx_t_13 * __pyx_v_short_fee_vec.strides[0]) ))) != 0.0);
-          __pyx_t_14 = __pyx_t_15;
-          __pyx_L9_bool_binop_done:;
-          if (__pyx_t_14) {
+          __pyx_t_11 = __pyx_v_i;
+          __pyx_t_12 = ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_short_fee_vec.data) + __pyx_t_11)) ))) != 0.0);
+          __pyx_t_10 = __pyx_t_12;
+          __pyx_L19_bool_binop_done:;
+          if (__pyx_t_10) {
 
-            /* "chronoton/_cy_inner.pyx":287
+            /* "chronoton/_cy_inner.pyx":333
  *             # (1) Overnight financing ------------------------------------
  *             if long_fee_vec[i] != 0.0 or short_fee_vec[i] != 0.0:
  *                 for k in range(n_slots):             # <<<<<<<<<<<<<<
  *                     if slot_active[k] == 0:
  *                         continue
 */
-            __pyx_t_16 = __pyx_v_n_slots;
-            __pyx_t_17 = __pyx_t_16;
-            for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
-              __pyx_v_k = __pyx_t_18;
+            __pyx_t_13 = __pyx_v_n_slots;
+            __pyx_t_14 = __pyx_t_13;
+            for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+              __pyx_v_k = __pyx_t_15;
 
-              /* "chronoton/_cy_inner.pyx":288
+              /* "chronoton/_cy_inner.pyx":334
  *             if long_fee_vec[i] != 0.0 or short_fee_vec[i] != 0.0:
  *                 for k in range(n_slots):
  *                     if slot_active[k] == 0:             # <<<<<<<<<<<<<<
  *                         continue
  *                     notional = (open_positions[k, F_SIZE]
 */
-              __pyx_t_13 = __pyx_v_k;
-              __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_13 * __pyx_v_slot_active.strides[0]) ))) == 0);
-              if (__pyx_t_14) {
+              __pyx_t_11 = __pyx_v_k;
+              __pyx_t_10 = ((*((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_11)) ))) == 0);
+              if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":289
+                /* "chronoton/_cy_inner.pyx":335
  *                 for k in range(n_slots):
  *                     if slot_active[k] == 0:
  *                         continue             # <<<<<<<<<<<<<<
  *                     notional = (open_positions[k, F_SIZE]
  *                                 * open_positions[k, F_ENTRY_PRICE])
 */
-                goto __pyx_L11_continue;
+                goto __pyx_L21_continue;
 
-                /* "chronoton/_cy_inner.pyx":288
+                /* "chronoton/_cy_inner.pyx":334
  *             if long_fee_vec[i] != 0.0 or short_fee_vec[i] != 0.0:
  *                 for k in range(n_slots):
  *                     if slot_active[k] == 0:             # <<<<<<<<<<<<<<
@@ -17993,60 +18225,60 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
               }
 
-              /* "chronoton/_cy_inner.pyx":290
+              /* "chronoton/_cy_inner.pyx":336
  *                     if slot_active[k] == 0:
  *                         continue
  *                     notional = (open_positions[k, F_SIZE]             # <<<<<<<<<<<<<<
  *                                 * open_positions[k, F_ENTRY_PRICE])
  *                     if open_positions[k, F_DIRECTION] > 0:
 */
-              __pyx_t_13 = __pyx_v_k;
-              __pyx_t_19 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
+              __pyx_t_11 = __pyx_v_k;
+              __pyx_t_16 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
 
-              /* "chronoton/_cy_inner.pyx":291
+              /* "chronoton/_cy_inner.pyx":337
  *                         continue
  *                     notional = (open_positions[k, F_SIZE]
  *                                 * open_positions[k, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
  *                     if open_positions[k, F_DIRECTION] > 0:
  *                         charge = long_fee_vec[i] * notional
 */
-              __pyx_t_20 = __pyx_v_k;
-              __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
-              __pyx_v_notional = ((*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_13 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_19 * __pyx_v_open_positions.strides[1]) ))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) ))));
+              __pyx_t_17 = __pyx_v_k;
+              __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
+              __pyx_v_notional = ((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_11 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_16)) ))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) ))));
 
-              /* "chronoton/_cy_inner.pyx":292
+              /* "chronoton/_cy_inner.pyx":338
  *                     notional = (open_positions[k, F_SIZE]
  *                                 * open_positions[k, F_ENTRY_PRICE])
  *                     if open_positions[k, F_DIRECTION] > 0:             # <<<<<<<<<<<<<<
  *                         charge = long_fee_vec[i] * notional
  *                     else:
 */
-              __pyx_t_21 = __pyx_v_k;
-              __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
-              __pyx_t_14 = ((*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) ))) > 0.0);
-              if (__pyx_t_14) {
+              __pyx_t_18 = __pyx_v_k;
+              __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
+              __pyx_t_10 = ((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) ))) > 0.0);
+              if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":293
+                /* "chronoton/_cy_inner.pyx":339
  *                                 * open_positions[k, F_ENTRY_PRICE])
  *                     if open_positions[k, F_DIRECTION] > 0:
  *                         charge = long_fee_vec[i] * notional             # <<<<<<<<<<<<<<
  *                     else:
  *                         charge = short_fee_vec[i] * notional
 */
-                __pyx_t_20 = __pyx_v_i;
-                __pyx_v_charge = ((*((double const  *) ( /* dim=0 */ (__pyx_v_long_fee_vec.data + __pyx_t_20 * __pyx_v_long_fee_vec.strides[0]) ))) * __pyx_v_notional);
+                __pyx_t_17 = __pyx_v_i;
+                __pyx_v_charge = ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_long_fee_vec.data) + __pyx_t_17)) ))) * __pyx_v_notional);
 
-                /* "chronoton/_cy_inner.pyx":292
+                /* "chronoton/_cy_inner.pyx":338
  *                     notional = (open_positions[k, F_SIZE]
  *                                 * open_positions[k, F_ENTRY_PRICE])
  *                     if open_positions[k, F_DIRECTION] > 0:             # <<<<<<<<<<<<<<
  *                         charge = long_fee_vec[i] * notional
  *                     else:
 */
-                goto __pyx_L14;
+                goto __pyx_L24;
               }
 
-              /* "chronoton/_cy_inner.pyx":295
+              /* "chronoton/_cy_inner.pyx":341
  *                         charge = long_fee_vec[i] * notional
  *                     else:
  *                         charge = short_fee_vec[i] * notional             # <<<<<<<<<<<<<<
@@ -18054,23 +18286,23 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
  *                     current_cash -= charge
 */
               /*else*/ {
-                __pyx_t_20 = __pyx_v_i;
-                __pyx_v_charge = ((*((double const  *) ( /* dim=0 */ (__pyx_v_short_fee_vec.data + __pyx_t_20 * __pyx_v_short_fee_vec.strides[0]) ))) * __pyx_v_notional);
+                __pyx_t_17 = __pyx_v_i;
+                __pyx_v_charge = ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_short_fee_vec.data) + __pyx_t_17)) ))) * __pyx_v_notional);
               }
-              __pyx_L14:;
+              __pyx_L24:;
 
-              /* "chronoton/_cy_inner.pyx":296
+              /* "chronoton/_cy_inner.pyx":342
  *                     else:
  *                         charge = short_fee_vec[i] * notional
  *                     open_positions[k, F_OVERNIGHT] += charge             # <<<<<<<<<<<<<<
  *                     current_cash -= charge
  * 
 */
-              __pyx_t_20 = __pyx_v_k;
-              __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_OVERNIGHT;
-              *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) )) += __pyx_v_charge;
+              __pyx_t_17 = __pyx_v_k;
+              __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_OVERNIGHT;
+              *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) )) += __pyx_v_charge;
 
-              /* "chronoton/_cy_inner.pyx":297
+              /* "chronoton/_cy_inner.pyx":343
  *                         charge = short_fee_vec[i] * notional
  *                     open_positions[k, F_OVERNIGHT] += charge
  *                     current_cash -= charge             # <<<<<<<<<<<<<<
@@ -18078,10 +18310,10 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
  *             # (2) TS peaks, MAE/MFE, SL/TP/TS checks ---------------------
 */
               __pyx_v_current_cash = (__pyx_v_current_cash - __pyx_v_charge);
-              __pyx_L11_continue:;
+              __pyx_L21_continue:;
             }
 
-            /* "chronoton/_cy_inner.pyx":286
+            /* "chronoton/_cy_inner.pyx":332
  * 
  *             # (1) Overnight financing ------------------------------------
  *             if long_fee_vec[i] != 0.0 or short_fee_vec[i] != 0.0:             # <<<<<<<<<<<<<<
@@ -18090,39 +18322,39 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
           }
 
-          /* "chronoton/_cy_inner.pyx":300
+          /* "chronoton/_cy_inner.pyx":346
  * 
  *             # (2) TS peaks, MAE/MFE, SL/TP/TS checks ---------------------
  *             for k in range(n_slots):             # <<<<<<<<<<<<<<
  *                 if slot_active[k] == 0:
  *                     continue
 */
-          __pyx_t_16 = __pyx_v_n_slots;
-          __pyx_t_17 = __pyx_t_16;
-          for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
-            __pyx_v_k = __pyx_t_18;
+          __pyx_t_13 = __pyx_v_n_slots;
+          __pyx_t_14 = __pyx_t_13;
+          for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+            __pyx_v_k = __pyx_t_15;
 
-            /* "chronoton/_cy_inner.pyx":301
+            /* "chronoton/_cy_inner.pyx":347
  *             # (2) TS peaks, MAE/MFE, SL/TP/TS checks ---------------------
  *             for k in range(n_slots):
  *                 if slot_active[k] == 0:             # <<<<<<<<<<<<<<
  *                     continue
  *                 direction = open_positions[k, F_DIRECTION]
 */
-            __pyx_t_21 = __pyx_v_k;
-            __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_21 * __pyx_v_slot_active.strides[0]) ))) == 0);
-            if (__pyx_t_14) {
+            __pyx_t_18 = __pyx_v_k;
+            __pyx_t_10 = ((*((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_18)) ))) == 0);
+            if (__pyx_t_10) {
 
-              /* "chronoton/_cy_inner.pyx":302
+              /* "chronoton/_cy_inner.pyx":348
  *             for k in range(n_slots):
  *                 if slot_active[k] == 0:
  *                     continue             # <<<<<<<<<<<<<<
  *                 direction = open_positions[k, F_DIRECTION]
  *                 entry_px = open_positions[k, F_ENTRY_PRICE]
 */
-              goto __pyx_L15_continue;
+              goto __pyx_L25_continue;
 
-              /* "chronoton/_cy_inner.pyx":301
+              /* "chronoton/_cy_inner.pyx":347
  *             # (2) TS peaks, MAE/MFE, SL/TP/TS checks ---------------------
  *             for k in range(n_slots):
  *                 if slot_active[k] == 0:             # <<<<<<<<<<<<<<
@@ -18131,746 +18363,377 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
             }
 
-            /* "chronoton/_cy_inner.pyx":303
+            /* "chronoton/_cy_inner.pyx":349
  *                 if slot_active[k] == 0:
  *                     continue
  *                 direction = open_positions[k, F_DIRECTION]             # <<<<<<<<<<<<<<
  *                 entry_px = open_positions[k, F_ENTRY_PRICE]
  *                 size = open_positions[k, F_SIZE]
 */
-            __pyx_t_21 = __pyx_v_k;
-            __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
-            __pyx_v_direction = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) )));
+            __pyx_t_18 = __pyx_v_k;
+            __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
+            __pyx_v_direction = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) )));
 
-            /* "chronoton/_cy_inner.pyx":304
+            /* "chronoton/_cy_inner.pyx":350
  *                     continue
  *                 direction = open_positions[k, F_DIRECTION]
  *                 entry_px = open_positions[k, F_ENTRY_PRICE]             # <<<<<<<<<<<<<<
  *                 size = open_positions[k, F_SIZE]
  * 
 */
-            __pyx_t_20 = __pyx_v_k;
-            __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
-            __pyx_v_entry_px = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) )));
+            __pyx_t_17 = __pyx_v_k;
+            __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
+            __pyx_v_entry_px = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) )));
 
-            /* "chronoton/_cy_inner.pyx":305
+            /* "chronoton/_cy_inner.pyx":351
  *                 direction = open_positions[k, F_DIRECTION]
  *                 entry_px = open_positions[k, F_ENTRY_PRICE]
  *                 size = open_positions[k, F_SIZE]             # <<<<<<<<<<<<<<
  * 
- *                 # Update trailing-stop peak
-*/
-            __pyx_t_21 = __pyx_v_k;
-            __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
-            __pyx_v_size = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) )));
-
-            /* "chronoton/_cy_inner.pyx":308
- * 
- *                 # Update trailing-stop peak
- *                 ts_dist = open_positions[k, F_TS_DIST]             # <<<<<<<<<<<<<<
- *                 if not isnan(ts_dist):
- *                     if direction > 0 and price_h > open_positions[k, F_TS_PEAK]:
-*/
-            __pyx_t_20 = __pyx_v_k;
-            __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_TS_DIST;
-            __pyx_v_ts_dist = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) )));
-
-            /* "chronoton/_cy_inner.pyx":309
- *                 # Update trailing-stop peak
- *                 ts_dist = open_positions[k, F_TS_DIST]
- *                 if not isnan(ts_dist):             # <<<<<<<<<<<<<<
- *                     if direction > 0 and price_h > open_positions[k, F_TS_PEAK]:
- *                         open_positions[k, F_TS_PEAK] = price_h
+ *                 # Favourable / adverse extreme of this bar for the slot's side.
 */
-            __pyx_t_14 = (!isnan(__pyx_v_ts_dist));
-            if (__pyx_t_14) {
+            __pyx_t_18 = __pyx_v_k;
+            __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
+            __pyx_v_size = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) )));
 
-              /* "chronoton/_cy_inner.pyx":310
- *                 ts_dist = open_positions[k, F_TS_DIST]
- *                 if not isnan(ts_dist):
- *                     if direction > 0 and price_h > open_positions[k, F_TS_PEAK]:             # <<<<<<<<<<<<<<
- *                         open_positions[k, F_TS_PEAK] = price_h
- *                     elif direction < 0 and price_l < open_positions[k, F_TS_PEAK]:
-*/
-              __pyx_t_15 = (__pyx_v_direction > 0.0);
-              if (__pyx_t_15) {
-              } else {
-                __pyx_t_14 = __pyx_t_15;
-                goto __pyx_L20_bool_binop_done;
-              }
-              __pyx_t_21 = __pyx_v_k;
-              __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_TS_PEAK;
-              __pyx_t_15 = (__pyx_v_price_h > (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) ))));
-              __pyx_t_14 = __pyx_t_15;
-              __pyx_L20_bool_binop_done:;
-              if (__pyx_t_14) {
-
-                /* "chronoton/_cy_inner.pyx":311
- *                 if not isnan(ts_dist):
- *                     if direction > 0 and price_h > open_positions[k, F_TS_PEAK]:
- *                         open_positions[k, F_TS_PEAK] = price_h             # <<<<<<<<<<<<<<
- *                     elif direction < 0 and price_l < open_positions[k, F_TS_PEAK]:
- *                         open_positions[k, F_TS_PEAK] = price_l
-*/
-                __pyx_t_20 = __pyx_v_k;
-                __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_TS_PEAK;
-                *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_price_h;
-
-                /* "chronoton/_cy_inner.pyx":310
- *                 ts_dist = open_positions[k, F_TS_DIST]
- *                 if not isnan(ts_dist):
- *                     if direction > 0 and price_h > open_positions[k, F_TS_PEAK]:             # <<<<<<<<<<<<<<
- *                         open_positions[k, F_TS_PEAK] = price_h
- *                     elif direction < 0 and price_l < open_positions[k, F_TS_PEAK]:
+            /* "chronoton/_cy_inner.pyx":357
+ *                 # direction-signed form (direction is exactly +1 or -1), so longs and
+ *                 # shorts share one path with no data-dependent side branches.
+ *                 is_long = direction > 0             # <<<<<<<<<<<<<<
+ *                 best_px = price_h if is_long else price_l
+ *                 worst_px = price_l if is_long else price_h
 */
-                goto __pyx_L19;
-              }
+            __pyx_v_is_long = (__pyx_v_direction > 0.0);
 
-              /* "chronoton/_cy_inner.pyx":312
- *                     if direction > 0 and price_h > open_positions[k, F_TS_PEAK]:
- *                         open_positions[k, F_TS_PEAK] = price_h
- *                     elif direction < 0 and price_l < open_positions[k, F_TS_PEAK]:             # <<<<<<<<<<<<<<
- *                         open_positions[k, F_TS_PEAK] = price_l
- * 
-*/
-              __pyx_t_15 = (__pyx_v_direction < 0.0);
-              if (__pyx_t_15) {
-              } else {
-                __pyx_t_14 = __pyx_t_15;
-                goto __pyx_L22_bool_binop_done;
-              }
-              __pyx_t_21 = __pyx_v_k;
-              __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_TS_PEAK;
-              __pyx_t_15 = (__pyx_v_price_l < (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) ))));
-              __pyx_t_14 = __pyx_t_15;
-              __pyx_L22_bool_binop_done:;
-              if (__pyx_t_14) {
-
-                /* "chronoton/_cy_inner.pyx":313
- *                         open_positions[k, F_TS_PEAK] = price_h
- *                     elif direction < 0 and price_l < open_positions[k, F_TS_PEAK]:
- *                         open_positions[k, F_TS_PEAK] = price_l             # <<<<<<<<<<<<<<
+            /* "chronoton/_cy_inner.pyx":358
+ *                 # shorts share one path with no data-dependent side branches.
+ *                 is_long = direction > 0
+ *                 best_px = price_h if is_long else price_l             # <<<<<<<<<<<<<<
+ *                 worst_px = price_l if is_long else price_h
  * 
- *                 # MAE/MFE
 */
-                __pyx_t_20 = __pyx_v_k;
-                __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_TS_PEAK;
-                *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_price_l;
+            if (__pyx_v_is_long) {
+              __pyx_t_19 = __pyx_v_price_h;
+            } else {
+              __pyx_t_19 = __pyx_v_price_l;
+            }
+            __pyx_v_best_px = __pyx_t_19;
 
-                /* "chronoton/_cy_inner.pyx":312
- *                     if direction > 0 and price_h > open_positions[k, F_TS_PEAK]:
- *                         open_positions[k, F_TS_PEAK] = price_h
- *                     elif direction < 0 and price_l < open_positions[k, F_TS_PEAK]:             # <<<<<<<<<<<<<<
- *                         open_positions[k, F_TS_PEAK] = price_l
+            /* "chronoton/_cy_inner.pyx":359
+ *                 is_long = direction > 0
+ *                 best_px = price_h if is_long else price_l
+ *                 worst_px = price_l if is_long else price_h             # <<<<<<<<<<<<<<
  * 
-*/
-              }
-              __pyx_L19:;
-
-              /* "chronoton/_cy_inner.pyx":309
  *                 # Update trailing-stop peak
- *                 ts_dist = open_positions[k, F_TS_DIST]
- *                 if not isnan(ts_dist):             # <<<<<<<<<<<<<<
- *                     if direction > 0 and price_h > open_positions[k, F_TS_PEAK]:
- *                         open_positions[k, F_TS_PEAK] = price_h
 */
+            if (__pyx_v_is_long) {
+              __pyx_t_19 = __pyx_v_price_l;
+            } else {
+              __pyx_t_19 = __pyx_v_price_h;
             }
+            __pyx_v_worst_px = __pyx_t_19;
 
-            /* "chronoton/_cy_inner.pyx":316
+            /* "chronoton/_cy_inner.pyx":362
  * 
- *                 # MAE/MFE
- *                 if direction > 0:             # <<<<<<<<<<<<<<
- *                     worst_px = price_l
- *                     best_px = price_h
-*/
-            __pyx_t_14 = (__pyx_v_direction > 0.0);
-            if (__pyx_t_14) {
-
-              /* "chronoton/_cy_inner.pyx":317
- *                 # MAE/MFE
- *                 if direction > 0:
- *                     worst_px = price_l             # <<<<<<<<<<<<<<
- *                     best_px = price_h
- *                 else:
+ *                 # Update trailing-stop peak
+ *                 ts_dist = open_positions[k, F_TS_DIST]             # <<<<<<<<<<<<<<
+ *                 if has_ts:
+ *                     open_positions[k, F_TS_PEAK] = direction * fmax(
 */
-              __pyx_v_worst_px = __pyx_v_price_l;
+            __pyx_t_17 = __pyx_v_k;
+            __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_TS_DIST;
+            __pyx_v_ts_dist = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) )));
 
-              /* "chronoton/_cy_inner.pyx":318
- *                 if direction > 0:
- *                     worst_px = price_l
- *                     best_px = price_h             # <<<<<<<<<<<<<<
- *                 else:
- *                     worst_px = price_h
+            /* "chronoton/_cy_inner.pyx":363
+ *                 # Update trailing-stop peak
+ *                 ts_dist = open_positions[k, F_TS_DIST]
+ *                 if has_ts:             # <<<<<<<<<<<<<<
+ *                     open_positions[k, F_TS_PEAK] = direction * fmax(
+ *                         direction * open_positions[k, F_TS_PEAK], direction * best_px)
 */
-              __pyx_v_best_px = __pyx_v_price_h;
+            if (__pyx_v_has_ts) {
 
-              /* "chronoton/_cy_inner.pyx":316
+              /* "chronoton/_cy_inner.pyx":365
+ *                 if has_ts:
+ *                     open_positions[k, F_TS_PEAK] = direction * fmax(
+ *                         direction * open_positions[k, F_TS_PEAK], direction * best_px)             # <<<<<<<<<<<<<<
  * 
  *                 # MAE/MFE
- *                 if direction > 0:             # <<<<<<<<<<<<<<
- *                     worst_px = price_l
- *                     best_px = price_h
 */
-              goto __pyx_L24;
-            }
+              __pyx_t_18 = __pyx_v_k;
+              __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_TS_PEAK;
 
-            /* "chronoton/_cy_inner.pyx":320
- *                     best_px = price_h
- *                 else:
- *                     worst_px = price_h             # <<<<<<<<<<<<<<
- *                     best_px = price_l
- *                 worst_pnl = direction * (worst_px - entry_px) * size
+              /* "chronoton/_cy_inner.pyx":364
+ *                 ts_dist = open_positions[k, F_TS_DIST]
+ *                 if has_ts:
+ *                     open_positions[k, F_TS_PEAK] = direction * fmax(             # <<<<<<<<<<<<<<
+ *                         direction * open_positions[k, F_TS_PEAK], direction * best_px)
+ * 
 */
-            /*else*/ {
-              __pyx_v_worst_px = __pyx_v_price_h;
+              __pyx_t_16 = __pyx_v_k;
+              __pyx_t_11 = __pyx_e_9chronoton_9_cy_inner_F_TS_PEAK;
+              *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_16 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_11)) )) = (__pyx_v_direction * fmax((__pyx_v_direction * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) )))), (__pyx_v_direction * __pyx_v_best_px)));
 
-              /* "chronoton/_cy_inner.pyx":321
- *                 else:
- *                     worst_px = price_h
- *                     best_px = price_l             # <<<<<<<<<<<<<<
- *                 worst_pnl = direction * (worst_px - entry_px) * size
- *                 best_pnl = direction * (best_px - entry_px) * size
+              /* "chronoton/_cy_inner.pyx":363
+ *                 # Update trailing-stop peak
+ *                 ts_dist = open_positions[k, F_TS_DIST]
+ *                 if has_ts:             # <<<<<<<<<<<<<<
+ *                     open_positions[k, F_TS_PEAK] = direction * fmax(
+ *                         direction * open_positions[k, F_TS_PEAK], direction * best_px)
 */
-              __pyx_v_best_px = __pyx_v_price_l;
             }
-            __pyx_L24:;
 
-            /* "chronoton/_cy_inner.pyx":322
- *                     worst_px = price_h
- *                     best_px = price_l
+            /* "chronoton/_cy_inner.pyx":368
+ * 
+ *                 # MAE/MFE
  *                 worst_pnl = direction * (worst_px - entry_px) * size             # <<<<<<<<<<<<<<
  *                 best_pnl = direction * (best_px - entry_px) * size
- *                 if worst_pnl < open_positions[k, F_MAE]:
+ *                 open_positions[k, F_MAE] = fmin(open_positions[k, F_MAE], worst_pnl)
 */
             __pyx_v_worst_pnl = ((__pyx_v_direction * (__pyx_v_worst_px - __pyx_v_entry_px)) * __pyx_v_size);
 
-            /* "chronoton/_cy_inner.pyx":323
- *                     best_px = price_l
+            /* "chronoton/_cy_inner.pyx":369
+ *                 # MAE/MFE
  *                 worst_pnl = direction * (worst_px - entry_px) * size
  *                 best_pnl = direction * (best_px - entry_px) * size             # <<<<<<<<<<<<<<
- *                 if worst_pnl < open_positions[k, F_MAE]:
- *                     open_positions[k, F_MAE] = worst_pnl
+ *                 open_positions[k, F_MAE] = fmin(open_positions[k, F_MAE], worst_pnl)
+ *                 open_positions[k, F_MFE] = fmax(open_positions[k, F_MFE], best_pnl)
 */
             __pyx_v_best_pnl = ((__pyx_v_direction * (__pyx_v_best_px - __pyx_v_entry_px)) * __pyx_v_size);
 
-            /* "chronoton/_cy_inner.pyx":324
- *                 worst_pnl = direction * (worst_px - entry_px) * size
- *                 best_pnl = direction * (best_px - entry_px) * size
- *                 if worst_pnl < open_positions[k, F_MAE]:             # <<<<<<<<<<<<<<
- *                     open_positions[k, F_MAE] = worst_pnl
- *                 if best_pnl > open_positions[k, F_MFE]:
-*/
-            __pyx_t_21 = __pyx_v_k;
-            __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_MAE;
-            __pyx_t_14 = (__pyx_v_worst_pnl < (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) ))));
-            if (__pyx_t_14) {
-
-              /* "chronoton/_cy_inner.pyx":325
- *                 best_pnl = direction * (best_px - entry_px) * size
- *                 if worst_pnl < open_positions[k, F_MAE]:
- *                     open_positions[k, F_MAE] = worst_pnl             # <<<<<<<<<<<<<<
- *                 if best_pnl > open_positions[k, F_MFE]:
- *                     open_positions[k, F_MFE] = best_pnl
-*/
-              __pyx_t_20 = __pyx_v_k;
-              __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_MAE;
-              *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_worst_pnl;
-
-              /* "chronoton/_cy_inner.pyx":324
+            /* "chronoton/_cy_inner.pyx":370
  *                 worst_pnl = direction * (worst_px - entry_px) * size
  *                 best_pnl = direction * (best_px - entry_px) * size
- *                 if worst_pnl < open_positions[k, F_MAE]:             # <<<<<<<<<<<<<<
- *                     open_positions[k, F_MAE] = worst_pnl
- *                 if best_pnl > open_positions[k, F_MFE]:
-*/
-            }
-
-            /* "chronoton/_cy_inner.pyx":326
- *                 if worst_pnl < open_positions[k, F_MAE]:
- *                     open_positions[k, F_MAE] = worst_pnl
- *                 if best_pnl > open_positions[k, F_MFE]:             # <<<<<<<<<<<<<<
- *                     open_positions[k, F_MFE] = best_pnl
- * 
-*/
-            __pyx_t_21 = __pyx_v_k;
-            __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_MFE;
-            __pyx_t_14 = (__pyx_v_best_pnl > (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) ))));
-            if (__pyx_t_14) {
-
-              /* "chronoton/_cy_inner.pyx":327
- *                     open_positions[k, F_MAE] = worst_pnl
- *                 if best_pnl > open_positions[k, F_MFE]:
- *                     open_positions[k, F_MFE] = best_pnl             # <<<<<<<<<<<<<<
+ *                 open_positions[k, F_MAE] = fmin(open_positions[k, F_MAE], worst_pnl)             # <<<<<<<<<<<<<<
+ *                 open_positions[k, F_MFE] = fmax(open_positions[k, F_MFE], best_pnl)
  * 
- *                 # SL / TP / TS triggers  SL has priority on tie
 */
-              __pyx_t_20 = __pyx_v_k;
-              __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_MFE;
-              *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) )) = __pyx_v_best_pnl;
+            __pyx_t_17 = __pyx_v_k;
+            __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_MAE;
+            __pyx_t_11 = __pyx_v_k;
+            __pyx_t_16 = __pyx_e_9chronoton_9_cy_inner_F_MAE;
+            *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_11 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_16)) )) = fmin((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) ))), __pyx_v_worst_pnl);
 
-              /* "chronoton/_cy_inner.pyx":326
- *                 if worst_pnl < open_positions[k, F_MAE]:
- *                     open_positions[k, F_MAE] = worst_pnl
- *                 if best_pnl > open_positions[k, F_MFE]:             # <<<<<<<<<<<<<<
- *                     open_positions[k, F_MFE] = best_pnl
+            /* "chronoton/_cy_inner.pyx":371
+ *                 best_pnl = direction * (best_px - entry_px) * size
+ *                 open_positions[k, F_MAE] = fmin(open_positions[k, F_MAE], worst_pnl)
+ *                 open_positions[k, F_MFE] = fmax(open_positions[k, F_MFE], best_pnl)             # <<<<<<<<<<<<<<
  * 
+ *                 # SL / TP / TS triggers  SL has priority on tie. An unset
 */
-            }
+            __pyx_t_18 = __pyx_v_k;
+            __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_MFE;
+            __pyx_t_16 = __pyx_v_k;
+            __pyx_t_11 = __pyx_e_9chronoton_9_cy_inner_F_MFE;
+            *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_16 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_11)) )) = fmax((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) ))), __pyx_v_best_pnl);
 
-            /* "chronoton/_cy_inner.pyx":330
- * 
- *                 # SL / TP / TS triggers  SL has priority on tie
+            /* "chronoton/_cy_inner.pyx":377
+ *                 # every ordered comparison with NaN is false, so unset levels
+ *                 # never fire without an explicit isnan() guard.
  *                 sl_px = open_positions[k, F_SL]             # <<<<<<<<<<<<<<
  *                 tp_px = open_positions[k, F_TP]
- *                 ts_trigger_px = NAN
+ *                 ts_trigger_px = open_positions[k, F_TS_PEAK] - direction * ts_dist
 */
-            __pyx_t_21 = __pyx_v_k;
-            __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_SL;
-            __pyx_v_sl_px = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) )));
+            __pyx_t_17 = __pyx_v_k;
+            __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_SL;
+            __pyx_v_sl_px = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) )));
 
-            /* "chronoton/_cy_inner.pyx":331
- *                 # SL / TP / TS triggers  SL has priority on tie
+            /* "chronoton/_cy_inner.pyx":378
+ *                 # never fire without an explicit isnan() guard.
  *                 sl_px = open_positions[k, F_SL]
  *                 tp_px = open_positions[k, F_TP]             # <<<<<<<<<<<<<<
- *                 ts_trigger_px = NAN
- *                 if not isnan(ts_dist):
+ *                 ts_trigger_px = open_positions[k, F_TS_PEAK] - direction * ts_dist
+ * 
 */
-            __pyx_t_20 = __pyx_v_k;
-            __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_TP;
-            __pyx_v_tp_px = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) )));
+            __pyx_t_18 = __pyx_v_k;
+            __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_TP;
+            __pyx_v_tp_px = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) )));
 
-            /* "chronoton/_cy_inner.pyx":332
+            /* "chronoton/_cy_inner.pyx":379
  *                 sl_px = open_positions[k, F_SL]
  *                 tp_px = open_positions[k, F_TP]
- *                 ts_trigger_px = NAN             # <<<<<<<<<<<<<<
- *                 if not isnan(ts_dist):
- *                     if direction > 0:
-*/
-            __pyx_v_ts_trigger_px = NAN;
-
-            /* "chronoton/_cy_inner.pyx":333
- *                 tp_px = open_positions[k, F_TP]
- *                 ts_trigger_px = NAN
- *                 if not isnan(ts_dist):             # <<<<<<<<<<<<<<
- *                     if direction > 0:
- *                         ts_trigger_px = open_positions[k, F_TS_PEAK] - ts_dist
-*/
-            __pyx_t_14 = (!isnan(__pyx_v_ts_dist));
-            if (__pyx_t_14) {
-
-              /* "chronoton/_cy_inner.pyx":334
- *                 ts_trigger_px = NAN
- *                 if not isnan(ts_dist):
- *                     if direction > 0:             # <<<<<<<<<<<<<<
- *                         ts_trigger_px = open_positions[k, F_TS_PEAK] - ts_dist
- *                     else:
-*/
-              __pyx_t_14 = (__pyx_v_direction > 0.0);
-              if (__pyx_t_14) {
-
-                /* "chronoton/_cy_inner.pyx":335
- *                 if not isnan(ts_dist):
- *                     if direction > 0:
- *                         ts_trigger_px = open_positions[k, F_TS_PEAK] - ts_dist             # <<<<<<<<<<<<<<
- *                     else:
- *                         ts_trigger_px = open_positions[k, F_TS_PEAK] + ts_dist
-*/
-                __pyx_t_21 = __pyx_v_k;
-                __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_TS_PEAK;
-                __pyx_v_ts_trigger_px = ((*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) ))) - __pyx_v_ts_dist);
-
-                /* "chronoton/_cy_inner.pyx":334
- *                 ts_trigger_px = NAN
- *                 if not isnan(ts_dist):
- *                     if direction > 0:             # <<<<<<<<<<<<<<
- *                         ts_trigger_px = open_positions[k, F_TS_PEAK] - ts_dist
- *                     else:
-*/
-                goto __pyx_L28;
-              }
-
-              /* "chronoton/_cy_inner.pyx":337
- *                         ts_trigger_px = open_positions[k, F_TS_PEAK] - ts_dist
- *                     else:
- *                         ts_trigger_px = open_positions[k, F_TS_PEAK] + ts_dist             # <<<<<<<<<<<<<<
+ *                 ts_trigger_px = open_positions[k, F_TS_PEAK] - direction * ts_dist             # <<<<<<<<<<<<<<
  * 
  *                 exit_reason = -1
 */
-              /*else*/ {
-                __pyx_t_20 = __pyx_v_k;
-                __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_TS_PEAK;
-                __pyx_v_ts_trigger_px = ((*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) ))) + __pyx_v_ts_dist);
-              }
-              __pyx_L28:;
-
-              /* "chronoton/_cy_inner.pyx":333
- *                 tp_px = open_positions[k, F_TP]
- *                 ts_trigger_px = NAN
- *                 if not isnan(ts_dist):             # <<<<<<<<<<<<<<
- *                     if direction > 0:
- *                         ts_trigger_px = open_positions[k, F_TS_PEAK] - ts_dist
-*/
-            }
+            __pyx_t_17 = __pyx_v_k;
+            __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_TS_PEAK;
+            __pyx_v_ts_trigger_px = ((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) ))) - (__pyx_v_direction * __pyx_v_ts_dist));
 
-            /* "chronoton/_cy_inner.pyx":339
- *                         ts_trigger_px = open_positions[k, F_TS_PEAK] + ts_dist
+            /* "chronoton/_cy_inner.pyx":381
+ *                 ts_trigger_px = open_positions[k, F_TS_PEAK] - direction * ts_dist
  * 
  *                 exit_reason = -1             # <<<<<<<<<<<<<<
  *                 exit_px = NAN
- *                 if direction > 0:
+ *                 if direction * (worst_px - sl_px) <= 0.0:
 */
             __pyx_v_exit_reason = -1;
 
-            /* "chronoton/_cy_inner.pyx":340
+            /* "chronoton/_cy_inner.pyx":382
  * 
  *                 exit_reason = -1
  *                 exit_px = NAN             # <<<<<<<<<<<<<<
- *                 if direction > 0:
- *                     if (not isnan(sl_px)) and price_l <= sl_px:
+ *                 if direction * (worst_px - sl_px) <= 0.0:
+ *                     exit_reason = EXIT_SL
 */
             __pyx_v_exit_px = NAN;
 
-            /* "chronoton/_cy_inner.pyx":341
+            /* "chronoton/_cy_inner.pyx":383
  *                 exit_reason = -1
  *                 exit_px = NAN
- *                 if direction > 0:             # <<<<<<<<<<<<<<
- *                     if (not isnan(sl_px)) and price_l <= sl_px:
- *                         exit_reason = EXIT_SL
+ *                 if direction * (worst_px - sl_px) <= 0.0:             # <<<<<<<<<<<<<<
+ *                     exit_reason = EXIT_SL
+ *                     exit_px = sl_px
 */
-            __pyx_t_14 = (__pyx_v_direction > 0.0);
-            if (__pyx_t_14) {
+            __pyx_t_10 = ((__pyx_v_direction * (__pyx_v_worst_px - __pyx_v_sl_px)) <= 0.0);
+            if (__pyx_t_10) {
 
-              /* "chronoton/_cy_inner.pyx":342
+              /* "chronoton/_cy_inner.pyx":384
  *                 exit_px = NAN
- *                 if direction > 0:
- *                     if (not isnan(sl_px)) and price_l <= sl_px:             # <<<<<<<<<<<<<<
- *                         exit_reason = EXIT_SL
- *                         exit_px = sl_px
+ *                 if direction * (worst_px - sl_px) <= 0.0:
+ *                     exit_reason = EXIT_SL             # <<<<<<<<<<<<<<
+ *                     exit_px = sl_px
+ *                 elif direction * (best_px - tp_px) >= 0.0:
 */
-              __pyx_t_15 = (!isnan(__pyx_v_sl_px));
-              if (__pyx_t_15) {
-              } else {
-                __pyx_t_14 = __pyx_t_15;
-                goto __pyx_L31_bool_binop_done;
-              }
-              __pyx_t_15 = (__pyx_v_price_l <= __pyx_v_sl_px);
-              __pyx_t_14 = __pyx_t_15;
-              __pyx_L31_bool_binop_done:;
-              if (__pyx_t_14) {
-
-                /* "chronoton/_cy_inner.pyx":343
- *                 if direction > 0:
- *                     if (not isnan(sl_px)) and price_l <= sl_px:
- *                         exit_reason = EXIT_SL             # <<<<<<<<<<<<<<
- *                         exit_px = sl_px
- *                     elif (not isnan(tp_px)) and price_h >= tp_px:
-*/
-                __pyx_v_exit_reason = __pyx_e_9chronoton_9_cy_inner_EXIT_SL;
-
-                /* "chronoton/_cy_inner.pyx":344
- *                     if (not isnan(sl_px)) and price_l <= sl_px:
- *                         exit_reason = EXIT_SL
- *                         exit_px = sl_px             # <<<<<<<<<<<<<<
- *                     elif (not isnan(tp_px)) and price_h >= tp_px:
- *                         exit_reason = EXIT_TP
-*/
-                __pyx_v_exit_px = __pyx_v_sl_px;
-
-                /* "chronoton/_cy_inner.pyx":342
- *                 exit_px = NAN
- *                 if direction > 0:
- *                     if (not isnan(sl_px)) and price_l <= sl_px:             # <<<<<<<<<<<<<<
- *                         exit_reason = EXIT_SL
- *                         exit_px = sl_px
-*/
-                goto __pyx_L30;
-              }
+              __pyx_v_exit_reason = __pyx_e_9chronoton_9_cy_inner_EXIT_SL;
 
-              /* "chronoton/_cy_inner.pyx":345
- *                         exit_reason = EXIT_SL
- *                         exit_px = sl_px
- *                     elif (not isnan(tp_px)) and price_h >= tp_px:             # <<<<<<<<<<<<<<
- *                         exit_reason = EXIT_TP
- *                         exit_px = tp_px
+              /* "chronoton/_cy_inner.pyx":385
+ *                 if direction * (worst_px - sl_px) <= 0.0:
+ *                     exit_reason = EXIT_SL
+ *                     exit_px = sl_px             # <<<<<<<<<<<<<<
+ *                 elif direction * (best_px - tp_px) >= 0.0:
+ *                     exit_reason = EXIT_TP
 */
-              __pyx_t_15 = (!isnan(__pyx_v_tp_px));
-              if (__pyx_t_15) {
-              } else {
-                __pyx_t_14 = __pyx_t_15;
-                goto __pyx_L33_bool_binop_done;
-              }
-              __pyx_t_15 = (__pyx_v_price_h >= __pyx_v_tp_px);
-              __pyx_t_14 = __pyx_t_15;
-              __pyx_L33_bool_binop_done:;
-              if (__pyx_t_14) {
-
-                /* "chronoton/_cy_inner.pyx":346
- *                         exit_px = sl_px
- *                     elif (not isnan(tp_px)) and price_h >= tp_px:
- *                         exit_reason = EXIT_TP             # <<<<<<<<<<<<<<
- *                         exit_px = tp_px
- *                     elif (not isnan(ts_trigger_px)) and price_l <= ts_trigger_px:
-*/
-                __pyx_v_exit_reason = __pyx_e_9chronoton_9_cy_inner_EXIT_TP;
-
-                /* "chronoton/_cy_inner.pyx":347
- *                     elif (not isnan(tp_px)) and price_h >= tp_px:
- *                         exit_reason = EXIT_TP
- *                         exit_px = tp_px             # <<<<<<<<<<<<<<
- *                     elif (not isnan(ts_trigger_px)) and price_l <= ts_trigger_px:
- *                         exit_reason = EXIT_TS
-*/
-                __pyx_v_exit_px = __pyx_v_tp_px;
-
-                /* "chronoton/_cy_inner.pyx":345
- *                         exit_reason = EXIT_SL
- *                         exit_px = sl_px
- *                     elif (not isnan(tp_px)) and price_h >= tp_px:             # <<<<<<<<<<<<<<
- *                         exit_reason = EXIT_TP
- *                         exit_px = tp_px
-*/
-                goto __pyx_L30;
-              }
+              __pyx_v_exit_px = __pyx_v_sl_px;
 
-              /* "chronoton/_cy_inner.pyx":348
- *                         exit_reason = EXIT_TP
- *                         exit_px = tp_px
- *                     elif (not isnan(ts_trigger_px)) and price_l <= ts_trigger_px:             # <<<<<<<<<<<<<<
- *                         exit_reason = EXIT_TS
- *                         exit_px = ts_trigger_px
-*/
-              __pyx_t_15 = (!isnan(__pyx_v_ts_trigger_px));
-              if (__pyx_t_15) {
-              } else {
-                __pyx_t_14 = __pyx_t_15;
-                goto __pyx_L35_bool_binop_done;
-              }
-              __pyx_t_15 = (__pyx_v_price_l <= __pyx_v_ts_trigger_px);
-              __pyx_t_14 = __pyx_t_15;
-              __pyx_L35_bool_binop_done:;
-              if (__pyx_t_14) {
-
-                /* "chronoton/_cy_inner.pyx":349
- *                         exit_px = tp_px
- *                     elif (not isnan(ts_trigger_px)) and price_l <= ts_trigger_px:
- *                         exit_reason = EXIT_TS             # <<<<<<<<<<<<<<
- *                         exit_px = ts_trigger_px
- *                 else:
-*/
-                __pyx_v_exit_reason = __pyx_e_9chronoton_9_cy_inner_EXIT_TS;
-
-                /* "chronoton/_cy_inner.pyx":350
- *                     elif (not isnan(ts_trigger_px)) and price_l <= ts_trigger_px:
- *                         exit_reason = EXIT_TS
- *                         exit_px = ts_trigger_px             # <<<<<<<<<<<<<<
- *                 else:
- *                     if (not isnan(sl_px)) and price_h >= sl_px:
-*/
-                __pyx_v_exit_px = __pyx_v_ts_trigger_px;
-
-                /* "chronoton/_cy_inner.pyx":348
- *                         exit_reason = EXIT_TP
- *                         exit_px = tp_px
- *                     elif (not isnan(ts_trigger_px)) and price_l <= ts_trigger_px:             # <<<<<<<<<<<<<<
- *                         exit_reason = EXIT_TS
- *                         exit_px = ts_trigger_px
-*/
-              }
-              __pyx_L30:;
-
-              /* "chronoton/_cy_inner.pyx":341
+              /* "chronoton/_cy_inner.pyx":383
  *                 exit_reason = -1
  *                 exit_px = NAN
- *                 if direction > 0:             # <<<<<<<<<<<<<<
- *                     if (not isnan(sl_px)) and price_l <= sl_px:
- *                         exit_reason = EXIT_SL
+ *                 if direction * (worst_px - sl_px) <= 0.0:             # <<<<<<<<<<<<<<
+ *                     exit_reason = EXIT_SL
+ *                     exit_px = sl_px
 */
               goto __pyx_L29;
             }
 
-            /* "chronoton/_cy_inner.pyx":352
- *                         exit_px = ts_trigger_px
- *                 else:
- *                     if (not isnan(sl_px)) and price_h >= sl_px:             # <<<<<<<<<<<<<<
- *                         exit_reason = EXIT_SL
- *                         exit_px = sl_px
-*/
-            /*else*/ {
-              __pyx_t_15 = (!isnan(__pyx_v_sl_px));
-              if (__pyx_t_15) {
-              } else {
-                __pyx_t_14 = __pyx_t_15;
-                goto __pyx_L38_bool_binop_done;
-              }
-              __pyx_t_15 = (__pyx_v_price_h >= __pyx_v_sl_px);
-              __pyx_t_14 = __pyx_t_15;
-              __pyx_L38_bool_binop_done:;
-              if (__pyx_t_14) {
-
-                /* "chronoton/_cy_inner.pyx":353
- *                 else:
- *                     if (not isnan(sl_px)) and price_h >= sl_px:
- *                         exit_reason = EXIT_SL             # <<<<<<<<<<<<<<
- *                         exit_px = sl_px
- *                     elif (not isnan(tp_px)) and price_l <= tp_px:
-*/
-                __pyx_v_exit_reason = __pyx_e_9chronoton_9_cy_inner_EXIT_SL;
-
-                /* "chronoton/_cy_inner.pyx":354
- *                     if (not isnan(sl_px)) and price_h >= sl_px:
- *                         exit_reason = EXIT_SL
- *                         exit_px = sl_px             # <<<<<<<<<<<<<<
- *                     elif (not isnan(tp_px)) and price_l <= tp_px:
- *                         exit_reason = EXIT_TP
-*/
-                __pyx_v_exit_px = __pyx_v_sl_px;
-
-                /* "chronoton/_cy_inner.pyx":352
- *                         exit_px = ts_trigger_px
- *                 else:
- *                     if (not isnan(sl_px)) and price_h >= sl_px:             # <<<<<<<<<<<<<<
- *                         exit_reason = EXIT_SL
- *                         exit_px = sl_px
+            /* "chronoton/_cy_inner.pyx":386
+ *                     exit_reason = EXIT_SL
+ *                     exit_px = sl_px
+ *                 elif direction * (best_px - tp_px) >= 0.0:             # <<<<<<<<<<<<<<
+ *                     exit_reason = EXIT_TP
+ *                     exit_px = tp_px
 */
-                goto __pyx_L37;
-              }
+            __pyx_t_10 = ((__pyx_v_direction * (__pyx_v_best_px - __pyx_v_tp_px)) >= 0.0);
+            if (__pyx_t_10) {
 
-              /* "chronoton/_cy_inner.pyx":355
- *                         exit_reason = EXIT_SL
- *                         exit_px = sl_px
- *                     elif (not isnan(tp_px)) and price_l <= tp_px:             # <<<<<<<<<<<<<<
- *                         exit_reason = EXIT_TP
- *                         exit_px = tp_px
+              /* "chronoton/_cy_inner.pyx":387
+ *                     exit_px = sl_px
+ *                 elif direction * (best_px - tp_px) >= 0.0:
+ *                     exit_reason = EXIT_TP             # <<<<<<<<<<<<<<
+ *                     exit_px = tp_px
+ *                 elif direction * (worst_px - ts_trigger_px) <= 0.0:
+*/
+              __pyx_v_exit_reason = __pyx_e_9chronoton_9_cy_inner_EXIT_TP;
+
+              /* "chronoton/_cy_inner.pyx":388
+ *                 elif direction * (best_px - tp_px) >= 0.0:
+ *                     exit_reason = EXIT_TP
+ *                     exit_px = tp_px             # <<<<<<<<<<<<<<
+ *                 elif direction * (worst_px - ts_trigger_px) <= 0.0:
+ *                     exit_reason = EXIT_TS
+*/
+              __pyx_v_exit_px = __pyx_v_tp_px;
+
+              /* "chronoton/_cy_inner.pyx":386
+ *                     exit_reason = EXIT_SL
+ *                     exit_px = sl_px
+ *                 elif direction * (best_px - tp_px) >= 0.0:             # <<<<<<<<<<<<<<
+ *                     exit_reason = EXIT_TP
+ *                     exit_px = tp_px
 */
-              __pyx_t_15 = (!isnan(__pyx_v_tp_px));
-              if (__pyx_t_15) {
-              } else {
-                __pyx_t_14 = __pyx_t_15;
-                goto __pyx_L40_bool_binop_done;
-              }
-              __pyx_t_15 = (__pyx_v_price_l <= __pyx_v_tp_px);
-              __pyx_t_14 = __pyx_t_15;
-              __pyx_L40_bool_binop_done:;
-              if (__pyx_t_14) {
-
-                /* "chronoton/_cy_inner.pyx":356
- *                         exit_px = sl_px
- *                     elif (not isnan(tp_px)) and price_l <= tp_px:
- *                         exit_reason = EXIT_TP             # <<<<<<<<<<<<<<
- *                         exit_px = tp_px
- *                     elif (not isnan(ts_trigger_px)) and price_h >= ts_trigger_px:
-*/
-                __pyx_v_exit_reason = __pyx_e_9chronoton_9_cy_inner_EXIT_TP;
-
-                /* "chronoton/_cy_inner.pyx":357
- *                     elif (not isnan(tp_px)) and price_l <= tp_px:
- *                         exit_reason = EXIT_TP
- *                         exit_px = tp_px             # <<<<<<<<<<<<<<
- *                     elif (not isnan(ts_trigger_px)) and price_h >= ts_trigger_px:
- *                         exit_reason = EXIT_TS
-*/
-                __pyx_v_exit_px = __pyx_v_tp_px;
-
-                /* "chronoton/_cy_inner.pyx":355
- *                         exit_reason = EXIT_SL
- *                         exit_px = sl_px
- *                     elif (not isnan(tp_px)) and price_l <= tp_px:             # <<<<<<<<<<<<<<
- *                         exit_reason = EXIT_TP
- *                         exit_px = tp_px
-*/
-                goto __pyx_L37;
-              }
+              goto __pyx_L29;
+            }
 
-              /* "chronoton/_cy_inner.pyx":358
- *                         exit_reason = EXIT_TP
- *                         exit_px = tp_px
- *                     elif (not isnan(ts_trigger_px)) and price_h >= ts_trigger_px:             # <<<<<<<<<<<<<<
- *                         exit_reason = EXIT_TS
- *                         exit_px = ts_trigger_px
+            /* "chronoton/_cy_inner.pyx":389
+ *                     exit_reason = EXIT_TP
+ *                     exit_px = tp_px
+ *                 elif direction * (worst_px - ts_trigger_px) <= 0.0:             # <<<<<<<<<<<<<<
+ *                     exit_reason = EXIT_TS
+ *                     exit_px = ts_trigger_px
 */
-              __pyx_t_15 = (!isnan(__pyx_v_ts_trigger_px));
-              if (__pyx_t_15) {
-              } else {
-                __pyx_t_14 = __pyx_t_15;
-                goto __pyx_L42_bool_binop_done;
-              }
-              __pyx_t_15 = (__pyx_v_price_h >= __pyx_v_ts_trigger_px);
-              __pyx_t_14 = __pyx_t_15;
-              __pyx_L42_bool_binop_done:;
-              if (__pyx_t_14) {
+            __pyx_t_10 = ((__pyx_v_direction * (__pyx_v_worst_px - __pyx_v_ts_trigger_px)) <= 0.0);
+            if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":359
- *                         exit_px = tp_px
- *                     elif (not isnan(ts_trigger_px)) and price_h >= ts_trigger_px:
- *                         exit_reason = EXIT_TS             # <<<<<<<<<<<<<<
- *                         exit_px = ts_trigger_px
+              /* "chronoton/_cy_inner.pyx":390
+ *                     exit_px = tp_px
+ *                 elif direction * (worst_px - ts_trigger_px) <= 0.0:
+ *                     exit_reason = EXIT_TS             # <<<<<<<<<<<<<<
+ *                     exit_px = ts_trigger_px
  * 
 */
-                __pyx_v_exit_reason = __pyx_e_9chronoton_9_cy_inner_EXIT_TS;
+              __pyx_v_exit_reason = __pyx_e_9chronoton_9_cy_inner_EXIT_TS;
 
-                /* "chronoton/_cy_inner.pyx":360
- *                     elif (not isnan(ts_trigger_px)) and price_h >= ts_trigger_px:
- *                         exit_reason = EXIT_TS
- *                         exit_px = ts_trigger_px             # <<<<<<<<<<<<<<
+              /* "chronoton/_cy_inner.pyx":391
+ *                 elif direction * (worst_px - ts_trigger_px) <= 0.0:
+ *                     exit_reason = EXIT_TS
+ *                     exit_px = ts_trigger_px             # <<<<<<<<<<<<<<
  * 
  *                 if exit_reason != -1:
 */
-                __pyx_v_exit_px = __pyx_v_ts_trigger_px;
+              __pyx_v_exit_px = __pyx_v_ts_trigger_px;
 
-                /* "chronoton/_cy_inner.pyx":358
- *                         exit_reason = EXIT_TP
- *                         exit_px = tp_px
- *                     elif (not isnan(ts_trigger_px)) and price_h >= ts_trigger_px:             # <<<<<<<<<<<<<<
- *                         exit_reason = EXIT_TS
- *                         exit_px = ts_trigger_px
+              /* "chronoton/_cy_inner.pyx":389
+ *                     exit_reason = EXIT_TP
+ *                     exit_px = tp_px
+ *                 elif direction * (worst_px - ts_trigger_px) <= 0.0:             # <<<<<<<<<<<<<<
+ *                     exit_reason = EXIT_TS
+ *                     exit_px = ts_trigger_px
 */
-              }
-              __pyx_L37:;
             }
             __pyx_L29:;
 
-            /* "chronoton/_cy_inner.pyx":362
- *                         exit_px = ts_trigger_px
+            /* "chronoton/_cy_inner.pyx":393
+ *                     exit_px = ts_trigger_px
  * 
  *                 if exit_reason != -1:             # <<<<<<<<<<<<<<
  *                     exit_spread = spread_arr[i] * size
  *                     exit_slippage = slippage_arr[i] * size
 */
-            __pyx_t_14 = (__pyx_v_exit_reason != -1L);
-            if (__pyx_t_14) {
+            __pyx_t_10 = (__pyx_v_exit_reason != -1L);
+            if (__pyx_t_10) {
 
-              /* "chronoton/_cy_inner.pyx":363
+              /* "chronoton/_cy_inner.pyx":394
  * 
  *                 if exit_reason != -1:
  *                     exit_spread = spread_arr[i] * size             # <<<<<<<<<<<<<<
  *                     exit_slippage = slippage_arr[i] * size
  *                     exit_px_net = exit_px - direction * (spread_arr[i] + slippage_arr[i])
 */
-              __pyx_t_21 = __pyx_v_i;
-              __pyx_v_exit_spread = ((*((double const  *) ( /* dim=0 */ (__pyx_v_spread_arr.data + __pyx_t_21 * __pyx_v_spread_arr.strides[0]) ))) * __pyx_v_size);
+              __pyx_t_18 = __pyx_v_i;
+              __pyx_v_exit_spread = ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_spread_arr.data) + __pyx_t_18)) ))) * __pyx_v_size);
 
-              /* "chronoton/_cy_inner.pyx":364
+              /* "chronoton/_cy_inner.pyx":395
  *                 if exit_reason != -1:
  *                     exit_spread = spread_arr[i] * size
  *                     exit_slippage = slippage_arr[i] * size             # <<<<<<<<<<<<<<
  *                     exit_px_net = exit_px - direction * (spread_arr[i] + slippage_arr[i])
  *                     exit_commission = commission * fabs(exit_px_net * size)
 */
-              __pyx_t_21 = __pyx_v_i;
-              __pyx_v_exit_slippage = ((*((double const  *) ( /* dim=0 */ (__pyx_v_slippage_arr.data + __pyx_t_21 * __pyx_v_slippage_arr.strides[0]) ))) * __pyx_v_size);
+              __pyx_t_18 = __pyx_v_i;
+              __pyx_v_exit_slippage = ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_slippage_arr.data) + __pyx_t_18)) ))) * __pyx_v_size);
 
-              /* "chronoton/_cy_inner.pyx":365
+              /* "chronoton/_cy_inner.pyx":396
  *                     exit_spread = spread_arr[i] * size
  *                     exit_slippage = slippage_arr[i] * size
  *                     exit_px_net = exit_px - direction * (spread_arr[i] + slippage_arr[i])             # <<<<<<<<<<<<<<
  *                     exit_commission = commission * fabs(exit_px_net * size)
  *                     proceeds = direction * (exit_px_net - entry_px) * size
 */
-              __pyx_t_21 = __pyx_v_i;
-              __pyx_t_20 = __pyx_v_i;
-              __pyx_v_exit_px_net = (__pyx_v_exit_px - (__pyx_v_direction * ((*((double const  *) ( /* dim=0 */ (__pyx_v_spread_arr.data + __pyx_t_21 * __pyx_v_spread_arr.strides[0]) ))) + (*((double const  *) ( /* dim=0 */ (__pyx_v_slippage_arr.data + __pyx_t_20 * __pyx_v_slippage_arr.strides[0]) ))))));
+              __pyx_t_18 = __pyx_v_i;
+              __pyx_t_17 = __pyx_v_i;
+              __pyx_v_exit_px_net = (__pyx_v_exit_px - (__pyx_v_direction * ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_spread_arr.data) + __pyx_t_18)) ))) + (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_slippage_arr.data) + __pyx_t_17)) ))))));
 
-              /* "chronoton/_cy_inner.pyx":366
+              /* "chronoton/_cy_inner.pyx":397
  *                     exit_slippage = slippage_arr[i] * size
  *                     exit_px_net = exit_px - direction * (spread_arr[i] + slippage_arr[i])
  *                     exit_commission = commission * fabs(exit_px_net * size)             # <<<<<<<<<<<<<<
@@ -18879,7 +18742,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
               __pyx_v_exit_commission = (__pyx_v_commission * fabs((__pyx_v_exit_px_net * __pyx_v_size)));
 
-              /* "chronoton/_cy_inner.pyx":367
+              /* "chronoton/_cy_inner.pyx":398
  *                     exit_px_net = exit_px - direction * (spread_arr[i] + slippage_arr[i])
  *                     exit_commission = commission * fabs(exit_px_net * size)
  *                     proceeds = direction * (exit_px_net - entry_px) * size             # <<<<<<<<<<<<<<
@@ -18888,7 +18751,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
               __pyx_v_proceeds = ((__pyx_v_direction * (__pyx_v_exit_px_net - __pyx_v_entry_px)) * __pyx_v_size);
 
-              /* "chronoton/_cy_inner.pyx":368
+              /* "chronoton/_cy_inner.pyx":399
  *                     exit_commission = commission * fabs(exit_px_net * size)
  *                     proceeds = direction * (exit_px_net - entry_px) * size
  *                     current_cash += (size * entry_px) + proceeds             # <<<<<<<<<<<<<<
@@ -18897,7 +18760,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
               __pyx_v_current_cash = (__pyx_v_current_cash + ((__pyx_v_size * __pyx_v_entry_px) + __pyx_v_proceeds));
 
-              /* "chronoton/_cy_inner.pyx":369
+              /* "chronoton/_cy_inner.pyx":400
  *                     proceeds = direction * (exit_px_net - entry_px) * size
  *                     current_cash += (size * entry_px) + proceeds
  *                     current_cash -= exit_commission             # <<<<<<<<<<<<<<
@@ -18906,36 +18769,36 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
               __pyx_v_current_cash = (__pyx_v_current_cash - __pyx_v_exit_commission);
 
-              /* "chronoton/_cy_inner.pyx":370
+              /* "chronoton/_cy_inner.pyx":401
  *                     current_cash += (size * entry_px) + proceeds
  *                     current_cash -= exit_commission
  *                     n_closed = _exit_position(             # <<<<<<<<<<<<<<
  *                         k, i, t_ns, exit_px_net, <double>exit_reason,
  *                         exit_commission, exit_spread, exit_slippage,
 */
-              __pyx_t_22 = __pyx_f_9chronoton_9_cy_inner__exit_position(__pyx_v_k, __pyx_v_i, __pyx_v_t_ns, __pyx_v_exit_px_net, ((double)__pyx_v_exit_reason), __pyx_v_exit_commission, __pyx_v_exit_spread, __pyx_v_exit_slippage, __pyx_v_open_positions, __pyx_v_slot_active, __pyx_v_closed_trades, __pyx_v_n_closed, __pyx_v_closed_capacity, __pyx_v_overflow_flag); if (unlikely(__pyx_t_22 == ((Py_ssize_t)-1L) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 370, __pyx_L4_error)
-              __pyx_v_n_closed = __pyx_t_22;
+              __pyx_t_20 = __pyx_f_9chronoton_9_cy_inner__exit_position(__pyx_v_k, __pyx_v_i, __pyx_v_t_ns, __pyx_v_exit_px_net, ((double)__pyx_v_exit_reason), __pyx_v_exit_commission, __pyx_v_exit_spread, __pyx_v_exit_slippage, __pyx_v_open_positions, __pyx_v_slot_active, __pyx_v_closed_trades, __pyx_v_n_closed, __pyx_v_closed_capacity, __pyx_v_overflow_flag); if (unlikely(__pyx_t_20 == ((Py_ssize_t)-1L) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 401, __pyx_L4_error)
+              __pyx_v_n_closed = __pyx_t_20;
 
-              /* "chronoton/_cy_inner.pyx":376
+              /* "chronoton/_cy_inner.pyx":407
  *                         n_closed, closed_capacity, overflow_flag,
  *                     )
  *                     if n_closed < 0:             # <<<<<<<<<<<<<<
  *                         break  # overflow; return to caller to raise
  * 
 */
-              __pyx_t_14 = (__pyx_v_n_closed < 0);
-              if (__pyx_t_14) {
+              __pyx_t_10 = (__pyx_v_n_closed < 0);
+              if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":377
+                /* "chronoton/_cy_inner.pyx":408
  *                     )
  *                     if n_closed < 0:
  *                         break  # overflow; return to caller to raise             # <<<<<<<<<<<<<<
  * 
  *             if n_closed < 0:
 */
-                goto __pyx_L16_break;
+                goto __pyx_L26_break;
 
-                /* "chronoton/_cy_inner.pyx":376
+                /* "chronoton/_cy_inner.pyx":407
  *                         n_closed, closed_capacity, overflow_flag,
  *                     )
  *                     if n_closed < 0:             # <<<<<<<<<<<<<<
@@ -18944,38 +18807,38 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
               }
 
-              /* "chronoton/_cy_inner.pyx":362
- *                         exit_px = ts_trigger_px
+              /* "chronoton/_cy_inner.pyx":393
+ *                     exit_px = ts_trigger_px
  * 
  *                 if exit_reason != -1:             # <<<<<<<<<<<<<<
  *                     exit_spread = spread_arr[i] * size
  *                     exit_slippage = slippage_arr[i] * size
 */
             }
-            __pyx_L15_continue:;
+            __pyx_L25_continue:;
           }
-          __pyx_L16_break:;
+          __pyx_L26_break:;
 
-          /* "chronoton/_cy_inner.pyx":379
+          /* "chronoton/_cy_inner.pyx":410
  *                         break  # overflow; return to caller to raise
  * 
  *             if n_closed < 0:             # <<<<<<<<<<<<<<
  *                 break
  * 
 */
-          __pyx_t_14 = (__pyx_v_n_closed < 0);
-          if (__pyx_t_14) {
+          __pyx_t_10 = (__pyx_v_n_closed < 0);
+          if (__pyx_t_10) {
 
-            /* "chronoton/_cy_inner.pyx":380
+            /* "chronoton/_cy_inner.pyx":411
  * 
  *             if n_closed < 0:
  *                 break             # <<<<<<<<<<<<<<
  * 
- *             # (3) Shifted exit signals ----------------------------------
+ *             # Signals arrive packed one byte per bar (SIG_* bits). Most bars
 */
             goto __pyx_L7_break;
 
-            /* "chronoton/_cy_inner.pyx":379
+            /* "chronoton/_cy_inner.pyx":410
  *                         break  # overflow; return to caller to raise
  * 
  *             if n_closed < 0:             # <<<<<<<<<<<<<<
@@ -18984,904 +18847,752 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
           }
 
-          /* "chronoton/_cy_inner.pyx":383
- * 
- *             # (3) Shifted exit signals ----------------------------------
- *             want_long_exit = long_exits_shifted[i] != 0             # <<<<<<<<<<<<<<
- *             want_short_exit = short_exits_shifted[i] != 0
- *             if want_long_exit or want_short_exit:
-*/
-          __pyx_t_20 = __pyx_v_i;
-          __pyx_v_want_long_exit = ((*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_long_exits_shifted.data + __pyx_t_20 * __pyx_v_long_exits_shifted.strides[0]) ))) != 0);
-
-          /* "chronoton/_cy_inner.pyx":384
- *             # (3) Shifted exit signals ----------------------------------
- *             want_long_exit = long_exits_shifted[i] != 0
- *             want_short_exit = short_exits_shifted[i] != 0             # <<<<<<<<<<<<<<
- *             if want_long_exit or want_short_exit:
- *                 for k in range(n_slots):
-*/
-          __pyx_t_20 = __pyx_v_i;
-          __pyx_v_want_short_exit = ((*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_short_exits_shifted.data + __pyx_t_20 * __pyx_v_short_exits_shifted.strides[0]) ))) != 0);
-
-          /* "chronoton/_cy_inner.pyx":385
- *             want_long_exit = long_exits_shifted[i] != 0
- *             want_short_exit = short_exits_shifted[i] != 0
- *             if want_long_exit or want_short_exit:             # <<<<<<<<<<<<<<
- *                 for k in range(n_slots):
- *                     if slot_active[k] == 0:
+          /* "chronoton/_cy_inner.pyx":415
+ *             # Signals arrive packed one byte per bar (SIG_* bits). Most bars
+ *             # carry none, so one load and test skips (3) and (4) entirely.
+ *             flags = signal_flags[i]             # <<<<<<<<<<<<<<
+ *             if flags != 0:
+ *                 # (3) Shifted exit signals ----------------------------------
 */
-          if (!__pyx_v_want_long_exit) {
-          } else {
-            __pyx_t_14 = __pyx_v_want_long_exit;
-            goto __pyx_L48_bool_binop_done;
-          }
-          __pyx_t_14 = __pyx_v_want_short_exit;
-          __pyx_L48_bool_binop_done:;
-          if (__pyx_t_14) {
+          __pyx_t_17 = __pyx_v_i;
+          __pyx_v_flags = (*((unsigned char const  *) ( /* dim=0 */ ((char *) (((unsigned char const  *) __pyx_v_signal_flags.data) + __pyx_t_17)) )));
 
-            /* "chronoton/_cy_inner.pyx":386
- *             want_short_exit = short_exits_shifted[i] != 0
- *             if want_long_exit or want_short_exit:
- *                 for k in range(n_slots):             # <<<<<<<<<<<<<<
- *                     if slot_active[k] == 0:
- *                         continue
+          /* "chronoton/_cy_inner.pyx":416
+ *             # carry none, so one load and test skips (3) and (4) entirely.
+ *             flags = signal_flags[i]
+ *             if flags != 0:             # <<<<<<<<<<<<<<
+ *                 # (3) Shifted exit signals ----------------------------------
+ *                 want_long_exit = (flags & SIG_LONG_EXIT) != 0
 */
-            __pyx_t_16 = __pyx_v_n_slots;
-            __pyx_t_17 = __pyx_t_16;
-            for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
-              __pyx_v_k = __pyx_t_18;
+          __pyx_t_10 = (__pyx_v_flags != 0);
+          if (__pyx_t_10) {
 
-              /* "chronoton/_cy_inner.pyx":387
- *             if want_long_exit or want_short_exit:
- *                 for k in range(n_slots):
- *                     if slot_active[k] == 0:             # <<<<<<<<<<<<<<
- *                         continue
- *                     direction = open_positions[k, F_DIRECTION]
+            /* "chronoton/_cy_inner.pyx":418
+ *             if flags != 0:
+ *                 # (3) Shifted exit signals ----------------------------------
+ *                 want_long_exit = (flags & SIG_LONG_EXIT) != 0             # <<<<<<<<<<<<<<
+ *                 want_short_exit = (flags & SIG_SHORT_EXIT) != 0
+ *                 if want_long_exit or want_short_exit:
 */
-              __pyx_t_20 = __pyx_v_k;
-              __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_20 * __pyx_v_slot_active.strides[0]) ))) == 0);
-              if (__pyx_t_14) {
+            __pyx_v_want_long_exit = ((__pyx_v_flags & __pyx_e_9chronoton_9_cy_inner_SIG_LONG_EXIT) != 0);
 
-                /* "chronoton/_cy_inner.pyx":388
- *                 for k in range(n_slots):
- *                     if slot_active[k] == 0:
- *                         continue             # <<<<<<<<<<<<<<
- *                     direction = open_positions[k, F_DIRECTION]
- *                     if ((direction > 0 and want_long_exit) or
+            /* "chronoton/_cy_inner.pyx":419
+ *                 # (3) Shifted exit signals ----------------------------------
+ *                 want_long_exit = (flags & SIG_LONG_EXIT) != 0
+ *                 want_short_exit = (flags & SIG_SHORT_EXIT) != 0             # <<<<<<<<<<<<<<
+ *                 if want_long_exit or want_short_exit:
+ *                     for k in range(n_slots):
+*/
+            __pyx_v_want_short_exit = ((__pyx_v_flags & __pyx_e_9chronoton_9_cy_inner_SIG_SHORT_EXIT) != 0);
+
+            /* "chronoton/_cy_inner.pyx":420
+ *                 want_long_exit = (flags & SIG_LONG_EXIT) != 0
+ *                 want_short_exit = (flags & SIG_SHORT_EXIT) != 0
+ *                 if want_long_exit or want_short_exit:             # <<<<<<<<<<<<<<
+ *                     for k in range(n_slots):
+ *                         if slot_active[k] == 0:
+*/
+            if (!__pyx_v_want_long_exit) {
+            } else {
+              __pyx_t_10 = __pyx_v_want_long_exit;
+              goto __pyx_L35_bool_binop_done;
+            }
+            __pyx_t_10 = __pyx_v_want_short_exit;
+            __pyx_L35_bool_binop_done:;
+            if (__pyx_t_10) {
+
+              /* "chronoton/_cy_inner.pyx":421
+ *                 want_short_exit = (flags & SIG_SHORT_EXIT) != 0
+ *                 if want_long_exit or want_short_exit:
+ *                     for k in range(n_slots):             # <<<<<<<<<<<<<<
+ *                         if slot_active[k] == 0:
+ *                             continue
+*/
+              __pyx_t_13 = __pyx_v_n_slots;
+              __pyx_t_14 = __pyx_t_13;
+              for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+                __pyx_v_k = __pyx_t_15;
+
+                /* "chronoton/_cy_inner.pyx":422
+ *                 if want_long_exit or want_short_exit:
+ *                     for k in range(n_slots):
+ *                         if slot_active[k] == 0:             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         direction = open_positions[k, F_DIRECTION]
+*/
+                __pyx_t_17 = __pyx_v_k;
+                __pyx_t_10 = ((*((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_17)) ))) == 0);
+                if (__pyx_t_10) {
+
+                  /* "chronoton/_cy_inner.pyx":423
+ *                     for k in range(n_slots):
+ *                         if slot_active[k] == 0:
+ *                             continue             # <<<<<<<<<<<<<<
+ *                         direction = open_positions[k, F_DIRECTION]
+ *                         if ((direction > 0 and want_long_exit) or
+*/
+                  goto __pyx_L37_continue;
+
+                  /* "chronoton/_cy_inner.pyx":422
+ *                 if want_long_exit or want_short_exit:
+ *                     for k in range(n_slots):
+ *                         if slot_active[k] == 0:             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         direction = open_positions[k, F_DIRECTION]
 */
-                goto __pyx_L50_continue;
+                }
 
-                /* "chronoton/_cy_inner.pyx":387
- *             if want_long_exit or want_short_exit:
- *                 for k in range(n_slots):
- *                     if slot_active[k] == 0:             # <<<<<<<<<<<<<<
- *                         continue
- *                     direction = open_positions[k, F_DIRECTION]
+                /* "chronoton/_cy_inner.pyx":424
+ *                         if slot_active[k] == 0:
+ *                             continue
+ *                         direction = open_positions[k, F_DIRECTION]             # <<<<<<<<<<<<<<
+ *                         if ((direction > 0 and want_long_exit) or
+ *                             (direction < 0 and want_short_exit)):
 */
-              }
+                __pyx_t_17 = __pyx_v_k;
+                __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
+                __pyx_v_direction = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) )));
 
-              /* "chronoton/_cy_inner.pyx":389
- *                     if slot_active[k] == 0:
- *                         continue
- *                     direction = open_positions[k, F_DIRECTION]             # <<<<<<<<<<<<<<
- *                     if ((direction > 0 and want_long_exit) or
- *                         (direction < 0 and want_short_exit)):
-*/
-              __pyx_t_20 = __pyx_v_k;
-              __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
-              __pyx_v_direction = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) )));
+                /* "chronoton/_cy_inner.pyx":425
+ *                             continue
+ *                         direction = open_positions[k, F_DIRECTION]
+ *                         if ((direction > 0 and want_long_exit) or             # <<<<<<<<<<<<<<
+ *                             (direction < 0 and want_short_exit)):
+ *                             size = open_positions[k, F_SIZE]
+*/
+                __pyx_t_12 = (__pyx_v_direction > 0.0);
+                if (!__pyx_t_12) {
+                  goto __pyx_L42_next_or;
+                } else {
+                }
+                if (!__pyx_v_want_long_exit) {
+                } else {
+                  __pyx_t_10 = __pyx_v_want_long_exit;
+                  goto __pyx_L41_bool_binop_done;
+                }
+                __pyx_L42_next_or:;
 
-              /* "chronoton/_cy_inner.pyx":390
- *                         continue
- *                     direction = open_positions[k, F_DIRECTION]
- *                     if ((direction > 0 and want_long_exit) or             # <<<<<<<<<<<<<<
- *                         (direction < 0 and want_short_exit)):
- *                         size = open_positions[k, F_SIZE]
-*/
-              __pyx_t_15 = (__pyx_v_direction > 0.0);
-              if (!__pyx_t_15) {
-                goto __pyx_L55_next_or;
-              } else {
-              }
-              if (!__pyx_v_want_long_exit) {
-              } else {
-                __pyx_t_14 = __pyx_v_want_long_exit;
-                goto __pyx_L54_bool_binop_done;
-              }
-              __pyx_L55_next_or:;
+                /* "chronoton/_cy_inner.pyx":426
+ *                         direction = open_positions[k, F_DIRECTION]
+ *                         if ((direction > 0 and want_long_exit) or
+ *                             (direction < 0 and want_short_exit)):             # <<<<<<<<<<<<<<
+ *                             size = open_positions[k, F_SIZE]
+ *                             entry_px = open_positions[k, F_ENTRY_PRICE]
+*/
+                __pyx_t_12 = (__pyx_v_direction < 0.0);
+                if (__pyx_t_12) {
+                } else {
+                  __pyx_t_10 = __pyx_t_12;
+                  goto __pyx_L41_bool_binop_done;
+                }
+                __pyx_t_10 = __pyx_v_want_short_exit;
+                __pyx_L41_bool_binop_done:;
 
-              /* "chronoton/_cy_inner.pyx":391
- *                     direction = open_positions[k, F_DIRECTION]
- *                     if ((direction > 0 and want_long_exit) or
- *                         (direction < 0 and want_short_exit)):             # <<<<<<<<<<<<<<
- *                         size = open_positions[k, F_SIZE]
- *                         entry_px = open_positions[k, F_ENTRY_PRICE]
+                /* "chronoton/_cy_inner.pyx":425
+ *                             continue
+ *                         direction = open_positions[k, F_DIRECTION]
+ *                         if ((direction > 0 and want_long_exit) or             # <<<<<<<<<<<<<<
+ *                             (direction < 0 and want_short_exit)):
+ *                             size = open_positions[k, F_SIZE]
+*/
+                if (__pyx_t_10) {
+
+                  /* "chronoton/_cy_inner.pyx":427
+ *                         if ((direction > 0 and want_long_exit) or
+ *                             (direction < 0 and want_short_exit)):
+ *                             size = open_positions[k, F_SIZE]             # <<<<<<<<<<<<<<
+ *                             entry_px = open_positions[k, F_ENTRY_PRICE]
+ *                             exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
+*/
+                  __pyx_t_18 = __pyx_v_k;
+                  __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
+                  __pyx_v_size = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) )));
+
+                  /* "chronoton/_cy_inner.pyx":428
+ *                             (direction < 0 and want_short_exit)):
+ *                             size = open_positions[k, F_SIZE]
+ *                             entry_px = open_positions[k, F_ENTRY_PRICE]             # <<<<<<<<<<<<<<
+ *                             exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
+ *                             exit_commission = commission * fabs(exit_px_net * size)
+*/
+                  __pyx_t_17 = __pyx_v_k;
+                  __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
+                  __pyx_v_entry_px = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) )));
+
+                  /* "chronoton/_cy_inner.pyx":429
+ *                             size = open_positions[k, F_SIZE]
+ *                             entry_px = open_positions[k, F_ENTRY_PRICE]
+ *                             exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])             # <<<<<<<<<<<<<<
+ *                             exit_commission = commission * fabs(exit_px_net * size)
+ *                             proceeds = direction * (exit_px_net - entry_px) * size
+*/
+                  __pyx_t_18 = __pyx_v_i;
+                  __pyx_t_17 = __pyx_v_i;
+                  __pyx_v_exit_px_net = (__pyx_v_price_o - (__pyx_v_direction * ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_spread_arr.data) + __pyx_t_18)) ))) + (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_slippage_arr.data) + __pyx_t_17)) ))))));
+
+                  /* "chronoton/_cy_inner.pyx":430
+ *                             entry_px = open_positions[k, F_ENTRY_PRICE]
+ *                             exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
+ *                             exit_commission = commission * fabs(exit_px_net * size)             # <<<<<<<<<<<<<<
+ *                             proceeds = direction * (exit_px_net - entry_px) * size
+ *                             current_cash += (size * entry_px) + proceeds
+*/
+                  __pyx_v_exit_commission = (__pyx_v_commission * fabs((__pyx_v_exit_px_net * __pyx_v_size)));
+
+                  /* "chronoton/_cy_inner.pyx":431
+ *                             exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
+ *                             exit_commission = commission * fabs(exit_px_net * size)
+ *                             proceeds = direction * (exit_px_net - entry_px) * size             # <<<<<<<<<<<<<<
+ *                             current_cash += (size * entry_px) + proceeds
+ *                             current_cash -= exit_commission
+*/
+                  __pyx_v_proceeds = ((__pyx_v_direction * (__pyx_v_exit_px_net - __pyx_v_entry_px)) * __pyx_v_size);
+
+                  /* "chronoton/_cy_inner.pyx":432
+ *                             exit_commission = commission * fabs(exit_px_net * size)
+ *                             proceeds = direction * (exit_px_net - entry_px) * size
+ *                             current_cash += (size * entry_px) + proceeds             # <<<<<<<<<<<<<<
+ *                             current_cash -= exit_commission
+ *                             n_closed = _exit_position(
+*/
+                  __pyx_v_current_cash = (__pyx_v_current_cash + ((__pyx_v_size * __pyx_v_entry_px) + __pyx_v_proceeds));
+
+                  /* "chronoton/_cy_inner.pyx":433
+ *                             proceeds = direction * (exit_px_net - entry_px) * size
+ *                             current_cash += (size * entry_px) + proceeds
+ *                             current_cash -= exit_commission             # <<<<<<<<<<<<<<
+ *                             n_closed = _exit_position(
+ *                                 k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
+*/
+                  __pyx_v_current_cash = (__pyx_v_current_cash - __pyx_v_exit_commission);
+
+                  /* "chronoton/_cy_inner.pyx":437
+ *                                 k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
+ *                                 exit_commission,
+ *                                 spread_arr[i] * size,             # <<<<<<<<<<<<<<
+ *                                 slippage_arr[i] * size,
+ *                                 open_positions, slot_active, closed_trades,
+*/
+                  __pyx_t_17 = __pyx_v_i;
+
+                  /* "chronoton/_cy_inner.pyx":438
+ *                                 exit_commission,
+ *                                 spread_arr[i] * size,
+ *                                 slippage_arr[i] * size,             # <<<<<<<<<<<<<<
+ *                                 open_positions, slot_active, closed_trades,
+ *                                 n_closed, closed_capacity, overflow_flag,
+*/
+                  __pyx_t_18 = __pyx_v_i;
+
+                  /* "chronoton/_cy_inner.pyx":434
+ *                             current_cash += (size * entry_px) + proceeds
+ *                             current_cash -= exit_commission
+ *                             n_closed = _exit_position(             # <<<<<<<<<<<<<<
+ *                                 k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
+ *                                 exit_commission,
+*/
+                  __pyx_t_20 = __pyx_f_9chronoton_9_cy_inner__exit_position(__pyx_v_k, __pyx_v_i, __pyx_v_t_ns, __pyx_v_exit_px_net, ((double)__pyx_e_9chronoton_9_cy_inner_EXIT_SIGNAL), __pyx_v_exit_commission, ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_spread_arr.data) + __pyx_t_17)) ))) * __pyx_v_size), ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_slippage_arr.data) + __pyx_t_18)) ))) * __pyx_v_size), __pyx_v_open_positions, __pyx_v_slot_active, __pyx_v_closed_trades, __pyx_v_n_closed, __pyx_v_closed_capacity, __pyx_v_overflow_flag); if (unlikely(__pyx_t_20 == ((Py_ssize_t)-1L) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 434, __pyx_L4_error)
+                  __pyx_v_n_closed = __pyx_t_20;
+
+                  /* "chronoton/_cy_inner.pyx":442
+ *                                 n_closed, closed_capacity, overflow_flag,
+ *                             )
+ *                             if n_closed < 0:             # <<<<<<<<<<<<<<
+ *                                 break
+ *                     if n_closed < 0:
 */
-              __pyx_t_15 = (__pyx_v_direction < 0.0);
-              if (__pyx_t_15) {
-              } else {
-                __pyx_t_14 = __pyx_t_15;
-                goto __pyx_L54_bool_binop_done;
-              }
-              __pyx_t_14 = __pyx_v_want_short_exit;
-              __pyx_L54_bool_binop_done:;
-
-              /* "chronoton/_cy_inner.pyx":390
- *                         continue
- *                     direction = open_positions[k, F_DIRECTION]
- *                     if ((direction > 0 and want_long_exit) or             # <<<<<<<<<<<<<<
- *                         (direction < 0 and want_short_exit)):
- *                         size = open_positions[k, F_SIZE]
-*/
-              if (__pyx_t_14) {
-
-                /* "chronoton/_cy_inner.pyx":392
- *                     if ((direction > 0 and want_long_exit) or
- *                         (direction < 0 and want_short_exit)):
- *                         size = open_positions[k, F_SIZE]             # <<<<<<<<<<<<<<
- *                         entry_px = open_positions[k, F_ENTRY_PRICE]
- *                         exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
-*/
-                __pyx_t_21 = __pyx_v_k;
-                __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
-                __pyx_v_size = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) )));
-
-                /* "chronoton/_cy_inner.pyx":393
- *                         (direction < 0 and want_short_exit)):
- *                         size = open_positions[k, F_SIZE]
- *                         entry_px = open_positions[k, F_ENTRY_PRICE]             # <<<<<<<<<<<<<<
- *                         exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
- *                         exit_commission = commission * fabs(exit_px_net * size)
-*/
-                __pyx_t_20 = __pyx_v_k;
-                __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
-                __pyx_v_entry_px = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) )));
-
-                /* "chronoton/_cy_inner.pyx":394
- *                         size = open_positions[k, F_SIZE]
- *                         entry_px = open_positions[k, F_ENTRY_PRICE]
- *                         exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])             # <<<<<<<<<<<<<<
- *                         exit_commission = commission * fabs(exit_px_net * size)
- *                         proceeds = direction * (exit_px_net - entry_px) * size
-*/
-                __pyx_t_21 = __pyx_v_i;
-                __pyx_t_20 = __pyx_v_i;
-                __pyx_v_exit_px_net = (__pyx_v_price_o - (__pyx_v_direction * ((*((double const  *) ( /* dim=0 */ (__pyx_v_spread_arr.data + __pyx_t_21 * __pyx_v_spread_arr.strides[0]) ))) + (*((double const  *) ( /* dim=0 */ (__pyx_v_slippage_arr.data + __pyx_t_20 * __pyx_v_slippage_arr.strides[0]) ))))));
-
-                /* "chronoton/_cy_inner.pyx":395
- *                         entry_px = open_positions[k, F_ENTRY_PRICE]
- *                         exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
- *                         exit_commission = commission * fabs(exit_px_net * size)             # <<<<<<<<<<<<<<
- *                         proceeds = direction * (exit_px_net - entry_px) * size
- *                         current_cash += (size * entry_px) + proceeds
-*/
-                __pyx_v_exit_commission = (__pyx_v_commission * fabs((__pyx_v_exit_px_net * __pyx_v_size)));
-
-                /* "chronoton/_cy_inner.pyx":396
- *                         exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
- *                         exit_commission = commission * fabs(exit_px_net * size)
- *                         proceeds = direction * (exit_px_net - entry_px) * size             # <<<<<<<<<<<<<<
- *                         current_cash += (size * entry_px) + proceeds
- *                         current_cash -= exit_commission
-*/
-                __pyx_v_proceeds = ((__pyx_v_direction * (__pyx_v_exit_px_net - __pyx_v_entry_px)) * __pyx_v_size);
-
-                /* "chronoton/_cy_inner.pyx":397
- *                         exit_commission = commission * fabs(exit_px_net * size)
- *                         proceeds = direction * (exit_px_net - entry_px) * size
- *                         current_cash += (size * entry_px) + proceeds             # <<<<<<<<<<<<<<
- *                         current_cash -= exit_commission
- *                         n_closed = _exit_position(
-*/
-                __pyx_v_current_cash = (__pyx_v_current_cash + ((__pyx_v_size * __pyx_v_entry_px) + __pyx_v_proceeds));
-
-                /* "chronoton/_cy_inner.pyx":398
- *                         proceeds = direction * (exit_px_net - entry_px) * size
- *                         current_cash += (size * entry_px) + proceeds
- *                         current_cash -= exit_commission             # <<<<<<<<<<<<<<
- *                         n_closed = _exit_position(
- *                             k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
-*/
-                __pyx_v_current_cash = (__pyx_v_current_cash - __pyx_v_exit_commission);
-
-                /* "chronoton/_cy_inner.pyx":402
- *                             k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
- *                             exit_commission,
- *                             spread_arr[i] * size,             # <<<<<<<<<<<<<<
- *                             slippage_arr[i] * size,
- *                             open_positions, slot_active, closed_trades,
-*/
-                __pyx_t_20 = __pyx_v_i;
-
-                /* "chronoton/_cy_inner.pyx":403
- *                             exit_commission,
- *                             spread_arr[i] * size,
- *                             slippage_arr[i] * size,             # <<<<<<<<<<<<<<
- *                             open_positions, slot_active, closed_trades,
- *                             n_closed, closed_capacity, overflow_flag,
-*/
-                __pyx_t_21 = __pyx_v_i;
-
-                /* "chronoton/_cy_inner.pyx":399
- *                         current_cash += (size * entry_px) + proceeds
- *                         current_cash -= exit_commission
- *                         n_closed = _exit_position(             # <<<<<<<<<<<<<<
- *                             k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
- *                             exit_commission,
-*/
-                __pyx_t_22 = __pyx_f_9chronoton_9_cy_inner__exit_position(__pyx_v_k, __pyx_v_i, __pyx_v_t_ns, __pyx_v_exit_px_net, ((double)__pyx_e_9chronoton_9_cy_inner_EXIT_SIGNAL), __pyx_v_exit_commission, ((*((double const  *) ( /* dim=0 */ (__pyx_v_spread_arr.data + __pyx_t_20 * __pyx_v_spread_arr.strides[0]) ))) * __pyx_v_size), ((*((double const  *) ( /* dim=0 */ (__pyx_v_slippage_arr.data + __pyx_t_21 * __pyx_v_slippage_arr.strides[0]) ))) * __pyx_v_size), __pyx_v_open_positions, __pyx_v_slot_active, __pyx_v_closed_trades, __pyx_v_n_closed, __pyx_v_closed_capacity, __pyx_v_overflow_flag); if (unlikely(__pyx_t_22 == ((Py_ssize_t)-1L) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 399, __pyx_L4_error)
-                __pyx_v_n_closed = __pyx_t_22;
+                  __pyx_t_10 = (__pyx_v_n_closed < 0);
+                  if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":407
- *                             n_closed, closed_capacity, overflow_flag,
- *                         )
- *                         if n_closed < 0:             # <<<<<<<<<<<<<<
- *                             break
- *                 if n_closed < 0:
+                    /* "chronoton/_cy_inner.pyx":443
+ *                             )
+ *                             if n_closed < 0:
+ *                                 break             # <<<<<<<<<<<<<<
+ *                     if n_closed < 0:
+ *                         break
 */
-                __pyx_t_14 = (__pyx_v_n_closed < 0);
-                if (__pyx_t_14) {
+                    goto __pyx_L38_break;
 
-                  /* "chronoton/_cy_inner.pyx":408
- *                         )
- *                         if n_closed < 0:
- *                             break             # <<<<<<<<<<<<<<
- *                 if n_closed < 0:
- *                     break
+                    /* "chronoton/_cy_inner.pyx":442
+ *                                 n_closed, closed_capacity, overflow_flag,
+ *                             )
+ *                             if n_closed < 0:             # <<<<<<<<<<<<<<
+ *                                 break
+ *                     if n_closed < 0:
 */
-                  goto __pyx_L51_break;
+                  }
 
-                  /* "chronoton/_cy_inner.pyx":407
- *                             n_closed, closed_capacity, overflow_flag,
- *                         )
- *                         if n_closed < 0:             # <<<<<<<<<<<<<<
- *                             break
- *                 if n_closed < 0:
+                  /* "chronoton/_cy_inner.pyx":425
+ *                             continue
+ *                         direction = open_positions[k, F_DIRECTION]
+ *                         if ((direction > 0 and want_long_exit) or             # <<<<<<<<<<<<<<
+ *                             (direction < 0 and want_short_exit)):
+ *                             size = open_positions[k, F_SIZE]
 */
                 }
-
-                /* "chronoton/_cy_inner.pyx":390
- *                         continue
- *                     direction = open_positions[k, F_DIRECTION]
- *                     if ((direction > 0 and want_long_exit) or             # <<<<<<<<<<<<<<
- *                         (direction < 0 and want_short_exit)):
- *                         size = open_positions[k, F_SIZE]
-*/
+                __pyx_L37_continue:;
               }
-              __pyx_L50_continue:;
-            }
-            __pyx_L51_break:;
+              __pyx_L38_break:;
 
-            /* "chronoton/_cy_inner.pyx":409
- *                         if n_closed < 0:
- *                             break
- *                 if n_closed < 0:             # <<<<<<<<<<<<<<
- *                     break
+              /* "chronoton/_cy_inner.pyx":444
+ *                             if n_closed < 0:
+ *                                 break
+ *                     if n_closed < 0:             # <<<<<<<<<<<<<<
+ *                         break
  * 
 */
-            __pyx_t_14 = (__pyx_v_n_closed < 0);
-            if (__pyx_t_14) {
+              __pyx_t_10 = (__pyx_v_n_closed < 0);
+              if (__pyx_t_10) {
 
-              /* "chronoton/_cy_inner.pyx":410
- *                             break
- *                 if n_closed < 0:
- *                     break             # <<<<<<<<<<<<<<
+                /* "chronoton/_cy_inner.pyx":445
+ *                                 break
+ *                     if n_closed < 0:
+ *                         break             # <<<<<<<<<<<<<<
  * 
- *             # (4) Shifted entry signals ---------------------------------
+ *                 # (4) Shifted entry signals ---------------------------------
 */
-              goto __pyx_L7_break;
+                goto __pyx_L7_break;
 
-              /* "chronoton/_cy_inner.pyx":409
- *                         if n_closed < 0:
- *                             break
- *                 if n_closed < 0:             # <<<<<<<<<<<<<<
- *                     break
+                /* "chronoton/_cy_inner.pyx":444
+ *                             if n_closed < 0:
+ *                                 break
+ *                     if n_closed < 0:             # <<<<<<<<<<<<<<
+ *                         break
  * 
 */
-            }
+              }
 
-            /* "chronoton/_cy_inner.pyx":385
- *             want_long_exit = long_exits_shifted[i] != 0
- *             want_short_exit = short_exits_shifted[i] != 0
- *             if want_long_exit or want_short_exit:             # <<<<<<<<<<<<<<
- *                 for k in range(n_slots):
- *                     if slot_active[k] == 0:
+              /* "chronoton/_cy_inner.pyx":420
+ *                 want_long_exit = (flags & SIG_LONG_EXIT) != 0
+ *                 want_short_exit = (flags & SIG_SHORT_EXIT) != 0
+ *                 if want_long_exit or want_short_exit:             # <<<<<<<<<<<<<<
+ *                     for k in range(n_slots):
+ *                         if slot_active[k] == 0:
 */
-          }
+            }
 
-          /* "chronoton/_cy_inner.pyx":413
+            /* "chronoton/_cy_inner.pyx":448
  * 
- *             # (4) Shifted entry signals ---------------------------------
- *             want_long_entry = long_entries_shifted[i] != 0             # <<<<<<<<<<<<<<
- *             want_short_entry = short_entries_shifted[i] != 0
+ *                 # (4) Shifted entry signals ---------------------------------
+ *                 want_long_entry = (flags & SIG_LONG_ENTRY) != 0             # <<<<<<<<<<<<<<
+ *                 want_short_entry = (flags & SIG_SHORT_ENTRY) != 0
  * 
 */
-          __pyx_t_21 = __pyx_v_i;
-          __pyx_v_want_long_entry = ((*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_long_entries_shifted.data + __pyx_t_21 * __pyx_v_long_entries_shifted.strides[0]) ))) != 0);
+            __pyx_v_want_long_entry = ((__pyx_v_flags & __pyx_e_9chronoton_9_cy_inner_SIG_LONG_ENTRY) != 0);
 
-          /* "chronoton/_cy_inner.pyx":414
- *             # (4) Shifted entry signals ---------------------------------
- *             want_long_entry = long_entries_shifted[i] != 0
- *             want_short_entry = short_entries_shifted[i] != 0             # <<<<<<<<<<<<<<
+            /* "chronoton/_cy_inner.pyx":449
+ *                 # (4) Shifted entry signals ---------------------------------
+ *                 want_long_entry = (flags & SIG_LONG_ENTRY) != 0
+ *                 want_short_entry = (flags & SIG_SHORT_ENTRY) != 0             # <<<<<<<<<<<<<<
  * 
- *             # Non-hedging: flatten opposite-direction positions first
+ *                 # Non-hedging: flatten opposite-direction positions first
 */
-          __pyx_t_21 = __pyx_v_i;
-          __pyx_v_want_short_entry = ((*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_short_entries_shifted.data + __pyx_t_21 * __pyx_v_short_entries_shifted.strides[0]) ))) != 0);
+            __pyx_v_want_short_entry = ((__pyx_v_flags & __pyx_e_9chronoton_9_cy_inner_SIG_SHORT_ENTRY) != 0);
 
-          /* "chronoton/_cy_inner.pyx":417
+            /* "chronoton/_cy_inner.pyx":452
  * 
- *             # Non-hedging: flatten opposite-direction positions first
- *             if (not hedging) and (want_long_entry or want_short_entry):             # <<<<<<<<<<<<<<
- *                 desired_dir = 1 if want_long_entry else -1
- *                 for k in range(n_slots):
+ *                 # Non-hedging: flatten opposite-direction positions first
+ *                 if (not hedging) and (want_long_entry or want_short_entry):             # <<<<<<<<<<<<<<
+ *                     desired_dir = 1 if want_long_entry else -1
+ *                     for k in range(n_slots):
 */
-          __pyx_t_15 = (!__pyx_v_hedging);
-          if (__pyx_t_15) {
-          } else {
-            __pyx_t_14 = __pyx_t_15;
-            goto __pyx_L61_bool_binop_done;
-          }
-          if (!__pyx_v_want_long_entry) {
-          } else {
-            __pyx_t_14 = __pyx_v_want_long_entry;
-            goto __pyx_L61_bool_binop_done;
-          }
-          __pyx_t_14 = __pyx_v_want_short_entry;
-          __pyx_L61_bool_binop_done:;
-          if (__pyx_t_14) {
-
-            /* "chronoton/_cy_inner.pyx":418
- *             # Non-hedging: flatten opposite-direction positions first
- *             if (not hedging) and (want_long_entry or want_short_entry):
- *                 desired_dir = 1 if want_long_entry else -1             # <<<<<<<<<<<<<<
- *                 for k in range(n_slots):
- *                     if slot_active[k] == 0:
-*/
-            if (__pyx_v_want_long_entry) {
-              __pyx_t_23 = 1;
+            __pyx_t_12 = (!__pyx_v_hedging);
+            if (__pyx_t_12) {
             } else {
-              __pyx_t_23 = -1;
+              __pyx_t_10 = __pyx_t_12;
+              goto __pyx_L48_bool_binop_done;
             }
-            __pyx_v_desired_dir = __pyx_t_23;
-
-            /* "chronoton/_cy_inner.pyx":419
- *             if (not hedging) and (want_long_entry or want_short_entry):
- *                 desired_dir = 1 if want_long_entry else -1
- *                 for k in range(n_slots):             # <<<<<<<<<<<<<<
- *                     if slot_active[k] == 0:
- *                         continue
-*/
-            __pyx_t_16 = __pyx_v_n_slots;
-            __pyx_t_17 = __pyx_t_16;
-            for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
-              __pyx_v_k = __pyx_t_18;
-
-              /* "chronoton/_cy_inner.pyx":420
- *                 desired_dir = 1 if want_long_entry else -1
- *                 for k in range(n_slots):
- *                     if slot_active[k] == 0:             # <<<<<<<<<<<<<<
- *                         continue
- *                     direction = open_positions[k, F_DIRECTION]
-*/
-              __pyx_t_21 = __pyx_v_k;
-              __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_21 * __pyx_v_slot_active.strides[0]) ))) == 0);
-              if (__pyx_t_14) {
-
-                /* "chronoton/_cy_inner.pyx":421
- *                 for k in range(n_slots):
- *                     if slot_active[k] == 0:
- *                         continue             # <<<<<<<<<<<<<<
- *                     direction = open_positions[k, F_DIRECTION]
- *                     if <int>direction != desired_dir:
-*/
-                goto __pyx_L64_continue;
+            if (!__pyx_v_want_long_entry) {
+            } else {
+              __pyx_t_10 = __pyx_v_want_long_entry;
+              goto __pyx_L48_bool_binop_done;
+            }
+            __pyx_t_10 = __pyx_v_want_short_entry;
+            __pyx_L48_bool_binop_done:;
+            if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":420
- *                 desired_dir = 1 if want_long_entry else -1
- *                 for k in range(n_slots):
- *                     if slot_active[k] == 0:             # <<<<<<<<<<<<<<
- *                         continue
- *                     direction = open_positions[k, F_DIRECTION]
-*/
+              /* "chronoton/_cy_inner.pyx":453
+ *                 # Non-hedging: flatten opposite-direction positions first
+ *                 if (not hedging) and (want_long_entry or want_short_entry):
+ *                     desired_dir = 1 if want_long_entry else -1             # <<<<<<<<<<<<<<
+ *                     for k in range(n_slots):
+ *                         if slot_active[k] == 0:
+*/
+              if (__pyx_v_want_long_entry) {
+                __pyx_t_21 = 1;
+              } else {
+                __pyx_t_21 = -1;
               }
+              __pyx_v_desired_dir = __pyx_t_21;
 
-              /* "chronoton/_cy_inner.pyx":422
- *                     if slot_active[k] == 0:
- *                         continue
- *                     direction = open_positions[k, F_DIRECTION]             # <<<<<<<<<<<<<<
- *                     if <int>direction != desired_dir:
- *                         size = open_positions[k, F_SIZE]
+              /* "chronoton/_cy_inner.pyx":454
+ *                 if (not hedging) and (want_long_entry or want_short_entry):
+ *                     desired_dir = 1 if want_long_entry else -1
+ *                     for k in range(n_slots):             # <<<<<<<<<<<<<<
+ *                         if slot_active[k] == 0:
+ *                             continue
+*/
+              __pyx_t_13 = __pyx_v_n_slots;
+              __pyx_t_14 = __pyx_t_13;
+              for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+                __pyx_v_k = __pyx_t_15;
+
+                /* "chronoton/_cy_inner.pyx":455
+ *                     desired_dir = 1 if want_long_entry else -1
+ *                     for k in range(n_slots):
+ *                         if slot_active[k] == 0:             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         direction = open_positions[k, F_DIRECTION]
+*/
+                __pyx_t_18 = __pyx_v_k;
+                __pyx_t_10 = ((*((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_18)) ))) == 0);
+                if (__pyx_t_10) {
+
+                  /* "chronoton/_cy_inner.pyx":456
+ *                     for k in range(n_slots):
+ *                         if slot_active[k] == 0:
+ *                             continue             # <<<<<<<<<<<<<<
+ *                         direction = open_positions[k, F_DIRECTION]
+ *                         if <int>direction != desired_dir:
+*/
+                  goto __pyx_L51_continue;
+
+                  /* "chronoton/_cy_inner.pyx":455
+ *                     desired_dir = 1 if want_long_entry else -1
+ *                     for k in range(n_slots):
+ *                         if slot_active[k] == 0:             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         direction = open_positions[k, F_DIRECTION]
 */
-              __pyx_t_21 = __pyx_v_k;
-              __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
-              __pyx_v_direction = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) )));
+                }
 
-              /* "chronoton/_cy_inner.pyx":423
- *                         continue
- *                     direction = open_positions[k, F_DIRECTION]
- *                     if <int>direction != desired_dir:             # <<<<<<<<<<<<<<
- *                         size = open_positions[k, F_SIZE]
- *                         entry_px = open_positions[k, F_ENTRY_PRICE]
+                /* "chronoton/_cy_inner.pyx":457
+ *                         if slot_active[k] == 0:
+ *                             continue
+ *                         direction = open_positions[k, F_DIRECTION]             # <<<<<<<<<<<<<<
+ *                         if <int>direction != desired_dir:
+ *                             size = open_positions[k, F_SIZE]
 */
-              __pyx_t_14 = (((int)__pyx_v_direction) != __pyx_v_desired_dir);
-              if (__pyx_t_14) {
+                __pyx_t_18 = __pyx_v_k;
+                __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
+                __pyx_v_direction = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) )));
 
-                /* "chronoton/_cy_inner.pyx":424
- *                     direction = open_positions[k, F_DIRECTION]
- *                     if <int>direction != desired_dir:
- *                         size = open_positions[k, F_SIZE]             # <<<<<<<<<<<<<<
- *                         entry_px = open_positions[k, F_ENTRY_PRICE]
- *                         exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
+                /* "chronoton/_cy_inner.pyx":458
+ *                             continue
+ *                         direction = open_positions[k, F_DIRECTION]
+ *                         if <int>direction != desired_dir:             # <<<<<<<<<<<<<<
+ *                             size = open_positions[k, F_SIZE]
+ *                             entry_px = open_positions[k, F_ENTRY_PRICE]
 */
-                __pyx_t_20 = __pyx_v_k;
-                __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
-                __pyx_v_size = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) )));
+                __pyx_t_10 = (((int)__pyx_v_direction) != __pyx_v_desired_dir);
+                if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":425
- *                     if <int>direction != desired_dir:
- *                         size = open_positions[k, F_SIZE]
- *                         entry_px = open_positions[k, F_ENTRY_PRICE]             # <<<<<<<<<<<<<<
- *                         exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
- *                         exit_commission = commission * fabs(exit_px_net * size)
+                  /* "chronoton/_cy_inner.pyx":459
+ *                         direction = open_positions[k, F_DIRECTION]
+ *                         if <int>direction != desired_dir:
+ *                             size = open_positions[k, F_SIZE]             # <<<<<<<<<<<<<<
+ *                             entry_px = open_positions[k, F_ENTRY_PRICE]
+ *                             exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
+*/
+                  __pyx_t_17 = __pyx_v_k;
+                  __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
+                  __pyx_v_size = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) )));
+
+                  /* "chronoton/_cy_inner.pyx":460
+ *                         if <int>direction != desired_dir:
+ *                             size = open_positions[k, F_SIZE]
+ *                             entry_px = open_positions[k, F_ENTRY_PRICE]             # <<<<<<<<<<<<<<
+ *                             exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
+ *                             exit_commission = commission * fabs(exit_px_net * size)
+*/
+                  __pyx_t_18 = __pyx_v_k;
+                  __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
+                  __pyx_v_entry_px = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) )));
+
+                  /* "chronoton/_cy_inner.pyx":461
+ *                             size = open_positions[k, F_SIZE]
+ *                             entry_px = open_positions[k, F_ENTRY_PRICE]
+ *                             exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])             # <<<<<<<<<<<<<<
+ *                             exit_commission = commission * fabs(exit_px_net * size)
+ *                             proceeds = direction * (exit_px_net - entry_px) * size
+*/
+                  __pyx_t_17 = __pyx_v_i;
+                  __pyx_t_18 = __pyx_v_i;
+                  __pyx_v_exit_px_net = (__pyx_v_price_o - (__pyx_v_direction * ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_spread_arr.data) + __pyx_t_17)) ))) + (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_slippage_arr.data) + __pyx_t_18)) ))))));
+
+                  /* "chronoton/_cy_inner.pyx":462
+ *                             entry_px = open_positions[k, F_ENTRY_PRICE]
+ *                             exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
+ *                             exit_commission = commission * fabs(exit_px_net * size)             # <<<<<<<<<<<<<<
+ *                             proceeds = direction * (exit_px_net - entry_px) * size
+ *                             current_cash += (size * entry_px) + proceeds
+*/
+                  __pyx_v_exit_commission = (__pyx_v_commission * fabs((__pyx_v_exit_px_net * __pyx_v_size)));
+
+                  /* "chronoton/_cy_inner.pyx":463
+ *                             exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
+ *                             exit_commission = commission * fabs(exit_px_net * size)
+ *                             proceeds = direction * (exit_px_net - entry_px) * size             # <<<<<<<<<<<<<<
+ *                             current_cash += (size * entry_px) + proceeds
+ *                             current_cash -= exit_commission
+*/
+                  __pyx_v_proceeds = ((__pyx_v_direction * (__pyx_v_exit_px_net - __pyx_v_entry_px)) * __pyx_v_size);
+
+                  /* "chronoton/_cy_inner.pyx":464
+ *                             exit_commission = commission * fabs(exit_px_net * size)
+ *                             proceeds = direction * (exit_px_net - entry_px) * size
+ *                             current_cash += (size * entry_px) + proceeds             # <<<<<<<<<<<<<<
+ *                             current_cash -= exit_commission
+ *                             n_closed = _exit_position(
+*/
+                  __pyx_v_current_cash = (__pyx_v_current_cash + ((__pyx_v_size * __pyx_v_entry_px) + __pyx_v_proceeds));
+
+                  /* "chronoton/_cy_inner.pyx":465
+ *                             proceeds = direction * (exit_px_net - entry_px) * size
+ *                             current_cash += (size * entry_px) + proceeds
+ *                             current_cash -= exit_commission             # <<<<<<<<<<<<<<
+ *                             n_closed = _exit_position(
+ *                                 k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
+*/
+                  __pyx_v_current_cash = (__pyx_v_current_cash - __pyx_v_exit_commission);
+
+                  /* "chronoton/_cy_inner.pyx":469
+ *                                 k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
+ *                                 exit_commission,
+ *                                 spread_arr[i] * size,             # <<<<<<<<<<<<<<
+ *                                 slippage_arr[i] * size,
+ *                                 open_positions, slot_active, closed_trades,
+*/
+                  __pyx_t_18 = __pyx_v_i;
+
+                  /* "chronoton/_cy_inner.pyx":470
+ *                                 exit_commission,
+ *                                 spread_arr[i] * size,
+ *                                 slippage_arr[i] * size,             # <<<<<<<<<<<<<<
+ *                                 open_positions, slot_active, closed_trades,
+ *                                 n_closed, closed_capacity, overflow_flag,
+*/
+                  __pyx_t_17 = __pyx_v_i;
+
+                  /* "chronoton/_cy_inner.pyx":466
+ *                             current_cash += (size * entry_px) + proceeds
+ *                             current_cash -= exit_commission
+ *                             n_closed = _exit_position(             # <<<<<<<<<<<<<<
+ *                                 k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
+ *                                 exit_commission,
+*/
+                  __pyx_t_20 = __pyx_f_9chronoton_9_cy_inner__exit_position(__pyx_v_k, __pyx_v_i, __pyx_v_t_ns, __pyx_v_exit_px_net, ((double)__pyx_e_9chronoton_9_cy_inner_EXIT_SIGNAL), __pyx_v_exit_commission, ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_spread_arr.data) + __pyx_t_18)) ))) * __pyx_v_size), ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_slippage_arr.data) + __pyx_t_17)) ))) * __pyx_v_size), __pyx_v_open_positions, __pyx_v_slot_active, __pyx_v_closed_trades, __pyx_v_n_closed, __pyx_v_closed_capacity, __pyx_v_overflow_flag); if (unlikely(__pyx_t_20 == ((Py_ssize_t)-1L) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 466, __pyx_L4_error)
+                  __pyx_v_n_closed = __pyx_t_20;
+
+                  /* "chronoton/_cy_inner.pyx":474
+ *                                 n_closed, closed_capacity, overflow_flag,
+ *                             )
+ *                             if n_closed < 0:             # <<<<<<<<<<<<<<
+ *                                 break
+ *                     if n_closed < 0:
 */
-                __pyx_t_21 = __pyx_v_k;
-                __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
-                __pyx_v_entry_px = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) )));
+                  __pyx_t_10 = (__pyx_v_n_closed < 0);
+                  if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":426
- *                         size = open_positions[k, F_SIZE]
- *                         entry_px = open_positions[k, F_ENTRY_PRICE]
- *                         exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])             # <<<<<<<<<<<<<<
- *                         exit_commission = commission * fabs(exit_px_net * size)
- *                         proceeds = direction * (exit_px_net - entry_px) * size
-*/
-                __pyx_t_20 = __pyx_v_i;
-                __pyx_t_21 = __pyx_v_i;
-                __pyx_v_exit_px_net = (__pyx_v_price_o - (__pyx_v_direction * ((*((double const  *) ( /* dim=0 */ (__pyx_v_spread_arr.data + __pyx_t_20 * __pyx_v_spread_arr.strides[0]) ))) + (*((double const  *) ( /* dim=0 */ (__pyx_v_slippage_arr.data + __pyx_t_21 * __pyx_v_slippage_arr.strides[0]) ))))));
-
-                /* "chronoton/_cy_inner.pyx":427
- *                         entry_px = open_positions[k, F_ENTRY_PRICE]
- *                         exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
- *                         exit_commission = commission * fabs(exit_px_net * size)             # <<<<<<<<<<<<<<
- *                         proceeds = direction * (exit_px_net - entry_px) * size
- *                         current_cash += (size * entry_px) + proceeds
-*/
-                __pyx_v_exit_commission = (__pyx_v_commission * fabs((__pyx_v_exit_px_net * __pyx_v_size)));
-
-                /* "chronoton/_cy_inner.pyx":428
- *                         exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
- *                         exit_commission = commission * fabs(exit_px_net * size)
- *                         proceeds = direction * (exit_px_net - entry_px) * size             # <<<<<<<<<<<<<<
- *                         current_cash += (size * entry_px) + proceeds
- *                         current_cash -= exit_commission
-*/
-                __pyx_v_proceeds = ((__pyx_v_direction * (__pyx_v_exit_px_net - __pyx_v_entry_px)) * __pyx_v_size);
-
-                /* "chronoton/_cy_inner.pyx":429
- *                         exit_commission = commission * fabs(exit_px_net * size)
- *                         proceeds = direction * (exit_px_net - entry_px) * size
- *                         current_cash += (size * entry_px) + proceeds             # <<<<<<<<<<<<<<
- *                         current_cash -= exit_commission
- *                         n_closed = _exit_position(
-*/
-                __pyx_v_current_cash = (__pyx_v_current_cash + ((__pyx_v_size * __pyx_v_entry_px) + __pyx_v_proceeds));
-
-                /* "chronoton/_cy_inner.pyx":430
- *                         proceeds = direction * (exit_px_net - entry_px) * size
- *                         current_cash += (size * entry_px) + proceeds
- *                         current_cash -= exit_commission             # <<<<<<<<<<<<<<
- *                         n_closed = _exit_position(
- *                             k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
-*/
-                __pyx_v_current_cash = (__pyx_v_current_cash - __pyx_v_exit_commission);
-
-                /* "chronoton/_cy_inner.pyx":434
- *                             k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
- *                             exit_commission,
- *                             spread_arr[i] * size,             # <<<<<<<<<<<<<<
- *                             slippage_arr[i] * size,
- *                             open_positions, slot_active, closed_trades,
-*/
-                __pyx_t_21 = __pyx_v_i;
-
-                /* "chronoton/_cy_inner.pyx":435
- *                             exit_commission,
- *                             spread_arr[i] * size,
- *                             slippage_arr[i] * size,             # <<<<<<<<<<<<<<
- *                             open_positions, slot_active, closed_trades,
- *                             n_closed, closed_capacity, overflow_flag,
-*/
-                __pyx_t_20 = __pyx_v_i;
-
-                /* "chronoton/_cy_inner.pyx":431
- *                         current_cash += (size * entry_px) + proceeds
- *                         current_cash -= exit_commission
- *                         n_closed = _exit_position(             # <<<<<<<<<<<<<<
- *                             k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
- *                             exit_commission,
-*/
-                __pyx_t_22 = __pyx_f_9chronoton_9_cy_inner__exit_position(__pyx_v_k, __pyx_v_i, __pyx_v_t_ns, __pyx_v_exit_px_net, ((double)__pyx_e_9chronoton_9_cy_inner_EXIT_SIGNAL), __pyx_v_exit_commission, ((*((double const  *) ( /* dim=0 */ (__pyx_v_spread_arr.data + __pyx_t_21 * __pyx_v_spread_arr.strides[0]) ))) * __pyx_v_size), ((*((double const  *) ( /* dim=0 */ (__pyx_v_slippage_arr.data + __pyx_t_20 * __pyx_v_slippage_arr.strides[0]) ))) * __pyx_v_size), __pyx_v_open_positions, __pyx_v_slot_active, __pyx_v_closed_trades, __pyx_v_n_closed, __pyx_v_closed_capacity, __pyx_v_overflow_flag); if (unlikely(__pyx_t_22 == ((Py_ssize_t)-1L) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 431, __pyx_L4_error)
-                __pyx_v_n_closed = __pyx_t_22;
-
-                /* "chronoton/_cy_inner.pyx":439
- *                             n_closed, closed_capacity, overflow_flag,
- *                         )
- *                         if n_closed < 0:             # <<<<<<<<<<<<<<
- *                             break
- *                 if n_closed < 0:
+                    /* "chronoton/_cy_inner.pyx":475
+ *                             )
+ *                             if n_closed < 0:
+ *                                 break             # <<<<<<<<<<<<<<
+ *                     if n_closed < 0:
+ *                         break
 */
-                __pyx_t_14 = (__pyx_v_n_closed < 0);
-                if (__pyx_t_14) {
+                    goto __pyx_L52_break;
 
-                  /* "chronoton/_cy_inner.pyx":440
- *                         )
- *                         if n_closed < 0:
- *                             break             # <<<<<<<<<<<<<<
- *                 if n_closed < 0:
- *                     break
+                    /* "chronoton/_cy_inner.pyx":474
+ *                                 n_closed, closed_capacity, overflow_flag,
+ *                             )
+ *                             if n_closed < 0:             # <<<<<<<<<<<<<<
+ *                                 break
+ *                     if n_closed < 0:
 */
-                  goto __pyx_L65_break;
+                  }
 
-                  /* "chronoton/_cy_inner.pyx":439
- *                             n_closed, closed_capacity, overflow_flag,
- *                         )
- *                         if n_closed < 0:             # <<<<<<<<<<<<<<
- *                             break
- *                 if n_closed < 0:
+                  /* "chronoton/_cy_inner.pyx":458
+ *                             continue
+ *                         direction = open_positions[k, F_DIRECTION]
+ *                         if <int>direction != desired_dir:             # <<<<<<<<<<<<<<
+ *                             size = open_positions[k, F_SIZE]
+ *                             entry_px = open_positions[k, F_ENTRY_PRICE]
 */
                 }
-
-                /* "chronoton/_cy_inner.pyx":423
- *                         continue
- *                     direction = open_positions[k, F_DIRECTION]
- *                     if <int>direction != desired_dir:             # <<<<<<<<<<<<<<
- *                         size = open_positions[k, F_SIZE]
- *                         entry_px = open_positions[k, F_ENTRY_PRICE]
-*/
+                __pyx_L51_continue:;
               }
-              __pyx_L64_continue:;
-            }
-            __pyx_L65_break:;
+              __pyx_L52_break:;
 
-            /* "chronoton/_cy_inner.pyx":441
- *                         if n_closed < 0:
- *                             break
- *                 if n_closed < 0:             # <<<<<<<<<<<<<<
- *                     break
+              /* "chronoton/_cy_inner.pyx":476
+ *                             if n_closed < 0:
+ *                                 break
+ *                     if n_closed < 0:             # <<<<<<<<<<<<<<
+ *                         break
  * 
 */
-            __pyx_t_14 = (__pyx_v_n_closed < 0);
-            if (__pyx_t_14) {
+              __pyx_t_10 = (__pyx_v_n_closed < 0);
+              if (__pyx_t_10) {
 
-              /* "chronoton/_cy_inner.pyx":442
- *                             break
- *                 if n_closed < 0:
- *                     break             # <<<<<<<<<<<<<<
+                /* "chronoton/_cy_inner.pyx":477
+ *                                 break
+ *                     if n_closed < 0:
+ *                         break             # <<<<<<<<<<<<<<
  * 
- *             # Open new positions. Unrolled for long and short separately
+ *                 # Open new positions. Unrolled for long and short separately
 */
-              goto __pyx_L7_break;
+                goto __pyx_L7_break;
 
-              /* "chronoton/_cy_inner.pyx":441
- *                         if n_closed < 0:
- *                             break
- *                 if n_closed < 0:             # <<<<<<<<<<<<<<
- *                     break
+                /* "chronoton/_cy_inner.pyx":476
+ *                             if n_closed < 0:
+ *                                 break
+ *                     if n_closed < 0:             # <<<<<<<<<<<<<<
+ *                         break
  * 
 */
-            }
+              }
 
-            /* "chronoton/_cy_inner.pyx":417
+              /* "chronoton/_cy_inner.pyx":452
  * 
- *             # Non-hedging: flatten opposite-direction positions first
- *             if (not hedging) and (want_long_entry or want_short_entry):             # <<<<<<<<<<<<<<
- *                 desired_dir = 1 if want_long_entry else -1
- *                 for k in range(n_slots):
-*/
-          }
-
-          /* "chronoton/_cy_inner.pyx":450
- *             # `want_*_entry` flag is consulted  kept as a helper-free inline
- *             # to stay fully in C.
- *             if want_long_entry:             # <<<<<<<<<<<<<<
- *                 desired_dir = 1
- *                 slot_idx = _find_free_slot(slot_active, n_slots)
-*/
-          if (__pyx_v_want_long_entry) {
-
-            /* "chronoton/_cy_inner.pyx":451
- *             # to stay fully in C.
- *             if want_long_entry:
- *                 desired_dir = 1             # <<<<<<<<<<<<<<
- *                 slot_idx = _find_free_slot(slot_active, n_slots)
- *                 if slot_idx != -1:
+ *                 # Non-hedging: flatten opposite-direction positions first
+ *                 if (not hedging) and (want_long_entry or want_short_entry):             # <<<<<<<<<<<<<<
+ *                     desired_dir = 1 if want_long_entry else -1
+ *                     for k in range(n_slots):
 */
-            __pyx_v_desired_dir = 1;
+            }
 
-            /* "chronoton/_cy_inner.pyx":452
- *             if want_long_entry:
- *                 desired_dir = 1
- *                 slot_idx = _find_free_slot(slot_active, n_slots)             # <<<<<<<<<<<<<<
- *                 if slot_idx != -1:
- *                     entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
+            /* "chronoton/_cy_inner.pyx":485
+ *                 # `want_*_entry` flag is consulted  kept as a helper-free inline
+ *                 # to stay fully in C.
+ *                 if want_long_entry:             # <<<<<<<<<<<<<<
+ *                     desired_dir = 1
+ *                     slot_idx = _find_free_slot(slot_active, n_slots)
 */
-            __pyx_t_16 = __pyx_f_9chronoton_9_cy_inner__find_free_slot(__pyx_v_slot_active, __pyx_v_n_slots); if (unlikely(__pyx_t_16 == ((Py_ssize_t)-1L) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 452, __pyx_L4_error)
-            __pyx_v_slot_idx = __pyx_t_16;
+            if (__pyx_v_want_long_entry) {
 
-            /* "chronoton/_cy_inner.pyx":453
- *                 desired_dir = 1
- *                 slot_idx = _find_free_slot(slot_active, n_slots)
- *                 if slot_idx != -1:             # <<<<<<<<<<<<<<
- *                     entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
- * 
+              /* "chronoton/_cy_inner.pyx":486
+ *                 # to stay fully in C.
+ *                 if want_long_entry:
+ *                     desired_dir = 1             # <<<<<<<<<<<<<<
+ *                     slot_idx = _find_free_slot(slot_active, n_slots)
+ *                     if slot_idx != -1:
 */
-            __pyx_t_14 = (__pyx_v_slot_idx != -1L);
-            if (__pyx_t_14) {
+              __pyx_v_desired_dir = 1;
 
-              /* "chronoton/_cy_inner.pyx":454
- *                 slot_idx = _find_free_slot(slot_active, n_slots)
- *                 if slot_idx != -1:
- *                     entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])             # <<<<<<<<<<<<<<
- * 
- *                     if sizing_method_code == SIZING_PERCENT_EQUITY:
+              /* "chronoton/_cy_inner.pyx":487
+ *                 if want_long_entry:
+ *                     desired_dir = 1
+ *                     slot_idx = _find_free_slot(slot_active, n_slots)             # <<<<<<<<<<<<<<
+ *                     if slot_idx != -1:
+ *                         entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
 */
-              __pyx_t_20 = __pyx_v_i;
-              __pyx_t_21 = __pyx_v_i;
-              __pyx_v_entry_px_net = (__pyx_v_price_o + (__pyx_v_desired_dir * ((*((double const  *) ( /* dim=0 */ (__pyx_v_spread_arr.data + __pyx_t_20 * __pyx_v_spread_arr.strides[0]) ))) + (*((double const  *) ( /* dim=0 */ (__pyx_v_slippage_arr.data + __pyx_t_21 * __pyx_v_slippage_arr.strides[0]) ))))));
+              __pyx_t_13 = __pyx_f_9chronoton_9_cy_inner__find_free_slot(__pyx_v_slot_active, __pyx_v_n_slots); if (unlikely(__pyx_t_13 == ((Py_ssize_t)-1L) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 487, __pyx_L4_error)
+              __pyx_v_slot_idx = __pyx_t_13;
 
-              /* "chronoton/_cy_inner.pyx":456
- *                     entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
+              /* "chronoton/_cy_inner.pyx":488
+ *                     desired_dir = 1
+ *                     slot_idx = _find_free_slot(slot_active, n_slots)
+ *                     if slot_idx != -1:             # <<<<<<<<<<<<<<
+ *                         entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
  * 
- *                     if sizing_method_code == SIZING_PERCENT_EQUITY:             # <<<<<<<<<<<<<<
- *                         equity_now = current_cash
- *                         for kk in range(n_slots):
 */
-              switch (__pyx_v_sizing_method_code) {
-                case __pyx_e_9chronoton_9_cy_inner_SIZING_PERCENT_EQUITY:
+              __pyx_t_10 = (__pyx_v_slot_idx != -1L);
+              if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":457
+                /* "chronoton/_cy_inner.pyx":489
+ *                     slot_idx = _find_free_slot(slot_active, n_slots)
+ *                     if slot_idx != -1:
+ *                         entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])             # <<<<<<<<<<<<<<
  * 
- *                     if sizing_method_code == SIZING_PERCENT_EQUITY:
- *                         equity_now = current_cash             # <<<<<<<<<<<<<<
- *                         for kk in range(n_slots):
- *                             if slot_active[kk] != 0:
-*/
-                __pyx_v_equity_now = __pyx_v_current_cash;
-
-                /* "chronoton/_cy_inner.pyx":458
- *                     if sizing_method_code == SIZING_PERCENT_EQUITY:
- *                         equity_now = current_cash
- *                         for kk in range(n_slots):             # <<<<<<<<<<<<<<
- *                             if slot_active[kk] != 0:
- *                                 d = open_positions[kk, F_DIRECTION]
-*/
-                __pyx_t_16 = __pyx_v_n_slots;
-                __pyx_t_17 = __pyx_t_16;
-                for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
-                  __pyx_v_kk = __pyx_t_18;
-
-                  /* "chronoton/_cy_inner.pyx":459
- *                         equity_now = current_cash
- *                         for kk in range(n_slots):
- *                             if slot_active[kk] != 0:             # <<<<<<<<<<<<<<
- *                                 d = open_positions[kk, F_DIRECTION]
- *                                 equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
-*/
-                  __pyx_t_21 = __pyx_v_kk;
-                  __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_21 * __pyx_v_slot_active.strides[0]) ))) != 0);
-                  if (__pyx_t_14) {
-
-                    /* "chronoton/_cy_inner.pyx":460
- *                         for kk in range(n_slots):
- *                             if slot_active[kk] != 0:
- *                                 d = open_positions[kk, F_DIRECTION]             # <<<<<<<<<<<<<<
- *                                 equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
- *                                                  * open_positions[kk, F_SIZE])
-*/
-                    __pyx_t_21 = __pyx_v_kk;
-                    __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
-                    __pyx_v_d = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) )));
-
-                    /* "chronoton/_cy_inner.pyx":461
- *                             if slot_active[kk] != 0:
- *                                 d = open_positions[kk, F_DIRECTION]
- *                                 equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
- *                                                  * open_positions[kk, F_SIZE])
- *                         size = (sizing_static * equity_now * leverage) / entry_px_net
-*/
-                    __pyx_t_20 = __pyx_v_kk;
-                    __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
-
-                    /* "chronoton/_cy_inner.pyx":462
- *                                 d = open_positions[kk, F_DIRECTION]
- *                                 equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
- *                                                  * open_positions[kk, F_SIZE])             # <<<<<<<<<<<<<<
- *                         size = (sizing_static * equity_now * leverage) / entry_px_net
- *                     elif sizing_method_code == SIZING_VALUE:
-*/
-                    __pyx_t_19 = __pyx_v_kk;
-                    __pyx_t_13 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
-
-                    /* "chronoton/_cy_inner.pyx":461
- *                             if slot_active[kk] != 0:
- *                                 d = open_positions[kk, F_DIRECTION]
- *                                 equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
- *                                                  * open_positions[kk, F_SIZE])
- *                         size = (sizing_static * equity_now * leverage) / entry_px_net
-*/
-                    __pyx_v_equity_now = (__pyx_v_equity_now + ((__pyx_v_d * (__pyx_v_price_c - (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) ))))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_19 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_13 * __pyx_v_open_positions.strides[1]) )))));
-
-                    /* "chronoton/_cy_inner.pyx":459
- *                         equity_now = current_cash
- *                         for kk in range(n_slots):
- *                             if slot_active[kk] != 0:             # <<<<<<<<<<<<<<
- *                                 d = open_positions[kk, F_DIRECTION]
- *                                 equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
-*/
-                  }
-                }
-
-                /* "chronoton/_cy_inner.pyx":463
- *                                 equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
- *                                                  * open_positions[kk, F_SIZE])
- *                         size = (sizing_static * equity_now * leverage) / entry_px_net             # <<<<<<<<<<<<<<
- *                     elif sizing_method_code == SIZING_VALUE:
- *                         size = (sizing_static * leverage) / entry_px_net
+ *                         if sizing_method_code == SIZING_PERCENT_EQUITY:
 */
-                __pyx_v_size = (((__pyx_v_sizing_static * __pyx_v_equity_now) * __pyx_v_leverage) / __pyx_v_entry_px_net);
+                __pyx_t_17 = __pyx_v_i;
+                __pyx_t_18 = __pyx_v_i;
+                __pyx_v_entry_px_net = (__pyx_v_price_o + (__pyx_v_desired_dir * ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_spread_arr.data) + __pyx_t_17)) ))) + (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_slippage_arr.data) + __pyx_t_18)) ))))));
 
-                /* "chronoton/_cy_inner.pyx":456
- *                     entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
+                /* "chronoton/_cy_inner.pyx":491
+ *                         entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
  * 
- *                     if sizing_method_code == SIZING_PERCENT_EQUITY:             # <<<<<<<<<<<<<<
- *                         equity_now = current_cash
- *                         for kk in range(n_slots):
-*/
-                break;
-                case __pyx_e_9chronoton_9_cy_inner_SIZING_VALUE:
-
-                /* "chronoton/_cy_inner.pyx":465
- *                         size = (sizing_static * equity_now * leverage) / entry_px_net
- *                     elif sizing_method_code == SIZING_VALUE:
- *                         size = (sizing_static * leverage) / entry_px_net             # <<<<<<<<<<<<<<
- *                     elif sizing_method_code == SIZING_PERCENT_AT_RISK:
- *                         # size = (risk_pct * equity) / sl_dist; leverage NOT applied.
-*/
-                __pyx_v_size = ((__pyx_v_sizing_static * __pyx_v_leverage) / __pyx_v_entry_px_net);
-
-                /* "chronoton/_cy_inner.pyx":464
- *                                                  * open_positions[kk, F_SIZE])
- *                         size = (sizing_static * equity_now * leverage) / entry_px_net
- *                     elif sizing_method_code == SIZING_VALUE:             # <<<<<<<<<<<<<<
- *                         size = (sizing_static * leverage) / entry_px_net
- *                     elif sizing_method_code == SIZING_PERCENT_AT_RISK:
-*/
-                break;
-                case __pyx_e_9chronoton_9_cy_inner_SIZING_PERCENT_AT_RISK:
-
-                /* "chronoton/_cy_inner.pyx":470
- *                         # Python dispatcher has already verified SL is not None;
- *                         # a per-bar NaN still guards the entry here.
- *                         sl_dist = sl_arr[i]             # <<<<<<<<<<<<<<
- *                         if isnan(sl_dist) or sl_dist <= 0.0:
- *                             size = 0.0
-*/
-                __pyx_t_13 = __pyx_v_i;
-                __pyx_v_sl_dist = (*((double const  *) ( /* dim=0 */ (__pyx_v_sl_arr.data + __pyx_t_13 * __pyx_v_sl_arr.strides[0]) )));
-
-                /* "chronoton/_cy_inner.pyx":471
- *                         # a per-bar NaN still guards the entry here.
- *                         sl_dist = sl_arr[i]
- *                         if isnan(sl_dist) or sl_dist <= 0.0:             # <<<<<<<<<<<<<<
- *                             size = 0.0
- *                         else:
-*/
-                __pyx_t_15 = isnan(__pyx_v_sl_dist);
-                if (!__pyx_t_15) {
-                } else {
-                  __pyx_t_14 = __pyx_t_15;
-                  goto __pyx_L76_bool_binop_done;
-                }
-                __pyx_t_15 = (__pyx_v_sl_dist <= 0.0);
-                __pyx_t_14 = __pyx_t_15;
-                __pyx_L76_bool_binop_done:;
-                if (__pyx_t_14) {
-
-                  /* "chronoton/_cy_inner.pyx":472
- *                         sl_dist = sl_arr[i]
- *                         if isnan(sl_dist) or sl_dist <= 0.0:
- *                             size = 0.0             # <<<<<<<<<<<<<<
- *                         else:
+ *                         if sizing_method_code == SIZING_PERCENT_EQUITY:             # <<<<<<<<<<<<<<
  *                             equity_now = current_cash
+ *                             for kk in range(n_slots):
 */
-                  __pyx_v_size = 0.0;
-
-                  /* "chronoton/_cy_inner.pyx":471
- *                         # a per-bar NaN still guards the entry here.
- *                         sl_dist = sl_arr[i]
- *                         if isnan(sl_dist) or sl_dist <= 0.0:             # <<<<<<<<<<<<<<
- *                             size = 0.0
- *                         else:
-*/
-                  goto __pyx_L75;
-                }
+                switch (__pyx_v_sizing_method_code) {
+                  case __pyx_e_9chronoton_9_cy_inner_SIZING_PERCENT_EQUITY:
 
-                /* "chronoton/_cy_inner.pyx":474
- *                             size = 0.0
- *                         else:
+                  /* "chronoton/_cy_inner.pyx":492
+ * 
+ *                         if sizing_method_code == SIZING_PERCENT_EQUITY:
  *                             equity_now = current_cash             # <<<<<<<<<<<<<<
  *                             for kk in range(n_slots):
  *                                 if slot_active[kk] != 0:
 */
-                /*else*/ {
                   __pyx_v_equity_now = __pyx_v_current_cash;
 
-                  /* "chronoton/_cy_inner.pyx":475
- *                         else:
+                  /* "chronoton/_cy_inner.pyx":493
+ *                         if sizing_method_code == SIZING_PERCENT_EQUITY:
  *                             equity_now = current_cash
  *                             for kk in range(n_slots):             # <<<<<<<<<<<<<<
  *                                 if slot_active[kk] != 0:
  *                                     d = open_positions[kk, F_DIRECTION]
 */
-                  __pyx_t_16 = __pyx_v_n_slots;
-                  __pyx_t_17 = __pyx_t_16;
-                  for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
-                    __pyx_v_kk = __pyx_t_18;
+                  __pyx_t_13 = __pyx_v_n_slots;
+                  __pyx_t_14 = __pyx_t_13;
+                  for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+                    __pyx_v_kk = __pyx_t_15;
 
-                    /* "chronoton/_cy_inner.pyx":476
+                    /* "chronoton/_cy_inner.pyx":494
  *                             equity_now = current_cash
  *                             for kk in range(n_slots):
  *                                 if slot_active[kk] != 0:             # <<<<<<<<<<<<<<
  *                                     d = open_positions[kk, F_DIRECTION]
  *                                     equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
 */
-                    __pyx_t_13 = __pyx_v_kk;
-                    __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_13 * __pyx_v_slot_active.strides[0]) ))) != 0);
-                    if (__pyx_t_14) {
+                    __pyx_t_18 = __pyx_v_kk;
+                    __pyx_t_10 = ((*((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_18)) ))) != 0);
+                    if (__pyx_t_10) {
 
-                      /* "chronoton/_cy_inner.pyx":477
+                      /* "chronoton/_cy_inner.pyx":495
  *                             for kk in range(n_slots):
  *                                 if slot_active[kk] != 0:
  *                                     d = open_positions[kk, F_DIRECTION]             # <<<<<<<<<<<<<<
  *                                     equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
  *                                                      * open_positions[kk, F_SIZE])
 */
-                      __pyx_t_13 = __pyx_v_kk;
-                      __pyx_t_19 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
-                      __pyx_v_d = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_13 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_19 * __pyx_v_open_positions.strides[1]) )));
+                      __pyx_t_18 = __pyx_v_kk;
+                      __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
+                      __pyx_v_d = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) )));
 
-                      /* "chronoton/_cy_inner.pyx":478
+                      /* "chronoton/_cy_inner.pyx":496
  *                                 if slot_active[kk] != 0:
  *                                     d = open_positions[kk, F_DIRECTION]
  *                                     equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
  *                                                      * open_positions[kk, F_SIZE])
- *                             size = (sizing_static * equity_now) / sl_dist
+ *                             size = (sizing_static * equity_now * leverage) / entry_px_net
 */
-                      __pyx_t_19 = __pyx_v_kk;
-                      __pyx_t_13 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
+                      __pyx_t_17 = __pyx_v_kk;
+                      __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
 
-                      /* "chronoton/_cy_inner.pyx":479
+                      /* "chronoton/_cy_inner.pyx":497
  *                                     d = open_positions[kk, F_DIRECTION]
  *                                     equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
  *                                                      * open_positions[kk, F_SIZE])             # <<<<<<<<<<<<<<
- *                             size = (sizing_static * equity_now) / sl_dist
- *                     else:  # SIZING_PRECOMPUTED
+ *                             size = (sizing_static * equity_now * leverage) / entry_px_net
+ *                         elif sizing_method_code == SIZING_VALUE:
 */
-                      __pyx_t_21 = __pyx_v_kk;
-                      __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
+                      __pyx_t_11 = __pyx_v_kk;
+                      __pyx_t_16 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
 
-                      /* "chronoton/_cy_inner.pyx":478
+                      /* "chronoton/_cy_inner.pyx":496
  *                                 if slot_active[kk] != 0:
  *                                     d = open_positions[kk, F_DIRECTION]
  *                                     equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
  *                                                      * open_positions[kk, F_SIZE])
- *                             size = (sizing_static * equity_now) / sl_dist
+ *                             size = (sizing_static * equity_now * leverage) / entry_px_net
 */
-                      __pyx_v_equity_now = (__pyx_v_equity_now + ((__pyx_v_d * (__pyx_v_price_c - (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_19 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_13 * __pyx_v_open_positions.strides[1]) ))))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) )))));
+                      __pyx_v_equity_now = (__pyx_v_equity_now + ((__pyx_v_d * (__pyx_v_price_c - (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) ))))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_11 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_16)) )))));
 
-                      /* "chronoton/_cy_inner.pyx":476
+                      /* "chronoton/_cy_inner.pyx":494
  *                             equity_now = current_cash
  *                             for kk in range(n_slots):
  *                                 if slot_active[kk] != 0:             # <<<<<<<<<<<<<<
@@ -19891,592 +19602,592 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
                     }
                   }
 
-                  /* "chronoton/_cy_inner.pyx":480
+                  /* "chronoton/_cy_inner.pyx":498
  *                                     equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
  *                                                      * open_positions[kk, F_SIZE])
- *                             size = (sizing_static * equity_now) / sl_dist             # <<<<<<<<<<<<<<
- *                     else:  # SIZING_PRECOMPUTED
- *                         size = sizing_array[i]
-*/
-                  __pyx_v_size = ((__pyx_v_sizing_static * __pyx_v_equity_now) / __pyx_v_sl_dist);
-                }
-                __pyx_L75:;
-
-                /* "chronoton/_cy_inner.pyx":466
- *                     elif sizing_method_code == SIZING_VALUE:
- *                         size = (sizing_static * leverage) / entry_px_net
- *                     elif sizing_method_code == SIZING_PERCENT_AT_RISK:             # <<<<<<<<<<<<<<
- *                         # size = (risk_pct * equity) / sl_dist; leverage NOT applied.
- *                         # Python dispatcher has already verified SL is not None;
-*/
-                break;
-                default:
-
-                /* "chronoton/_cy_inner.pyx":482
- *                             size = (sizing_static * equity_now) / sl_dist
- *                     else:  # SIZING_PRECOMPUTED
- *                         size = sizing_array[i]             # <<<<<<<<<<<<<<
- * 
- *                     if size > 0.0 and not isnan(size):
-*/
-                __pyx_t_20 = __pyx_v_i;
-                __pyx_v_size = (*((double const  *) ( /* dim=0 */ (__pyx_v_sizing_array.data + __pyx_t_20 * __pyx_v_sizing_array.strides[0]) )));
-                break;
-              }
-
-              /* "chronoton/_cy_inner.pyx":484
- *                         size = sizing_array[i]
- * 
- *                     if size > 0.0 and not isnan(size):             # <<<<<<<<<<<<<<
- *                         entry_spread = spread_arr[i] * size
- *                         entry_slippage = slippage_arr[i] * size
-*/
-              __pyx_t_15 = (__pyx_v_size > 0.0);
-              if (__pyx_t_15) {
-              } else {
-                __pyx_t_14 = __pyx_t_15;
-                goto __pyx_L82_bool_binop_done;
-              }
-              __pyx_t_15 = (!isnan(__pyx_v_size));
-              __pyx_t_14 = __pyx_t_15;
-              __pyx_L82_bool_binop_done:;
-              if (__pyx_t_14) {
-
-                /* "chronoton/_cy_inner.pyx":485
- * 
- *                     if size > 0.0 and not isnan(size):
- *                         entry_spread = spread_arr[i] * size             # <<<<<<<<<<<<<<
- *                         entry_slippage = slippage_arr[i] * size
- *                         entry_commission = commission * fabs(entry_px_net * size)
+ *                             size = (sizing_static * equity_now * leverage) / entry_px_net             # <<<<<<<<<<<<<<
+ *                         elif sizing_method_code == SIZING_VALUE:
+ *                             size = (sizing_static * leverage) / entry_px_net
 */
-                __pyx_t_20 = __pyx_v_i;
-                __pyx_v_entry_spread = ((*((double const  *) ( /* dim=0 */ (__pyx_v_spread_arr.data + __pyx_t_20 * __pyx_v_spread_arr.strides[0]) ))) * __pyx_v_size);
+                  __pyx_v_size = (((__pyx_v_sizing_static * __pyx_v_equity_now) * __pyx_v_leverage) / __pyx_v_entry_px_net);
 
-                /* "chronoton/_cy_inner.pyx":486
- *                     if size > 0.0 and not isnan(size):
- *                         entry_spread = spread_arr[i] * size
- *                         entry_slippage = slippage_arr[i] * size             # <<<<<<<<<<<<<<
- *                         entry_commission = commission * fabs(entry_px_net * size)
- *                         margin = size * entry_px_net
-*/
-                __pyx_t_20 = __pyx_v_i;
-                __pyx_v_entry_slippage = ((*((double const  *) ( /* dim=0 */ (__pyx_v_slippage_arr.data + __pyx_t_20 * __pyx_v_slippage_arr.strides[0]) ))) * __pyx_v_size);
-
-                /* "chronoton/_cy_inner.pyx":487
- *                         entry_spread = spread_arr[i] * size
- *                         entry_slippage = slippage_arr[i] * size
- *                         entry_commission = commission * fabs(entry_px_net * size)             # <<<<<<<<<<<<<<
- *                         margin = size * entry_px_net
- * 
-*/
-                __pyx_v_entry_commission = (__pyx_v_commission * fabs((__pyx_v_entry_px_net * __pyx_v_size)));
-
-                /* "chronoton/_cy_inner.pyx":488
- *                         entry_slippage = slippage_arr[i] * size
- *                         entry_commission = commission * fabs(entry_px_net * size)
- *                         margin = size * entry_px_net             # <<<<<<<<<<<<<<
+                  /* "chronoton/_cy_inner.pyx":491
+ *                         entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
  * 
- *                         if current_cash >= margin + entry_commission:
+ *                         if sizing_method_code == SIZING_PERCENT_EQUITY:             # <<<<<<<<<<<<<<
+ *                             equity_now = current_cash
+ *                             for kk in range(n_slots):
 */
-                __pyx_v_margin = (__pyx_v_size * __pyx_v_entry_px_net);
+                  break;
+                  case __pyx_e_9chronoton_9_cy_inner_SIZING_VALUE:
 
-                /* "chronoton/_cy_inner.pyx":490
- *                         margin = size * entry_px_net
- * 
- *                         if current_cash >= margin + entry_commission:             # <<<<<<<<<<<<<<
- *                             current_cash -= margin + entry_commission
- * 
+                  /* "chronoton/_cy_inner.pyx":500
+ *                             size = (sizing_static * equity_now * leverage) / entry_px_net
+ *                         elif sizing_method_code == SIZING_VALUE:
+ *                             size = (sizing_static * leverage) / entry_px_net             # <<<<<<<<<<<<<<
+ *                         elif sizing_method_code == SIZING_PERCENT_AT_RISK:
+ *                             # size = (risk_pct * equity) / sl_dist; leverage NOT applied.
 */
-                __pyx_t_14 = (__pyx_v_current_cash >= (__pyx_v_margin + __pyx_v_entry_commission));
-                if (__pyx_t_14) {
+                  __pyx_v_size = ((__pyx_v_sizing_static * __pyx_v_leverage) / __pyx_v_entry_px_net);
 
-                  /* "chronoton/_cy_inner.pyx":491
- * 
- *                         if current_cash >= margin + entry_commission:
- *                             current_cash -= margin + entry_commission             # <<<<<<<<<<<<<<
- * 
- *                             sl_dist = sl_arr[i]
+                  /* "chronoton/_cy_inner.pyx":499
+ *                                                      * open_positions[kk, F_SIZE])
+ *                             size = (sizing_static * equity_now * leverage) / entry_px_net
+ *                         elif sizing_method_code == SIZING_VALUE:             # <<<<<<<<<<<<<<
+ *                             size = (sizing_static * leverage) / entry_px_net
+ *                         elif sizing_method_code == SIZING_PERCENT_AT_RISK:
 */
-                  __pyx_v_current_cash = (__pyx_v_current_cash - (__pyx_v_margin + __pyx_v_entry_commission));
+                  break;
+                  case __pyx_e_9chronoton_9_cy_inner_SIZING_PERCENT_AT_RISK:
 
-                  /* "chronoton/_cy_inner.pyx":493
- *                             current_cash -= margin + entry_commission
- * 
+                  /* "chronoton/_cy_inner.pyx":505
+ *                             # Python dispatcher has already verified SL is not None;
+ *                             # a per-bar NaN still guards the entry here.
  *                             sl_dist = sl_arr[i]             # <<<<<<<<<<<<<<
- *                             if isnan(sl_dist):
- *                                 sl_price = NAN
+ *                             if isnan(sl_dist) or sl_dist <= 0.0:
+ *                                 size = 0.0
 */
-                  __pyx_t_20 = __pyx_v_i;
-                  __pyx_v_sl_dist = (*((double const  *) ( /* dim=0 */ (__pyx_v_sl_arr.data + __pyx_t_20 * __pyx_v_sl_arr.strides[0]) )));
+                  __pyx_t_16 = __pyx_v_i;
+                  __pyx_v_sl_dist = (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_sl_arr.data) + __pyx_t_16)) )));
 
-                  /* "chronoton/_cy_inner.pyx":494
- * 
+                  /* "chronoton/_cy_inner.pyx":506
+ *                             # a per-bar NaN still guards the entry here.
  *                             sl_dist = sl_arr[i]
- *                             if isnan(sl_dist):             # <<<<<<<<<<<<<<
- *                                 sl_price = NAN
+ *                             if isnan(sl_dist) or sl_dist <= 0.0:             # <<<<<<<<<<<<<<
+ *                                 size = 0.0
  *                             else:
 */
-                  __pyx_t_14 = isnan(__pyx_v_sl_dist);
-                  if (__pyx_t_14) {
+                  __pyx_t_12 = isnan(__pyx_v_sl_dist);
+                  if (!__pyx_t_12) {
+                  } else {
+                    __pyx_t_10 = __pyx_t_12;
+                    goto __pyx_L63_bool_binop_done;
+                  }
+                  __pyx_t_12 = (__pyx_v_sl_dist <= 0.0);
+                  __pyx_t_10 = __pyx_t_12;
+                  __pyx_L63_bool_binop_done:;
+                  if (__pyx_t_10) {
 
-                    /* "chronoton/_cy_inner.pyx":495
+                    /* "chronoton/_cy_inner.pyx":507
  *                             sl_dist = sl_arr[i]
- *                             if isnan(sl_dist):
- *                                 sl_price = NAN             # <<<<<<<<<<<<<<
+ *                             if isnan(sl_dist) or sl_dist <= 0.0:
+ *                                 size = 0.0             # <<<<<<<<<<<<<<
  *                             else:
- *                                 sl_price = entry_px_net - desired_dir * sl_dist
+ *                                 equity_now = current_cash
 */
-                    __pyx_v_sl_price = NAN;
+                    __pyx_v_size = 0.0;
 
-                    /* "chronoton/_cy_inner.pyx":494
- * 
+                    /* "chronoton/_cy_inner.pyx":506
+ *                             # a per-bar NaN still guards the entry here.
  *                             sl_dist = sl_arr[i]
- *                             if isnan(sl_dist):             # <<<<<<<<<<<<<<
- *                                 sl_price = NAN
+ *                             if isnan(sl_dist) or sl_dist <= 0.0:             # <<<<<<<<<<<<<<
+ *                                 size = 0.0
  *                             else:
 */
-                    goto __pyx_L85;
+                    goto __pyx_L62;
                   }
 
-                  /* "chronoton/_cy_inner.pyx":497
- *                                 sl_price = NAN
+                  /* "chronoton/_cy_inner.pyx":509
+ *                                 size = 0.0
  *                             else:
- *                                 sl_price = entry_px_net - desired_dir * sl_dist             # <<<<<<<<<<<<<<
- *                             if isnan(tp):
- *                                 tp_price = NAN
+ *                                 equity_now = current_cash             # <<<<<<<<<<<<<<
+ *                                 for kk in range(n_slots):
+ *                                     if slot_active[kk] != 0:
 */
                   /*else*/ {
-                    __pyx_v_sl_price = (__pyx_v_entry_px_net - (__pyx_v_desired_dir * __pyx_v_sl_dist));
-                  }
-                  __pyx_L85:;
-
-                  /* "chronoton/_cy_inner.pyx":498
- *                             else:
- *                                 sl_price = entry_px_net - desired_dir * sl_dist
- *                             if isnan(tp):             # <<<<<<<<<<<<<<
- *                                 tp_price = NAN
- *                             else:
-*/
-                  __pyx_t_14 = isnan(__pyx_v_tp);
-                  if (__pyx_t_14) {
+                    __pyx_v_equity_now = __pyx_v_current_cash;
 
-                    /* "chronoton/_cy_inner.pyx":499
- *                                 sl_price = entry_px_net - desired_dir * sl_dist
- *                             if isnan(tp):
- *                                 tp_price = NAN             # <<<<<<<<<<<<<<
+                    /* "chronoton/_cy_inner.pyx":510
  *                             else:
- *                                 tp_price = entry_px_net + desired_dir * tp
+ *                                 equity_now = current_cash
+ *                                 for kk in range(n_slots):             # <<<<<<<<<<<<<<
+ *                                     if slot_active[kk] != 0:
+ *                                         d = open_positions[kk, F_DIRECTION]
+*/
+                    __pyx_t_13 = __pyx_v_n_slots;
+                    __pyx_t_14 = __pyx_t_13;
+                    for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+                      __pyx_v_kk = __pyx_t_15;
+
+                      /* "chronoton/_cy_inner.pyx":511
+ *                                 equity_now = current_cash
+ *                                 for kk in range(n_slots):
+ *                                     if slot_active[kk] != 0:             # <<<<<<<<<<<<<<
+ *                                         d = open_positions[kk, F_DIRECTION]
+ *                                         equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
+*/
+                      __pyx_t_16 = __pyx_v_kk;
+                      __pyx_t_10 = ((*((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_16)) ))) != 0);
+                      if (__pyx_t_10) {
+
+                        /* "chronoton/_cy_inner.pyx":512
+ *                                 for kk in range(n_slots):
+ *                                     if slot_active[kk] != 0:
+ *                                         d = open_positions[kk, F_DIRECTION]             # <<<<<<<<<<<<<<
+ *                                         equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
+ *                                                          * open_positions[kk, F_SIZE])
+*/
+                        __pyx_t_16 = __pyx_v_kk;
+                        __pyx_t_11 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
+                        __pyx_v_d = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_16 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_11)) )));
+
+                        /* "chronoton/_cy_inner.pyx":513
+ *                                     if slot_active[kk] != 0:
+ *                                         d = open_positions[kk, F_DIRECTION]
+ *                                         equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
+ *                                                          * open_positions[kk, F_SIZE])
+ *                                 size = (sizing_static * equity_now) / sl_dist
+*/
+                        __pyx_t_11 = __pyx_v_kk;
+                        __pyx_t_16 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
+
+                        /* "chronoton/_cy_inner.pyx":514
+ *                                         d = open_positions[kk, F_DIRECTION]
+ *                                         equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
+ *                                                          * open_positions[kk, F_SIZE])             # <<<<<<<<<<<<<<
+ *                                 size = (sizing_static * equity_now) / sl_dist
+ *                         else:  # SIZING_PRECOMPUTED
+*/
+                        __pyx_t_18 = __pyx_v_kk;
+                        __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
+
+                        /* "chronoton/_cy_inner.pyx":513
+ *                                     if slot_active[kk] != 0:
+ *                                         d = open_positions[kk, F_DIRECTION]
+ *                                         equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
+ *                                                          * open_positions[kk, F_SIZE])
+ *                                 size = (sizing_static * equity_now) / sl_dist
+*/
+                        __pyx_v_equity_now = (__pyx_v_equity_now + ((__pyx_v_d * (__pyx_v_price_c - (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_11 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_16)) ))))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) )))));
+
+                        /* "chronoton/_cy_inner.pyx":511
+ *                                 equity_now = current_cash
+ *                                 for kk in range(n_slots):
+ *                                     if slot_active[kk] != 0:             # <<<<<<<<<<<<<<
+ *                                         d = open_positions[kk, F_DIRECTION]
+ *                                         equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
 */
-                    __pyx_v_tp_price = NAN;
+                      }
+                    }
 
-                    /* "chronoton/_cy_inner.pyx":498
- *                             else:
- *                                 sl_price = entry_px_net - desired_dir * sl_dist
- *                             if isnan(tp):             # <<<<<<<<<<<<<<
- *                                 tp_price = NAN
- *                             else:
+                    /* "chronoton/_cy_inner.pyx":515
+ *                                         equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
+ *                                                          * open_positions[kk, F_SIZE])
+ *                                 size = (sizing_static * equity_now) / sl_dist             # <<<<<<<<<<<<<<
+ *                         else:  # SIZING_PRECOMPUTED
+ *                             size = sizing_array[i]
 */
-                    goto __pyx_L86;
+                    __pyx_v_size = ((__pyx_v_sizing_static * __pyx_v_equity_now) / __pyx_v_sl_dist);
                   }
+                  __pyx_L62:;
 
                   /* "chronoton/_cy_inner.pyx":501
- *                                 tp_price = NAN
- *                             else:
- *                                 tp_price = entry_px_net + desired_dir * tp             # <<<<<<<<<<<<<<
- *                             if isnan(ts):
- *                                 ts_dist_val = NAN
+ *                         elif sizing_method_code == SIZING_VALUE:
+ *                             size = (sizing_static * leverage) / entry_px_net
+ *                         elif sizing_method_code == SIZING_PERCENT_AT_RISK:             # <<<<<<<<<<<<<<
+ *                             # size = (risk_pct * equity) / sl_dist; leverage NOT applied.
+ *                             # Python dispatcher has already verified SL is not None;
 */
-                  /*else*/ {
-                    __pyx_v_tp_price = (__pyx_v_entry_px_net + (__pyx_v_desired_dir * __pyx_v_tp));
-                  }
-                  __pyx_L86:;
+                  break;
+                  default:
 
-                  /* "chronoton/_cy_inner.pyx":502
- *                             else:
- *                                 tp_price = entry_px_net + desired_dir * tp
- *                             if isnan(ts):             # <<<<<<<<<<<<<<
- *                                 ts_dist_val = NAN
- *                             else:
+                  /* "chronoton/_cy_inner.pyx":517
+ *                                 size = (sizing_static * equity_now) / sl_dist
+ *                         else:  # SIZING_PRECOMPUTED
+ *                             size = sizing_array[i]             # <<<<<<<<<<<<<<
+ * 
+ *                         if size > 0.0 and not isnan(size):
 */
-                  __pyx_t_14 = isnan(__pyx_v_ts);
-                  if (__pyx_t_14) {
+                  __pyx_t_17 = __pyx_v_i;
+                  __pyx_v_size = (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_sizing_array.data) + __pyx_t_17)) )));
+                  break;
+                }
 
-                    /* "chronoton/_cy_inner.pyx":503
- *                                 tp_price = entry_px_net + desired_dir * tp
- *                             if isnan(ts):
- *                                 ts_dist_val = NAN             # <<<<<<<<<<<<<<
- *                             else:
- *                                 ts_dist_val = ts
+                /* "chronoton/_cy_inner.pyx":519
+ *                             size = sizing_array[i]
+ * 
+ *                         if size > 0.0 and not isnan(size):             # <<<<<<<<<<<<<<
+ *                             entry_spread = spread_arr[i] * size
+ *                             entry_slippage = slippage_arr[i] * size
 */
-                    __pyx_v_ts_dist_val = NAN;
+                __pyx_t_12 = (__pyx_v_size > 0.0);
+                if (__pyx_t_12) {
+                } else {
+                  __pyx_t_10 = __pyx_t_12;
+                  goto __pyx_L69_bool_binop_done;
+                }
+                __pyx_t_12 = (!isnan(__pyx_v_size));
+                __pyx_t_10 = __pyx_t_12;
+                __pyx_L69_bool_binop_done:;
+                if (__pyx_t_10) {
 
-                    /* "chronoton/_cy_inner.pyx":502
- *                             else:
- *                                 tp_price = entry_px_net + desired_dir * tp
- *                             if isnan(ts):             # <<<<<<<<<<<<<<
- *                                 ts_dist_val = NAN
- *                             else:
+                  /* "chronoton/_cy_inner.pyx":520
+ * 
+ *                         if size > 0.0 and not isnan(size):
+ *                             entry_spread = spread_arr[i] * size             # <<<<<<<<<<<<<<
+ *                             entry_slippage = slippage_arr[i] * size
+ *                             entry_commission = commission * fabs(entry_px_net * size)
 */
-                    goto __pyx_L87;
-                  }
+                  __pyx_t_17 = __pyx_v_i;
+                  __pyx_v_entry_spread = ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_spread_arr.data) + __pyx_t_17)) ))) * __pyx_v_size);
 
-                  /* "chronoton/_cy_inner.pyx":505
- *                                 ts_dist_val = NAN
- *                             else:
- *                                 ts_dist_val = ts             # <<<<<<<<<<<<<<
+                  /* "chronoton/_cy_inner.pyx":521
+ *                         if size > 0.0 and not isnan(size):
+ *                             entry_spread = spread_arr[i] * size
+ *                             entry_slippage = slippage_arr[i] * size             # <<<<<<<<<<<<<<
+ *                             entry_commission = commission * fabs(entry_px_net * size)
+ *                             margin = size * entry_px_net
+*/
+                  __pyx_t_17 = __pyx_v_i;
+                  __pyx_v_entry_slippage = ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_slippage_arr.data) + __pyx_t_17)) ))) * __pyx_v_size);
+
+                  /* "chronoton/_cy_inner.pyx":522
+ *                             entry_spread = spread_arr[i] * size
+ *                             entry_slippage = slippage_arr[i] * size
+ *                             entry_commission = commission * fabs(entry_px_net * size)             # <<<<<<<<<<<<<<
+ *                             margin = size * entry_px_net
  * 
- *                             _enter_position(
 */
-                  /*else*/ {
-                    __pyx_v_ts_dist_val = __pyx_v_ts;
-                  }
-                  __pyx_L87:;
+                  __pyx_v_entry_commission = (__pyx_v_commission * fabs((__pyx_v_entry_px_net * __pyx_v_size)));
 
-                  /* "chronoton/_cy_inner.pyx":507
- *                                 ts_dist_val = ts
+                  /* "chronoton/_cy_inner.pyx":523
+ *                             entry_slippage = slippage_arr[i] * size
+ *                             entry_commission = commission * fabs(entry_px_net * size)
+ *                             margin = size * entry_px_net             # <<<<<<<<<<<<<<
  * 
- *                             _enter_position(             # <<<<<<<<<<<<<<
- *                                 slot_idx, <double>desired_dir, i, t_ns,
- *                                 entry_px_net, size,
+ *                             if current_cash >= margin + entry_commission:
 */
-                  __pyx_f_9chronoton_9_cy_inner__enter_position(__pyx_v_slot_idx, ((double)__pyx_v_desired_dir), __pyx_v_i, __pyx_v_t_ns, __pyx_v_entry_px_net, __pyx_v_size, __pyx_v_sl_price, __pyx_v_tp_price, __pyx_v_ts_dist_val, __pyx_v_entry_commission, __pyx_v_entry_spread, __pyx_v_entry_slippage, __pyx_v_open_positions, __pyx_v_slot_active); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 507, __pyx_L4_error)
+                  __pyx_v_margin = (__pyx_v_size * __pyx_v_entry_px_net);
 
-                  /* "chronoton/_cy_inner.pyx":490
- *                         margin = size * entry_px_net
+                  /* "chronoton/_cy_inner.pyx":525
+ *                             margin = size * entry_px_net
  * 
- *                         if current_cash >= margin + entry_commission:             # <<<<<<<<<<<<<<
- *                             current_cash -= margin + entry_commission
+ *                             if current_cash >= margin + entry_commission:             # <<<<<<<<<<<<<<
+ *                                 current_cash -= margin + entry_commission
  * 
 */
-                }
+                  __pyx_t_10 = (__pyx_v_current_cash >= (__pyx_v_margin + __pyx_v_entry_commission));
+                  if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":484
- *                         size = sizing_array[i]
+                    /* "chronoton/_cy_inner.pyx":526
  * 
- *                     if size > 0.0 and not isnan(size):             # <<<<<<<<<<<<<<
- *                         entry_spread = spread_arr[i] * size
- *                         entry_slippage = slippage_arr[i] * size
+ *                             if current_cash >= margin + entry_commission:
+ *                                 current_cash -= margin + entry_commission             # <<<<<<<<<<<<<<
+ * 
+ *                                 sl_dist = sl_arr[i]
 */
-              }
+                    __pyx_v_current_cash = (__pyx_v_current_cash - (__pyx_v_margin + __pyx_v_entry_commission));
 
-              /* "chronoton/_cy_inner.pyx":453
- *                 desired_dir = 1
- *                 slot_idx = _find_free_slot(slot_active, n_slots)
- *                 if slot_idx != -1:             # <<<<<<<<<<<<<<
- *                     entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
+                    /* "chronoton/_cy_inner.pyx":528
+ *                                 current_cash -= margin + entry_commission
  * 
+ *                                 sl_dist = sl_arr[i]             # <<<<<<<<<<<<<<
+ *                                 if isnan(sl_dist):
+ *                                     sl_price = NAN
 */
-            }
+                    __pyx_t_17 = __pyx_v_i;
+                    __pyx_v_sl_dist = (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_sl_arr.data) + __pyx_t_17)) )));
 
-            /* "chronoton/_cy_inner.pyx":450
- *             # `want_*_entry` flag is consulted  kept as a helper-free inline
- *             # to stay fully in C.
- *             if want_long_entry:             # <<<<<<<<<<<<<<
- *                 desired_dir = 1
- *                 slot_idx = _find_free_slot(slot_active, n_slots)
+                    /* "chronoton/_cy_inner.pyx":529
+ * 
+ *                                 sl_dist = sl_arr[i]
+ *                                 if isnan(sl_dist):             # <<<<<<<<<<<<<<
+ *                                     sl_price = NAN
+ *                                 else:
 */
-          }
+                    __pyx_t_10 = isnan(__pyx_v_sl_dist);
+                    if (__pyx_t_10) {
 
-          /* "chronoton/_cy_inner.pyx":515
- *                             )
- * 
- *             if want_short_entry:             # <<<<<<<<<<<<<<
- *                 desired_dir = -1
- *                 slot_idx = _find_free_slot(slot_active, n_slots)
+                      /* "chronoton/_cy_inner.pyx":530
+ *                                 sl_dist = sl_arr[i]
+ *                                 if isnan(sl_dist):
+ *                                     sl_price = NAN             # <<<<<<<<<<<<<<
+ *                                 else:
+ *                                     sl_price = entry_px_net - desired_dir * sl_dist
 */
-          if (__pyx_v_want_short_entry) {
+                      __pyx_v_sl_price = NAN;
 
-            /* "chronoton/_cy_inner.pyx":516
+                      /* "chronoton/_cy_inner.pyx":529
  * 
- *             if want_short_entry:
- *                 desired_dir = -1             # <<<<<<<<<<<<<<
- *                 slot_idx = _find_free_slot(slot_active, n_slots)
- *                 if slot_idx != -1:
+ *                                 sl_dist = sl_arr[i]
+ *                                 if isnan(sl_dist):             # <<<<<<<<<<<<<<
+ *                                     sl_price = NAN
+ *                                 else:
 */
-            __pyx_v_desired_dir = -1;
+                      goto __pyx_L72;
+                    }
 
-            /* "chronoton/_cy_inner.pyx":517
- *             if want_short_entry:
- *                 desired_dir = -1
- *                 slot_idx = _find_free_slot(slot_active, n_slots)             # <<<<<<<<<<<<<<
- *                 if slot_idx != -1:
- *                     entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
+                    /* "chronoton/_cy_inner.pyx":532
+ *                                     sl_price = NAN
+ *                                 else:
+ *                                     sl_price = entry_px_net - desired_dir * sl_dist             # <<<<<<<<<<<<<<
+ *                                 if isnan(tp):
+ *                                     tp_price = NAN
 */
-            __pyx_t_16 = __pyx_f_9chronoton_9_cy_inner__find_free_slot(__pyx_v_slot_active, __pyx_v_n_slots); if (unlikely(__pyx_t_16 == ((Py_ssize_t)-1L) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 517, __pyx_L4_error)
-            __pyx_v_slot_idx = __pyx_t_16;
+                    /*else*/ {
+                      __pyx_v_sl_price = (__pyx_v_entry_px_net - (__pyx_v_desired_dir * __pyx_v_sl_dist));
+                    }
+                    __pyx_L72:;
+
+                    /* "chronoton/_cy_inner.pyx":533
+ *                                 else:
+ *                                     sl_price = entry_px_net - desired_dir * sl_dist
+ *                                 if isnan(tp):             # <<<<<<<<<<<<<<
+ *                                     tp_price = NAN
+ *                                 else:
+*/
+                    __pyx_t_10 = isnan(__pyx_v_tp);
+                    if (__pyx_t_10) {
+
+                      /* "chronoton/_cy_inner.pyx":534
+ *                                     sl_price = entry_px_net - desired_dir * sl_dist
+ *                                 if isnan(tp):
+ *                                     tp_price = NAN             # <<<<<<<<<<<<<<
+ *                                 else:
+ *                                     tp_price = entry_px_net + desired_dir * tp
+*/
+                      __pyx_v_tp_price = NAN;
+
+                      /* "chronoton/_cy_inner.pyx":533
+ *                                 else:
+ *                                     sl_price = entry_px_net - desired_dir * sl_dist
+ *                                 if isnan(tp):             # <<<<<<<<<<<<<<
+ *                                     tp_price = NAN
+ *                                 else:
+*/
+                      goto __pyx_L73;
+                    }
 
-            /* "chronoton/_cy_inner.pyx":518
- *                 desired_dir = -1
- *                 slot_idx = _find_free_slot(slot_active, n_slots)
- *                 if slot_idx != -1:             # <<<<<<<<<<<<<<
- *                     entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
- * 
+                    /* "chronoton/_cy_inner.pyx":536
+ *                                     tp_price = NAN
+ *                                 else:
+ *                                     tp_price = entry_px_net + desired_dir * tp             # <<<<<<<<<<<<<<
+ *                                 if isnan(ts):
+ *                                     ts_dist_val = NAN
 */
-            __pyx_t_14 = (__pyx_v_slot_idx != -1L);
-            if (__pyx_t_14) {
+                    /*else*/ {
+                      __pyx_v_tp_price = (__pyx_v_entry_px_net + (__pyx_v_desired_dir * __pyx_v_tp));
+                    }
+                    __pyx_L73:;
 
-              /* "chronoton/_cy_inner.pyx":519
- *                 slot_idx = _find_free_slot(slot_active, n_slots)
- *                 if slot_idx != -1:
- *                     entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])             # <<<<<<<<<<<<<<
- * 
- *                     if sizing_method_code == SIZING_PERCENT_EQUITY:
+                    /* "chronoton/_cy_inner.pyx":537
+ *                                 else:
+ *                                     tp_price = entry_px_net + desired_dir * tp
+ *                                 if isnan(ts):             # <<<<<<<<<<<<<<
+ *                                     ts_dist_val = NAN
+ *                                 else:
 */
-              __pyx_t_20 = __pyx_v_i;
-              __pyx_t_21 = __pyx_v_i;
-              __pyx_v_entry_px_net = (__pyx_v_price_o + (__pyx_v_desired_dir * ((*((double const  *) ( /* dim=0 */ (__pyx_v_spread_arr.data + __pyx_t_20 * __pyx_v_spread_arr.strides[0]) ))) + (*((double const  *) ( /* dim=0 */ (__pyx_v_slippage_arr.data + __pyx_t_21 * __pyx_v_slippage_arr.strides[0]) ))))));
+                    __pyx_t_10 = isnan(__pyx_v_ts);
+                    if (__pyx_t_10) {
 
-              /* "chronoton/_cy_inner.pyx":521
- *                     entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
- * 
- *                     if sizing_method_code == SIZING_PERCENT_EQUITY:             # <<<<<<<<<<<<<<
- *                         equity_now = current_cash
- *                         for kk in range(n_slots):
-*/
-              switch (__pyx_v_sizing_method_code) {
-                case __pyx_e_9chronoton_9_cy_inner_SIZING_PERCENT_EQUITY:
+                      /* "chronoton/_cy_inner.pyx":538
+ *                                     tp_price = entry_px_net + desired_dir * tp
+ *                                 if isnan(ts):
+ *                                     ts_dist_val = NAN             # <<<<<<<<<<<<<<
+ *                                 else:
+ *                                     ts_dist_val = ts
+*/
+                      __pyx_v_ts_dist_val = NAN;
+
+                      /* "chronoton/_cy_inner.pyx":537
+ *                                 else:
+ *                                     tp_price = entry_px_net + desired_dir * tp
+ *                                 if isnan(ts):             # <<<<<<<<<<<<<<
+ *                                     ts_dist_val = NAN
+ *                                 else:
+*/
+                      goto __pyx_L74;
+                    }
 
-                /* "chronoton/_cy_inner.pyx":522
+                    /* "chronoton/_cy_inner.pyx":540
+ *                                     ts_dist_val = NAN
+ *                                 else:
+ *                                     ts_dist_val = ts             # <<<<<<<<<<<<<<
  * 
- *                     if sizing_method_code == SIZING_PERCENT_EQUITY:
- *                         equity_now = current_cash             # <<<<<<<<<<<<<<
- *                         for kk in range(n_slots):
- *                             if slot_active[kk] != 0:
+ *                                 _enter_position(
 */
-                __pyx_v_equity_now = __pyx_v_current_cash;
+                    /*else*/ {
+                      __pyx_v_ts_dist_val = __pyx_v_ts;
+                    }
+                    __pyx_L74:;
 
-                /* "chronoton/_cy_inner.pyx":523
- *                     if sizing_method_code == SIZING_PERCENT_EQUITY:
- *                         equity_now = current_cash
- *                         for kk in range(n_slots):             # <<<<<<<<<<<<<<
- *                             if slot_active[kk] != 0:
- *                                 d = open_positions[kk, F_DIRECTION]
+                    /* "chronoton/_cy_inner.pyx":542
+ *                                     ts_dist_val = ts
+ * 
+ *                                 _enter_position(             # <<<<<<<<<<<<<<
+ *                                     slot_idx, <double>desired_dir, i, t_ns,
+ *                                     entry_px_net, size,
 */
-                __pyx_t_16 = __pyx_v_n_slots;
-                __pyx_t_17 = __pyx_t_16;
-                for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
-                  __pyx_v_kk = __pyx_t_18;
+                    __pyx_f_9chronoton_9_cy_inner__enter_position(__pyx_v_slot_idx, ((double)__pyx_v_desired_dir), __pyx_v_i, __pyx_v_t_ns, __pyx_v_entry_px_net, __pyx_v_size, __pyx_v_sl_price, __pyx_v_tp_price, __pyx_v_ts_dist_val, __pyx_v_entry_commission, __pyx_v_entry_spread, __pyx_v_entry_slippage, __pyx_v_open_positions, __pyx_v_slot_active); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 542, __pyx_L4_error)
 
-                  /* "chronoton/_cy_inner.pyx":524
- *                         equity_now = current_cash
- *                         for kk in range(n_slots):
- *                             if slot_active[kk] != 0:             # <<<<<<<<<<<<<<
- *                                 d = open_positions[kk, F_DIRECTION]
- *                                 equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
+                    /* "chronoton/_cy_inner.pyx":525
+ *                             margin = size * entry_px_net
+ * 
+ *                             if current_cash >= margin + entry_commission:             # <<<<<<<<<<<<<<
+ *                                 current_cash -= margin + entry_commission
+ * 
 */
-                  __pyx_t_21 = __pyx_v_kk;
-                  __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_21 * __pyx_v_slot_active.strides[0]) ))) != 0);
-                  if (__pyx_t_14) {
+                  }
 
-                    /* "chronoton/_cy_inner.pyx":525
- *                         for kk in range(n_slots):
- *                             if slot_active[kk] != 0:
- *                                 d = open_positions[kk, F_DIRECTION]             # <<<<<<<<<<<<<<
- *                                 equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
- *                                                  * open_positions[kk, F_SIZE])
+                  /* "chronoton/_cy_inner.pyx":519
+ *                             size = sizing_array[i]
+ * 
+ *                         if size > 0.0 and not isnan(size):             # <<<<<<<<<<<<<<
+ *                             entry_spread = spread_arr[i] * size
+ *                             entry_slippage = slippage_arr[i] * size
 */
-                    __pyx_t_21 = __pyx_v_kk;
-                    __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
-                    __pyx_v_d = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) )));
+                }
 
-                    /* "chronoton/_cy_inner.pyx":526
- *                             if slot_active[kk] != 0:
- *                                 d = open_positions[kk, F_DIRECTION]
- *                                 equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
- *                                                  * open_positions[kk, F_SIZE])
- *                         size = (sizing_static * equity_now * leverage) / entry_px_net
+                /* "chronoton/_cy_inner.pyx":488
+ *                     desired_dir = 1
+ *                     slot_idx = _find_free_slot(slot_active, n_slots)
+ *                     if slot_idx != -1:             # <<<<<<<<<<<<<<
+ *                         entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
+ * 
 */
-                    __pyx_t_20 = __pyx_v_kk;
-                    __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
+              }
 
-                    /* "chronoton/_cy_inner.pyx":527
- *                                 d = open_positions[kk, F_DIRECTION]
- *                                 equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
- *                                                  * open_positions[kk, F_SIZE])             # <<<<<<<<<<<<<<
- *                         size = (sizing_static * equity_now * leverage) / entry_px_net
- *                     elif sizing_method_code == SIZING_VALUE:
+              /* "chronoton/_cy_inner.pyx":485
+ *                 # `want_*_entry` flag is consulted  kept as a helper-free inline
+ *                 # to stay fully in C.
+ *                 if want_long_entry:             # <<<<<<<<<<<<<<
+ *                     desired_dir = 1
+ *                     slot_idx = _find_free_slot(slot_active, n_slots)
 */
-                    __pyx_t_13 = __pyx_v_kk;
-                    __pyx_t_19 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
+            }
 
-                    /* "chronoton/_cy_inner.pyx":526
- *                             if slot_active[kk] != 0:
- *                                 d = open_positions[kk, F_DIRECTION]
- *                                 equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
- *                                                  * open_positions[kk, F_SIZE])
- *                         size = (sizing_static * equity_now * leverage) / entry_px_net
+            /* "chronoton/_cy_inner.pyx":550
+ *                                 )
+ * 
+ *                 if want_short_entry:             # <<<<<<<<<<<<<<
+ *                     desired_dir = -1
+ *                     slot_idx = _find_free_slot(slot_active, n_slots)
 */
-                    __pyx_v_equity_now = (__pyx_v_equity_now + ((__pyx_v_d * (__pyx_v_price_c - (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) ))))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_13 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_19 * __pyx_v_open_positions.strides[1]) )))));
+            if (__pyx_v_want_short_entry) {
 
-                    /* "chronoton/_cy_inner.pyx":524
- *                         equity_now = current_cash
- *                         for kk in range(n_slots):
- *                             if slot_active[kk] != 0:             # <<<<<<<<<<<<<<
- *                                 d = open_positions[kk, F_DIRECTION]
- *                                 equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
+              /* "chronoton/_cy_inner.pyx":551
+ * 
+ *                 if want_short_entry:
+ *                     desired_dir = -1             # <<<<<<<<<<<<<<
+ *                     slot_idx = _find_free_slot(slot_active, n_slots)
+ *                     if slot_idx != -1:
 */
-                  }
-                }
+              __pyx_v_desired_dir = -1;
 
-                /* "chronoton/_cy_inner.pyx":528
- *                                 equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
- *                                                  * open_positions[kk, F_SIZE])
- *                         size = (sizing_static * equity_now * leverage) / entry_px_net             # <<<<<<<<<<<<<<
- *                     elif sizing_method_code == SIZING_VALUE:
- *                         size = (sizing_static * leverage) / entry_px_net
+              /* "chronoton/_cy_inner.pyx":552
+ *                 if want_short_entry:
+ *                     desired_dir = -1
+ *                     slot_idx = _find_free_slot(slot_active, n_slots)             # <<<<<<<<<<<<<<
+ *                     if slot_idx != -1:
+ *                         entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
 */
-                __pyx_v_size = (((__pyx_v_sizing_static * __pyx_v_equity_now) * __pyx_v_leverage) / __pyx_v_entry_px_net);
+              __pyx_t_13 = __pyx_f_9chronoton_9_cy_inner__find_free_slot(__pyx_v_slot_active, __pyx_v_n_slots); if (unlikely(__pyx_t_13 == ((Py_ssize_t)-1L) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 552, __pyx_L4_error)
+              __pyx_v_slot_idx = __pyx_t_13;
 
-                /* "chronoton/_cy_inner.pyx":521
- *                     entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
+              /* "chronoton/_cy_inner.pyx":553
+ *                     desired_dir = -1
+ *                     slot_idx = _find_free_slot(slot_active, n_slots)
+ *                     if slot_idx != -1:             # <<<<<<<<<<<<<<
+ *                         entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
  * 
- *                     if sizing_method_code == SIZING_PERCENT_EQUITY:             # <<<<<<<<<<<<<<
- *                         equity_now = current_cash
- *                         for kk in range(n_slots):
 */
-                break;
-                case __pyx_e_9chronoton_9_cy_inner_SIZING_VALUE:
+              __pyx_t_10 = (__pyx_v_slot_idx != -1L);
+              if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":530
- *                         size = (sizing_static * equity_now * leverage) / entry_px_net
- *                     elif sizing_method_code == SIZING_VALUE:
- *                         size = (sizing_static * leverage) / entry_px_net             # <<<<<<<<<<<<<<
- *                     elif sizing_method_code == SIZING_PERCENT_AT_RISK:
- *                         sl_dist = sl_arr[i]
+                /* "chronoton/_cy_inner.pyx":554
+ *                     slot_idx = _find_free_slot(slot_active, n_slots)
+ *                     if slot_idx != -1:
+ *                         entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])             # <<<<<<<<<<<<<<
+ * 
+ *                         if sizing_method_code == SIZING_PERCENT_EQUITY:
 */
-                __pyx_v_size = ((__pyx_v_sizing_static * __pyx_v_leverage) / __pyx_v_entry_px_net);
+                __pyx_t_17 = __pyx_v_i;
+                __pyx_t_18 = __pyx_v_i;
+                __pyx_v_entry_px_net = (__pyx_v_price_o + (__pyx_v_desired_dir * ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_spread_arr.data) + __pyx_t_17)) ))) + (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_slippage_arr.data) + __pyx_t_18)) ))))));
 
-                /* "chronoton/_cy_inner.pyx":529
- *                                                  * open_positions[kk, F_SIZE])
- *                         size = (sizing_static * equity_now * leverage) / entry_px_net
- *                     elif sizing_method_code == SIZING_VALUE:             # <<<<<<<<<<<<<<
- *                         size = (sizing_static * leverage) / entry_px_net
- *                     elif sizing_method_code == SIZING_PERCENT_AT_RISK:
-*/
-                break;
-                case __pyx_e_9chronoton_9_cy_inner_SIZING_PERCENT_AT_RISK:
-
-                /* "chronoton/_cy_inner.pyx":532
- *                         size = (sizing_static * leverage) / entry_px_net
- *                     elif sizing_method_code == SIZING_PERCENT_AT_RISK:
- *                         sl_dist = sl_arr[i]             # <<<<<<<<<<<<<<
- *                         if isnan(sl_dist) or sl_dist <= 0.0:
- *                             size = 0.0
-*/
-                __pyx_t_19 = __pyx_v_i;
-                __pyx_v_sl_dist = (*((double const  *) ( /* dim=0 */ (__pyx_v_sl_arr.data + __pyx_t_19 * __pyx_v_sl_arr.strides[0]) )));
-
-                /* "chronoton/_cy_inner.pyx":533
- *                     elif sizing_method_code == SIZING_PERCENT_AT_RISK:
- *                         sl_dist = sl_arr[i]
- *                         if isnan(sl_dist) or sl_dist <= 0.0:             # <<<<<<<<<<<<<<
- *                             size = 0.0
- *                         else:
-*/
-                __pyx_t_15 = isnan(__pyx_v_sl_dist);
-                if (!__pyx_t_15) {
-                } else {
-                  __pyx_t_14 = __pyx_t_15;
-                  goto __pyx_L94_bool_binop_done;
-                }
-                __pyx_t_15 = (__pyx_v_sl_dist <= 0.0);
-                __pyx_t_14 = __pyx_t_15;
-                __pyx_L94_bool_binop_done:;
-                if (__pyx_t_14) {
-
-                  /* "chronoton/_cy_inner.pyx":534
- *                         sl_dist = sl_arr[i]
- *                         if isnan(sl_dist) or sl_dist <= 0.0:
- *                             size = 0.0             # <<<<<<<<<<<<<<
- *                         else:
+                /* "chronoton/_cy_inner.pyx":556
+ *                         entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
+ * 
+ *                         if sizing_method_code == SIZING_PERCENT_EQUITY:             # <<<<<<<<<<<<<<
  *                             equity_now = current_cash
+ *                             for kk in range(n_slots):
 */
-                  __pyx_v_size = 0.0;
-
-                  /* "chronoton/_cy_inner.pyx":533
- *                     elif sizing_method_code == SIZING_PERCENT_AT_RISK:
- *                         sl_dist = sl_arr[i]
- *                         if isnan(sl_dist) or sl_dist <= 0.0:             # <<<<<<<<<<<<<<
- *                             size = 0.0
- *                         else:
-*/
-                  goto __pyx_L93;
-                }
+                switch (__pyx_v_sizing_method_code) {
+                  case __pyx_e_9chronoton_9_cy_inner_SIZING_PERCENT_EQUITY:
 
-                /* "chronoton/_cy_inner.pyx":536
- *                             size = 0.0
- *                         else:
+                  /* "chronoton/_cy_inner.pyx":557
+ * 
+ *                         if sizing_method_code == SIZING_PERCENT_EQUITY:
  *                             equity_now = current_cash             # <<<<<<<<<<<<<<
  *                             for kk in range(n_slots):
  *                                 if slot_active[kk] != 0:
 */
-                /*else*/ {
                   __pyx_v_equity_now = __pyx_v_current_cash;
 
-                  /* "chronoton/_cy_inner.pyx":537
- *                         else:
+                  /* "chronoton/_cy_inner.pyx":558
+ *                         if sizing_method_code == SIZING_PERCENT_EQUITY:
  *                             equity_now = current_cash
  *                             for kk in range(n_slots):             # <<<<<<<<<<<<<<
  *                                 if slot_active[kk] != 0:
  *                                     d = open_positions[kk, F_DIRECTION]
 */
-                  __pyx_t_16 = __pyx_v_n_slots;
-                  __pyx_t_17 = __pyx_t_16;
-                  for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
-                    __pyx_v_kk = __pyx_t_18;
+                  __pyx_t_13 = __pyx_v_n_slots;
+                  __pyx_t_14 = __pyx_t_13;
+                  for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+                    __pyx_v_kk = __pyx_t_15;
 
-                    /* "chronoton/_cy_inner.pyx":538
+                    /* "chronoton/_cy_inner.pyx":559
  *                             equity_now = current_cash
  *                             for kk in range(n_slots):
  *                                 if slot_active[kk] != 0:             # <<<<<<<<<<<<<<
  *                                     d = open_positions[kk, F_DIRECTION]
  *                                     equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
 */
-                    __pyx_t_19 = __pyx_v_kk;
-                    __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_19 * __pyx_v_slot_active.strides[0]) ))) != 0);
-                    if (__pyx_t_14) {
+                    __pyx_t_18 = __pyx_v_kk;
+                    __pyx_t_10 = ((*((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_18)) ))) != 0);
+                    if (__pyx_t_10) {
 
-                      /* "chronoton/_cy_inner.pyx":539
+                      /* "chronoton/_cy_inner.pyx":560
  *                             for kk in range(n_slots):
  *                                 if slot_active[kk] != 0:
  *                                     d = open_positions[kk, F_DIRECTION]             # <<<<<<<<<<<<<<
  *                                     equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
  *                                                      * open_positions[kk, F_SIZE])
 */
-                      __pyx_t_19 = __pyx_v_kk;
-                      __pyx_t_13 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
-                      __pyx_v_d = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_19 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_13 * __pyx_v_open_positions.strides[1]) )));
+                      __pyx_t_18 = __pyx_v_kk;
+                      __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
+                      __pyx_v_d = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) )));
 
-                      /* "chronoton/_cy_inner.pyx":540
+                      /* "chronoton/_cy_inner.pyx":561
  *                                 if slot_active[kk] != 0:
  *                                     d = open_positions[kk, F_DIRECTION]
  *                                     equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
  *                                                      * open_positions[kk, F_SIZE])
- *                             size = (sizing_static * equity_now) / sl_dist
+ *                             size = (sizing_static * equity_now * leverage) / entry_px_net
 */
-                      __pyx_t_13 = __pyx_v_kk;
-                      __pyx_t_19 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
+                      __pyx_t_17 = __pyx_v_kk;
+                      __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
 
-                      /* "chronoton/_cy_inner.pyx":541
+                      /* "chronoton/_cy_inner.pyx":562
  *                                     d = open_positions[kk, F_DIRECTION]
  *                                     equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
  *                                                      * open_positions[kk, F_SIZE])             # <<<<<<<<<<<<<<
- *                             size = (sizing_static * equity_now) / sl_dist
- *                     else:
+ *                             size = (sizing_static * equity_now * leverage) / entry_px_net
+ *                         elif sizing_method_code == SIZING_VALUE:
 */
-                      __pyx_t_21 = __pyx_v_kk;
-                      __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
+                      __pyx_t_16 = __pyx_v_kk;
+                      __pyx_t_11 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
 
-                      /* "chronoton/_cy_inner.pyx":540
+                      /* "chronoton/_cy_inner.pyx":561
  *                                 if slot_active[kk] != 0:
  *                                     d = open_positions[kk, F_DIRECTION]
  *                                     equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
  *                                                      * open_positions[kk, F_SIZE])
- *                             size = (sizing_static * equity_now) / sl_dist
+ *                             size = (sizing_static * equity_now * leverage) / entry_px_net
 */
-                      __pyx_v_equity_now = (__pyx_v_equity_now + ((__pyx_v_d * (__pyx_v_price_c - (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_13 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_19 * __pyx_v_open_positions.strides[1]) ))))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) )))));
+                      __pyx_v_equity_now = (__pyx_v_equity_now + ((__pyx_v_d * (__pyx_v_price_c - (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) ))))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_16 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_11)) )))));
 
-                      /* "chronoton/_cy_inner.pyx":538
+                      /* "chronoton/_cy_inner.pyx":559
  *                             equity_now = current_cash
  *                             for kk in range(n_slots):
  *                                 if slot_active[kk] != 0:             # <<<<<<<<<<<<<<
@@ -20486,293 +20197,470 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
                     }
                   }
 
-                  /* "chronoton/_cy_inner.pyx":542
+                  /* "chronoton/_cy_inner.pyx":563
  *                                     equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
  *                                                      * open_positions[kk, F_SIZE])
- *                             size = (sizing_static * equity_now) / sl_dist             # <<<<<<<<<<<<<<
- *                     else:
- *                         size = sizing_array[i]
+ *                             size = (sizing_static * equity_now * leverage) / entry_px_net             # <<<<<<<<<<<<<<
+ *                         elif sizing_method_code == SIZING_VALUE:
+ *                             size = (sizing_static * leverage) / entry_px_net
 */
-                  __pyx_v_size = ((__pyx_v_sizing_static * __pyx_v_equity_now) / __pyx_v_sl_dist);
-                }
-                __pyx_L93:;
+                  __pyx_v_size = (((__pyx_v_sizing_static * __pyx_v_equity_now) * __pyx_v_leverage) / __pyx_v_entry_px_net);
 
-                /* "chronoton/_cy_inner.pyx":531
- *                     elif sizing_method_code == SIZING_VALUE:
- *                         size = (sizing_static * leverage) / entry_px_net
- *                     elif sizing_method_code == SIZING_PERCENT_AT_RISK:             # <<<<<<<<<<<<<<
- *                         sl_dist = sl_arr[i]
- *                         if isnan(sl_dist) or sl_dist <= 0.0:
+                  /* "chronoton/_cy_inner.pyx":556
+ *                         entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
+ * 
+ *                         if sizing_method_code == SIZING_PERCENT_EQUITY:             # <<<<<<<<<<<<<<
+ *                             equity_now = current_cash
+ *                             for kk in range(n_slots):
 */
-                break;
-                default:
+                  break;
+                  case __pyx_e_9chronoton_9_cy_inner_SIZING_VALUE:
 
-                /* "chronoton/_cy_inner.pyx":544
- *                             size = (sizing_static * equity_now) / sl_dist
- *                     else:
- *                         size = sizing_array[i]             # <<<<<<<<<<<<<<
- * 
- *                     if size > 0.0 and not isnan(size):
+                  /* "chronoton/_cy_inner.pyx":565
+ *                             size = (sizing_static * equity_now * leverage) / entry_px_net
+ *                         elif sizing_method_code == SIZING_VALUE:
+ *                             size = (sizing_static * leverage) / entry_px_net             # <<<<<<<<<<<<<<
+ *                         elif sizing_method_code == SIZING_PERCENT_AT_RISK:
+ *                             sl_dist = sl_arr[i]
 */
-                __pyx_t_20 = __pyx_v_i;
-                __pyx_v_size = (*((double const  *) ( /* dim=0 */ (__pyx_v_sizing_array.data + __pyx_t_20 * __pyx_v_sizing_array.strides[0]) )));
-                break;
-              }
+                  __pyx_v_size = ((__pyx_v_sizing_static * __pyx_v_leverage) / __pyx_v_entry_px_net);
 
-              /* "chronoton/_cy_inner.pyx":546
- *                         size = sizing_array[i]
- * 
- *                     if size > 0.0 and not isnan(size):             # <<<<<<<<<<<<<<
- *                         entry_spread = spread_arr[i] * size
- *                         entry_slippage = slippage_arr[i] * size
+                  /* "chronoton/_cy_inner.pyx":564
+ *                                                      * open_positions[kk, F_SIZE])
+ *                             size = (sizing_static * equity_now * leverage) / entry_px_net
+ *                         elif sizing_method_code == SIZING_VALUE:             # <<<<<<<<<<<<<<
+ *                             size = (sizing_static * leverage) / entry_px_net
+ *                         elif sizing_method_code == SIZING_PERCENT_AT_RISK:
 */
-              __pyx_t_15 = (__pyx_v_size > 0.0);
-              if (__pyx_t_15) {
-              } else {
-                __pyx_t_14 = __pyx_t_15;
-                goto __pyx_L100_bool_binop_done;
-              }
-              __pyx_t_15 = (!isnan(__pyx_v_size));
-              __pyx_t_14 = __pyx_t_15;
-              __pyx_L100_bool_binop_done:;
-              if (__pyx_t_14) {
+                  break;
+                  case __pyx_e_9chronoton_9_cy_inner_SIZING_PERCENT_AT_RISK:
 
-                /* "chronoton/_cy_inner.pyx":547
- * 
- *                     if size > 0.0 and not isnan(size):
- *                         entry_spread = spread_arr[i] * size             # <<<<<<<<<<<<<<
- *                         entry_slippage = slippage_arr[i] * size
- *                         entry_commission = commission * fabs(entry_px_net * size)
+                  /* "chronoton/_cy_inner.pyx":567
+ *                             size = (sizing_static * leverage) / entry_px_net
+ *                         elif sizing_method_code == SIZING_PERCENT_AT_RISK:
+ *                             sl_dist = sl_arr[i]             # <<<<<<<<<<<<<<
+ *                             if isnan(sl_dist) or sl_dist <= 0.0:
+ *                                 size = 0.0
 */
-                __pyx_t_20 = __pyx_v_i;
-                __pyx_v_entry_spread = ((*((double const  *) ( /* dim=0 */ (__pyx_v_spread_arr.data + __pyx_t_20 * __pyx_v_spread_arr.strides[0]) ))) * __pyx_v_size);
+                  __pyx_t_11 = __pyx_v_i;
+                  __pyx_v_sl_dist = (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_sl_arr.data) + __pyx_t_11)) )));
 
-                /* "chronoton/_cy_inner.pyx":548
- *                     if size > 0.0 and not isnan(size):
- *                         entry_spread = spread_arr[i] * size
- *                         entry_slippage = slippage_arr[i] * size             # <<<<<<<<<<<<<<
- *                         entry_commission = commission * fabs(entry_px_net * size)
- *                         margin = size * entry_px_net
+                  /* "chronoton/_cy_inner.pyx":568
+ *                         elif sizing_method_code == SIZING_PERCENT_AT_RISK:
+ *                             sl_dist = sl_arr[i]
+ *                             if isnan(sl_dist) or sl_dist <= 0.0:             # <<<<<<<<<<<<<<
+ *                                 size = 0.0
+ *                             else:
 */
-                __pyx_t_20 = __pyx_v_i;
-                __pyx_v_entry_slippage = ((*((double const  *) ( /* dim=0 */ (__pyx_v_slippage_arr.data + __pyx_t_20 * __pyx_v_slippage_arr.strides[0]) ))) * __pyx_v_size);
+                  __pyx_t_12 = isnan(__pyx_v_sl_dist);
+                  if (!__pyx_t_12) {
+                  } else {
+                    __pyx_t_10 = __pyx_t_12;
+                    goto __pyx_L81_bool_binop_done;
+                  }
+                  __pyx_t_12 = (__pyx_v_sl_dist <= 0.0);
+                  __pyx_t_10 = __pyx_t_12;
+                  __pyx_L81_bool_binop_done:;
+                  if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":549
- *                         entry_spread = spread_arr[i] * size
- *                         entry_slippage = slippage_arr[i] * size
- *                         entry_commission = commission * fabs(entry_px_net * size)             # <<<<<<<<<<<<<<
- *                         margin = size * entry_px_net
- * 
+                    /* "chronoton/_cy_inner.pyx":569
+ *                             sl_dist = sl_arr[i]
+ *                             if isnan(sl_dist) or sl_dist <= 0.0:
+ *                                 size = 0.0             # <<<<<<<<<<<<<<
+ *                             else:
+ *                                 equity_now = current_cash
 */
-                __pyx_v_entry_commission = (__pyx_v_commission * fabs((__pyx_v_entry_px_net * __pyx_v_size)));
+                    __pyx_v_size = 0.0;
 
-                /* "chronoton/_cy_inner.pyx":550
- *                         entry_slippage = slippage_arr[i] * size
- *                         entry_commission = commission * fabs(entry_px_net * size)
- *                         margin = size * entry_px_net             # <<<<<<<<<<<<<<
- * 
- *                         if current_cash >= margin + entry_commission:
+                    /* "chronoton/_cy_inner.pyx":568
+ *                         elif sizing_method_code == SIZING_PERCENT_AT_RISK:
+ *                             sl_dist = sl_arr[i]
+ *                             if isnan(sl_dist) or sl_dist <= 0.0:             # <<<<<<<<<<<<<<
+ *                                 size = 0.0
+ *                             else:
 */
-                __pyx_v_margin = (__pyx_v_size * __pyx_v_entry_px_net);
+                    goto __pyx_L80;
+                  }
 
-                /* "chronoton/_cy_inner.pyx":552
- *                         margin = size * entry_px_net
- * 
- *                         if current_cash >= margin + entry_commission:             # <<<<<<<<<<<<<<
- *                             current_cash -= margin + entry_commission
- * 
+                  /* "chronoton/_cy_inner.pyx":571
+ *                                 size = 0.0
+ *                             else:
+ *                                 equity_now = current_cash             # <<<<<<<<<<<<<<
+ *                                 for kk in range(n_slots):
+ *                                     if slot_active[kk] != 0:
 */
-                __pyx_t_14 = (__pyx_v_current_cash >= (__pyx_v_margin + __pyx_v_entry_commission));
-                if (__pyx_t_14) {
+                  /*else*/ {
+                    __pyx_v_equity_now = __pyx_v_current_cash;
 
-                  /* "chronoton/_cy_inner.pyx":553
- * 
- *                         if current_cash >= margin + entry_commission:
- *                             current_cash -= margin + entry_commission             # <<<<<<<<<<<<<<
- * 
+                    /* "chronoton/_cy_inner.pyx":572
+ *                             else:
+ *                                 equity_now = current_cash
+ *                                 for kk in range(n_slots):             # <<<<<<<<<<<<<<
+ *                                     if slot_active[kk] != 0:
+ *                                         d = open_positions[kk, F_DIRECTION]
+*/
+                    __pyx_t_13 = __pyx_v_n_slots;
+                    __pyx_t_14 = __pyx_t_13;
+                    for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+                      __pyx_v_kk = __pyx_t_15;
+
+                      /* "chronoton/_cy_inner.pyx":573
+ *                                 equity_now = current_cash
+ *                                 for kk in range(n_slots):
+ *                                     if slot_active[kk] != 0:             # <<<<<<<<<<<<<<
+ *                                         d = open_positions[kk, F_DIRECTION]
+ *                                         equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
+*/
+                      __pyx_t_11 = __pyx_v_kk;
+                      __pyx_t_10 = ((*((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_11)) ))) != 0);
+                      if (__pyx_t_10) {
+
+                        /* "chronoton/_cy_inner.pyx":574
+ *                                 for kk in range(n_slots):
+ *                                     if slot_active[kk] != 0:
+ *                                         d = open_positions[kk, F_DIRECTION]             # <<<<<<<<<<<<<<
+ *                                         equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
+ *                                                          * open_positions[kk, F_SIZE])
+*/
+                        __pyx_t_11 = __pyx_v_kk;
+                        __pyx_t_16 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
+                        __pyx_v_d = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_11 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_16)) )));
+
+                        /* "chronoton/_cy_inner.pyx":575
+ *                                     if slot_active[kk] != 0:
+ *                                         d = open_positions[kk, F_DIRECTION]
+ *                                         equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
+ *                                                          * open_positions[kk, F_SIZE])
+ *                                 size = (sizing_static * equity_now) / sl_dist
+*/
+                        __pyx_t_16 = __pyx_v_kk;
+                        __pyx_t_11 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
+
+                        /* "chronoton/_cy_inner.pyx":576
+ *                                         d = open_positions[kk, F_DIRECTION]
+ *                                         equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
+ *                                                          * open_positions[kk, F_SIZE])             # <<<<<<<<<<<<<<
+ *                                 size = (sizing_static * equity_now) / sl_dist
+ *                         else:
+*/
+                        __pyx_t_18 = __pyx_v_kk;
+                        __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
+
+                        /* "chronoton/_cy_inner.pyx":575
+ *                                     if slot_active[kk] != 0:
+ *                                         d = open_positions[kk, F_DIRECTION]
+ *                                         equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
+ *                                                          * open_positions[kk, F_SIZE])
+ *                                 size = (sizing_static * equity_now) / sl_dist
+*/
+                        __pyx_v_equity_now = (__pyx_v_equity_now + ((__pyx_v_d * (__pyx_v_price_c - (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_16 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_11)) ))))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) )))));
+
+                        /* "chronoton/_cy_inner.pyx":573
+ *                                 equity_now = current_cash
+ *                                 for kk in range(n_slots):
+ *                                     if slot_active[kk] != 0:             # <<<<<<<<<<<<<<
+ *                                         d = open_positions[kk, F_DIRECTION]
+ *                                         equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
+*/
+                      }
+                    }
+
+                    /* "chronoton/_cy_inner.pyx":577
+ *                                         equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
+ *                                                          * open_positions[kk, F_SIZE])
+ *                                 size = (sizing_static * equity_now) / sl_dist             # <<<<<<<<<<<<<<
+ *                         else:
+ *                             size = sizing_array[i]
+*/
+                    __pyx_v_size = ((__pyx_v_sizing_static * __pyx_v_equity_now) / __pyx_v_sl_dist);
+                  }
+                  __pyx_L80:;
+
+                  /* "chronoton/_cy_inner.pyx":566
+ *                         elif sizing_method_code == SIZING_VALUE:
+ *                             size = (sizing_static * leverage) / entry_px_net
+ *                         elif sizing_method_code == SIZING_PERCENT_AT_RISK:             # <<<<<<<<<<<<<<
  *                             sl_dist = sl_arr[i]
+ *                             if isnan(sl_dist) or sl_dist <= 0.0:
 */
-                  __pyx_v_current_cash = (__pyx_v_current_cash - (__pyx_v_margin + __pyx_v_entry_commission));
+                  break;
+                  default:
 
-                  /* "chronoton/_cy_inner.pyx":555
- *                             current_cash -= margin + entry_commission
+                  /* "chronoton/_cy_inner.pyx":579
+ *                                 size = (sizing_static * equity_now) / sl_dist
+ *                         else:
+ *                             size = sizing_array[i]             # <<<<<<<<<<<<<<
  * 
- *                             sl_dist = sl_arr[i]             # <<<<<<<<<<<<<<
- *                             if isnan(sl_dist):
- *                                 sl_price = NAN
+ *                         if size > 0.0 and not isnan(size):
 */
-                  __pyx_t_20 = __pyx_v_i;
-                  __pyx_v_sl_dist = (*((double const  *) ( /* dim=0 */ (__pyx_v_sl_arr.data + __pyx_t_20 * __pyx_v_sl_arr.strides[0]) )));
+                  __pyx_t_17 = __pyx_v_i;
+                  __pyx_v_size = (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_sizing_array.data) + __pyx_t_17)) )));
+                  break;
+                }
 
-                  /* "chronoton/_cy_inner.pyx":556
+                /* "chronoton/_cy_inner.pyx":581
+ *                             size = sizing_array[i]
  * 
- *                             sl_dist = sl_arr[i]
- *                             if isnan(sl_dist):             # <<<<<<<<<<<<<<
- *                                 sl_price = NAN
- *                             else:
+ *                         if size > 0.0 and not isnan(size):             # <<<<<<<<<<<<<<
+ *                             entry_spread = spread_arr[i] * size
+ *                             entry_slippage = slippage_arr[i] * size
+*/
+                __pyx_t_12 = (__pyx_v_size > 0.0);
+                if (__pyx_t_12) {
+                } else {
+                  __pyx_t_10 = __pyx_t_12;
+                  goto __pyx_L87_bool_binop_done;
+                }
+                __pyx_t_12 = (!isnan(__pyx_v_size));
+                __pyx_t_10 = __pyx_t_12;
+                __pyx_L87_bool_binop_done:;
+                if (__pyx_t_10) {
+
+                  /* "chronoton/_cy_inner.pyx":582
+ * 
+ *                         if size > 0.0 and not isnan(size):
+ *                             entry_spread = spread_arr[i] * size             # <<<<<<<<<<<<<<
+ *                             entry_slippage = slippage_arr[i] * size
+ *                             entry_commission = commission * fabs(entry_px_net * size)
 */
-                  __pyx_t_14 = isnan(__pyx_v_sl_dist);
-                  if (__pyx_t_14) {
+                  __pyx_t_17 = __pyx_v_i;
+                  __pyx_v_entry_spread = ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_spread_arr.data) + __pyx_t_17)) ))) * __pyx_v_size);
 
-                    /* "chronoton/_cy_inner.pyx":557
- *                             sl_dist = sl_arr[i]
- *                             if isnan(sl_dist):
- *                                 sl_price = NAN             # <<<<<<<<<<<<<<
- *                             else:
- *                                 sl_price = entry_px_net - desired_dir * sl_dist
+                  /* "chronoton/_cy_inner.pyx":583
+ *                         if size > 0.0 and not isnan(size):
+ *                             entry_spread = spread_arr[i] * size
+ *                             entry_slippage = slippage_arr[i] * size             # <<<<<<<<<<<<<<
+ *                             entry_commission = commission * fabs(entry_px_net * size)
+ *                             margin = size * entry_px_net
 */
-                    __pyx_v_sl_price = NAN;
+                  __pyx_t_17 = __pyx_v_i;
+                  __pyx_v_entry_slippage = ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_slippage_arr.data) + __pyx_t_17)) ))) * __pyx_v_size);
 
-                    /* "chronoton/_cy_inner.pyx":556
+                  /* "chronoton/_cy_inner.pyx":584
+ *                             entry_spread = spread_arr[i] * size
+ *                             entry_slippage = slippage_arr[i] * size
+ *                             entry_commission = commission * fabs(entry_px_net * size)             # <<<<<<<<<<<<<<
+ *                             margin = size * entry_px_net
  * 
- *                             sl_dist = sl_arr[i]
- *                             if isnan(sl_dist):             # <<<<<<<<<<<<<<
- *                                 sl_price = NAN
- *                             else:
 */
-                    goto __pyx_L103;
-                  }
+                  __pyx_v_entry_commission = (__pyx_v_commission * fabs((__pyx_v_entry_px_net * __pyx_v_size)));
 
-                  /* "chronoton/_cy_inner.pyx":559
- *                                 sl_price = NAN
- *                             else:
- *                                 sl_price = entry_px_net - desired_dir * sl_dist             # <<<<<<<<<<<<<<
- *                             if isnan(tp):
- *                                 tp_price = NAN
+                  /* "chronoton/_cy_inner.pyx":585
+ *                             entry_slippage = slippage_arr[i] * size
+ *                             entry_commission = commission * fabs(entry_px_net * size)
+ *                             margin = size * entry_px_net             # <<<<<<<<<<<<<<
+ * 
+ *                             if current_cash >= margin + entry_commission:
 */
-                  /*else*/ {
-                    __pyx_v_sl_price = (__pyx_v_entry_px_net - (__pyx_v_desired_dir * __pyx_v_sl_dist));
-                  }
-                  __pyx_L103:;
+                  __pyx_v_margin = (__pyx_v_size * __pyx_v_entry_px_net);
 
-                  /* "chronoton/_cy_inner.pyx":560
- *                             else:
- *                                 sl_price = entry_px_net - desired_dir * sl_dist
- *                             if isnan(tp):             # <<<<<<<<<<<<<<
- *                                 tp_price = NAN
- *                             else:
+                  /* "chronoton/_cy_inner.pyx":587
+ *                             margin = size * entry_px_net
+ * 
+ *                             if current_cash >= margin + entry_commission:             # <<<<<<<<<<<<<<
+ *                                 current_cash -= margin + entry_commission
+ * 
 */
-                  __pyx_t_14 = isnan(__pyx_v_tp);
-                  if (__pyx_t_14) {
+                  __pyx_t_10 = (__pyx_v_current_cash >= (__pyx_v_margin + __pyx_v_entry_commission));
+                  if (__pyx_t_10) {
 
-                    /* "chronoton/_cy_inner.pyx":561
- *                                 sl_price = entry_px_net - desired_dir * sl_dist
- *                             if isnan(tp):
- *                                 tp_price = NAN             # <<<<<<<<<<<<<<
- *                             else:
- *                                 tp_price = entry_px_net + desired_dir * tp
+                    /* "chronoton/_cy_inner.pyx":588
+ * 
+ *                             if current_cash >= margin + entry_commission:
+ *                                 current_cash -= margin + entry_commission             # <<<<<<<<<<<<<<
+ * 
+ *                                 sl_dist = sl_arr[i]
 */
-                    __pyx_v_tp_price = NAN;
+                    __pyx_v_current_cash = (__pyx_v_current_cash - (__pyx_v_margin + __pyx_v_entry_commission));
 
-                    /* "chronoton/_cy_inner.pyx":560
- *                             else:
- *                                 sl_price = entry_px_net - desired_dir * sl_dist
- *                             if isnan(tp):             # <<<<<<<<<<<<<<
- *                                 tp_price = NAN
- *                             else:
+                    /* "chronoton/_cy_inner.pyx":590
+ *                                 current_cash -= margin + entry_commission
+ * 
+ *                                 sl_dist = sl_arr[i]             # <<<<<<<<<<<<<<
+ *                                 if isnan(sl_dist):
+ *                                     sl_price = NAN
 */
-                    goto __pyx_L104;
-                  }
+                    __pyx_t_17 = __pyx_v_i;
+                    __pyx_v_sl_dist = (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_sl_arr.data) + __pyx_t_17)) )));
 
-                  /* "chronoton/_cy_inner.pyx":563
- *                                 tp_price = NAN
- *                             else:
- *                                 tp_price = entry_px_net + desired_dir * tp             # <<<<<<<<<<<<<<
- *                             if isnan(ts):
- *                                 ts_dist_val = NAN
+                    /* "chronoton/_cy_inner.pyx":591
+ * 
+ *                                 sl_dist = sl_arr[i]
+ *                                 if isnan(sl_dist):             # <<<<<<<<<<<<<<
+ *                                     sl_price = NAN
+ *                                 else:
 */
-                  /*else*/ {
-                    __pyx_v_tp_price = (__pyx_v_entry_px_net + (__pyx_v_desired_dir * __pyx_v_tp));
-                  }
-                  __pyx_L104:;
+                    __pyx_t_10 = isnan(__pyx_v_sl_dist);
+                    if (__pyx_t_10) {
 
-                  /* "chronoton/_cy_inner.pyx":564
- *                             else:
- *                                 tp_price = entry_px_net + desired_dir * tp
- *                             if isnan(ts):             # <<<<<<<<<<<<<<
- *                                 ts_dist_val = NAN
- *                             else:
+                      /* "chronoton/_cy_inner.pyx":592
+ *                                 sl_dist = sl_arr[i]
+ *                                 if isnan(sl_dist):
+ *                                     sl_price = NAN             # <<<<<<<<<<<<<<
+ *                                 else:
+ *                                     sl_price = entry_px_net - desired_dir * sl_dist
 */
-                  __pyx_t_14 = isnan(__pyx_v_ts);
-                  if (__pyx_t_14) {
+                      __pyx_v_sl_price = NAN;
 
-                    /* "chronoton/_cy_inner.pyx":565
- *                                 tp_price = entry_px_net + desired_dir * tp
- *                             if isnan(ts):
- *                                 ts_dist_val = NAN             # <<<<<<<<<<<<<<
- *                             else:
- *                                 ts_dist_val = ts
+                      /* "chronoton/_cy_inner.pyx":591
+ * 
+ *                                 sl_dist = sl_arr[i]
+ *                                 if isnan(sl_dist):             # <<<<<<<<<<<<<<
+ *                                     sl_price = NAN
+ *                                 else:
 */
-                    __pyx_v_ts_dist_val = NAN;
+                      goto __pyx_L90;
+                    }
 
-                    /* "chronoton/_cy_inner.pyx":564
- *                             else:
- *                                 tp_price = entry_px_net + desired_dir * tp
- *                             if isnan(ts):             # <<<<<<<<<<<<<<
- *                                 ts_dist_val = NAN
- *                             else:
+                    /* "chronoton/_cy_inner.pyx":594
+ *                                     sl_price = NAN
+ *                                 else:
+ *                                     sl_price = entry_px_net - desired_dir * sl_dist             # <<<<<<<<<<<<<<
+ *                                 if isnan(tp):
+ *                                     tp_price = NAN
 */
-                    goto __pyx_L105;
-                  }
+                    /*else*/ {
+                      __pyx_v_sl_price = (__pyx_v_entry_px_net - (__pyx_v_desired_dir * __pyx_v_sl_dist));
+                    }
+                    __pyx_L90:;
+
+                    /* "chronoton/_cy_inner.pyx":595
+ *                                 else:
+ *                                     sl_price = entry_px_net - desired_dir * sl_dist
+ *                                 if isnan(tp):             # <<<<<<<<<<<<<<
+ *                                     tp_price = NAN
+ *                                 else:
+*/
+                    __pyx_t_10 = isnan(__pyx_v_tp);
+                    if (__pyx_t_10) {
+
+                      /* "chronoton/_cy_inner.pyx":596
+ *                                     sl_price = entry_px_net - desired_dir * sl_dist
+ *                                 if isnan(tp):
+ *                                     tp_price = NAN             # <<<<<<<<<<<<<<
+ *                                 else:
+ *                                     tp_price = entry_px_net + desired_dir * tp
+*/
+                      __pyx_v_tp_price = NAN;
+
+                      /* "chronoton/_cy_inner.pyx":595
+ *                                 else:
+ *                                     sl_price = entry_px_net - desired_dir * sl_dist
+ *                                 if isnan(tp):             # <<<<<<<<<<<<<<
+ *                                     tp_price = NAN
+ *                                 else:
+*/
+                      goto __pyx_L91;
+                    }
 
-                  /* "chronoton/_cy_inner.pyx":567
- *                                 ts_dist_val = NAN
- *                             else:
- *                                 ts_dist_val = ts             # <<<<<<<<<<<<<<
+                    /* "chronoton/_cy_inner.pyx":598
+ *                                     tp_price = NAN
+ *                                 else:
+ *                                     tp_price = entry_px_net + desired_dir * tp             # <<<<<<<<<<<<<<
+ *                                 if isnan(ts):
+ *                                     ts_dist_val = NAN
+*/
+                    /*else*/ {
+                      __pyx_v_tp_price = (__pyx_v_entry_px_net + (__pyx_v_desired_dir * __pyx_v_tp));
+                    }
+                    __pyx_L91:;
+
+                    /* "chronoton/_cy_inner.pyx":599
+ *                                 else:
+ *                                     tp_price = entry_px_net + desired_dir * tp
+ *                                 if isnan(ts):             # <<<<<<<<<<<<<<
+ *                                     ts_dist_val = NAN
+ *                                 else:
+*/
+                    __pyx_t_10 = isnan(__pyx_v_ts);
+                    if (__pyx_t_10) {
+
+                      /* "chronoton/_cy_inner.pyx":600
+ *                                     tp_price = entry_px_net + desired_dir * tp
+ *                                 if isnan(ts):
+ *                                     ts_dist_val = NAN             # <<<<<<<<<<<<<<
+ *                                 else:
+ *                                     ts_dist_val = ts
+*/
+                      __pyx_v_ts_dist_val = NAN;
+
+                      /* "chronoton/_cy_inner.pyx":599
+ *                                 else:
+ *                                     tp_price = entry_px_net + desired_dir * tp
+ *                                 if isnan(ts):             # <<<<<<<<<<<<<<
+ *                                     ts_dist_val = NAN
+ *                                 else:
+*/
+                      goto __pyx_L92;
+                    }
+
+                    /* "chronoton/_cy_inner.pyx":602
+ *                                     ts_dist_val = NAN
+ *                                 else:
+ *                                     ts_dist_val = ts             # <<<<<<<<<<<<<<
  * 
- *                             _enter_position(
+ *                                 _enter_position(
 */
-                  /*else*/ {
-                    __pyx_v_ts_dist_val = __pyx_v_ts;
-                  }
-                  __pyx_L105:;
+                    /*else*/ {
+                      __pyx_v_ts_dist_val = __pyx_v_ts;
+                    }
+                    __pyx_L92:;
 
-                  /* "chronoton/_cy_inner.pyx":569
- *                                 ts_dist_val = ts
+                    /* "chronoton/_cy_inner.pyx":604
+ *                                     ts_dist_val = ts
  * 
- *                             _enter_position(             # <<<<<<<<<<<<<<
- *                                 slot_idx, <double>desired_dir, i, t_ns,
- *                                 entry_px_net, size,
+ *                                 _enter_position(             # <<<<<<<<<<<<<<
+ *                                     slot_idx, <double>desired_dir, i, t_ns,
+ *                                     entry_px_net, size,
 */
-                  __pyx_f_9chronoton_9_cy_inner__enter_position(__pyx_v_slot_idx, ((double)__pyx_v_desired_dir), __pyx_v_i, __pyx_v_t_ns, __pyx_v_entry_px_net, __pyx_v_size, __pyx_v_sl_price, __pyx_v_tp_price, __pyx_v_ts_dist_val, __pyx_v_entry_commission, __pyx_v_entry_spread, __pyx_v_entry_slippage, __pyx_v_open_positions, __pyx_v_slot_active); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 569, __pyx_L4_error)
+                    __pyx_f_9chronoton_9_cy_inner__enter_position(__pyx_v_slot_idx, ((double)__pyx_v_desired_dir), __pyx_v_i, __pyx_v_t_ns, __pyx_v_entry_px_net, __pyx_v_size, __pyx_v_sl_price, __pyx_v_tp_price, __pyx_v_ts_dist_val, __pyx_v_entry_commission, __pyx_v_entry_spread, __pyx_v_entry_slippage, __pyx_v_open_positions, __pyx_v_slot_active); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 604, __pyx_L4_error)
 
-                  /* "chronoton/_cy_inner.pyx":552
- *                         margin = size * entry_px_net
+                    /* "chronoton/_cy_inner.pyx":587
+ *                             margin = size * entry_px_net
  * 
- *                         if current_cash >= margin + entry_commission:             # <<<<<<<<<<<<<<
- *                             current_cash -= margin + entry_commission
+ *                             if current_cash >= margin + entry_commission:             # <<<<<<<<<<<<<<
+ *                                 current_cash -= margin + entry_commission
  * 
+*/
+                  }
+
+                  /* "chronoton/_cy_inner.pyx":581
+ *                             size = sizing_array[i]
+ * 
+ *                         if size > 0.0 and not isnan(size):             # <<<<<<<<<<<<<<
+ *                             entry_spread = spread_arr[i] * size
+ *                             entry_slippage = slippage_arr[i] * size
 */
                 }
 
-                /* "chronoton/_cy_inner.pyx":546
- *                         size = sizing_array[i]
+                /* "chronoton/_cy_inner.pyx":553
+ *                     desired_dir = -1
+ *                     slot_idx = _find_free_slot(slot_active, n_slots)
+ *                     if slot_idx != -1:             # <<<<<<<<<<<<<<
+ *                         entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
  * 
- *                     if size > 0.0 and not isnan(size):             # <<<<<<<<<<<<<<
- *                         entry_spread = spread_arr[i] * size
- *                         entry_slippage = slippage_arr[i] * size
 */
               }
 
-              /* "chronoton/_cy_inner.pyx":518
- *                 desired_dir = -1
- *                 slot_idx = _find_free_slot(slot_active, n_slots)
- *                 if slot_idx != -1:             # <<<<<<<<<<<<<<
- *                     entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
+              /* "chronoton/_cy_inner.pyx":550
+ *                                 )
  * 
+ *                 if want_short_entry:             # <<<<<<<<<<<<<<
+ *                     desired_dir = -1
+ *                     slot_idx = _find_free_slot(slot_active, n_slots)
 */
             }
 
-            /* "chronoton/_cy_inner.pyx":515
- *                             )
- * 
- *             if want_short_entry:             # <<<<<<<<<<<<<<
- *                 desired_dir = -1
- *                 slot_idx = _find_free_slot(slot_active, n_slots)
+            /* "chronoton/_cy_inner.pyx":416
+ *             # carry none, so one load and test skips (3) and (4) entirely.
+ *             flags = signal_flags[i]
+ *             if flags != 0:             # <<<<<<<<<<<<<<
+ *                 # (3) Shifted exit signals ----------------------------------
+ *                 want_long_exit = (flags & SIG_LONG_EXIT) != 0
 */
           }
 
-          /* "chronoton/_cy_inner.pyx":578
+          /* "chronoton/_cy_inner.pyx":613
  * 
  *             # (5) Mark-to-market ---------------------------------------
  *             unrealized = 0.0             # <<<<<<<<<<<<<<
@@ -20781,7 +20669,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
           __pyx_v_unrealized = 0.0;
 
-          /* "chronoton/_cy_inner.pyx":579
+          /* "chronoton/_cy_inner.pyx":614
  *             # (5) Mark-to-market ---------------------------------------
  *             unrealized = 0.0
  *             margin_held = 0.0             # <<<<<<<<<<<<<<
@@ -20790,39 +20678,39 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
           __pyx_v_margin_held = 0.0;
 
-          /* "chronoton/_cy_inner.pyx":580
+          /* "chronoton/_cy_inner.pyx":615
  *             unrealized = 0.0
  *             margin_held = 0.0
  *             for k in range(n_slots):             # <<<<<<<<<<<<<<
  *                 if slot_active[k] == 0:
  *                     continue
 */
-          __pyx_t_16 = __pyx_v_n_slots;
-          __pyx_t_17 = __pyx_t_16;
-          for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
-            __pyx_v_k = __pyx_t_18;
+          __pyx_t_13 = __pyx_v_n_slots;
+          __pyx_t_14 = __pyx_t_13;
+          for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+            __pyx_v_k = __pyx_t_15;
 
-            /* "chronoton/_cy_inner.pyx":581
+            /* "chronoton/_cy_inner.pyx":616
  *             margin_held = 0.0
  *             for k in range(n_slots):
  *                 if slot_active[k] == 0:             # <<<<<<<<<<<<<<
  *                     continue
  *                 d = open_positions[k, F_DIRECTION]
 */
-            __pyx_t_20 = __pyx_v_k;
-            __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_20 * __pyx_v_slot_active.strides[0]) ))) == 0);
-            if (__pyx_t_14) {
+            __pyx_t_17 = __pyx_v_k;
+            __pyx_t_10 = ((*((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_17)) ))) == 0);
+            if (__pyx_t_10) {
 
-              /* "chronoton/_cy_inner.pyx":582
+              /* "chronoton/_cy_inner.pyx":617
  *             for k in range(n_slots):
  *                 if slot_active[k] == 0:
  *                     continue             # <<<<<<<<<<<<<<
  *                 d = open_positions[k, F_DIRECTION]
  *                 unrealized += (d * (price_c - open_positions[k, F_ENTRY_PRICE])
 */
-              goto __pyx_L106_continue;
+              goto __pyx_L93_continue;
 
-              /* "chronoton/_cy_inner.pyx":581
+              /* "chronoton/_cy_inner.pyx":616
  *             margin_held = 0.0
  *             for k in range(n_slots):
  *                 if slot_active[k] == 0:             # <<<<<<<<<<<<<<
@@ -20831,114 +20719,114 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
             }
 
-            /* "chronoton/_cy_inner.pyx":583
+            /* "chronoton/_cy_inner.pyx":618
  *                 if slot_active[k] == 0:
  *                     continue
  *                 d = open_positions[k, F_DIRECTION]             # <<<<<<<<<<<<<<
  *                 unrealized += (d * (price_c - open_positions[k, F_ENTRY_PRICE])
  *                                  * open_positions[k, F_SIZE])
 */
-            __pyx_t_20 = __pyx_v_k;
-            __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
-            __pyx_v_d = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) )));
+            __pyx_t_17 = __pyx_v_k;
+            __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
+            __pyx_v_d = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) )));
 
-            /* "chronoton/_cy_inner.pyx":584
+            /* "chronoton/_cy_inner.pyx":619
  *                     continue
  *                 d = open_positions[k, F_DIRECTION]
  *                 unrealized += (d * (price_c - open_positions[k, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
  *                                  * open_positions[k, F_SIZE])
  *                 margin_held += open_positions[k, F_SIZE] * open_positions[k, F_ENTRY_PRICE]
 */
-            __pyx_t_21 = __pyx_v_k;
-            __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
+            __pyx_t_18 = __pyx_v_k;
+            __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
 
-            /* "chronoton/_cy_inner.pyx":585
+            /* "chronoton/_cy_inner.pyx":620
  *                 d = open_positions[k, F_DIRECTION]
  *                 unrealized += (d * (price_c - open_positions[k, F_ENTRY_PRICE])
  *                                  * open_positions[k, F_SIZE])             # <<<<<<<<<<<<<<
  *                 margin_held += open_positions[k, F_SIZE] * open_positions[k, F_ENTRY_PRICE]
  *                 open_positions[k, F_BARS_HELD] = <double>(
 */
-            __pyx_t_19 = __pyx_v_k;
-            __pyx_t_13 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
+            __pyx_t_11 = __pyx_v_k;
+            __pyx_t_16 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
 
-            /* "chronoton/_cy_inner.pyx":584
+            /* "chronoton/_cy_inner.pyx":619
  *                     continue
  *                 d = open_positions[k, F_DIRECTION]
  *                 unrealized += (d * (price_c - open_positions[k, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
  *                                  * open_positions[k, F_SIZE])
  *                 margin_held += open_positions[k, F_SIZE] * open_positions[k, F_ENTRY_PRICE]
 */
-            __pyx_v_unrealized = (__pyx_v_unrealized + ((__pyx_v_d * (__pyx_v_price_c - (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) ))))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_19 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_13 * __pyx_v_open_positions.strides[1]) )))));
+            __pyx_v_unrealized = (__pyx_v_unrealized + ((__pyx_v_d * (__pyx_v_price_c - (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) ))))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_11 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_16)) )))));
 
-            /* "chronoton/_cy_inner.pyx":586
+            /* "chronoton/_cy_inner.pyx":621
  *                 unrealized += (d * (price_c - open_positions[k, F_ENTRY_PRICE])
  *                                  * open_positions[k, F_SIZE])
  *                 margin_held += open_positions[k, F_SIZE] * open_positions[k, F_ENTRY_PRICE]             # <<<<<<<<<<<<<<
  *                 open_positions[k, F_BARS_HELD] = <double>(
  *                     i - <Py_ssize_t>open_positions[k, F_ENTRY_BAR]
 */
-            __pyx_t_13 = __pyx_v_k;
-            __pyx_t_19 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
-            __pyx_t_20 = __pyx_v_k;
-            __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
-            __pyx_v_margin_held = (__pyx_v_margin_held + ((*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_13 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_19 * __pyx_v_open_positions.strides[1]) ))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) )))));
+            __pyx_t_16 = __pyx_v_k;
+            __pyx_t_11 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
+            __pyx_t_17 = __pyx_v_k;
+            __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
+            __pyx_v_margin_held = (__pyx_v_margin_held + ((*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_16 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_11)) ))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) )))));
 
-            /* "chronoton/_cy_inner.pyx":588
+            /* "chronoton/_cy_inner.pyx":623
  *                 margin_held += open_positions[k, F_SIZE] * open_positions[k, F_ENTRY_PRICE]
  *                 open_positions[k, F_BARS_HELD] = <double>(
  *                     i - <Py_ssize_t>open_positions[k, F_ENTRY_BAR]             # <<<<<<<<<<<<<<
  *                 )
  *             equity_out[i] = current_cash + margin_held + unrealized
 */
-            __pyx_t_21 = __pyx_v_k;
-            __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_BAR;
+            __pyx_t_18 = __pyx_v_k;
+            __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_BAR;
 
-            /* "chronoton/_cy_inner.pyx":587
+            /* "chronoton/_cy_inner.pyx":622
  *                                  * open_positions[k, F_SIZE])
  *                 margin_held += open_positions[k, F_SIZE] * open_positions[k, F_ENTRY_PRICE]
  *                 open_positions[k, F_BARS_HELD] = <double>(             # <<<<<<<<<<<<<<
  *                     i - <Py_ssize_t>open_positions[k, F_ENTRY_BAR]
  *                 )
 */
-            __pyx_t_19 = __pyx_v_k;
-            __pyx_t_13 = __pyx_e_9chronoton_9_cy_inner_F_BARS_HELD;
-            *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_19 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_13 * __pyx_v_open_positions.strides[1]) )) = ((double)(__pyx_v_i - ((Py_ssize_t)(*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) ))))));
-            __pyx_L106_continue:;
+            __pyx_t_11 = __pyx_v_k;
+            __pyx_t_16 = __pyx_e_9chronoton_9_cy_inner_F_BARS_HELD;
+            *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_11 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_16)) )) = ((double)(__pyx_v_i - ((Py_ssize_t)(*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) ))))));
+            __pyx_L93_continue:;
           }
 
-          /* "chronoton/_cy_inner.pyx":590
+          /* "chronoton/_cy_inner.pyx":625
  *                     i - <Py_ssize_t>open_positions[k, F_ENTRY_BAR]
  *                 )
  *             equity_out[i] = current_cash + margin_held + unrealized             # <<<<<<<<<<<<<<
  *             cash_out[i] = current_cash
  * 
 */
-          __pyx_t_20 = __pyx_v_i;
-          *((double *) ( /* dim=0 */ (__pyx_v_equity_out.data + __pyx_t_20 * __pyx_v_equity_out.strides[0]) )) = ((__pyx_v_current_cash + __pyx_v_margin_held) + __pyx_v_unrealized);
+          __pyx_t_17 = __pyx_v_i;
+          *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_equity_out.data) + __pyx_t_17)) )) = ((__pyx_v_current_cash + __pyx_v_margin_held) + __pyx_v_unrealized);
 
-          /* "chronoton/_cy_inner.pyx":591
+          /* "chronoton/_cy_inner.pyx":626
  *                 )
  *             equity_out[i] = current_cash + margin_held + unrealized
  *             cash_out[i] = current_cash             # <<<<<<<<<<<<<<
  * 
  *             # (6) Liquidation ------------------------------------------
 */
-          __pyx_t_20 = __pyx_v_i;
-          *((double *) ( /* dim=0 */ (__pyx_v_cash_out.data + __pyx_t_20 * __pyx_v_cash_out.strides[0]) )) = __pyx_v_current_cash;
+          __pyx_t_17 = __pyx_v_i;
+          *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_cash_out.data) + __pyx_t_17)) )) = __pyx_v_current_cash;
 
-          /* "chronoton/_cy_inner.pyx":594
+          /* "chronoton/_cy_inner.pyx":629
  * 
  *             # (6) Liquidation ------------------------------------------
  *             if equity_out[i] <= 0.0:             # <<<<<<<<<<<<<<
  *                 total_loss_budget = current_cash + margin_held
  *                 total_bad = 0.0
 */
-          __pyx_t_20 = __pyx_v_i;
-          __pyx_t_14 = ((*((double *) ( /* dim=0 */ (__pyx_v_equity_out.data + __pyx_t_20 * __pyx_v_equity_out.strides[0]) ))) <= 0.0);
-          if (__pyx_t_14) {
+          __pyx_t_17 = __pyx_v_i;
+          __pyx_t_10 = ((*((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_equity_out.data) + __pyx_t_17)) ))) <= 0.0);
+          if (__pyx_t_10) {
 
-            /* "chronoton/_cy_inner.pyx":595
+            /* "chronoton/_cy_inner.pyx":630
  *             # (6) Liquidation ------------------------------------------
  *             if equity_out[i] <= 0.0:
  *                 total_loss_budget = current_cash + margin_held             # <<<<<<<<<<<<<<
@@ -20947,7 +20835,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
             __pyx_v_total_loss_budget = (__pyx_v_current_cash + __pyx_v_margin_held);
 
-            /* "chronoton/_cy_inner.pyx":596
+            /* "chronoton/_cy_inner.pyx":631
  *             if equity_out[i] <= 0.0:
  *                 total_loss_budget = current_cash + margin_held
  *                 total_bad = 0.0             # <<<<<<<<<<<<<<
@@ -20956,49 +20844,49 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
             __pyx_v_total_bad = 0.0;
 
-            /* "chronoton/_cy_inner.pyx":597
+            /* "chronoton/_cy_inner.pyx":632
  *                 total_loss_budget = current_cash + margin_held
  *                 total_bad = 0.0
  *                 for k in range(n_slots):             # <<<<<<<<<<<<<<
  *                     if slot_active[k] == 0:
  *                         unrealized_by_slot[k] = 0.0
 */
-            __pyx_t_16 = __pyx_v_n_slots;
-            __pyx_t_17 = __pyx_t_16;
-            for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
-              __pyx_v_k = __pyx_t_18;
+            __pyx_t_13 = __pyx_v_n_slots;
+            __pyx_t_14 = __pyx_t_13;
+            for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+              __pyx_v_k = __pyx_t_15;
 
-              /* "chronoton/_cy_inner.pyx":598
+              /* "chronoton/_cy_inner.pyx":633
  *                 total_bad = 0.0
  *                 for k in range(n_slots):
  *                     if slot_active[k] == 0:             # <<<<<<<<<<<<<<
  *                         unrealized_by_slot[k] = 0.0
  *                         continue
 */
-              __pyx_t_20 = __pyx_v_k;
-              __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_20 * __pyx_v_slot_active.strides[0]) ))) == 0);
-              if (__pyx_t_14) {
+              __pyx_t_17 = __pyx_v_k;
+              __pyx_t_10 = ((*((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_17)) ))) == 0);
+              if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":599
+                /* "chronoton/_cy_inner.pyx":634
  *                 for k in range(n_slots):
  *                     if slot_active[k] == 0:
  *                         unrealized_by_slot[k] = 0.0             # <<<<<<<<<<<<<<
  *                         continue
  *                     d = open_positions[k, F_DIRECTION]
 */
-                __pyx_t_20 = __pyx_v_k;
-                *((double *) ( /* dim=0 */ (__pyx_v_unrealized_by_slot.data + __pyx_t_20 * __pyx_v_unrealized_by_slot.strides[0]) )) = 0.0;
+                __pyx_t_17 = __pyx_v_k;
+                *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_unrealized_by_slot.data) + __pyx_t_17)) )) = 0.0;
 
-                /* "chronoton/_cy_inner.pyx":600
+                /* "chronoton/_cy_inner.pyx":635
  *                     if slot_active[k] == 0:
  *                         unrealized_by_slot[k] = 0.0
  *                         continue             # <<<<<<<<<<<<<<
  *                     d = open_positions[k, F_DIRECTION]
  *                     u = (d * (price_c - open_positions[k, F_ENTRY_PRICE])
 */
-                goto __pyx_L110_continue;
+                goto __pyx_L97_continue;
 
-                /* "chronoton/_cy_inner.pyx":598
+                /* "chronoton/_cy_inner.pyx":633
  *                 total_bad = 0.0
  *                 for k in range(n_slots):
  *                     if slot_active[k] == 0:             # <<<<<<<<<<<<<<
@@ -21007,59 +20895,59 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
               }
 
-              /* "chronoton/_cy_inner.pyx":601
+              /* "chronoton/_cy_inner.pyx":636
  *                         unrealized_by_slot[k] = 0.0
  *                         continue
  *                     d = open_positions[k, F_DIRECTION]             # <<<<<<<<<<<<<<
  *                     u = (d * (price_c - open_positions[k, F_ENTRY_PRICE])
  *                            * open_positions[k, F_SIZE])
 */
-              __pyx_t_20 = __pyx_v_k;
-              __pyx_t_21 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
-              __pyx_v_d = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_20 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_21 * __pyx_v_open_positions.strides[1]) )));
+              __pyx_t_17 = __pyx_v_k;
+              __pyx_t_18 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
+              __pyx_v_d = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_17 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_18)) )));
 
-              /* "chronoton/_cy_inner.pyx":602
+              /* "chronoton/_cy_inner.pyx":637
  *                         continue
  *                     d = open_positions[k, F_DIRECTION]
  *                     u = (d * (price_c - open_positions[k, F_ENTRY_PRICE])             # <<<<<<<<<<<<<<
  *                            * open_positions[k, F_SIZE])
  *                     unrealized_by_slot[k] = u
 */
-              __pyx_t_21 = __pyx_v_k;
-              __pyx_t_20 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
+              __pyx_t_18 = __pyx_v_k;
+              __pyx_t_17 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
 
-              /* "chronoton/_cy_inner.pyx":603
+              /* "chronoton/_cy_inner.pyx":638
  *                     d = open_positions[k, F_DIRECTION]
  *                     u = (d * (price_c - open_positions[k, F_ENTRY_PRICE])
  *                            * open_positions[k, F_SIZE])             # <<<<<<<<<<<<<<
  *                     unrealized_by_slot[k] = u
  *                     if u < 0.0:
 */
-              __pyx_t_13 = __pyx_v_k;
-              __pyx_t_19 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
-              __pyx_v_u = ((__pyx_v_d * (__pyx_v_price_c - (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_21 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_20 * __pyx_v_open_positions.strides[1]) ))))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_13 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_19 * __pyx_v_open_positions.strides[1]) ))));
+              __pyx_t_16 = __pyx_v_k;
+              __pyx_t_11 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
+              __pyx_v_u = ((__pyx_v_d * (__pyx_v_price_c - (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_18 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_17)) ))))) * (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_16 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_11)) ))));
 
-              /* "chronoton/_cy_inner.pyx":604
+              /* "chronoton/_cy_inner.pyx":639
  *                     u = (d * (price_c - open_positions[k, F_ENTRY_PRICE])
  *                            * open_positions[k, F_SIZE])
  *                     unrealized_by_slot[k] = u             # <<<<<<<<<<<<<<
  *                     if u < 0.0:
  *                         total_bad += -u
 */
-              __pyx_t_19 = __pyx_v_k;
-              *((double *) ( /* dim=0 */ (__pyx_v_unrealized_by_slot.data + __pyx_t_19 * __pyx_v_unrealized_by_slot.strides[0]) )) = __pyx_v_u;
+              __pyx_t_11 = __pyx_v_k;
+              *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_unrealized_by_slot.data) + __pyx_t_11)) )) = __pyx_v_u;
 
-              /* "chronoton/_cy_inner.pyx":605
+              /* "chronoton/_cy_inner.pyx":640
  *                            * open_positions[k, F_SIZE])
  *                     unrealized_by_slot[k] = u
  *                     if u < 0.0:             # <<<<<<<<<<<<<<
  *                         total_bad += -u
  * 
 */
-              __pyx_t_14 = (__pyx_v_u < 0.0);
-              if (__pyx_t_14) {
+              __pyx_t_10 = (__pyx_v_u < 0.0);
+              if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":606
+                /* "chronoton/_cy_inner.pyx":641
  *                     unrealized_by_slot[k] = u
  *                     if u < 0.0:
  *                         total_bad += -u             # <<<<<<<<<<<<<<
@@ -21068,7 +20956,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
                 __pyx_v_total_bad = (__pyx_v_total_bad + (-__pyx_v_u));
 
-                /* "chronoton/_cy_inner.pyx":605
+                /* "chronoton/_cy_inner.pyx":640
  *                            * open_positions[k, F_SIZE])
  *                     unrealized_by_slot[k] = u
  *                     if u < 0.0:             # <<<<<<<<<<<<<<
@@ -21076,42 +20964,42 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
  * 
 */
               }
-              __pyx_L110_continue:;
+              __pyx_L97_continue:;
             }
 
-            /* "chronoton/_cy_inner.pyx":608
+            /* "chronoton/_cy_inner.pyx":643
  *                         total_bad += -u
  * 
  *                 for k in range(n_slots):             # <<<<<<<<<<<<<<
  *                     if slot_active[k] == 0:
  *                         continue
 */
-            __pyx_t_16 = __pyx_v_n_slots;
-            __pyx_t_17 = __pyx_t_16;
-            for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
-              __pyx_v_k = __pyx_t_18;
+            __pyx_t_13 = __pyx_v_n_slots;
+            __pyx_t_14 = __pyx_t_13;
+            for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+              __pyx_v_k = __pyx_t_15;
 
-              /* "chronoton/_cy_inner.pyx":609
+              /* "chronoton/_cy_inner.pyx":644
  * 
  *                 for k in range(n_slots):
  *                     if slot_active[k] == 0:             # <<<<<<<<<<<<<<
  *                         continue
  *                     direction = open_positions[k, F_DIRECTION]
 */
-              __pyx_t_19 = __pyx_v_k;
-              __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_19 * __pyx_v_slot_active.strides[0]) ))) == 0);
-              if (__pyx_t_14) {
+              __pyx_t_11 = __pyx_v_k;
+              __pyx_t_10 = ((*((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_11)) ))) == 0);
+              if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":610
+                /* "chronoton/_cy_inner.pyx":645
  *                 for k in range(n_slots):
  *                     if slot_active[k] == 0:
  *                         continue             # <<<<<<<<<<<<<<
  *                     direction = open_positions[k, F_DIRECTION]
  *                     size = open_positions[k, F_SIZE]
 */
-                goto __pyx_L114_continue;
+                goto __pyx_L101_continue;
 
-                /* "chronoton/_cy_inner.pyx":609
+                /* "chronoton/_cy_inner.pyx":644
  * 
  *                 for k in range(n_slots):
  *                     if slot_active[k] == 0:             # <<<<<<<<<<<<<<
@@ -21120,68 +21008,68 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
               }
 
-              /* "chronoton/_cy_inner.pyx":611
+              /* "chronoton/_cy_inner.pyx":646
  *                     if slot_active[k] == 0:
  *                         continue
  *                     direction = open_positions[k, F_DIRECTION]             # <<<<<<<<<<<<<<
  *                     size = open_positions[k, F_SIZE]
  *                     entry_px = open_positions[k, F_ENTRY_PRICE]
 */
-              __pyx_t_19 = __pyx_v_k;
-              __pyx_t_13 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
-              __pyx_v_direction = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_19 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_13 * __pyx_v_open_positions.strides[1]) )));
+              __pyx_t_11 = __pyx_v_k;
+              __pyx_t_16 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
+              __pyx_v_direction = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_11 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_16)) )));
 
-              /* "chronoton/_cy_inner.pyx":612
+              /* "chronoton/_cy_inner.pyx":647
  *                         continue
  *                     direction = open_positions[k, F_DIRECTION]
  *                     size = open_positions[k, F_SIZE]             # <<<<<<<<<<<<<<
  *                     entry_px = open_positions[k, F_ENTRY_PRICE]
  *                     u = unrealized_by_slot[k]
 */
-              __pyx_t_13 = __pyx_v_k;
-              __pyx_t_19 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
-              __pyx_v_size = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_13 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_19 * __pyx_v_open_positions.strides[1]) )));
+              __pyx_t_16 = __pyx_v_k;
+              __pyx_t_11 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
+              __pyx_v_size = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_16 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_11)) )));
 
-              /* "chronoton/_cy_inner.pyx":613
+              /* "chronoton/_cy_inner.pyx":648
  *                     direction = open_positions[k, F_DIRECTION]
  *                     size = open_positions[k, F_SIZE]
  *                     entry_px = open_positions[k, F_ENTRY_PRICE]             # <<<<<<<<<<<<<<
  *                     u = unrealized_by_slot[k]
  * 
 */
-              __pyx_t_19 = __pyx_v_k;
-              __pyx_t_13 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
-              __pyx_v_entry_px = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_19 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_13 * __pyx_v_open_positions.strides[1]) )));
+              __pyx_t_11 = __pyx_v_k;
+              __pyx_t_16 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
+              __pyx_v_entry_px = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_11 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_16)) )));
 
-              /* "chronoton/_cy_inner.pyx":614
+              /* "chronoton/_cy_inner.pyx":649
  *                     size = open_positions[k, F_SIZE]
  *                     entry_px = open_positions[k, F_ENTRY_PRICE]
  *                     u = unrealized_by_slot[k]             # <<<<<<<<<<<<<<
  * 
  *                     if u >= 0.0 or total_bad == 0.0:
 */
-              __pyx_t_13 = __pyx_v_k;
-              __pyx_v_u = (*((double *) ( /* dim=0 */ (__pyx_v_unrealized_by_slot.data + __pyx_t_13 * __pyx_v_unrealized_by_slot.strides[0]) )));
+              __pyx_t_16 = __pyx_v_k;
+              __pyx_v_u = (*((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_unrealized_by_slot.data) + __pyx_t_16)) )));
 
-              /* "chronoton/_cy_inner.pyx":616
+              /* "chronoton/_cy_inner.pyx":651
  *                     u = unrealized_by_slot[k]
  * 
  *                     if u >= 0.0 or total_bad == 0.0:             # <<<<<<<<<<<<<<
  *                         realised_pnl = u
  *                         exit_px_net = price_c
 */
-              __pyx_t_15 = (__pyx_v_u >= 0.0);
-              if (!__pyx_t_15) {
+              __pyx_t_12 = (__pyx_v_u >= 0.0);
+              if (!__pyx_t_12) {
               } else {
-                __pyx_t_14 = __pyx_t_15;
-                goto __pyx_L118_bool_binop_done;
+                __pyx_t_10 = __pyx_t_12;
+                goto __pyx_L105_bool_binop_done;
               }
-              __pyx_t_15 = (__pyx_v_total_bad == 0.0);
-              __pyx_t_14 = __pyx_t_15;
-              __pyx_L118_bool_binop_done:;
-              if (__pyx_t_14) {
+              __pyx_t_12 = (__pyx_v_total_bad == 0.0);
+              __pyx_t_10 = __pyx_t_12;
+              __pyx_L105_bool_binop_done:;
+              if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":617
+                /* "chronoton/_cy_inner.pyx":652
  * 
  *                     if u >= 0.0 or total_bad == 0.0:
  *                         realised_pnl = u             # <<<<<<<<<<<<<<
@@ -21190,7 +21078,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
                 __pyx_v_realised_pnl = __pyx_v_u;
 
-                /* "chronoton/_cy_inner.pyx":618
+                /* "chronoton/_cy_inner.pyx":653
  *                     if u >= 0.0 or total_bad == 0.0:
  *                         realised_pnl = u
  *                         exit_px_net = price_c             # <<<<<<<<<<<<<<
@@ -21199,17 +21087,17 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
                 __pyx_v_exit_px_net = __pyx_v_price_c;
 
-                /* "chronoton/_cy_inner.pyx":616
+                /* "chronoton/_cy_inner.pyx":651
  *                     u = unrealized_by_slot[k]
  * 
  *                     if u >= 0.0 or total_bad == 0.0:             # <<<<<<<<<<<<<<
  *                         realised_pnl = u
  *                         exit_px_net = price_c
 */
-                goto __pyx_L117;
+                goto __pyx_L104;
               }
 
-              /* "chronoton/_cy_inner.pyx":620
+              /* "chronoton/_cy_inner.pyx":655
  *                         exit_px_net = price_c
  *                     else:
  *                         share = (-u) / total_bad             # <<<<<<<<<<<<<<
@@ -21219,7 +21107,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
               /*else*/ {
                 __pyx_v_share = ((-__pyx_v_u) / __pyx_v_total_bad);
 
-                /* "chronoton/_cy_inner.pyx":621
+                /* "chronoton/_cy_inner.pyx":656
  *                     else:
  *                         share = (-u) / total_bad
  *                         realised_pnl = -share * total_loss_budget             # <<<<<<<<<<<<<<
@@ -21228,7 +21116,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
                 __pyx_v_realised_pnl = ((-__pyx_v_share) * __pyx_v_total_loss_budget);
 
-                /* "chronoton/_cy_inner.pyx":622
+                /* "chronoton/_cy_inner.pyx":657
  *                         share = (-u) / total_bad
  *                         realised_pnl = -share * total_loss_budget
  *                         exit_px_net = entry_px + realised_pnl / (direction * size)             # <<<<<<<<<<<<<<
@@ -21237,9 +21125,9 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
                 __pyx_v_exit_px_net = (__pyx_v_entry_px + (__pyx_v_realised_pnl / (__pyx_v_direction * __pyx_v_size)));
               }
-              __pyx_L117:;
+              __pyx_L104:;
 
-              /* "chronoton/_cy_inner.pyx":624
+              /* "chronoton/_cy_inner.pyx":659
  *                         exit_px_net = entry_px + realised_pnl / (direction * size)
  * 
  *                     current_cash += (size * entry_px) + realised_pnl             # <<<<<<<<<<<<<<
@@ -21248,36 +21136,36 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
               __pyx_v_current_cash = (__pyx_v_current_cash + ((__pyx_v_size * __pyx_v_entry_px) + __pyx_v_realised_pnl));
 
-              /* "chronoton/_cy_inner.pyx":625
+              /* "chronoton/_cy_inner.pyx":660
  * 
  *                     current_cash += (size * entry_px) + realised_pnl
  *                     n_closed = _exit_position(             # <<<<<<<<<<<<<<
  *                         k, i, t_ns, exit_px_net, <double>EXIT_LIQUIDATION,
  *                         0.0, 0.0, 0.0,
 */
-              __pyx_t_22 = __pyx_f_9chronoton_9_cy_inner__exit_position(__pyx_v_k, __pyx_v_i, __pyx_v_t_ns, __pyx_v_exit_px_net, ((double)__pyx_e_9chronoton_9_cy_inner_EXIT_LIQUIDATION), 0.0, 0.0, 0.0, __pyx_v_open_positions, __pyx_v_slot_active, __pyx_v_closed_trades, __pyx_v_n_closed, __pyx_v_closed_capacity, __pyx_v_overflow_flag); if (unlikely(__pyx_t_22 == ((Py_ssize_t)-1L) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 625, __pyx_L4_error)
-              __pyx_v_n_closed = __pyx_t_22;
+              __pyx_t_20 = __pyx_f_9chronoton_9_cy_inner__exit_position(__pyx_v_k, __pyx_v_i, __pyx_v_t_ns, __pyx_v_exit_px_net, ((double)__pyx_e_9chronoton_9_cy_inner_EXIT_LIQUIDATION), 0.0, 0.0, 0.0, __pyx_v_open_positions, __pyx_v_slot_active, __pyx_v_closed_trades, __pyx_v_n_closed, __pyx_v_closed_capacity, __pyx_v_overflow_flag); if (unlikely(__pyx_t_20 == ((Py_ssize_t)-1L) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 660, __pyx_L4_error)
+              __pyx_v_n_closed = __pyx_t_20;
 
-              /* "chronoton/_cy_inner.pyx":631
+              /* "chronoton/_cy_inner.pyx":666
  *                         n_closed, closed_capacity, overflow_flag,
  *                     )
  *                     if n_closed < 0:             # <<<<<<<<<<<<<<
  *                         break
  * 
 */
-              __pyx_t_14 = (__pyx_v_n_closed < 0);
-              if (__pyx_t_14) {
+              __pyx_t_10 = (__pyx_v_n_closed < 0);
+              if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":632
+                /* "chronoton/_cy_inner.pyx":667
  *                     )
  *                     if n_closed < 0:
  *                         break             # <<<<<<<<<<<<<<
  * 
  *                 if n_closed < 0:
 */
-                goto __pyx_L115_break;
+                goto __pyx_L102_break;
 
-                /* "chronoton/_cy_inner.pyx":631
+                /* "chronoton/_cy_inner.pyx":666
  *                         n_closed, closed_capacity, overflow_flag,
  *                     )
  *                     if n_closed < 0:             # <<<<<<<<<<<<<<
@@ -21285,21 +21173,21 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
  * 
 */
               }
-              __pyx_L114_continue:;
+              __pyx_L101_continue:;
             }
-            __pyx_L115_break:;
+            __pyx_L102_break:;
 
-            /* "chronoton/_cy_inner.pyx":634
+            /* "chronoton/_cy_inner.pyx":669
  *                         break
  * 
  *                 if n_closed < 0:             # <<<<<<<<<<<<<<
  *                     break
  * 
 */
-            __pyx_t_14 = (__pyx_v_n_closed < 0);
-            if (__pyx_t_14) {
+            __pyx_t_10 = (__pyx_v_n_closed < 0);
+            if (__pyx_t_10) {
 
-              /* "chronoton/_cy_inner.pyx":635
+              /* "chronoton/_cy_inner.pyx":670
  * 
  *                 if n_closed < 0:
  *                     break             # <<<<<<<<<<<<<<
@@ -21308,7 +21196,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
               goto __pyx_L7_break;
 
-              /* "chronoton/_cy_inner.pyx":634
+              /* "chronoton/_cy_inner.pyx":669
  *                         break
  * 
  *                 if n_closed < 0:             # <<<<<<<<<<<<<<
@@ -21317,70 +21205,70 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
             }
 
-            /* "chronoton/_cy_inner.pyx":637
+            /* "chronoton/_cy_inner.pyx":672
  *                     break
  * 
  *                 equity_out[i] = current_cash             # <<<<<<<<<<<<<<
  *                 cash_out[i] = current_cash
  *                 # Fill remaining bars with terminal equity
 */
-            __pyx_t_13 = __pyx_v_i;
-            *((double *) ( /* dim=0 */ (__pyx_v_equity_out.data + __pyx_t_13 * __pyx_v_equity_out.strides[0]) )) = __pyx_v_current_cash;
+            __pyx_t_16 = __pyx_v_i;
+            *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_equity_out.data) + __pyx_t_16)) )) = __pyx_v_current_cash;
 
-            /* "chronoton/_cy_inner.pyx":638
+            /* "chronoton/_cy_inner.pyx":673
  * 
  *                 equity_out[i] = current_cash
  *                 cash_out[i] = current_cash             # <<<<<<<<<<<<<<
  *                 # Fill remaining bars with terminal equity
  *                 if i + 1 < n:
 */
-            __pyx_t_13 = __pyx_v_i;
-            *((double *) ( /* dim=0 */ (__pyx_v_cash_out.data + __pyx_t_13 * __pyx_v_cash_out.strides[0]) )) = __pyx_v_current_cash;
+            __pyx_t_16 = __pyx_v_i;
+            *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_cash_out.data) + __pyx_t_16)) )) = __pyx_v_current_cash;
 
-            /* "chronoton/_cy_inner.pyx":640
+            /* "chronoton/_cy_inner.pyx":675
  *                 cash_out[i] = current_cash
  *                 # Fill remaining bars with terminal equity
  *                 if i + 1 < n:             # <<<<<<<<<<<<<<
  *                     for k in range(i + 1, n):
  *                         cash_out[k] = current_cash
 */
-            __pyx_t_14 = ((__pyx_v_i + 1) < __pyx_v_n);
-            if (__pyx_t_14) {
+            __pyx_t_10 = ((__pyx_v_i + 1) < __pyx_v_n);
+            if (__pyx_t_10) {
 
-              /* "chronoton/_cy_inner.pyx":641
+              /* "chronoton/_cy_inner.pyx":676
  *                 # Fill remaining bars with terminal equity
  *                 if i + 1 < n:
  *                     for k in range(i + 1, n):             # <<<<<<<<<<<<<<
  *                         cash_out[k] = current_cash
  *                         equity_out[k] = current_cash
 */
-              __pyx_t_16 = __pyx_v_n;
-              __pyx_t_17 = __pyx_t_16;
-              for (__pyx_t_18 = (__pyx_v_i + 1); __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
-                __pyx_v_k = __pyx_t_18;
+              __pyx_t_13 = __pyx_v_n;
+              __pyx_t_14 = __pyx_t_13;
+              for (__pyx_t_15 = (__pyx_v_i + 1); __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+                __pyx_v_k = __pyx_t_15;
 
-                /* "chronoton/_cy_inner.pyx":642
+                /* "chronoton/_cy_inner.pyx":677
  *                 if i + 1 < n:
  *                     for k in range(i + 1, n):
  *                         cash_out[k] = current_cash             # <<<<<<<<<<<<<<
  *                         equity_out[k] = current_cash
  *                 liquidated = 1
 */
-                __pyx_t_13 = __pyx_v_k;
-                *((double *) ( /* dim=0 */ (__pyx_v_cash_out.data + __pyx_t_13 * __pyx_v_cash_out.strides[0]) )) = __pyx_v_current_cash;
+                __pyx_t_16 = __pyx_v_k;
+                *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_cash_out.data) + __pyx_t_16)) )) = __pyx_v_current_cash;
 
-                /* "chronoton/_cy_inner.pyx":643
+                /* "chronoton/_cy_inner.pyx":678
  *                     for k in range(i + 1, n):
  *                         cash_out[k] = current_cash
  *                         equity_out[k] = current_cash             # <<<<<<<<<<<<<<
  *                 liquidated = 1
  *                 break
 */
-                __pyx_t_13 = __pyx_v_k;
-                *((double *) ( /* dim=0 */ (__pyx_v_equity_out.data + __pyx_t_13 * __pyx_v_equity_out.strides[0]) )) = __pyx_v_current_cash;
+                __pyx_t_16 = __pyx_v_k;
+                *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_equity_out.data) + __pyx_t_16)) )) = __pyx_v_current_cash;
               }
 
-              /* "chronoton/_cy_inner.pyx":640
+              /* "chronoton/_cy_inner.pyx":675
  *                 cash_out[i] = current_cash
  *                 # Fill remaining bars with terminal equity
  *                 if i + 1 < n:             # <<<<<<<<<<<<<<
@@ -21389,7 +21277,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
             }
 
-            /* "chronoton/_cy_inner.pyx":644
+            /* "chronoton/_cy_inner.pyx":679
  *                         cash_out[k] = current_cash
  *                         equity_out[k] = current_cash
  *                 liquidated = 1             # <<<<<<<<<<<<<<
@@ -21398,16 +21286,16 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
             __pyx_v_liquidated = 1;
 
-            /* "chronoton/_cy_inner.pyx":645
+            /* "chronoton/_cy_inner.pyx":680
  *                         equity_out[k] = current_cash
  *                 liquidated = 1
  *                 break             # <<<<<<<<<<<<<<
  * 
- *         # --- end-of-data close-out (only if not liquidated) -------------
+ *             i += 1
 */
             goto __pyx_L7_break;
 
-            /* "chronoton/_cy_inner.pyx":594
+            /* "chronoton/_cy_inner.pyx":629
  * 
  *             # (6) Liquidation ------------------------------------------
  *             if equity_out[i] <= 0.0:             # <<<<<<<<<<<<<<
@@ -21415,28 +21303,38 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
  *                 total_bad = 0.0
 */
           }
+
+          /* "chronoton/_cy_inner.pyx":682
+ *                 break
+ * 
+ *             i += 1             # <<<<<<<<<<<<<<
+ * 
+ *         # --- end-of-data close-out (only if not liquidated) -------------
+*/
+          __pyx_v_i = (__pyx_v_i + 1);
+          __pyx_L6_continue:;
         }
         __pyx_L7_break:;
 
-        /* "chronoton/_cy_inner.pyx":651
+        /* "chronoton/_cy_inner.pyx":688
  *         # at the final bar's close, with no costs. Skipped if we broke out
  *         # early via liquidation.
  *         if not liquidated and n_closed >= 0:             # <<<<<<<<<<<<<<
  *             any_active = 0
  *             for k in range(n_slots):
 */
-        __pyx_t_15 = (!__pyx_v_liquidated);
-        if (__pyx_t_15) {
+        __pyx_t_12 = (!__pyx_v_liquidated);
+        if (__pyx_t_12) {
         } else {
-          __pyx_t_14 = __pyx_t_15;
-          goto __pyx_L126_bool_binop_done;
+          __pyx_t_10 = __pyx_t_12;
+          goto __pyx_L113_bool_binop_done;
         }
-        __pyx_t_15 = (__pyx_v_n_closed >= 0);
-        __pyx_t_14 = __pyx_t_15;
-        __pyx_L126_bool_binop_done:;
-        if (__pyx_t_14) {
+        __pyx_t_12 = (__pyx_v_n_closed >= 0);
+        __pyx_t_10 = __pyx_t_12;
+        __pyx_L113_bool_binop_done:;
+        if (__pyx_t_10) {
 
-          /* "chronoton/_cy_inner.pyx":652
+          /* "chronoton/_cy_inner.pyx":689
  *         # early via liquidation.
  *         if not liquidated and n_closed >= 0:
  *             any_active = 0             # <<<<<<<<<<<<<<
@@ -21445,30 +21343,30 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
           __pyx_v_any_active = 0;
 
-          /* "chronoton/_cy_inner.pyx":653
+          /* "chronoton/_cy_inner.pyx":690
  *         if not liquidated and n_closed >= 0:
  *             any_active = 0
  *             for k in range(n_slots):             # <<<<<<<<<<<<<<
  *                 if slot_active[k] != 0:
  *                     any_active = 1
 */
-          __pyx_t_10 = __pyx_v_n_slots;
-          __pyx_t_11 = __pyx_t_10;
-          for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
-            __pyx_v_k = __pyx_t_12;
+          __pyx_t_13 = __pyx_v_n_slots;
+          __pyx_t_14 = __pyx_t_13;
+          for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+            __pyx_v_k = __pyx_t_15;
 
-            /* "chronoton/_cy_inner.pyx":654
+            /* "chronoton/_cy_inner.pyx":691
  *             any_active = 0
  *             for k in range(n_slots):
  *                 if slot_active[k] != 0:             # <<<<<<<<<<<<<<
  *                     any_active = 1
  *                     break
 */
-            __pyx_t_13 = __pyx_v_k;
-            __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_13 * __pyx_v_slot_active.strides[0]) ))) != 0);
-            if (__pyx_t_14) {
+            __pyx_t_16 = __pyx_v_k;
+            __pyx_t_10 = ((*((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_16)) ))) != 0);
+            if (__pyx_t_10) {
 
-              /* "chronoton/_cy_inner.pyx":655
+              /* "chronoton/_cy_inner.pyx":692
  *             for k in range(n_slots):
  *                 if slot_active[k] != 0:
  *                     any_active = 1             # <<<<<<<<<<<<<<
@@ -21477,16 +21375,16 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
               __pyx_v_any_active = 1;
 
-              /* "chronoton/_cy_inner.pyx":656
+              /* "chronoton/_cy_inner.pyx":693
  *                 if slot_active[k] != 0:
  *                     any_active = 1
  *                     break             # <<<<<<<<<<<<<<
  * 
  *             if any_active == 1:
 */
-              goto __pyx_L129_break;
+              goto __pyx_L116_break;
 
-              /* "chronoton/_cy_inner.pyx":654
+              /* "chronoton/_cy_inner.pyx":691
  *             any_active = 0
  *             for k in range(n_slots):
  *                 if slot_active[k] != 0:             # <<<<<<<<<<<<<<
@@ -21495,51 +21393,51 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
             }
           }
-          __pyx_L129_break:;
+          __pyx_L116_break:;
 
-          /* "chronoton/_cy_inner.pyx":658
+          /* "chronoton/_cy_inner.pyx":695
  *                     break
  * 
  *             if any_active == 1:             # <<<<<<<<<<<<<<
  *                 for k in range(n_slots):
  *                     if slot_active[k] == 0:
 */
-          __pyx_t_14 = (__pyx_v_any_active == 1);
-          if (__pyx_t_14) {
+          __pyx_t_10 = (__pyx_v_any_active == 1);
+          if (__pyx_t_10) {
 
-            /* "chronoton/_cy_inner.pyx":659
+            /* "chronoton/_cy_inner.pyx":696
  * 
  *             if any_active == 1:
  *                 for k in range(n_slots):             # <<<<<<<<<<<<<<
  *                     if slot_active[k] == 0:
  *                         continue
 */
-            __pyx_t_10 = __pyx_v_n_slots;
-            __pyx_t_11 = __pyx_t_10;
-            for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
-              __pyx_v_k = __pyx_t_12;
+            __pyx_t_13 = __pyx_v_n_slots;
+            __pyx_t_14 = __pyx_t_13;
+            for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+              __pyx_v_k = __pyx_t_15;
 
-              /* "chronoton/_cy_inner.pyx":660
+              /* "chronoton/_cy_inner.pyx":697
  *             if any_active == 1:
  *                 for k in range(n_slots):
  *                     if slot_active[k] == 0:             # <<<<<<<<<<<<<<
  *                         continue
  *                     direction = open_positions[k, F_DIRECTION]
 */
-              __pyx_t_13 = __pyx_v_k;
-              __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_slot_active.data + __pyx_t_13 * __pyx_v_slot_active.strides[0]) ))) == 0);
-              if (__pyx_t_14) {
+              __pyx_t_16 = __pyx_v_k;
+              __pyx_t_10 = ((*((unsigned char *) ( /* dim=0 */ ((char *) (((unsigned char *) __pyx_v_slot_active.data) + __pyx_t_16)) ))) == 0);
+              if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":661
+                /* "chronoton/_cy_inner.pyx":698
  *                 for k in range(n_slots):
  *                     if slot_active[k] == 0:
  *                         continue             # <<<<<<<<<<<<<<
  *                     direction = open_positions[k, F_DIRECTION]
  *                     size = open_positions[k, F_SIZE]
 */
-                goto __pyx_L132_continue;
+                goto __pyx_L119_continue;
 
-                /* "chronoton/_cy_inner.pyx":660
+                /* "chronoton/_cy_inner.pyx":697
  *             if any_active == 1:
  *                 for k in range(n_slots):
  *                     if slot_active[k] == 0:             # <<<<<<<<<<<<<<
@@ -21548,50 +21446,50 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
               }
 
-              /* "chronoton/_cy_inner.pyx":662
+              /* "chronoton/_cy_inner.pyx":699
  *                     if slot_active[k] == 0:
  *                         continue
  *                     direction = open_positions[k, F_DIRECTION]             # <<<<<<<<<<<<<<
  *                     size = open_positions[k, F_SIZE]
  *                     entry_px = open_positions[k, F_ENTRY_PRICE]
 */
-              __pyx_t_13 = __pyx_v_k;
-              __pyx_t_19 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
-              __pyx_v_direction = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_13 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_19 * __pyx_v_open_positions.strides[1]) )));
+              __pyx_t_16 = __pyx_v_k;
+              __pyx_t_11 = __pyx_e_9chronoton_9_cy_inner_F_DIRECTION;
+              __pyx_v_direction = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_16 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_11)) )));
 
-              /* "chronoton/_cy_inner.pyx":663
+              /* "chronoton/_cy_inner.pyx":700
  *                         continue
  *                     direction = open_positions[k, F_DIRECTION]
  *                     size = open_positions[k, F_SIZE]             # <<<<<<<<<<<<<<
  *                     entry_px = open_positions[k, F_ENTRY_PRICE]
  *                     realised_pnl = direction * (c[n - 1] - entry_px) * size
 */
-              __pyx_t_19 = __pyx_v_k;
-              __pyx_t_13 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
-              __pyx_v_size = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_19 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_13 * __pyx_v_open_positions.strides[1]) )));
+              __pyx_t_11 = __pyx_v_k;
+              __pyx_t_16 = __pyx_e_9chronoton_9_cy_inner_F_SIZE;
+              __pyx_v_size = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_11 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_16)) )));
 
-              /* "chronoton/_cy_inner.pyx":664
+              /* "chronoton/_cy_inner.pyx":701
  *                     direction = open_positions[k, F_DIRECTION]
  *                     size = open_positions[k, F_SIZE]
  *                     entry_px = open_positions[k, F_ENTRY_PRICE]             # <<<<<<<<<<<<<<
  *                     realised_pnl = direction * (c[n - 1] - entry_px) * size
  *                     current_cash += (size * entry_px) + realised_pnl
 */
-              __pyx_t_13 = __pyx_v_k;
-              __pyx_t_19 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
-              __pyx_v_entry_px = (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_13 * __pyx_v_open_positions.strides[0]) ) + __pyx_t_19 * __pyx_v_open_positions.strides[1]) )));
+              __pyx_t_16 = __pyx_v_k;
+              __pyx_t_11 = __pyx_e_9chronoton_9_cy_inner_F_ENTRY_PRICE;
+              __pyx_v_entry_px = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_open_positions.data + __pyx_t_16 * __pyx_v_open_positions.strides[0]) )) + __pyx_t_11)) )));
 
-              /* "chronoton/_cy_inner.pyx":665
+              /* "chronoton/_cy_inner.pyx":702
  *                     size = open_positions[k, F_SIZE]
  *                     entry_px = open_positions[k, F_ENTRY_PRICE]
  *                     realised_pnl = direction * (c[n - 1] - entry_px) * size             # <<<<<<<<<<<<<<
  *                     current_cash += (size * entry_px) + realised_pnl
  *                     n_closed = _exit_position(
 */
-              __pyx_t_19 = (__pyx_v_n - 1);
-              __pyx_v_realised_pnl = ((__pyx_v_direction * ((*((double const  *) ( /* dim=0 */ (__pyx_v_c.data + __pyx_t_19 * __pyx_v_c.strides[0]) ))) - __pyx_v_entry_px)) * __pyx_v_size);
+              __pyx_t_11 = (__pyx_v_n - 1);
+              __pyx_v_realised_pnl = ((__pyx_v_direction * ((*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_c.data) + __pyx_t_11)) ))) - __pyx_v_entry_px)) * __pyx_v_size);
 
-              /* "chronoton/_cy_inner.pyx":666
+              /* "chronoton/_cy_inner.pyx":703
  *                     entry_px = open_positions[k, F_ENTRY_PRICE]
  *                     realised_pnl = direction * (c[n - 1] - entry_px) * size
  *                     current_cash += (size * entry_px) + realised_pnl             # <<<<<<<<<<<<<<
@@ -21600,46 +21498,46 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
               __pyx_v_current_cash = (__pyx_v_current_cash + ((__pyx_v_size * __pyx_v_entry_px) + __pyx_v_realised_pnl));
 
-              /* "chronoton/_cy_inner.pyx":668
+              /* "chronoton/_cy_inner.pyx":705
  *                     current_cash += (size * entry_px) + realised_pnl
  *                     n_closed = _exit_position(
  *                         k, n - 1, date_ns[n - 1], c[n - 1],             # <<<<<<<<<<<<<<
  *                         <double>EXIT_END_OF_DATA,
  *                         0.0, 0.0, 0.0,
 */
-              __pyx_t_19 = (__pyx_v_n - 1);
-              __pyx_t_13 = (__pyx_v_n - 1);
+              __pyx_t_11 = (__pyx_v_n - 1);
+              __pyx_t_16 = (__pyx_v_n - 1);
 
-              /* "chronoton/_cy_inner.pyx":667
+              /* "chronoton/_cy_inner.pyx":704
  *                     realised_pnl = direction * (c[n - 1] - entry_px) * size
  *                     current_cash += (size * entry_px) + realised_pnl
  *                     n_closed = _exit_position(             # <<<<<<<<<<<<<<
  *                         k, n - 1, date_ns[n - 1], c[n - 1],
  *                         <double>EXIT_END_OF_DATA,
 */
-              __pyx_t_16 = __pyx_f_9chronoton_9_cy_inner__exit_position(__pyx_v_k, (__pyx_v_n - 1), (*((double const  *) ( /* dim=0 */ (__pyx_v_date_ns.data + __pyx_t_19 * __pyx_v_date_ns.strides[0]) ))), (*((double const  *) ( /* dim=0 */ (__pyx_v_c.data + __pyx_t_13 * __pyx_v_c.strides[0]) ))), ((double)__pyx_e_9chronoton_9_cy_inner_EXIT_END_OF_DATA), 0.0, 0.0, 0.0, __pyx_v_open_positions, __pyx_v_slot_active, __pyx_v_closed_trades, __pyx_v_n_closed, __pyx_v_closed_capacity, __pyx_v_overflow_flag); if (unlikely(__pyx_t_16 == ((Py_ssize_t)-1L) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 667, __pyx_L4_error)
-              __pyx_v_n_closed = __pyx_t_16;
+              __pyx_t_20 = __pyx_f_9chronoton_9_cy_inner__exit_position(__pyx_v_k, (__pyx_v_n - 1), (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_date_ns.data) + __pyx_t_11)) ))), (*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_c.data) + __pyx_t_16)) ))), ((double)__pyx_e_9chronoton_9_cy_inner_EXIT_END_OF_DATA), 0.0, 0.0, 0.0, __pyx_v_open_positions, __pyx_v_slot_active, __pyx_v_closed_trades, __pyx_v_n_closed, __pyx_v_closed_capacity, __pyx_v_overflow_flag); if (unlikely(__pyx_t_20 == ((Py_ssize_t)-1L) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 704, __pyx_L4_error)
+              __pyx_v_n_closed = __pyx_t_20;
 
-              /* "chronoton/_cy_inner.pyx":674
+              /* "chronoton/_cy_inner.pyx":711
  *                         n_closed, closed_capacity, overflow_flag,
  *                     )
  *                     if n_closed < 0:             # <<<<<<<<<<<<<<
  *                         break
  *                 if n_closed >= 0:
 */
-              __pyx_t_14 = (__pyx_v_n_closed < 0);
-              if (__pyx_t_14) {
+              __pyx_t_10 = (__pyx_v_n_closed < 0);
+              if (__pyx_t_10) {
 
-                /* "chronoton/_cy_inner.pyx":675
+                /* "chronoton/_cy_inner.pyx":712
  *                     )
  *                     if n_closed < 0:
  *                         break             # <<<<<<<<<<<<<<
  *                 if n_closed >= 0:
  *                     equity_out[n - 1] = current_cash
 */
-                goto __pyx_L133_break;
+                goto __pyx_L120_break;
 
-                /* "chronoton/_cy_inner.pyx":674
+                /* "chronoton/_cy_inner.pyx":711
  *                         n_closed, closed_capacity, overflow_flag,
  *                     )
  *                     if n_closed < 0:             # <<<<<<<<<<<<<<
@@ -21647,41 +21545,41 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
  *                 if n_closed >= 0:
 */
               }
-              __pyx_L132_continue:;
+              __pyx_L119_continue:;
             }
-            __pyx_L133_break:;
+            __pyx_L120_break:;
 
-            /* "chronoton/_cy_inner.pyx":676
+            /* "chronoton/_cy_inner.pyx":713
  *                     if n_closed < 0:
  *                         break
  *                 if n_closed >= 0:             # <<<<<<<<<<<<<<
  *                     equity_out[n - 1] = current_cash
  *                     cash_out[n - 1] = current_cash
 */
-            __pyx_t_14 = (__pyx_v_n_closed >= 0);
-            if (__pyx_t_14) {
+            __pyx_t_10 = (__pyx_v_n_closed >= 0);
+            if (__pyx_t_10) {
 
-              /* "chronoton/_cy_inner.pyx":677
+              /* "chronoton/_cy_inner.pyx":714
  *                         break
  *                 if n_closed >= 0:
  *                     equity_out[n - 1] = current_cash             # <<<<<<<<<<<<<<
  *                     cash_out[n - 1] = current_cash
  * 
 */
-              __pyx_t_13 = (__pyx_v_n - 1);
-              *((double *) ( /* dim=0 */ (__pyx_v_equity_out.data + __pyx_t_13 * __pyx_v_equity_out.strides[0]) )) = __pyx_v_current_cash;
+              __pyx_t_16 = (__pyx_v_n - 1);
+              *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_equity_out.data) + __pyx_t_16)) )) = __pyx_v_current_cash;
 
-              /* "chronoton/_cy_inner.pyx":678
+              /* "chronoton/_cy_inner.pyx":715
  *                 if n_closed >= 0:
  *                     equity_out[n - 1] = current_cash
  *                     cash_out[n - 1] = current_cash             # <<<<<<<<<<<<<<
  * 
  *     # Return overflow status to Python
 */
-              __pyx_t_13 = (__pyx_v_n - 1);
-              *((double *) ( /* dim=0 */ (__pyx_v_cash_out.data + __pyx_t_13 * __pyx_v_cash_out.strides[0]) )) = __pyx_v_current_cash;
+              __pyx_t_16 = (__pyx_v_n - 1);
+              *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_cash_out.data) + __pyx_t_16)) )) = __pyx_v_current_cash;
 
-              /* "chronoton/_cy_inner.pyx":676
+              /* "chronoton/_cy_inner.pyx":713
  *                     if n_closed < 0:
  *                         break
  *                 if n_closed >= 0:             # <<<<<<<<<<<<<<
@@ -21690,7 +21588,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
             }
 
-            /* "chronoton/_cy_inner.pyx":658
+            /* "chronoton/_cy_inner.pyx":695
  *                     break
  * 
  *             if any_active == 1:             # <<<<<<<<<<<<<<
@@ -21699,7 +21597,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
           }
 
-          /* "chronoton/_cy_inner.pyx":651
+          /* "chronoton/_cy_inner.pyx":688
  *         # at the final bar's close, with no costs. Skipped if we broke out
  *         # early via liquidation.
  *         if not liquidated and n_closed >= 0:             # <<<<<<<<<<<<<<
@@ -21709,12 +21607,12 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
         }
       }
 
-      /* "chronoton/_cy_inner.pyx":277
- *     cdef bint liquidated = 0
+      /* "chronoton/_cy_inner.pyx":307
+ *     cdef bint has_ts = not isnan(ts)
  * 
  *     with nogil:             # <<<<<<<<<<<<<<
- *         for i in range(n):
- *             price_o = o[i]
+ *         i = 0
+ *         while i < n:
 */
       /*finally:*/ {
         /*normal exit:*/{
@@ -21731,18 +21629,18 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
       }
   }
 
-  /* "chronoton/_cy_inner.pyx":681
+  /* "chronoton/_cy_inner.pyx":718
  * 
  *     # Return overflow status to Python
  *     if overflow_flag[0] == 1:             # <<<<<<<<<<<<<<
  *         return -1
  *     return n_closed
 */
-  __pyx_t_13 = 0;
-  __pyx_t_14 = ((*((int *) ( /* dim=0 */ (__pyx_v_overflow_flag.data + __pyx_t_13 * __pyx_v_overflow_flag.strides[0]) ))) == 1);
-  if (__pyx_t_14) {
+  __pyx_t_16 = 0;
+  __pyx_t_10 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_overflow_flag.data) + __pyx_t_16)) ))) == 1);
+  if (__pyx_t_10) {
 
-    /* "chronoton/_cy_inner.pyx":682
+    /* "chronoton/_cy_inner.pyx":719
  *     # Return overflow status to Python
  *     if overflow_flag[0] == 1:
  *         return -1             # <<<<<<<<<<<<<<
@@ -21753,7 +21651,7 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
     __pyx_r = __pyx_mstate_global->__pyx_int_neg_1;
     goto __pyx_L0;
 
-    /* "chronoton/_cy_inner.pyx":681
+    /* "chronoton/_cy_inner.pyx":718
  * 
  *     # Return overflow status to Python
  *     if overflow_flag[0] == 1:             # <<<<<<<<<<<<<<
@@ -21762,19 +21660,19 @@ static PyObject *__pyx_pf_9chronoton_9_cy_inner_inner_loop_fast(CYTHON_UNUSED Py
 */
   }
 
-  /* "chronoton/_cy_inner.pyx":683
+  /* "chronoton/_cy_inner.pyx":720
  *     if overflow_flag[0] == 1:
  *         return -1
  *     return n_closed             # <<<<<<<<<<<<<<
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyLong_FromSsize_t(__pyx_v_n_closed); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 683, __pyx_L1_error)
+  __pyx_t_1 = PyLong_FromSsize_t(__pyx_v_n_closed); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 720, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "chronoton/_cy_inner.pyx":204
+  /* "chronoton/_cy_inner.pyx":231
  * # `closed_trades` are modified in place by the caller.
  * # ---------------------------------------------------------------------------
  * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
@@ -23634,32 +23532,32 @@ __Pyx_RefNannySetupContext("PyInit__cy_inner", 0);
   if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_Enum, __pyx_t_4) < (0)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "chronoton/_cy_inner.pyx":46
+  /* "chronoton/_cy_inner.pyx":55
  * """
  * 
  * import numpy as np             # <<<<<<<<<<<<<<
  * cimport cython
- * from libc.math cimport isnan, NAN, fabs
+ * from libc.math cimport isnan, NAN, fabs, fmax, fmin
 */
-  __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_numpy, 0, 0, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_numpy, 0, 0, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 55, __pyx_L1_error)
   __pyx_t_4 = __pyx_t_1;
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_np, __pyx_t_4) < (0)) __PYX_ERR(0, 46, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_np, __pyx_t_4) < (0)) __PYX_ERR(0, 55, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "chronoton/_cy_inner.pyx":204
+  /* "chronoton/_cy_inner.pyx":231
  * # `closed_trades` are modified in place by the caller.
  * # ---------------------------------------------------------------------------
  * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
  * @cython.wraparound(False)
  * def inner_loop_fast(
 */
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_9chronoton_9_cy_inner_1inner_loop_fast, 0, __pyx_mstate_global->__pyx_n_u_inner_loop_fast, NULL, __pyx_mstate_global->__pyx_n_u_chronoton__cy_inner, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 204, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_9chronoton_9_cy_inner_1inner_loop_fast, 0, __pyx_mstate_global->__pyx_n_u_inner_loop_fast, NULL, __pyx_mstate_global->__pyx_n_u_chronoton__cy_inner, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 231, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_4);
   #endif
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_inner_loop_fast, __pyx_t_4) < (0)) __PYX_ERR(0, 204, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_inner_loop_fast, __pyx_t_4) < (0)) __PYX_ERR(0, 231, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
   /* "chronoton/_cy_inner.pyx":1
@@ -23805,25 +23703,25 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
 static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   {
-    const struct { const unsigned int length: 12; } index[] = {{2},{68},{35},{54},{37},{60},{24},{52},{26},{34},{29},{33},{45},{22},{15},{179},{37},{30},{32},{1},{1},{1},{1},{1},{8},{5},{6},{15},{23},{25},{7},{6},{2},{6},{35},{9},{30},{50},{8},{27},{20},{32},{22},{30},{37},{5},{8},{20},{8},{15},{3},{15},{10},{18},{4},{8},{7},{1},{8},{6},{19},{9},{17},{18},{15},{13},{10},{5},{12},{1},{7},{11},{8},{9},{5},{15},{6},{16},{8},{12},{14},{12},{9},{10},{10},{5},{15},{7},{11},{11},{13},{11},{5},{7},{6},{7},{8},{12},{1},{7},{1},{2},{10},{5},{15},{4},{13},{5},{8},{1},{2},{1},{8},{10},{20},{18},{12},{8},{6},{11},{7},{4},{10},{1},{8},{7},{4},{8},{4},{7},{8},{2},{5},{1},{3},{14},{13},{4},{3},{7},{7},{7},{7},{8},{14},{11},{10},{19},{14},{12},{12},{10},{17},{13},{8},{12},{10},{12},{19},{5},{5},{21},{19},{13},{4},{12},{18},{13},{6},{7},{8},{5},{12},{11},{8},{10},{5},{16},{4},{4},{6},{4},{8},{9},{17},{2},{8},{5},{2},{7},{11},{13},{1},{6},{10},{18},{6},{1},{6},{15},{14},{16},{15},{9},{8},{1},{5},{3499},{1}};
-    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (3138 bytes) */
-const char* const cstring = "BZh91AY&SYu\037\225_\000\002\361\177\377\377\177\377\377\377\377\377\377\277\367\377\377\277\377\377\377\300@@@@@@@@@@@@\000@\000`\014\274\372(\271\233M\r*j(\"\211!\026\201\226\256\000\240\241\231\002SE\021B\032z\200zjl\243\324x\232O\310z\rL\243`\232\232\217SG\264\210\017I\352\017Q\342\236D\321\351\210i4\036\220a=A\246\220\000\232ML\2154\236\251\351\241\017SL\232\032h\006\232\000\003@\000\000\r\000\r\032hd4\000\203\000\004\300\001\014L\023\000\000F\000L\230&L\000\010\310\304\304`!\200\000\004\246\210\322\004\000*y\244d\304\232\217\322\236\232\214\200h4\007\250=@\000\000\000\000\000\003\324\364\324\002\014\000\023\000\00410L\000\001\030\0012`\2310\000##\023\021\200\206\000\000\022I\220D&T\375I\266\232S\030MF\215=@\323\322f\215@\000\0324\365\0324i\240\000\000\365\000\302\000\036\244\277\207-4c\004\302\372\243x\377\301\344o\3627\224<\261\352\324\035\305\346\227PL\016\356\344\020\037\350\034\202\254\345\0175\254\024\241,K\026\t\231&ZI?\347\375C1}\305\016\002t\373\351\030\014\022*i>\022\340\276\367\026|\362.\231r\006`\256\274\244\276\366\014\030\243d\300\354nlp1BL\302BL\311\003$\3070cR\366\202\373\332\360\305\233\035M\252a\"J\204\263Bq\331\352@\344\033\335KKEB\241V\3010\3232\304\204\231\001\231\222d\300\231\2013 L\313R\353\222\340^\225\341y\256*!\243|\220\005Y\\%x B\001&I\201\204\206\242b\224d\255\223>\232\215\273652.\273\274\301pk\306\345\237N\271\313}\354\326B\314\"\2431\250@\201\004E\004g\316l\327J\235\223-\253\276\026/\270G|\0376\315\223\024$w\260\020\214\207\030y*\327\350\306\217\304\353\037Y\035g\3526\365@\321\006\030`\335\353\310.\247\243\026\362e\367Y\377\223ch\205\301\344\221\315`\177.J&\027\236\261\227Q\364\n\306\267\241\025\261\262\037\023\367\354|\246\307\036K\334\346\320*\364o@\333)^\233\330q\016\037\266fL4\262\366\230h\226,\352A\307\311}\262|nO\026)\236\023\3041j\332\264\321\026\273,gj\351\351]}g[\020\034\376\026\036\020v\003v3v\r\341\230B! \243?\200q\010*\345\033\302\324\021M\220\271\\\003\033\027\245`/\013\302\212\266<|C\027\251\227\236\\\203\020U\022""\250\225K[\0000\030U1\260\270\252TL4\013$\021\301\302I\000\340\342\211!\224\262Q\024\305Ccg\332\323\302\030\002\351\005GK\234B\274\327\3246\252U/(\270$Z\306lylT*0P\231\247\207L*\020\037N\201\222\306\023c\212\332\332\330\253Dwz\275w>\261\267dv\313\270\374I'\323p\351?\366\02561\343\313\201\230\251\022\t<\312d\310\222\201\210\224\302\t\003\306\344\241\020W\317\300Y\0268\312\312\310-U\256tK\"~\317G\247\223\031y\273yr\312bX\nq:\024\272\007:g2\244M+\035\017\251\323\3148.\244P\351f8]\311\311j\323\335\274\220\274\034\242u\201\031V.\224\024\305x\352\242\270-e\303\036m\023h&\0208\303&#\217AHp\2054j\233\333\365\342\216F\024\023A\021\306\213Q\242\203\217\364lr\370Y\302DT\211\001\222LK\234\373l\350d\346^\027pL\016\343\232&m\032\325T\343\366\0300R\210\355m\362\323\222X`\242\275-\003H\314`2O%\n\223 \223&\035H\254\212\016@\251\006lvD\321\001e\366\017\223\231x\3064\t \225eF\t\263\020\"\216CP\355\256Q\347\247\336\321a`\240t\0014\003\362\017\314\241\220\203\025\263\001\213G\264t\235\365\334M\306\203\224\331\266\374\206\264\347\305z\303Q\347~L`&^Eh\331\312+\244\367\361}\225\217kC\245\202I\262t!\316\342(\214\013\250i\022^\252O\216\253\214\037U\203\225MFf4^\214x\231\0167\004X\311\257\242\370t\232\231a\236\264\022\210\3120\031&l\001\311Vq\361\312J\341j\302\234\207\314\314qW\2410.\255\272dTQ>\242\342\347#1\031\377Z\207\377\002)A\243\233\207=\341A\303\327\3473\336\301\001\351Sh,l6\222\333\215\241\250\325cV\314\341we\037\023\340\362R\341`\316\240\316,\360^~S\0055M\337\033\241\230\357\201\326\007H\336\200\272\342\245SV\242hftP\035\251\t@-\033\216\217\021\316h:'\206\360\220*\\A&\363J \026D\275\300\341\353\313sw\035,\266\243\2318yG@\320AF\031\275b\365\302\371\356\275n%US\352d?\227\274\367,\374\256{3\224~\251x2\314\231\204!&\314-zd\221\035\256,\307\026n,\334r\301\204\307\346\314\234u\020f\034\243\271\347.\224fz\365\317]\2122\235*\264\026\332\342\021\257\035wU1\021\0042d\353\323v\240t\252Tv\262t\021s\341\264\332m\356\032\265y\265\220\263\2773\354\242^\266\033l\322w[\242\311*\224\356\224\213A\327""\022$n\253\302\330u0fDc\021v\210\206\365P$$\253R\263\262pkV\346\264H\253\246\364l\024R\000G|^R\255\344zL\r\224\014\254\350E3\016\220(\250]k\337;\336\022\232\303\262\301\354h[\021\314o\033;H\200S\216\313k\264\306l\0103^a\226\003X\252\263%\221\323#:\205\317D\230\302\356j\223\265\034\021 LM\250\317\272\262\266\310v\317\274\271\303\234[\303\335\332\310G\234\306\320\321\0325\351\310\367\376\014\314\210\021\300\\f\0010\341\320\246\210q\2578\301\206-\240\344L1,1%\006\225\nW\203f\026\200\241\n\005h\307\021\325\215{\227\000\221\273>\216Mp\303K\020X\211\016\340\222\t\206 7\032&\324\237R\202y\321\373\020kA `\340\371\337y\244G9\220\335spg\022@\222\301\214\001\242\241\213=\212V\235\r\027\243\222\341\263N\034\223\217H\254\032\314\366k\353\230Lrr7Kd\273\013\343\302\3515w\337\253\010I\035\301\344)w\014@\231\274\325\013\247!%F\265\251\313\342K\230\324\026\202h\333$\232!\240\016W\330n\250\304\014,C\\\036\343\237L@(+\000\220~\244\232?m\264D\2061b<\350\210\244\025!=9b(2w\316\365\314\364\274\367\025#Vm\212k\207\242\366\206\016\366\rgp\261W\320\2373<\264\016\302a\007#;<&\271\214-d\220\220\212\222+\214Q\001\006#=\316\202\372\321\2501\251c\221Kq:\271\216\035\240\320\2036\215&\234a\255\334\3448\213\205\301\025My\022\370\343\002D\r\277\006'\306^U\213\303i\366\343\350\306\324\326\r\026cX\205\320\026\214\221\024U\t\207\003$$\022\003\005\002\216)F\014w\205\265\245\361\024\032#.\006{\r\313\273\024\245n\364#\204dY\005v\010\315\355\211\336o\322\221\243\222\260\313g)\010K%\312\316@\017f\250:\347\300\216P\034\036\"o''\262\rsT\367\302f)\000\244\226\035\tAL\367&L^\2338\223&\346\r\333\215\315\2238\332#\334\t\314\243R\335\226\034\022V\026\024\017\253)\274j\347-\023,\032o%B\202\207f\204+\234\023\t\221\301\265\266\306\333\271\265\235[\334\314\"\367|\267\251z\315\032\022\254V\036*;\326\022\035\312dq\316\365B\261\267so\347\265\032\230C\203\254\222\266,\23157\363d\216Js\247\341\2523v\363\025\243\225\317\2214=)\251\222\rm\266\206\tF\016\213\222\245'F^\311\220\366\251\007qZ\330\362\201\316\301\304\016!\347""\234\305\213s.D\334\004\024\331\264\245\014\311\352\231\267\255J\327\337n\023V\"\013\366I)%A\017\203\370,Q\231W%u\250\204\231\261\301\372\001\0301I\315\350\342\323M\270\300\304l\240f\342\006\340\231\2420\233\257QI\252P\000\320\372\353\325\r\206\212\010\300&\001\273\354`\002\220eE\326\323\242e\025s\253\021b\213l\002\256\255CP\324\002\313\371\304\2744w\236\232\240\376j\022)\274\266\346\350\365\234\331\034\272\357\350\247Sq1\345\243u/\022\016\327\236-1ie45\370d\215K\247\007\020\326X\253T\025ls\310\321Rq\302w&3j\210\027\326\207\027\020@\317\301\307m\227U\n\367\347>\005\034\324\270\022;s\247\3238c\201>\345\202\250\245\354\215\234\353D/\307 \2103\347\034q9&>7$\203 \223\013w{l\3307\322\270\356\273I+< \333)\2173\263m/\005\335\266\\A\304\217m\216\256\341\204&\204\303nnY\014\313R7FW4\337\364\313\035z\343p\021\325o\r\003\272\243\313\212\270|\334]\306\360\222:gC\241\213\346\371\3743\210\333FNA)*K\203\263\356\235\321e<eJk.\200\334?\313&\3534?$\016\307\033pDfp\2651\263z\220:\204\356\321\004Gb\001\2413h\357\223;\347l\021Q\223\246c\0370\370\036bbe\003\210\247\367S\033\276\0234\203\215q\246X\r\323&Z2\263\320\020\372\241\251V\211\350\"x\206aCWL\031\303d\025J\265\2105\215\027\r\316C\226\316N3\316\023\251\033\215\273\314T\254\343U8\036\033nV?\305+\363]\034e\020\224M\314;e_\232vt\t\224\022\237\207lz\343\223\232g{\367\"\314\255D\240\341\313\374Zv+\010\346\013z\003>C\307+\211/\356\305\202[\307!-\256Z\307%3\2349\266r\340U9G\234o\355\365\r\266\016\271 \333\"\016d\203\206y\265\347\364\264-\232\001\003\370\343\304\016Q\226\tA\334\264\307]Zd\310\266[I!\313e\2665uK7I\306\351\335(\227D\\f\241pW\017\005\335@I\307\272\306\260\232\3377\311r4n\275\343\264>\304`%\002B\365\366\3212\375+\254H_}\375~Q\200\224\226\"\326\r,\244[\013\2105\311o\337\240Q\201\250\337 \320-Se\344\034\275z\361@\240\215\347\240t:z\rtO\214\362\020;h\026O\365\221\204\"\370\274E\271\tEb\322\r\016\373\370\207\\\365\017\340\021\270n\023\246^y\370H\330%\353sBc\020r7M\244H\346\270Y\"A\026\013>\254\325~y\334S\216\317\377\0175\177($W""\255\002\014\342c4\307\202;$\207\305\262f\205N\301\200\252V*T*90\345*Y\316\024\214\215#'K\242e\205\346\307\3061\233\035\221\327\372\275\243\235\211\206j\230z\275#\014\366\rC\254\026\017\350\317\300\207\036\301\212\030\207\0319\354\327npi\234\206)\213\317\347\224\312A\211\227\226#t\237h\3315\371M\257\220u)\031\371\247\327:O\026\007\223\234\367'\224\356\237(\361\365i\365\025)\333t\232\261\035\344\371\353\307\332\226\365(M\327\265\345\345\377I\355k\336\347W)\244\325*<\321\313\250\312\352\320\221\241]|\310]P\265\207-T=b'g!\236\326\223\177\317\023D\213)\014<\252\320\364*Xy$\365S(L\254)\300\341'\"L\252R\255F&T\337!;\224*\304\227\024\021p\316\"\206D\022\022Q\304\\A`\201\027\027\022*\222z\006\302\351\246l\366\036\257\027\326D\332I\234d\304\241I\245G @\232\265\202\331_p\362\357\017\037\374]\311\024\341BA\324~U|";
-    PyObject *data = __Pyx_DecompressString(cstring, 3138, 2);
+    const struct { const unsigned int length: 12; } index[] = {{2},{68},{35},{54},{37},{60},{24},{52},{26},{34},{29},{33},{45},{22},{15},{179},{37},{30},{32},{1},{1},{1},{1},{1},{8},{5},{6},{15},{23},{25},{7},{6},{2},{6},{35},{9},{30},{50},{8},{27},{20},{32},{22},{30},{37},{5},{8},{20},{8},{15},{3},{15},{10},{18},{4},{8},{7},{1},{8},{6},{19},{9},{17},{18},{15},{13},{10},{5},{12},{1},{7},{11},{8},{9},{5},{15},{6},{16},{8},{12},{14},{12},{9},{10},{10},{5},{15},{7},{11},{11},{13},{11},{5},{7},{6},{7},{8},{12},{1},{6},{7},{1},{2},{10},{5},{15},{4},{13},{7},{5},{8},{1},{1},{2},{1},{8},{10},{12},{8},{6},{11},{7},{4},{10},{1},{8},{7},{4},{8},{4},{7},{8},{2},{5},{1},{3},{14},{13},{4},{3},{7},{7},{7},{7},{8},{14},{11},{10},{19},{14},{12},{12},{10},{17},{13},{8},{12},{10},{12},{19},{5},{5},{13},{12},{4},{12},{18},{13},{6},{7},{8},{5},{12},{11},{8},{10},{5},{16},{4},{4},{6},{4},{8},{9},{17},{2},{8},{5},{2},{7},{11},{13},{1},{6},{10},{18},{6},{1},{6},{15},{14},{16},{15},{9},{8},{1},{5},{3477},{1}};
+    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (3183 bytes) */
+const char* const cstring = "BZh91AY&SY*\333\323F\000\002\347\177\377\377\377\377\377\377\377\377\377\277\377\377\267\277\377\377\377\300@@@@@@@@@@@@\000@\000`\014\334\370\007\020\324\225\266\230f\320\202\260\266\261\230\326l8P\000\010:\022\232DH\232A\262\236\232\214\203L\217Szi\350%=6\203FM\0054\361\032G\352\231= i\215O\325<Dl\232OM12\236\223M\224\r4@LBji\352j\236\247\350S\021\246\207\250d\000\003@\003A\240\000\000\000\032h\321\243&\020\004\030\000&\000\010b`\230\000\0020\002d\3012`\000FF&#\001\014\000\000%4 \243(a\014$\364\247\351\242h\210d\365\036\241\246\232h\000\365\006\200\0004\000\000i\246\200\006j\r\020`\000\230\000!\211\202`\000\010\300\t\223\004\311\200\001\031\030\230\214\0040\000\000\221@\004(\3210\206\251\351\262\211\352~\250\375\031F\241\2404=@\000\000\001\240\000\006\200\006\200\003J\336<<R\330\320\317\004\211\243\354\215\361\377\301\376[\3753z\314x\317^h\302\212?\215\323V\034rA\016;\216Q\310\365\355%Y\254\325\013X)F\226?\357\376BD\034!uE\352 \221\213\021\n\256Yd\306/{<\235\316\334\226l1\2641\222\335\265\357\225\203\"\321lZ\241P\222$p\255t\rF\206\323h\033Hm6\271\213\314\300\021!\214`0\032/\374\2458\262\022\"\346\2405\002\006\244\010\212\\d\307\275*\251\300(\250+D\251v\005k\"\241Tj-\201\241\t\265\337/p\"G\\#\013\313\n\242\260\223B\203\250+\r1\241\266\304\036\243\342\234\323f\210\320\204\264\304MzPmy\262\333\221\235\014\034w\025X\314\220(\033\003\030\322J$\215\375\343w\r\021\212]u[p_c\302id\303b\r\364\222\t1\221h\374\272\240?q\351\236\221/Nd\271\247\224\300f\010\004\017K\234\300N\034\227K\311^]\241\315t\255 \267\300\2227\330C\277\232\213\202\362\326S\351B\201Y\316\346Ill\207\310\350\361y\016\226>\204\036\367P*\376\270P:\312W\237\0068\207\216\206\206\2708\266\026\2708O\026\351E\347\2418\325i\"\255\020\353\330\2532\010\276\263\226\364km3N\323\3519\316\372\347\357y\310\234\231\322\221\322.\224\035g\210u\223\034\245\016q\304\2406\2102\223\"Jc\t\014)\343\247b\216\0140\352\2045f44A\224\215\017\016\201u<\227\270\030\204\r\343\341\263DTZ\006\213;\340\272\201\214`i\331\241\256\244!\261\250j""\2652T/J\026T+\270\214\346\237=*v\373O\271\334\313\210x\260\034w1=\021\006\032\002\241F\240\344\230\232\216\357\002\345\250\262pF\343d\311\362\362\341L\261o>\305y\264\245I\237(\364\2668fL=gj\354\354\306\322\216\377o\231\243\334\033\003\023W9\247.\354\345\202\302\013m\223\270\010=\214e\2666<\007\220I]\273\302H\244\313n\n\332\002\tt\254\366)\200\324,\323S\002a\362U\n%b\345\212\373\177\257\364}\035\264Y2\262\021\363\r\221\220#\336\201\363\313\026\335N\203\321=\246I\224\375\020\323%\311\353553\351\237P\373'l\346\360\236\305\336\306\237\177\331\371\376\373X\334\215f\314\337k/\333\267$\026k\030\215~\212G-i\010\212\244@\346\360rG:\2019\235\226\264\246L*\212\212\310\375~-{\016\035\355\014\254c\007\233\215\252P\343}\233>\014\000\251\310\013\t\036\271\230K\350\215\265f\327\334\006h\005h\3146\363\203\321\343\tJ\224\002\207\336\267\347\267\200l\202\0135\203\000\324s\030Qi\256\253P\225\"\207d\315\024 LdI\221\343\336\261ba\177\303\344\332\245Up,\227\rI4v\252\026bX\261\373\217\336[W\234\255\352\267\360\241\220\202\177\221&S\230p\256\007\364 \267\365\r`qj\362a\232#\204\014\274\251=\342\327\350|\205zS\256-2\325]\374\221\002Y=\034p\233\247%\324|YB\312\320s\203\347zM\323|c\330\365\212%\022\372\032J\n\274\205\\a\030\325e\005SQ\241\234!\204\235\021q\0208\002,nt&|\327A\342\267^\367\002Y\252\327\004%\020\207\230(ZU\341\363\250{\030T.\3378l?,\226HL\313\357\303\236E\342\311\312//z6I\237\361Z\030\364\304\322\243k\223\036d\002\201\324q\257\027\315\000`;gi\007\232\213|\257\021\332\r\304\367T\335\303\260_\303(T\370\235\331XxPq6\036\321.y\014:M\256\244t\002\360%\336A\326\035j1\204\034\274\331\247\002\004\237\234&H\211$\201Nns\253\344\233\314\307Uu\352\n\201B\350I{\274\355\216v\3141\241\006\000p\367\264\356p4m\265\372\316I\303\330\226c2\n1\272\013(-\323\207\021_!\002\362\357\253\210\376\267\224\367\\}\016y\247@\375\332\274\030\361&a\010I\270\205\2435J\210\332\006\3206\263ml20\230\364\361N:\2101\034\227sR\354F/N\332\366\330\226U\344T\221i\246\001\031\360\317z&\" \206L\235z\016\322pSA\354\235\004]""\362\3514\365\231\263x\363\220\270\237\241\364J^\312\033Mf\274\266\362,\222\241=\342b\320u\304\001#K\325\216C\202\200X\206\2434\260fN\231\000\2215Z\225\272\311\275Z\273E\244E_t\035\032D\tu\343\t\316\270P\364X:q3\263\343$\320:\000\242\241}\260\303L \022\216\321g\266\260\266#\216\356\313K\210\210S\216n\256\3236\300\213k\3202\274P\256\205\221\332\221\235\002\354\\\227\013^\367)9\313Z$H\240\322E\373/\201\323\001\270:'tn\214\300\343\306$\021\251\006\2200l\016X\324y[\372\032\034Q\210\030\344\020a\302\241L\345\277\2062\214+\304\230\236\014\255\r\306gI\215\235PB\207\342\204\206vx3\3467tr\002F\364\371\3319\342\332\231\005f<\002H&.\274\\\231\311\364('\260\220\312.p$\013<\2466\347\223-\300\356yS\226\312\003l\033xF\001Fa\225\n\3629\322}\365\0343\226\342\332\231\2453\320:\234\006\325W\236\203G'w\241n\037l\277\203\262\r\252H\344\307\016b\330\316u\n\204\263\313\240e\357\342\t\317\027/\005)Iy<\313\373\271#Z\256\341\310\314\247\220\234)\251\345@\337\r\272\372\303z%*Z\257\223\233\000\321\265EZn%\311\rn\242$r\223$\016\244\300LVJH*\375\306g\004*\270+\357W\\<*\027\235<|\312\325\303\333=\241\203\311\301\254\356\026(\371\223\361\263\325\240v\023&K\241AB-Y\030\255[cc&Pv2\310\204L\212\026\203\013\316J@\320\260\304\233t\356\322yf\275\341\231\007\036l\346|a\255\333\264\334-\227\010\242l\203AiF\004\206\t\265p\020\363\304\303\320L\rP\267\007<mM\340h\267\r\321\034\020\270d\210\242\250Lu\344\204\202@a@\243|\243\014xB\333\251\206\"\203fS\334\323a\257\007\342\224\256\020B:\2632\321W\336\215\302\330\273\013\241\251%G\245c\226yLFy.Vz\003\361\301\035T\253<\360\347=_@\272<\004\222~\\\2468\2462\004\002[Y\246\213\265\260\332k\2308\270\216%\277\333\037\031\033\202\211\300:[\273\246`\254-\022\216\367\244N\375\205\346\205\303l;I\"\207b\020\256\340\230L\215M\241\271NV\324\3079\253\334\234\307f\3073\010\305\337\223b\253\322\262\320\225\"\220\361A\334|\317R\231\216\345\036\210V5km\233\355-9c\010\"\335\030\263\262h\333\273\211\024\235\352\333r\306;\325\017r\207\332\302\016\035\254\036,@\320\230\351x\241.\242""\2212\\\350\350\267n\204,hA\301Z\330\356\030\334\315\271\215\301\270\251]\253ZmB\t\321\244\2311OD\313\215\357\272\336\365\344\244\324b_\202\205\033nC!\210x\252I'=\035\253&6\226q\005tFzx\361'\216KU\330\355\"=\304KU\277c\\Om\014\342\013 HB\273\232\243\223\205\004\242\021\270\213\200\002\221l \265\235\311\224\225\357\245\342\305\026w\205^\006\315f\263^_\036&P\315\336y\321\007\367P\221:\213s\266\376\377{\023\243NM\363\301\273\206\035\022\335k\345 \351\333\264\353\320q\365\364\216o\311I<\203\203qZ\336v\016\006E\232\331\324\344);\243\250\222\242\\\004\013\322\207\026\340C\017\261\307nnS-P\260~\243\341\313\234\313aQ\333\251>\212\341\236F\217{p\263\025\312\230\346\332\315\316l\0143\270Rs\235\220N\010\027\304?yH\304i\010\r\000\277\034\273\267\344\266l\355\036\005a\316\202\360\244y6\377a\014r;x\223\tpP\263m\226\343\025Q\363\206\217\234\327\203\260\317\273\220\027\2318N\3626\204%\203h?\241L%\240\033\206\223p\312tT\037\331\361.\337\363*\344\336\333n\001D\037\"\020\030\362\340#X\267\325\332\362\351J\374W\363\335\367'\264\204\021\202\034<l\203\005\020\\m\346z:\274e \361;\257\003\264<\020\337Y\307L7\373\365|^\027\366\361\341b\t\237\014\224\"\223\001\303\313J\230\227\014\nM\340\242\035FjlDs,\330XJB#\2112\025+w\364\271\255\024\304\004!\2257\351(\246j\0047\305\347\272v\242\217\320F\024\\>nR\275\323\025*)\030\246n\347\265Cy\360\252ay\244}x\204\177\336s\243\324l\334J\"\351<\0144\334\272\235f\212h\214\220S\033Y\037Is\207\207\264\332\010.6\033\274\033\305Q\236\251Wo\204\223\263);}\346\310F\222\252\306)\220c\365o \312tZS\327\254D\271\013\235cv\267\272\201\025\207^\330\261K\216\023\033\036\264\016\301Y\275o\3356\"4\356a8\256v\225vL\212\302\333,\020\007\013\025\333\264\261\217\370\307\310FI\212#\210\263\\\222A\241\230i\235\343\354\\\003x\314\334\306i\010\216 \257\226]}\271\266dF`;j\255\220 W\315k\254\240\201e\367 Y\"E\263\232\265k!h\177NYa\"x\317g\277\234\\\231\302#\372\242\342vq\230Y\264\030\014\377\324 rHw\004J\211R\313\257b\311D\206\\\"1\002\271\224W=\214\210\035\003')\027x\275\207\"""\210'\264\320\177I).PI,\356\331!w[\220\351\030\361\0239\210\007\021\215T\304\211\314\365\024\352k\210q\030\202\205TD\353\021\242Q\231\260\304\345*\006\t\236\016L!\315\031\363\010\323p\337\230\267!\203\311Dr\225\256\314\232e\022\204\312fjp\n\007\325\370\235\370\034\245\"&\251A\211\212'\\r\221@\236P\026y\233\200O8\021\343\241\\\236_\367p\021\250X\260}\037!\323\021\224#\341\371t[G\337\374\216\276\220\257\202\253_\030\211\252\234\360\2759\355zT\316k\300\373\2051|^\235O\021\315h\370{\236\321\316$\245h\230>3\242t\314=0\267\250g\226\203\322<\303\247\301\323\335\363\337\256\212\2513\276jB\372/V\363iD*\355\274\253e\264C\336\263\023WOx\231/\nh\"\340\250_%\355\026h{(k\330\241zR\355H\227\255\246\360\343\336/G^\303\2214g\0134\330\245\"\220<\321\267\217z%\220\265\225\305pr\257bG\036\203\225*\010\261%\017\204]\254P\271q@\345\306q\027$\202\200\342h*AP\201\027,T\241SA\370JZ\332\355\002$Y\034a\206`o\223\222\261\002\306M\006\014\213\234\312\302X\205\250\365\204\246\326\377\342\356H\247\n\022\005[zh\300";
+    PyObject *data = __Pyx_DecompressString(cstring, 3183, 2);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (2990 bytes) */
-const char* const cstring = "x\332\355WM{\323V\026\306!\364I\333\320\211\301\264\0168 ;!\201\000\006'\241\264|\244\217\303\307\024\036\240$)\235\266\323\251\236k\351\332V#K\212>\202\r\235N\227,\275\324RK-\265\364\322K/\275\324\322?\201\2370\357\271R>(\245\303bf\321\347\231\205\245\253\373q\3569\357y\317{\257\257KU]\227T\255\305\rG3\rG\262l\256pU3\032\373\235\322YUjy\216+\325\270\244\031*osUb\206*\031\246+9\272\206\351k^\275\316miG\343\317$\325\344\216\030\342m\313t\270\344\270\266\246r\34763$\323\320;\222bs\346r\211I\265d\221\333d\256\2449\222b\032\256\326\360L\317\301&R\213\267L\273S\306*2\305\034Gk\030\222kJX\254^\022v\222\031\264e:)5\374\314\326\\V\323y:!q\252n\233\255?Z+\302\222\236inSr;\026\227\026\322~\327f\206#\302\330_\222L\303\n\rP\271\007\260\273s\0200-\001!\231t\267e\271\035\311i2\230v=\013\316\325M[R:n\3234\312\314\266Y\347\276p\300\364\\\311\254K5\3233TG:\307\332\260rV=\177\377\315\275\022\360=\3132m\227\253\367\215\035\246k\310\222\251\362\213\004<&#I\013\312\202\204}\026\260\031\005\262pQj`\325\356\344\304\035`-\266\271\371H\004\370\r\005\010\027\036\233\200R\244\346\266\360\222\342Q\271\256\325\270\r\220\001!\245\025\233\210\374\031\322\223\273O.\255|\266\"ha\363\237\260\275\003\357j\212\216\314\201\016\024\223\247\351.6#x\235\262t\277.uLO28\334DZ-\314;\270\300mrCr\270K\riA\344\202\271\210[\306rps!\305U\333\341\264\372\036\323\035^\376\3525\360\340rJ0\246(\334\331Es\323\345\226\324b\035\201\037\370\374\234\333\346>\320O\r\301\034\230\004\033w\270\rb\270\274E\337f\215\202*\257.\234\377\202\251\252l\020<\024\254\004\204\256\264\025S\327\311\035$\246\314j\312\315\003\\\246I\211\263\253\277\355\336\245\320\252\2529\264/\027\2737\024\351\034\245\251!\330C\021P1\362\266\313\rW\224\306~]jN\262D%/\035\3559\227n\336\222\256\274\301-\303D\352\352\314\323]I\226m\256z\n\227eI\365D\240\206i\\B*w4\246cT\321\014\315\305`\022\356\252c+\227\225\246m\"\\\323\270,+\035Y3\014n\227\255N\373fR\327\352k\001\276\331G\374\333\213\363\265\361\275^o\017t\246\353\246\"\304\201\334\226T\346\262\362\357\214&""\304%\033\251\266\224\253\233\267\357\337\277\253\353\232\345h\216,?\351\264\361\273\003~\312\217\001\334\006\257o\362m\217\033\n'z\227\367\231\216\\\355Z\225\023\2660\243#3A,\346t\014E3\313\212i\243,5\203;5\346\360\032w\\\3312\364\344\335V\024\3464e\214+Mf7\370\036V\345=\254\200)qZ\226w\033\r\356R\272\350\023F1IFm*\274\306\224-E\207\322\250\262\302,\246hn'\375\3040bT\314VKs(\355\n\010\356*\236m\203\0202\355\257\252\344\277\341`\026\020Ue\340*\343\201\350\345\264LLC\245\272\023\017\031\010%\351\005 \320\013X\261;\362\276\371\344\333j\357\276e\203\273I\033ZoY\254\221\256p,\322Snx-!\t\000\030.\2430\236\245-\200\302m\333\264y\033\214:`\236>a=y\t\343\324\204-'\035\334\333F|\210]\352:k8u\335d\356\247+`w\213\271\251\244\311r\3353\024\002\027\260:.\341 7\233\\m\240f4M\225e\255E\n\2117\351k\222\020\3354-\271\316\034\344\324U\010\215\275\014'e\224\326\322\326\326\026\212\032\"\000Wt\r1\021\312\252n\032\r\231\000\320\270#;M\255\276\327\007o_\357\251s.\357p8\327bH2\2366\274J\236r\223\353*N\024:NH\2631j\252\236\216\267a\310I\332\r\340`\272\216\301Z\324\233<Q\371x\362g2\351\017\260d\272a\001\177\253c\"\241\246\305\r\031G\225&d\310\204\343\000\354\231L\320\201N[\226iYPl.+\311\253\231\274\364\344eZ\266\251@\213\301S\324\266\2544\271\262\345x\255\344+\305\225\232\202@\242\345\031\226\246l\301\345\273\306\356\274\035q\356R2\266=\270&|F\366t\215X\214\232\331\027\237\275V\"S\007:x\233\232\r\315q\251tp\002\244\261\243\225j\230h\247.\035h\357Z\022\342\200\207\215\007e\3767\271J;\017&+\351J\263E\231\307\017\364\221\205\010\245\355\026\207uT\246\251\356\216\322\256\232\342\3504\rOH\270\213\227@\223\336\355]\026'\343\246\233\252\212hjj;\341\265\030t\231\355\212\007\231\2551\235A\247\020\276\345\270&~\266\247\270\000\001\211qIrd\027'\241\216ij\322\000W\034H\227\n\372\273\226k%\016\320\273\r\233\216p+}\3118\365\321\004\032\215\006\260\265\332\036R\010bx\206\310\321s\340\277\327\222k\035A?\317\"\322\357`\245\307\235g\014z\263\307\377\316\201O\240)\276\366\021\357\034\374\246a\323Nt3m\264\333t""\360:\277f^=\316\034:2\355g\374\217\375\355 \023\217\237\366\215\360^T\214*\361\370|\320\212>\355e{\305x\374\214\277\035\217K\301X0\037f\302\343\230P\212\252#\352}u\345\320\221\363\341X8\037e\242\351\336|\177\254_\034\215\237\362+\243\367?\210'&_\336\355\236\350\262\356v<\3711\275\374\314\0376\216w\257\371E\277\362\352\275CG\247^\376\354W\374\333\276\023\314\005J8\023\261\310\351\315\366\326\343\251\\\367\256\177\302gp'\367I\367EP\014\2261\236\215\363\323qN\n>\nY\350D\305X*\005e\370s<\252\322\254_\202ua\243\326\313\304\371bP\010\327C%:\026UF\370\230\021+J4\261D\306\206\363\237F,\316\315\005U\362\"\333=\322}J.\305S\307\2737\260\253\023\314\006\353q\356D<U\360\037\207\305p9d\361\324)\1775\314\206\263!\274\333\335,\213\325\331S~Y\200U\245\325+]\317\257\372\353\344\317\363\340X\260\024|\035\346\341\304j?\333\237\355\257\307\371\371\200\005Nx)\332\216\247g1\272\021\270\341g\321R\364c\277\322\277\335\337>0N\226s\335\353\376\006A@i\311\235\366\331h\257E\236=\200\007\323\010\352A\257\326\317\220\177\327\203\315p\"\032\213\026{k=F\336\320\362_\004\016\3314\360@\013\267i\344s\177\r\004\250\206\233Q\346\300\010m:\355\177$|(\306S\371\375\246\004\316\274\031^%\316\237\013?\022Y\273\320\337\350o\217~\3639E\356N\235\364\213\273\316\300\371\274?\356\337\r\262\301\271p.lFJ/+\202\216\363p\">y\332\347A%\3702\274\023M\364\016\367*o\014\r\347V\242;\275\211\376\341\376\201\261\321\377\302&\034\276\351\273\210\020\350,\n\240\306\30080\346\241`\334\032\321\247\204\rK\341\003lxR\344\317\036\024\206O\277\031~\363\26787\037l!\355+\321vo\262\277\326g\224\302\347\340\310\303\336Xo1\3518\033<\025\213\211\256DD\232\202\\\305\371S\376\262_\017\036Ey\n\343<\025\005\241|4\302PiXZ\006\241\201~\0075ZD9\214&\377\362\262\343\217\021\302D\306\243\247\2073\227\303\355\350p\264\214e\223\247\207\247+Q6\232\2156\261\tf\376\313W\202\354;\026Wn\332?\2310tx\341\006`\333\343+P:\263\307\252\374l\260*v\020\334n\206\265\350\003\024\360\367\375\355\301\341\301\322\340\207\341w\337\017\277\377{\234_\014/D\033\221""\333\253\364\036\016\306\006EZv\035\220N\202\250?%\035\347\303\023bq\251W\245p3\251\345\270p\006\3258\217\360\277\205,\024f\342BR!%\224[\341\234\250\2735\024g\341b\370\010p\025\346\207\363\327\"\320\360\224\377y\260\206TbAJv ~\202\000:3<\275\004\331[\026,\231<3<\263\022U\001\017\210\221(\301x\367\276\377tXZ\022!M\201 \303\331\317{\357\214\331'\250\217\007\311\300\237\025\243)R\345m\n]h\336\027\220\277[\275L2\345\016T 7\033|\026.\205?\364\216\367\036\364Y\337\031\224\006\017\207\337~\207(\300\313\341'\213B!\363g\241\237\371\202\177/8\033l\303Qx\370\002\206V\022\331\236\013\036#\005(\216X\272\034\332\250\246/\021\2431\250\016\276\036\256o\304\225e!\227s(\222<A[\213>\354-\001.{\220\215\247/\206\267!`i\177\202D\322\367j\342\020\030J\307V\226J\350j\220\t\246\341\312\267\202\372\205\331\2402*\234\307PA\n\336\013xX\0014\322lp\003ysE\251\314%\302\005\364\343\271e\010\362&\004a\254_\036>Y\037\256?EQ\307W\257E\277\364\327\373*\362P \377K\321Cq\010\"\317?\223\271\221\310\375\232\257\342$S\303\263\250A\244g!x.\022\277\201P\221\275B\264\016\332\035#\r\272\020\336@\345\217\367\252\275\177\000\300*\035X'\202Z\230\241\264\334\n\017\207\327\304a\205\224\375\025\316\254\217\220\321:Dh\235\200\364\202*\300\225.\204\225\021\036\267\240(\027\373\265A\346\335\206\312!\033\211G\001\223bi1<\027]\3529\375\242\030\241\357El+-Ee\234(\322\225(\223\034\322\240\203P\362?\017\035H\304\377O\206\3776\031&\016\035=\351C6\351D\237\234z\373\255)\327},\024\222\021o\354\3408N\337\265\320@|\233\260T\334\227\303\251]\221\314\003\210\325Av0;\020\242K\266.\323\235\345\343n\315\237\024\364@^F\342\n\351\371\217\302c\341\315\310&\375\316u\253\344C\302\322\347~\326\237\3657\351\2462\207\363\023W?\272%U\337\256\335\213\340\340UJ\3154]Kv\357:8\370\216\341\010n\"\003\311]\246\030\237\232\361\177D^\211W9\322V/\0247N\033\023+\202\334\001\033\275\343\t\261\177\213\314\355\237\020\271\374P8#\216v\333?\216\312:,\304_\320&\271\026\32256\013\2047\350\033\235\341{\240|\206\2064\024\315LO\351\237\304i\262>z\375b\361{w\212""\031\377)\335\035\336~\2478p\034\214\350\366F\005D\267\301\014\305G\243K\335\2154x\340v\204\314\211\273\001\241\207Z\314\200\275\311-*\270\212b\237\232\301\205\021\267\223\311C\357O\276\\y\371\302\237\36351ur\232\270\3646\032!Z\332\037\267\226\027\310\352\273\376%x\013\276\311Q\232\001\355J\270\272Q\331]\247\013j\374\026\260\226pUu\202\005\030*\201\270*\375M\3022\361\307\202.\302\377\021\301D\036o\247wuT\3001\201D\016l\204e\233\360\001e\217L\374\372O\360w\323?\214\340'\246\272\370W\366\341\313\312W\377\006\277\357\315\233";
-    PyObject *data = __Pyx_DecompressString(cstring, 2990, 1);
+    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (3064 bytes) */
+const char* const cstring = "x\332\355WMw\323f\026\306\001:\300\004&\316G\307\020\247\310\216\301!\200\301I\200)P8N\200)\035\240\204\024\346\264\247\255\216,\275\216\325\310\222\254\217\304\206\201\351\222\245\227Zj\251\245\226Zz\351\245\227Z\372'\360\023\346\271\257\224\017\332\322a1\233\2363\013\353\375\276\357\275\317}\356}\257o\n5M\023\024\265\305t[5t[0-&3E\3257\367'\205s\212\320rmG\2503A\325\025\326a\212 \351\212\240\033\216`k*\266\257\272\215\006\263\204m\225\355\010\212\301l\276\304:\246a3\301v,Ua\366\232\244\013\206\256u\005\331b\222\303\004I\250'\207\234\246\344\010\252-\310\206\356\250\233\256\341\332\270Dh\261\226au+8E\242$\333V7u\3011\004\034V.s9\311\016\2722\335\224\n\336\261TG\252k,\335\220(\325\260\214\326\357\235\345f\t;\252\323\024\234\256\311\204r:\357X\222ns3\366\217$\333pB\005T\316\001\354\356\035\004LM@H6\335o\231NW\260\233\022D;\256\t\345\032\206%\310]\247i\350\025\311\262\244\356C\256\200\341:\202\321\020\352\206\253+\266\260 u \345\234r\341\341\257\357J\300wM\323\260\034\246<\324\267%M\205\227\014\205]\"\340\261\031N*\313e\001\367\224q\031\031R\276$l\342\324\356\346D\035`\315\257\271\375\230\033\370\202\014\204\nO\014@\311]\263\306\265${\024\246\251uf\001d@Hn\305%\334\177\272\360\364\376\323\313+\177[\341\264\260\330O\270\336\206vuY\203\347@\007\262\311U5\007\227\021\274vEx\330\020\272\206+\350\014j\302\255&\366\035<\3404\231.\330\314\241\216P\346\276\220\034\330-\3428\270YNqU\267\031\235~ i6\253|\375\036xP9%\230$\313\314\336Es\303a\246\320\222\272\034?\360\371%\263\214}\240\237\353\2349\020\t6n3\013\304pX\213\306F\235\214\252\334)_\270+)\212\250\023<d\254\000\204\256vdC\323H\0358\246\"\325\345\333\007\270L\233\022e\357\374rz\227Bw\024\325\246{\031\277}S\026\026\310M\233\234=d\001\005#\3538Lwxh\354\307\245j'G\024\322\322V_2\341\366\027\302\325_qK7\340\272\206\344j\216 \212\026S\\\231\211\242\240\270\334P\335\320/\303\225\333\252\244aUVu\325\301bb\356\035\333\222\257\310M\313\200\271\206~E\224\273\242\252\353\314\252\230\335\316\355$\256\225\367\014\374\365\034\361o\317""\316\367\326\367f\335=\320%M3d\236\034HmA\221\034\251\362\033\253\tqIF\232[*\265\215\265\207\017\357k\232j\332\252-\212O\273\035\374\356\201\237\342\023\000\367\21456X\333e\272\314\210\336\225}\246\303W\273R\305\204-\222\336\025%N,\311\356\352\262jTd\303BX\252:\263\353\222\315\352\314vDS\327\222\266#\313\222\335\024\261.7%k\223\355aU\331\303\n\230\022\247Eq\267\263\311\034r\027\r!\024\233D\304\246\314\352\222\274%k\3104\212(K\246$\253N7\035b\0316\312F\253\245\332\344v\031\004wd\327\262@\010\221\356W\024\322_\267\261\013\210*\"p\025\361\201\365b\032&\206\256P\334\361\217\010\204\022\367\002\020\344\013H\261\272\342\276\370dlvv[QgN\322G\2567Mi3=a\233\224O\231\356\266xJ\000\300P\031\201\261\223\366\000\n\263,\303b\0350\352\200x\032Bz\322p\341\324\205,;]\334\273\206\017\370-\rM\332\264\033\232!9\327W\300\356\226\344\244)M\024\033\256.\023\270\200\325v\010\007\261\331\224l\321\261\233L\331D\344\250\252\"\212j\213\362$Z\312\262\211[4\3030\305\206d\303\263\216L\230\354\371\031}\315\300A\036Si`\375\264\265\265\205\020GJ\200b\232\n\013\ts\205\366\211\r\306\304m\006%Z\022\234\211\257\205{\223\257\330d\232\202\227\203\236\r\312\315X5\024WC\253\353b\342^\035\366\032\216\255K-\232M\276\210p|\331\216Hy\006\230I\232n\002g\263k\300q\206\311t\021O\222\312\323\215\001\225\000\314\216H\020\2016[\246a\232\310\314L\224\223\246\2314Z\322\030\246e\310\310\271\340#bX\224\233L\336\262\335V2J\361\243.'\n\357\271\272\251\312[P\371\276\276\273o\233\277\257\004z\333\205j\\gxIS\211\255\210\215\375$\263\327K\322\321\201\t\326\241\356\246j;\024\"\310\364\251\355\350\245\271\212\367S\225\016\364w%\361$\200\217\205\017\3716\365\002\325\t\222\306\321\260\311q\370\201\004\"O(i\277\305 \001Qf(\273\253$Y\225m\215\266\341\213t\354\240\341\210Q\333\331ed\262n8i\206\340]U\351$\034\345\213\216d9\374Cb\353\222&!\347\300D\323v\014\374,Wv`(\300w(}\210\016^5\r\333\224\244\003>\330HC\n\250\354\230\216\231(@m\0072m\256V\332\210x\301\321E\366\333\334\004~f\307\205\233\340|W\347~x\t\214\367zb\275\313)\346\232D\331m""\234t\231\275#!wp\366\362`>0D\320\361Q\202\352\376j:\246e\303Jr`\332\351t\350\021\265\177\316\274\3732s\350\350i/\343}\352\265\375L|\3443O\017\036\204\205\260\032\0379\357\267\302\353Q6*\304G\316z\355\370H\321/\372\017\202B\260\0344\302\325P\032\321\354\273\225CG/\006E~\344\363\350A\277\330\257\215\216\314z\325w\307\016\035\315\365\034\357\232\237\361\263\243\343'\342c\343ok\361\261So\353\275\261^\341\335\211C'\263\275q\257\346m\370\207\375%\377\233`.\254G\231x:\347\235\362%\377uX\213'\246{\253\275\272\227\211'>E3\346\025\275{\376xP\0136\302\303\320m\372\264\227\245-\017\274sP\373\260\217\231<\244\275\240\316g\236\344m\373\353\264\0141\331\321\370\247=\251\327\206\244\337\353L\365nx\005\250\375\311\241\223\023o\377\345U\2755\317\366K\276\014\305\244\320\216\346#.\357\2767\003\341\355x\372\257\275W~\301_\306z6\316\235\216\247\005\377T \005vX\210\205\242_\t3\341\024L\300\2567\376:\227A\306\345\n~>X\017\344p2\254\2160\230\343'\212\264\261H\302\206\347\257\207R<]\362k\244E\266w\264\367\234T\212'\246z\267p\253\355\317\303\250\351\231x\"\357=\341^\220\342\211Y\357N\220\r\346\003h\267{Y\366\335\370\241\354\254\267\350\257\372\330p\306\273\350\377\000\265\260\363\026\334I\006b\261\022d\202\251\240F\242\253\351\355X\274\031=\213\234~5\316\221\243\237\300\241\313\241\326_\034\254\016$:5\347}\005\351\247\241\360WQ\275\237!\2117\375\215\340X8\026.F\253\021\356\372\214ky!X\t\332\341\251H\212\354\376\302\240\360\201iR\3624w\266\035`On\277\273\013\345Eh\363r09\250\216&\210}\260\244@\372\336\004e\216\007\223\301\215p>\\\347\272s\217\3073gq\311\002\230\370w\250-\375r\341B\260\024\210\321Z\324\336_\030A\330m\317\3619\000\213\234Yc\000\n\370?\342\376[M\244\220\310\257B9:\323\257\366\327\372\326 ?|\376b\370\342\237\361\364y\177\013\236\\\t\333\321x\177\265\217\275g\275\227\000\365Q4\026-&\023\347\374\347\3740g6\334J[\336\300U\271Yo\331k\370\217\303\\\004\366\\ \212\305\271\205\340$\354\311\025\207\305e\320\003\324\351\372c\3204wz4\376\227\267]\004\000\254\317\"\252N\316\364\036QL\305""\230\336\356mx\231\321D\321?\037\214\005W\242\251\010\036\235\367\257\007\223\303\213\267\242er\311T\357nB\233\234w\324{\016?W\351\366[\034kbM~.\316\225R_C\2119\357;\337\002\270+\303+w\201\325\\9\031\005\3558?\357\337\t\263\034\363|\331\177\023\256\003\222l\234_\014\0268!\344\376\231Au\2606\260\206\353?\014\177\370q\370\243\030\347+\301V4\031\255D\355\3768q\210\316\275\004\256\217\372c\t\251\342\374\345\340\371\036\235\362\227\300\307Dt,\314\203\217\215\340q\224\353gc\0011\265\310\371^\0173\261pi\317S\302\325\360$\302RX\034.\336\212\252\243\374Y\257\013\030\nt\340\000|D\335\322{\230\224\220\304\212\303K_D\033\375\014\255\316\364\356y\307\375\031\n?\262\t>?7,\177\021}4h\263Hr'\222\205?,H\023\207\262\323i* \226\376\033\021\370:\252%[\216\200\271\271\262\337\t\2540\017\314N\014\n\203\345A}\370\364\373\341\367d\306(7;\234\255 \255\301\322\013H\207y\301\377\304gA\025\232B\305[\220\344p\234J\013\301)\344R'\252\306\245\345p)\334\210\216\301\310\312\360\351\372p\3759\202*\276v#|\323_\357+\310\031y\202\267\030\376#\262\000\331\322`=\236\273\312\323~:\237\200\221\314!$@\323\006\014\006\350g=\327\257\371\337B\231\034\217\006\241\354\267G\302e,\t\344\365s\310@\231\270T\366_\301w+H\353\205x\341R\360$*\220\003\342\205\033\241\205S_\"x\365\3417P\351\333\341\267\337\305\237\337\212\356\014\262\203\022\\!\220\005\365$\334G\360\365m\0227\342\376\037\303[\241\004\245\200\205U\344\363\374\305\340&w\376$\214\205\003\277\307#:\217t\2060\272\022\274\212\212\321\275~\246?G\030B\347$K\324\3105\257\203\265`\207\247\013\270\355O\320&;\202W\317#\035e\t\313k\310\332\331\270t%h\217\360y\215\244\253\r\212\203\332\307--\205\205\021\377\010\330\024\227*A3l\365\227\221\246h\222\306?\341\332\322\365P\357\327\342\322JHoPB\211y\312\220\177(J\304\371\363\377'\304\377\236\020x{\316\240\352\032\247\207x|\342\303\345\311t\357\t/(\220j\317z\226?\345\177\031\254\006zT\243|\033\027\366S\344\004\177\r\271k&9\244\363\360jZ-\\\201\201\323T\370\215\357\346\331\244\214s\275\307x\220n\023\022\3618\352;\322!\251""\331^zYo\036\265A\206\022\374c\252\261\250P\252}\270j\243ty\r\336\247\362m\277\374@a9\211\327\271\351\32795\211\021\263s\336\217\340\356\032P\302\243/\371n\300\243\300\302F<\014\347Pt\241\226\370\250\332pz\277\\\233\3365\036v\346\206\\\031\376\352[\336\024\n\335\303\376M\344\357\014\305X;\316\341R\252\027\263@\370\031\2151\031|\302\023=\226T\304\340\034\177Z\020\024\243\367k\216\337*7\346\350E\373\275r\003\376\374\334[E\3414=3\242\242\213Jx*\3202d\037\255.\365\236\245\306\357=\220KP\214\320\313\t(Mf\340\371\034\325\224 Z<1\347\255\363\"<\333\243\302\364\370\370\333\225\267\257\274\222\247\362\375\343T\306\177\220K0\231\224@\241\363\n\256\375\330\002\374\003 \317'\220\202{E\224v\024\2117\373\317\372\355\370\003\210-y\317\240F\031\202\212`\257B\177\210p\214\227\361\260\361\277\303\030s\030\327HUb\264\345Or8\370\277\224g\030\002$\360\366\350\261\237_\203\304\033\336a\030\177l\242\207\377_\177~[\375\372?`\016\272\265";
+    PyObject *data = __Pyx_DecompressString(cstring, 3064, 1);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #else /* compression: none (6186 bytes) */
-const char* const bytes = ": All dimensions preceding dimension %d must be indexed and not slicedBuffer view does not expose stridesCan only create a buffer that is contiguous in memory.Cannot assign to read-only memoryviewCannot create writable memory view from read-only memoryviewCannot index with type 'Cannot transpose memoryview with indirect dimensionsDimension %d is not directEmpty shape tuple for cython.arrayIndex out of bounds (axis %d)Indirect dimensions not supportedInvalid mode, expected 'c' or 'fortran', got Invalid shape in axis <MemoryView of Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.Out of bounds on buffer access (axis Step may not be zero (axis %d)Unable to convert item to object.>')?add_note and  at 0xcollections.abc<contiguous and direct><contiguous and indirect>disableenablegc (got got differing extents in dimension isenableditemsize <= 0 for cython.arrayno default __reduce__ due to non-trivial __cinit__ object>src/chronoton/_cy_inner.pyx<strided and direct><strided and direct or indirect><strided and indirect>unable to allocate array data.unable to allocate shape and strides.ASCIIEllipsis__Pyx_PyDict_NextRefSequenceView.MemoryViewabcallocate_bufferany_activeasyncio.coroutinesbasebest_pnlbest_pxccash_outchargechronoton._cy_inner__class____class_getitem__cline_in_tracebackclosed_capacityclosed_tradescommissioncountcurrent_cashddate_nsdesired_dir__dict__directiondtypedtype_is_objectencodeentry_commissionentry_pxentry_px_netentry_slippageentry_spreadenumerateequity_nowequity_outerrorexit_commissionexit_pxexit_px_netexit_reasonexit_slippageexit_spreadflagsfloat64formatfortran__func____getstate__hhedgingiid__import__indexinner_loop_fastintc_is_coroutineitemsitemsizekkklleverageliquidatedlong_entries_shiftedlong_exits_shiftedlong_fee_vec__main__marginmargin_heldmemviewmode__module__nn_closedn_slotsname__name__ndim__new__notionalnpnumpyoobjopen_p""ositionsoverflow_flagpackpopprice_cprice_hprice_lprice_oproceeds__pyx_checksum__pyx_state__pyx_type__pyx_unpickle_Enum__pyx_vtable____qualname__realised_pnl__reduce____reduce_cython____reduce_ex__register__set_name__setdefault__setstate____setstate_cython__shapeshareshort_entries_shiftedshort_exits_shiftedshort_fee_vecsizesizing_arraysizing_method_codesizing_staticsl_arrsl_distsl_pricesl_pxslippage_arrslot_activeslot_idxspread_arrstartstarting_balancestepstopstructt_ns__test__total_badtotal_loss_budgettptp_pricetp_pxtsts_distts_dist_valts_trigger_pxuunpackunrealizedunrealized_by_slotupdatevvalueswant_long_entrywant_long_exitwant_short_entrywant_short_exitworst_pnlworst_pxxzeros\200\001\360N\001\000\005\031\230\001\230\026\230q\240\001\330\004\036\230n\250F\260!\2601\330\004&\240m\2606\270\021\270!\330\004\037\230q\330\004 \240\002\240&\250\001\250\023\250F\260\"\260A\340\004\037\230q\3600\000\005)\250\002\250&\260\001\260\031\270&\300\002\300!\340\004\033\2301\340\t\n\330\010\014\210E\220\025\220a\220q\330\014\026\220a\220q\230\001\330\014\026\220a\220q\230\001\330\014\026\220a\220q\230\001\330\014\026\220a\220q\230\001\330\014\023\2207\230!\2301\360\006\000\r\020\210|\2301\230C\230s\240$\240c\250\035\260a\260s\270#\270Q\330\020\024\220E\230\025\230a\230q\330\024\027\220{\240!\2403\240c\250\021\330\030\031\330\024 \240\016\250a\250s\260!\330 \"\240.\260\001\260\023\260A\330\024\027\220~\240Q\240c\250\035\260b\270\001\330\030!\240\034\250Q\250c\260\022\2601\340\030!\240\035\250a\250s\260\"\260A\330\024\"\240!\2403\320&6\260a\330\024$\240A\360\006\000\r\021\220\005\220U\230!\2301\330\020\023\220;\230a\230s\240#\240Q\330\024\025\330\020\034\230N\250!\2503\250a\330\020\033\230>\250\021\250#\250Q\330\020\027\220~\240Q\240c\250\021\360\006\000\021\033\230.\250\001\250\023\250A\330\020\023\2204\220u\230A\230Q\330\024\027\220z\240\022\2402\240T\250\030\260\022\260>\300\021\300#\300Q\330\030&\240a\240s\250-\260q\330\031#\2402\240R\240t\2508\2602\260^\3001\300C\300q\330\030&""\240a\240s\250-\260q\360\006\000\021\024\220:\230R\230q\330\024\037\230q\330\024\036\230a\340\024\037\230q\330\024\036\230a\330\020\034\230J\240c\250\031\260\"\260J\270b\300\001\330\020\033\230:\240S\250\010\260\002\260*\270B\270a\330\020\023\220:\230R\230~\250Q\250c\260\021\330\024\"\240!\2403\240i\250q\330\020\023\2209\230B\230n\250A\250S\260\001\330\024\"\240!\2403\240i\250q\360\006\000\021\031\230\016\240a\240s\250!\330\020\030\230\016\240a\240s\250!\330\020 \240\001\330\020\023\2204\220u\230A\230Q\330\024\027\220z\240\022\2401\330\030(\250\016\260a\260s\270+\300R\300q\340\030(\250\016\260a\260s\270+\300R\300q\340\020\037\230q\330\020\032\230!\330\020\023\220:\230R\230q\330\024\030\230\004\230E\240\021\240(\250$\250h\260c\270\021\330\030&\240a\330\030\"\240!\330\032\036\230e\2401\240H\250D\260\010\270\003\2701\330\030&\240a\330\030\"\240!\330\032\036\230e\2401\320$4\260D\270\010\300\003\3001\330\030&\240a\330\030\"\240!\340\024\030\230\004\230E\240\021\240(\250$\250h\260c\270\021\330\030&\240a\330\030\"\240!\330\032\036\230e\2401\240H\250D\260\010\270\003\2701\330\030&\240a\330\030\"\240!\330\032\036\230e\2401\320$4\260D\270\010\300\003\3001\330\030&\240a\330\030\"\240!\340\020\023\220<\230t\2401\330\024\"\240*\250A\250S\260\002\260!\330\024$\240L\260\001\260\023\260B\260a\330\024\"\240(\250\"\250J\260c\270\032\3001\300C\300r\310\034\320UV\320VW\330\024&\240k\260\022\2604\260q\270\014\300B\300a\330\024\037\230z\250\023\250L\270\002\270*\300B\300a\330\024%\240U\250\"\250J\260b\270\001\330\024$\240A\330\024\037\230~\250Q\330\030\033\2303\230f\240M\260\030\270\021\330\030)\250\035\260a\330\030(\250\r\260Q\330\030\"\320\"3\2601\340\024\027\220y\240\002\240!\330\030\031\340\014\017\210y\230\002\230!\330\020\021\360\006\000\r\036\320\035/\250q\260\003\2603\260a\330\014\036\320\0361\260\021\260#\260S\270\001\330\014\017\210\177\230c\240\021\330\020\024\220E\230\025\230a\230q\330\024\027\220{\240!\2403\240c\250\021\330\030\031\330\024 \240\016\250a\250s\260!\330\024""\031\230\032\2402\240R\240t\320+;\2701\330\031#\2402\240R\240t\2501\330\030\037\230~\250Q\250c\260\021\330\030#\240>\260\021\260#\260Q\330\030&\240h\250b\260\n\270#\270Z\300q\310\003\3102\310\\\320YZ\320Z[\330\030*\250+\260R\260t\2701\270L\310\002\310!\330\030#\240:\250S\260\014\270B\270j\310\002\310!\330\030)\250\025\250b\260\n\270\"\270A\330\030(\250\001\330\030#\240>\260\021\330\034\037\230s\240&\250\r\260X\270Q\330\034\035\330\034&\240a\240s\250\"\250A\330\034(\250\001\250\023\250B\250a\330\034,\250M\270\021\330\034&\320&7\260q\340\030\033\2309\240B\240a\330\034\035\330\020\023\2209\230B\230a\330\024\025\360\006\000\r\037\320\0362\260!\2603\260c\270\021\330\014\037\320\0374\260A\260S\270\003\2701\360\006\000\r\021\220\004\220I\230U\320\"2\260#\260Q\330\020\036\230e\320#9\270\021\330\020\024\220E\230\025\230a\230q\330\024\027\220{\240!\2403\240c\250\021\330\030\031\330\024 \240\016\250a\250s\260!\330\024\027\220u\230J\240c\250\021\330\030\037\230~\250Q\250c\260\021\330\030#\240>\260\021\260#\260Q\330\030&\240h\250b\260\n\270#\270Z\300q\310\003\3102\310\\\320YZ\320Z[\330\030*\250+\260R\260t\2701\270L\310\002\310!\330\030#\240:\250S\260\014\270B\270j\310\002\310!\330\030)\250\025\250b\260\n\270\"\270A\330\030(\250\001\330\030#\240>\260\021\330\034\037\230s\240&\250\r\260X\270Q\330\034\035\330\034&\240a\240s\250\"\250A\330\034(\250\001\250\023\250B\250a\330\034,\250M\270\021\330\034&\320&7\260q\340\030\033\2309\240B\240a\330\034\035\330\020\023\2209\230B\230a\330\024\025\360\020\000\r\020\210q\330\020\036\230a\330\020\033\230?\250!\250=\270\001\330\020\023\2209\230D\240\001\330\024#\2408\2502\250\\\270\023\270J\300a\300s\310\"\310L\320XY\320YZ\340\024\027\320\027*\250#\250Q\330\030%\240Q\330\030\034\230F\240%\240q\250\001\330\034\037\230{\250!\2504\250s\260!\330 $\240N\260!\2604\260q\330 /\250r\260\023\260H\270B\270n\310A\310T\320QR\33013\260>\300\021\300$\300a\330\030 \240\016\250b\260\013\2702\270Z\300r\310\021\330\031,\250C\250q\330\030 \240\016\250b\260\n\270""\"\270A\330\031,\250C\250q\360\010\000\031#\240&\250\001\250\021\330\030\033\2305\240\001\240\031\250#\250X\260S\270\001\330\034#\2401\340\034)\250\021\330\034 \240\006\240e\2501\250A\330 #\240;\250a\250t\2603\260a\330$(\250\016\260a\260t\2701\330$3\2602\260S\270\010\300\002\300.\320PQ\320QU\320UV\33057\260~\300Q\300d\310!\330\034$\240N\260\"\260L\300\002\300!\340\030\037\230|\2501\250A\340\024\027\220u\230B\230d\240$\240d\250%\250q\260\001\330\030'\240z\260\021\260#\260R\260q\330\030)\250\034\260Q\260c\270\022\2701\330\030+\250;\260b\270\004\270A\270]\310\"\310A\330\030!\240\025\240b\250\001\340\030\033\230=\250\003\2507\260\"\260A\330\034,\250G\2602\260Q\340\034&\240f\250A\250Q\330\034\037\230u\240A\240Q\330 +\2501\340 +\250=\270\002\270,\300b\310\001\330\034\037\230u\240A\240Q\330 +\2501\340 +\250=\270\002\270,\300b\310\001\330\034\037\230u\240A\240Q\330 .\250a\340 .\250a\340\034+\2501\330 *\250(\260-\270s\300!\330 .\250a\330 *\250*\260A\330 2\260.\300\001\330 0\260\001\360\006\000\r\020\210q\330\020\037\230q\330\020\033\230?\250!\250=\270\001\330\020\023\2209\230D\240\001\330\024#\2408\2502\250\\\270\023\270J\300a\300s\310\"\310L\320XY\320YZ\340\024\027\320\027*\250#\250Q\330\030%\240Q\330\030\034\230F\240%\240q\250\001\330\034\037\230{\250!\2504\250s\260!\330 $\240N\260!\2604\260q\330 /\250r\260\023\260H\270B\270n\310A\310T\320QR\33013\260>\300\021\300$\300a\330\030 \240\016\250b\260\013\2702\270Z\300r\310\021\330\031,\250C\250q\330\030 \240\016\250b\260\n\270\"\270A\330\031,\250C\250q\330\030\"\240&\250\001\250\021\330\030\033\2305\240\001\240\031\250#\250X\260S\270\001\330\034#\2401\340\034)\250\021\330\034 \240\006\240e\2501\250A\330 #\240;\250a\250t\2603\260a\330$(\250\016\260a\260t\2701\330$3\2602\260S\270\010\300\002\300.\320PQ\320QU\320UV\33057\260~\300Q\300d\310!\330\034$\240N\260\"\260L\300\002\300!\340\030\037\230|\2501\250A\340\024\027\220u\230B\230d\240$\240d\250%\250q\260\001\330\030'\240z\260\021\260#\260R\260q\330\030)\250\034\260Q\260c\270\022""\2701\330\030+\250;\260b\270\004\270A\270]\310\"\310A\330\030!\240\025\240b\250\001\340\030\033\230=\250\003\2507\260\"\260A\330\034,\250G\2602\260Q\340\034&\240f\250A\250Q\330\034\037\230u\240A\240Q\330 +\2501\340 +\250=\270\002\270,\300b\310\001\330\034\037\230u\240A\240Q\330 +\2501\340 +\250=\270\002\270,\300b\310\001\330\034\037\230u\240A\240Q\330 .\250a\340 .\250a\340\034+\2501\330 *\250(\260-\270s\300!\330 .\250a\330 *\250*\260A\330 2\260.\300\001\330 0\260\001\360\010\000\r\032\230\021\330\014\032\230!\330\014\020\220\005\220U\230!\2301\330\020\023\220;\230a\230s\240#\240Q\330\024\025\330\020\024\220N\240!\2403\240a\330\020\037\230r\240\023\240H\250B\250n\270A\270S\300\001\330!#\240>\260\021\260#\260Q\330\020\037\230~\250Q\250c\260\030\270\022\270>\310\021\310#\310Q\330\020\036\230a\230s\240/\260\021\330\024\026\220b\230\014\240N\260!\2603\260a\340\014\026\220a\220u\230M\250\022\250<\260r\270\021\330\014\024\220A\220U\230!\360\006\000\r\020\210z\230\021\230#\230S\240\001\330\020$\240M\260\022\2601\330\020\034\230A\330\020\024\220E\230\025\230a\230q\330\024\027\220{\240!\2403\240c\250\021\330\030*\250!\2505\260\001\330\030\031\330\024\030\230\016\240a\240s\250!\330\024\031\230\022\2303\230h\240b\250\016\260a\260s\270!\330\033\035\230^\2501\250C\250q\330\024&\240a\240u\250A\330\024\027\220r\230\022\2301\330\030%\240Q\240a\340\020\024\220E\230\025\230a\230q\330\024\027\220{\240!\2403\240c\250\021\330\030\031\330\024 \240\016\250a\250s\260!\330\024\033\230>\250\021\250#\250Q\330\024\037\230~\250Q\250c\260\021\330\024\030\320\030*\250!\2501\340\024\027\220r\230\023\230D\240\003\240:\250S\260\001\330\030'\240q\330\030&\240a\340\030!\240\021\240#\240R\240q\330\030'\240q\250\006\250b\260\001\330\030&\240i\250r\260\035\270c\300\032\3102\310Q\340\024%\240U\250\"\250J\260b\270\001\330\024\037\230~\250Q\330\030\033\2303\230f\240M\260\030\270\021\330\030\035\230U\240!\330\030(\250\r\260Q\330\030\"\320\"3\2601\340\024\027\220y\240\002\240!\330\030\031\340\020\023\2209\230B""\230a\330\024\025\340\020\032\230!\2305\240\001\330\020\030\230\001\230\025\230a\340\020\023\2202\220R\220r\230\022\2301\330\024\030\230\005\230U\240!\2402\240R\240s\250!\330\030 \240\001\240\025\240a\330\030\"\240!\2405\250\001\330\020\035\230Q\330\020\021\360\014\000\t\014\2104\210{\230$\230i\240s\250!\330\014\031\230\021\330\014\020\220\005\220U\230!\2301\330\020\023\220;\230a\230s\240#\240Q\330\024!\240\021\330\024\025\340\014\017\210{\230#\230Q\330\020\024\220E\230\025\230a\230q\330\024\027\220{\240!\2403\240c\250\021\330\030\031\330\024 \240\016\250a\250s\260!\330\024\033\230>\250\021\250#\250Q\330\024\037\230~\250Q\250c\260\021\330\024#\240:\250S\260\001\260\021\260\"\260B\260c\270\022\270:\300R\300q\330\024%\240U\250\"\250J\260b\270\001\330\024\037\230~\250Q\330\030\033\2302\230R\230s\240'\250\021\250\"\250B\250d\260!\2601\260B\260b\270\001\330\030 \240\001\330\030\035\230U\240!\330\030(\250\r\260Q\330\030\"\320\"3\2601\340\024\027\220y\240\002\240!\330\030\031\330\020\023\2209\230C\230q\330\024\036\230a\230r\240\022\2405\250\001\330\024\034\230A\230R\230r\240\025\240a\360\006\000\005\010\200}\220A\220S\230\003\2301\330\010\020\220\001\330\004\013\2101O";
+    #else /* compression: none (6112 bytes) */
+const char* const bytes = ": All dimensions preceding dimension %d must be indexed and not slicedBuffer view does not expose stridesCan only create a buffer that is contiguous in memory.Cannot assign to read-only memoryviewCannot create writable memory view from read-only memoryviewCannot index with type 'Cannot transpose memoryview with indirect dimensionsDimension %d is not directEmpty shape tuple for cython.arrayIndex out of bounds (axis %d)Indirect dimensions not supportedInvalid mode, expected 'c' or 'fortran', got Invalid shape in axis <MemoryView of Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.Out of bounds on buffer access (axis Step may not be zero (axis %d)Unable to convert item to object.>')?add_note and  at 0xcollections.abc<contiguous and direct><contiguous and indirect>disableenablegc (got got differing extents in dimension isenableditemsize <= 0 for cython.arrayno default __reduce__ due to non-trivial __cinit__ object>src/chronoton/_cy_inner.pyx<strided and direct><strided and direct or indirect><strided and indirect>unable to allocate array data.unable to allocate shape and strides.ASCIIEllipsis__Pyx_PyDict_NextRefSequenceView.MemoryViewabcallocate_bufferany_activeasyncio.coroutinesbasebest_pnlbest_pxccash_outchargechronoton._cy_inner__class____class_getitem__cline_in_tracebackclosed_capacityclosed_tradescommissioncountcurrent_cashddate_nsdesired_dir__dict__directiondtypedtype_is_objectencodeentry_commissionentry_pxentry_px_netentry_slippageentry_spreadenumerateequity_nowequity_outerrorexit_commissionexit_pxexit_px_netexit_reasonexit_slippageexit_spreadflagsfloat64formatfortran__func____getstate__hhas_tshedgingiid__import__indexinner_loop_fastintc_is_coroutineis_longitemsitemsizejkkklleverageliquidatedlong_fee_vec__main__marginmargin_heldmemviewmode__module__nn_closedn_slotsname__name__ndim__new__notionalnpnumpyoobjopen_positionsoverflow_flagpac""kpopprice_cprice_hprice_lprice_oproceeds__pyx_checksum__pyx_state__pyx_type__pyx_unpickle_Enum__pyx_vtable____qualname__realised_pnl__reduce____reduce_cython____reduce_ex__register__set_name__setdefault__setstate____setstate_cython__shapeshareshort_fee_vecsignal_flagssizesizing_arraysizing_method_codesizing_staticsl_arrsl_distsl_pricesl_pxslippage_arrslot_activeslot_idxspread_arrstartstarting_balancestepstopstructt_ns__test__total_badtotal_loss_budgettptp_pricetp_pxtsts_distts_dist_valts_trigger_pxuunpackunrealizedunrealized_by_slotupdatevvalueswant_long_entrywant_long_exitwant_short_entrywant_short_exitworst_pnlworst_pxxzeros\200\001\360H\001\000\005\031\230\001\230\026\230q\240\001\330\004\036\230n\250F\260!\2601\330\004&\240m\2606\270\021\270!\330\004\037\230q\330\004\"\240\"\240F\250!\2503\250f\260B\260a\340\004\037\230q\3604\000\005+\250\"\250F\260!\2609\270F\300\"\300A\340\004\033\2301\360\010\000\005\030\220t\2305\240\001\240\021\340\t\n\330\010\014\210A\330\010\016\210b\220\002\220!\360\n\000\r\021\220\014\230A\230S\240\003\2402\240T\250\035\260b\270\001\330\024\030\230\016\240a\240}\260A\330\020\024\220B\220b\230\001\330\020\026\220b\230\002\230\"\230D\240\014\250A\250S\260\003\2601\330\024\031\230\021\330\020\024\220F\230%\230q\240\003\2401\330\024\034\230A\230V\2401\330\024\036\230a\230v\240Q\330\020\024\220A\330\020\021\340\014\026\220a\220q\230\001\330\014\026\220a\220q\230\001\330\014\026\220a\220q\230\001\330\014\026\220a\220q\230\001\330\014\023\2207\230!\2301\360\006\000\r\020\210|\2301\230C\230s\240$\240c\250\035\260a\260s\270#\270Q\330\020\024\220E\230\025\230a\230q\330\024\027\220{\240!\2403\240c\250\021\330\030\031\330\024 \240\016\250a\250s\260!\330 \"\240.\260\001\260\023\260A\330\024\027\220~\240Q\240c\250\035\260b\270\001\330\030!\240\034\250Q\250c\260\022\2601\340\030!\240\035\250a\250s\260\"\260A\330\024\"\240!\2403\320&6\260a\330\024$\240A\360\006\000\r\021\220\005\220U\230!\2301\330\020\023\220;\230a\230s\240#\240Q\330\024\025\330\020""\034\230N\250!\2503\250a\330\020\033\230>\250\021\250#\250Q\330\020\027\220~\240Q\240c\250\021\360\014\000\021\033\230*\240B\240a\330\020\032\230+\240]\260!\330\020\033\230;\240m\2601\360\006\000\021\033\230.\250\001\250\023\250A\330\020\023\2201\330\024\"\240!\2403\240m\260:\270R\270t\3001\330\030\"\240\"\240N\260!\2603\260l\300*\310B\310a\360\006\000\021\035\230J\240c\250\031\260\"\260J\270b\300\001\330\020\033\230:\240S\250\010\260\002\260*\270B\270a\330\020\036\230a\230s\240)\2504\250q\260\016\270a\270s\300(\310!\330\020\036\230a\230s\240)\2504\250q\260\016\270a\270s\300(\310!\360\014\000\021\031\230\016\240a\240s\250!\330\020\030\230\016\240a\240s\250!\330\020 \240\016\250a\250s\260+\270R\270z\310\022\3101\340\020\037\230q\330\020\032\230!\330\020\023\220:\230S\240\t\250\022\2507\260#\260Q\330\024\"\240!\330\024\036\230a\330\025\037\230s\240(\250\"\250G\2603\260a\330\024\"\240!\330\024\036\230a\330\025\037\230s\240)\2502\250_\270C\270q\330\024\"\240!\330\024\036\230a\340\020\023\220<\230t\2401\330\024\"\240*\250A\250S\260\002\260!\330\024$\240L\260\001\260\023\260B\260a\330\024\"\240(\250\"\250J\260c\270\032\3001\300C\300r\310\034\320UV\320VW\330\024&\240k\260\022\2604\260q\270\014\300B\300a\330\024\037\230z\250\023\250L\270\002\270*\300B\300a\330\024%\240U\250\"\250J\260b\270\001\330\024$\240A\330\024\037\230~\250Q\330\030\033\2303\230f\240M\260\030\270\021\330\030)\250\035\260a\330\030(\250\r\260Q\330\030\"\320\"3\2601\340\024\027\220y\240\002\240!\330\030\031\340\014\017\210y\230\002\230!\330\020\021\360\010\000\r\025\220L\240\001\240\021\330\014\017\210v\220S\230\001\340\020\"\240&\250\002\250/\270\023\270A\330\020#\2406\250\022\320+;\2703\270a\330\020\023\220?\240#\240Q\330\024\030\230\005\230U\240!\2401\330\030\033\230;\240a\240s\250#\250Q\330\034\035\330\030$\240N\260!\2603\260a\330\030\035\230Z\240r\250\022\2504\320/?\270q\330\035'\240r\250\022\2504\250q\330\034#\240>\260\021\260#\260Q\330\034'\240~\260Q\260c\270\021\330\034*\250(\260\"\260J\270c\300""\032\3101\310C\310r\320Q]\320]^\320^_\330\034.\250k\270\022\2704\270q\300\014\310B\310a\330\034'\240z\260\023\260L\300\002\300*\310B\310a\330\034-\250U\260\"\260J\270b\300\001\330\034,\250A\330\034'\240~\260Q\330 #\2403\240f\250M\270\030\300\021\330 !\330 *\250!\2503\250b\260\001\330 ,\250A\250S\260\002\260!\330 0\260\r\270Q\330 *\320*;\2701\340\034\037\230y\250\002\250!\330 !\330\024\027\220y\240\002\240!\330\030\031\360\006\000\021$\2406\250\022\320+;\2703\270a\330\020$\240F\250\"\320,=\270S\300\001\360\006\000\021\025\220D\230\t\240\025\320&6\260c\270\021\330\024\"\240%\320'=\270Q\330\024\030\230\005\230U\240!\2401\330\030\033\230;\240a\240s\250#\250Q\330\034\035\330\030$\240N\260!\2603\260a\330\030\033\2305\240\n\250#\250Q\330\034#\240>\260\021\260#\260Q\330\034'\240~\260Q\260c\270\021\330\034*\250(\260\"\260J\270c\300\032\3101\310C\310r\320Q]\320]^\320^_\330\034.\250k\270\022\2704\270q\300\014\310B\310a\330\034'\240z\260\023\260L\300\002\300*\310B\310a\330\034-\250U\260\"\260J\270b\300\001\330\034,\250A\330\034'\240~\260Q\330 #\2403\240f\250M\270\030\300\021\330 !\330 *\250!\2503\250b\260\001\330 ,\250A\250S\260\002\260!\330 0\260\r\270Q\330 *\320*;\2701\340\034\037\230y\250\002\250!\330 !\330\024\027\220y\240\002\240!\330\030\031\360\020\000\021\024\2201\330\024\"\240!\330\024\037\230\177\250a\250}\270A\330\024\027\220y\240\004\240A\330\030'\240x\250r\260\034\270S\300\n\310!\3103\310b\320P\\\320\\]\320]^\340\030\033\320\033.\250c\260\021\330\034)\250\021\330\034 \240\006\240e\2501\250A\330 #\240;\250a\250t\2603\260a\330$(\250\016\260a\260t\2701\330$3\2602\260S\270\010\300\002\300.\320PQ\320QU\320UV\33057\260~\300Q\300d\310!\330\034$\240N\260\"\260K\270r\300\032\3102\310Q\330\0350\260\003\2601\330\034$\240N\260\"\260J\270b\300\001\330\0350\260\003\2601\360\010\000\035'\240f\250A\250Q\330\034\037\230u\240A\240Y\250c\260\030\270\023\270A\330 '\240q\340 -\250Q\330 $\240F\250%\250q\260\001\330$'\240{\260!\2604\260s\270!\330(,\250N\270!\2704\270q\330(7\260r\270\023""\270H\300B\300n\320TU\320UY\320YZ\3309;\270>\310\021\310$\310a\330 (\250\016\260b\270\014\300B\300a\340\034#\240<\250q\260\001\340\030\033\2305\240\002\240$\240d\250$\250e\2601\260A\330\034+\250:\260Q\260c\270\022\2701\330\034-\250\\\270\021\270#\270R\270q\330\034/\250{\270\"\270D\300\001\300\035\310b\320PQ\330\034%\240U\250\"\250A\340\034\037\230}\250C\250w\260b\270\001\330 0\260\007\260r\270\021\340 *\250&\260\001\260\021\330 #\2405\250\001\250\021\330$/\250q\340$/\250}\270B\270l\310\"\310A\330 #\2405\250\001\250\021\330$/\250q\340$/\250}\270B\270l\310\"\310A\330 #\2405\250\001\250\021\330$2\260!\340$2\260!\340 /\250q\330$.\250h\260m\3003\300a\330$2\260!\330$.\250j\270\001\330$6\260n\300A\330$4\260A\360\006\000\021\024\2201\330\024#\2401\330\024\037\230\177\250a\250}\270A\330\024\027\220y\240\004\240A\330\030'\240x\250r\260\034\270S\300\n\310!\3103\310b\320P\\\320\\]\320]^\340\030\033\320\033.\250c\260\021\330\034)\250\021\330\034 \240\006\240e\2501\250A\330 #\240;\250a\250t\2603\260a\330$(\250\016\260a\260t\2701\330$3\2602\260S\270\010\300\002\300.\320PQ\320QU\320UV\33057\260~\300Q\300d\310!\330\034$\240N\260\"\260K\270r\300\032\3102\310Q\330\0350\260\003\2601\330\034$\240N\260\"\260J\270b\300\001\330\0350\260\003\2601\330\034&\240f\250A\250Q\330\034\037\230u\240A\240Y\250c\260\030\270\023\270A\330 '\240q\340 -\250Q\330 $\240F\250%\250q\260\001\330$'\240{\260!\2604\260s\270!\330(,\250N\270!\2704\270q\330(7\260r\270\023\270H\300B\300n\320TU\320UY\320YZ\3309;\270>\310\021\310$\310a\330 (\250\016\260b\270\014\300B\300a\340\034#\240<\250q\260\001\340\030\033\2305\240\002\240$\240d\250$\250e\2601\260A\330\034+\250:\260Q\260c\270\022\2701\330\034-\250\\\270\021\270#\270R\270q\330\034/\250{\270\"\270D\300\001\300\035\310b\320PQ\330\034%\240U\250\"\250A\340\034\037\230}\250C\250w\260b\270\001\330 0\260\007\260r\270\021\340 *\250&\260\001\260\021\330 #\2405\250\001\250\021\330$/\250q\340$/\250}\270B\270l\310\"\310A\330 #\2405\250\001\250\021\330$/\250q\340$/\250}\270B""\270l\310\"\310A\330 #\2405\250\001\250\021\330$2\260!\340$2\260!\340 /\250q\330$.\250h\260m\3003\300a\330$2\260!\330$.\250j\270\001\330$6\260n\300A\330$4\260A\360\010\000\r\032\230\021\330\014\032\230!\330\014\020\220\005\220U\230!\2301\330\020\023\220;\230a\230s\240#\240Q\330\024\025\330\020\024\220N\240!\2403\240a\330\020\037\230r\240\023\240H\250B\250n\270A\270S\300\001\330!#\240>\260\021\260#\260Q\330\020\037\230~\250Q\250c\260\030\270\022\270>\310\021\310#\310Q\330\020\036\230a\230s\240/\260\021\330\024\026\220b\230\014\240N\260!\2603\260a\340\014\026\220a\220u\230M\250\022\250<\260r\270\021\330\014\024\220A\220U\230!\360\006\000\r\020\210z\230\021\230#\230S\240\001\330\020$\240M\260\022\2601\330\020\034\230A\330\020\024\220E\230\025\230a\230q\330\024\027\220{\240!\2403\240c\250\021\330\030*\250!\2505\260\001\330\030\031\330\024\030\230\016\240a\240s\250!\330\024\031\230\022\2303\230h\240b\250\016\260a\260s\270!\330\033\035\230^\2501\250C\250q\330\024&\240a\240u\250A\330\024\027\220r\230\022\2301\330\030%\240Q\240a\340\020\024\220E\230\025\230a\230q\330\024\027\220{\240!\2403\240c\250\021\330\030\031\330\024 \240\016\250a\250s\260!\330\024\033\230>\250\021\250#\250Q\330\024\037\230~\250Q\250c\260\021\330\024\030\320\030*\250!\2501\340\024\027\220r\230\023\230D\240\003\240:\250S\260\001\330\030'\240q\330\030&\240a\340\030!\240\021\240#\240R\240q\330\030'\240q\250\006\250b\260\001\330\030&\240i\250r\260\035\270c\300\032\3102\310Q\340\024%\240U\250\"\250J\260b\270\001\330\024\037\230~\250Q\330\030\033\2303\230f\240M\260\030\270\021\330\030\035\230U\240!\330\030(\250\r\260Q\330\030\"\320\"3\2601\340\024\027\220y\240\002\240!\330\030\031\340\020\023\2209\230B\230a\330\024\025\340\020\032\230!\2305\240\001\330\020\030\230\001\230\025\230a\340\020\023\2202\220R\220r\230\022\2301\330\024\030\230\005\230U\240!\2402\240R\240s\250!\330\030 \240\001\240\025\240a\330\030\"\240!\2405\250\001\330\020\035\230Q\330\020\021\340\014\021\220\021\360\014\000\t\014\2104\210{\230$""\230i\240s\250!\330\014\031\230\021\330\014\020\220\005\220U\230!\2301\330\020\023\220;\230a\230s\240#\240Q\330\024!\240\021\330\024\025\340\014\017\210{\230#\230Q\330\020\024\220E\230\025\230a\230q\330\024\027\220{\240!\2403\240c\250\021\330\030\031\330\024 \240\016\250a\250s\260!\330\024\033\230>\250\021\250#\250Q\330\024\037\230~\250Q\250c\260\021\330\024#\240:\250S\260\001\260\021\260\"\260B\260c\270\022\270:\300R\300q\330\024%\240U\250\"\250J\260b\270\001\330\024\037\230~\250Q\330\030\033\2302\230R\230s\240'\250\021\250\"\250B\250d\260!\2601\260B\260b\270\001\330\030 \240\001\330\030\035\230U\240!\330\030(\250\r\260Q\330\030\"\320\"3\2601\340\024\027\220y\240\002\240!\330\030\031\330\020\023\2209\230C\230q\330\024\036\230a\230r\240\022\2405\250\001\330\024\034\230A\230R\230r\240\025\240a\360\006\000\005\010\200}\220A\220S\230\003\2301\330\010\020\220\001\330\004\013\2101O";
     PyObject *data = NULL;
     CYTHON_UNUSED_VAR(__Pyx_DecompressString);
     #endif
@@ -23932,9 +23830,9 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
   PyObject* tuple_dedup_map = PyDict_New();
   if (unlikely(!tuple_dedup_map)) return -1;
   {
-    const __Pyx_PyCode_New_function_description descr = {29, 0, 0, 90, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 204};
-    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_o, __pyx_mstate->__pyx_n_u_h, __pyx_mstate->__pyx_n_u_l, __pyx_mstate->__pyx_n_u_c, __pyx_mstate->__pyx_n_u_v, __pyx_mstate->__pyx_n_u_date_ns, __pyx_mstate->__pyx_n_u_long_entries_shifted, __pyx_mstate->__pyx_n_u_long_exits_shifted, __pyx_mstate->__pyx_n_u_short_entries_shifted, __pyx_mstate->__pyx_n_u_short_exits_shifted, __pyx_mstate->__pyx_n_u_starting_balance, __pyx_mstate->__pyx_n_u_sizing_method_code, __pyx_mstate->__pyx_n_u_sizing_static, __pyx_mstate->__pyx_n_u_sizing_array, __pyx_mstate->__pyx_n_u_sl_arr, __pyx_mstate->__pyx_n_u_tp, __pyx_mstate->__pyx_n_u_ts, __pyx_mstate->__pyx_n_u_leverage, __pyx_mstate->__pyx_n_u_commission, __pyx_mstate->__pyx_n_u_spread_arr, __pyx_mstate->__pyx_n_u_slippage_arr, __pyx_mstate->__pyx_n_u_long_fee_vec, __pyx_mstate->__pyx_n_u_short_fee_vec, __pyx_mstate->__pyx_n_u_hedging, __pyx_mstate->__pyx_n_u_cash_out, __pyx_mstate->__pyx_n_u_equity_out, __pyx_mstate->__pyx_n_u_open_positions, __pyx_mstate->__pyx_n_u_slot_active, __pyx_mstate->__pyx_n_u_closed_trades, __pyx_mstate->__pyx_n_u_n, __pyx_mstate->__pyx_n_u_n_slots, __pyx_mstate->__pyx_n_u_closed_capacity, __pyx_mstate->__pyx_n_u_n_closed, __pyx_mstate->__pyx_n_u_overflow_flag, __pyx_mstate->__pyx_n_u_current_cash, __pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_k, __pyx_mstate->__pyx_n_u_kk, __pyx_mstate->__pyx_n_u_slot_idx, __pyx_mstate->__pyx_n_u_price_o, __pyx_mstate->__pyx_n_u_price_h, __pyx_mstate->__pyx_n_u_price_l, __pyx_mstate->__pyx_n_u_price_c, __pyx_mstate->__pyx_n_u_t_ns, __pyx_mstate->__pyx_n_u_direction, __pyx_mstate->__pyx_n_u_entry_px, __pyx_mstate->__pyx_n_u_size, __pyx_mstate->__pyx_n_u_ts_dist, __pyx_mstate->__pyx_n_u_sl_px, __pyx_mstate->__pyx_n_u_tp_px, __pyx_mstate->__pyx_n_u_ts_trigger_px, __pyx_mstate->__pyx_n_u_worst_px, __pyx_mstate->__pyx_n_u_best_px, __pyx_mstate->__pyx_n_u_worst_pnl, __pyx_mstate->__pyx_n_u_best_pnl, __pyx_mstate->__pyx_n_u_exit_reason, __pyx_mstate->__pyx_n_u_exit_px, __pyx_mstate->__pyx_n_u_exit_px_net, __pyx_mstate->__pyx_n_u_exit_spread, __pyx_mstate->__pyx_n_u_exit_slippage, __pyx_mstate->__pyx_n_u_exit_commission, __pyx_mstate->__pyx_n_u_proceeds, __pyx_mstate->__pyx_n_u_notional, __pyx_mstate->__pyx_n_u_charge, __pyx_mstate->__pyx_n_u_d, __pyx_mstate->__pyx_n_u_u, __pyx_mstate->__pyx_n_u_sl_dist, __pyx_mstate->__pyx_n_u_sl_price, __pyx_mstate->__pyx_n_u_tp_price, __pyx_mstate->__pyx_n_u_ts_dist_val, __pyx_mstate->__pyx_n_u_entry_px_net, __pyx_mstate->__pyx_n_u_entry_spread, __pyx_mstate->__pyx_n_u_entry_slippage, __pyx_mstate->__pyx_n_u_entry_commission, __pyx_mstate->__pyx_n_u_margin, __pyx_mstate->__pyx_n_u_equity_now, __pyx_mstate->__pyx_n_u_unrealized, __pyx_mstate->__pyx_n_u_margin_held, __pyx_mstate->__pyx_n_u_total_loss_budget, __pyx_mstate->__pyx_n_u_total_bad, __pyx_mstate->__pyx_n_u_share, __pyx_mstate->__pyx_n_u_realised_pnl, __pyx_mstate->__pyx_n_u_want_long_entry, __pyx_mstate->__pyx_n_u_want_short_entry, __pyx_mstate->__pyx_n_u_want_long_exit, __pyx_mstate->__pyx_n_u_want_short_exit, __pyx_mstate->__pyx_n_u_desired_dir, __pyx_mstate->__pyx_n_u_any_active, __pyx_mstate->__pyx_n_u_unrealized_by_slot, __pyx_mstate->__pyx_n_u_liquidated};
-    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_chronoton__cy_inner_pyx, __pyx_mstate->__pyx_n_u_inner_loop_fast, __pyx_mstate->__pyx_kp_b_iso88591_N_q_nF_1_m6_q_F_A_q0_1_E_aq_aq, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+    const __Pyx_PyCode_New_function_description descr = {26, 0, 0, 91, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 231};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_o, __pyx_mstate->__pyx_n_u_h, __pyx_mstate->__pyx_n_u_l, __pyx_mstate->__pyx_n_u_c, __pyx_mstate->__pyx_n_u_v, __pyx_mstate->__pyx_n_u_date_ns, __pyx_mstate->__pyx_n_u_signal_flags, __pyx_mstate->__pyx_n_u_starting_balance, __pyx_mstate->__pyx_n_u_sizing_method_code, __pyx_mstate->__pyx_n_u_sizing_static, __pyx_mstate->__pyx_n_u_sizing_array, __pyx_mstate->__pyx_n_u_sl_arr, __pyx_mstate->__pyx_n_u_tp, __pyx_mstate->__pyx_n_u_ts, __pyx_mstate->__pyx_n_u_leverage, __pyx_mstate->__pyx_n_u_commission, __pyx_mstate->__pyx_n_u_spread_arr, __pyx_mstate->__pyx_n_u_slippage_arr, __pyx_mstate->__pyx_n_u_long_fee_vec, __pyx_mstate->__pyx_n_u_short_fee_vec, __pyx_mstate->__pyx_n_u_hedging, __pyx_mstate->__pyx_n_u_cash_out, __pyx_mstate->__pyx_n_u_equity_out, __pyx_mstate->__pyx_n_u_open_positions, __pyx_mstate->__pyx_n_u_slot_active, __pyx_mstate->__pyx_n_u_closed_trades, __pyx_mstate->__pyx_n_u_n, __pyx_mstate->__pyx_n_u_n_slots, __pyx_mstate->__pyx_n_u_closed_capacity, __pyx_mstate->__pyx_n_u_n_closed, __pyx_mstate->__pyx_n_u_overflow_flag, __pyx_mstate->__pyx_n_u_current_cash, __pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_j, __pyx_mstate->__pyx_n_u_k, __pyx_mstate->__pyx_n_u_kk, __pyx_mstate->__pyx_n_u_slot_idx, __pyx_mstate->__pyx_n_u_price_o, __pyx_mstate->__pyx_n_u_price_h, __pyx_mstate->__pyx_n_u_price_l, __pyx_mstate->__pyx_n_u_price_c, __pyx_mstate->__pyx_n_u_t_ns, __pyx_mstate->__pyx_n_u_direction, __pyx_mstate->__pyx_n_u_entry_px, __pyx_mstate->__pyx_n_u_size, __pyx_mstate->__pyx_n_u_ts_dist, __pyx_mstate->__pyx_n_u_sl_px, __pyx_mstate->__pyx_n_u_tp_px, __pyx_mstate->__pyx_n_u_ts_trigger_px, __pyx_mstate->__pyx_n_u_worst_px, __pyx_mstate->__pyx_n_u_best_px, __pyx_mstate->__pyx_n_u_worst_pnl, __pyx_mstate->__pyx_n_u_best_pnl, __pyx_mstate->__pyx_n_u_is_long, __pyx_mstate->__pyx_n_u_exit_reason, __pyx_mstate->__pyx_n_u_exit_px, __pyx_mstate->__pyx_n_u_exit_px_net, __pyx_mstate->__pyx_n_u_exit_spread, __pyx_mstate->__pyx_n_u_exit_slippage, __pyx_mstate->__pyx_n_u_exit_commission, __pyx_mstate->__pyx_n_u_proceeds, __pyx_mstate->__pyx_n_u_notional, __pyx_mstate->__pyx_n_u_charge, __pyx_mstate->__pyx_n_u_d, __pyx_mstate->__pyx_n_u_u, __pyx_mstate->__pyx_n_u_sl_dist, __pyx_mstate->__pyx_n_u_sl_price, __pyx_mstate->__pyx_n_u_tp_price, __pyx_mstate->__pyx_n_u_ts_dist_val, __pyx_mstate->__pyx_n_u_entry_px_net, __pyx_mstate->__pyx_n_u_entry_spread, __pyx_mstate->__pyx_n_u_entry_slippage, __pyx_mstate->__pyx_n_u_entry_commission, __pyx_mstate->__pyx_n_u_margin, __pyx_mstate->__pyx_n_u_equity_now, __pyx_mstate->__pyx_n_u_unrealized, __pyx_mstate->__pyx_n_u_margin_held, __pyx_mstate->__pyx_n_u_total_loss_budget, __pyx_mstate->__pyx_n_u_total_bad, __pyx_mstate->__pyx_n_u_share, __pyx_mstate->__pyx_n_u_realised_pnl, __pyx_mstate->__pyx_n_u_want_long_entry, __pyx_mstate->__pyx_n_u_want_short_entry, __pyx_mstate->__pyx_n_u_want_long_exit, __pyx_mstate->__pyx_n_u_want_short_exit, __pyx_mstate->__pyx_n_u_flags, __pyx_mstate->__pyx_n_u_desired_dir, __pyx_mstate->__pyx_n_u_any_active, __pyx_mstate->__pyx_n_u_unrealized_by_slot, __pyx_mstate->__pyx_n_u_liquidated, __pyx_mstate->__pyx_n_u_has_ts};
+    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_chronoton__cy_inner_pyx, __pyx_mstate->__pyx_n_u_inner_loop_fast, __pyx_mstate->__pyx_kp_b_iso88591_H_q_nF_1_m6_q_F_3fBa_q4_F_9F_A, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
   }
   Py_DECREF(tuple_dedup_map);
   return 0;
@@ -30103,17 +30001,17 @@ static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const cha
   }
   
 /* ObjectToMemviewSlice */
-  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(PyObject *obj, int writable_flag) {
       __Pyx_memviewslice result = __Pyx_MEMSLICE_INIT;
       __Pyx_BufFmt_StackElem stack[1];
-      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
       int retcode;
       if (obj == Py_None) {
           result.memview = (struct __pyx_memoryview_obj *) Py_None;
           return result;
       }
-      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
-                                                   PyBUF_RECORDS_RO | writable_flag, 1,
+      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                   (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 1,
                                                    &__Pyx_TypeInfo_double__const__, stack,
                                                    &result, obj);
       if (unlikely(retcode == -1))
@@ -30126,17 +30024,17 @@ static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const cha
   }
   
 /* ObjectToMemviewSlice */
-  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_unsigned_char__const__(PyObject *obj, int writable_flag) {
       __Pyx_memviewslice result = __Pyx_MEMSLICE_INIT;
       __Pyx_BufFmt_StackElem stack[1];
-      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
       int retcode;
       if (obj == Py_None) {
           result.memview = (struct __pyx_memoryview_obj *) Py_None;
           return result;
       }
-      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
-                                                   PyBUF_RECORDS_RO | writable_flag, 1,
+      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                   (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 1,
                                                    &__Pyx_TypeInfo_unsigned_char__const__, stack,
                                                    &result, obj);
       if (unlikely(retcode == -1))
@@ -30171,17 +30069,17 @@ static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const cha
       }
   
 /* ObjectToMemviewSlice */
-  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_double(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_double(PyObject *obj, int writable_flag) {
       __Pyx_memviewslice result = __Pyx_MEMSLICE_INIT;
       __Pyx_BufFmt_StackElem stack[1];
-      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
       int retcode;
       if (obj == Py_None) {
           result.memview = (struct __pyx_memoryview_obj *) Py_None;
           return result;
       }
-      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
-                                                   PyBUF_RECORDS_RO | writable_flag, 1,
+      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                   (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 1,
                                                    &__Pyx_TypeInfo_double, stack,
                                                    &result, obj);
       if (unlikely(retcode == -1))
@@ -30194,17 +30092,17 @@ static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const cha
   }
   
 /* ObjectToMemviewSlice */
-  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_double(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(PyObject *obj, int writable_flag) {
       __Pyx_memviewslice result = __Pyx_MEMSLICE_INIT;
       __Pyx_BufFmt_StackElem stack[1];
-      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
       int retcode;
       if (obj == Py_None) {
           result.memview = (struct __pyx_memoryview_obj *) Py_None;
           return result;
       }
-      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
-                                                   PyBUF_RECORDS_RO | writable_flag, 2,
+      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                   (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
                                                    &__Pyx_TypeInfo_double, stack,
                                                    &result, obj);
       if (unlikely(retcode == -1))
@@ -30217,17 +30115,17 @@ static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const cha
   }
   
 /* ObjectToMemviewSlice */
-  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_unsigned_char(PyObject *obj, int writable_flag) {
       __Pyx_memviewslice result = __Pyx_MEMSLICE_INIT;
       __Pyx_BufFmt_StackElem stack[1];
-      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
       int retcode;
       if (obj == Py_None) {
           result.memview = (struct __pyx_memoryview_obj *) Py_None;
           return result;
       }
-      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
-                                                   PyBUF_RECORDS_RO | writable_flag, 1,
+      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                   (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 1,
                                                    &__Pyx_TypeInfo_unsigned_char, stack,
                                                    &result, obj);
       if (unlikely(retcode == -1))
@@ -30240,17 +30138,40 @@ static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const cha
   }
   
 /* ObjectToMemviewSlice */
-  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_int(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dcd__double(PyObject *obj, int writable_flag) {
+      __Pyx_memviewslice result = __Pyx_MEMSLICE_INIT;
+      __Pyx_BufFmt_StackElem stack[1];
+      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW) };
+      int retcode;
+      if (obj == Py_None) {
+          result.memview = (struct __pyx_memoryview_obj *) Py_None;
+          return result;
+      }
+      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_F_CONTIG,
+                                                   (PyBUF_F_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
+                                                   &__Pyx_TypeInfo_double, stack,
+                                                   &result, obj);
+      if (unlikely(retcode == -1))
+          goto __pyx_fail;
+      return result;
+  __pyx_fail:
+      result.memview = NULL;
+      result.data = NULL;
+      return result;
+  }
+  
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_int(PyObject *obj, int writable_flag) {
       __Pyx_memviewslice result = __Pyx_MEMSLICE_INIT;
       __Pyx_BufFmt_StackElem stack[1];
-      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
       int retcode;
       if (obj == Py_None) {
           result.memview = (struct __pyx_memoryview_obj *) Py_None;
           return result;
       }
-      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
-                                                   PyBUF_RECORDS_RO | writable_flag, 1,
+      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                   (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 1,
                                                    &__Pyx_TypeInfo_int, stack,
                                                    &result, obj);
       if (unlikely(retcode == -1))
@@ -39,13 +39,22 @@ Field layout (matches F_* in the Python module):
 Exit reason codes (must match Python):
     0 SIGNAL, 1 SL, 2 TP, 3 TS, 4 LIQUIDATION, 5 END_OF_DATA
 
+Signal-flag bits (must match Python SIG_*):
+    1 LONG_ENTRY, 2 LONG_EXIT, 4 SHORT_ENTRY, 8 SHORT_EXIT
+
 Sizing method codes (must match Python; note: custom=3 is NOT handled here):
     0 PERCENT_EQUITY, 1 VALUE, 2 PRECOMPUTED
+
+Memory layout: every 1-D view is declared contiguous (``[::1]``) so element
+access compiles to a plain pointer offset with no stride multiply.
+``open_positions`` is row-major (``[:, ::1]``); ``closed_trades`` is
+column-major (``[::1, :]``), matching the order="F" allocation in the
+dispatcher. Callers must pass arrays in exactly these layouts.
 """
 
 import numpy as np
 cimport cython
-from libc.math cimport isnan, NAN, fabs
+from libc.math cimport isnan, NAN, fabs, fmax, fmin
 
 
 # --- Field index constants --------------------------------------------------
@@ -82,6 +91,12 @@ cdef enum:
     EXIT_LIQUIDATION  = 4
     EXIT_END_OF_DATA  = 5
 
+cdef enum:
+    SIG_LONG_ENTRY   = 1
+    SIG_LONG_EXIT    = 2
+    SIG_SHORT_ENTRY  = 4
+    SIG_SHORT_EXIT   = 8
+
 cdef enum:
     SIZING_PERCENT_EQUITY  = 0
     SIZING_VALUE           = 1
@@ -95,7 +110,7 @@ cdef enum:
 # ---------------------------------------------------------------------------
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef inline Py_ssize_t _find_free_slot(const unsigned char[:] slot_active,
+cdef inline Py_ssize_t _find_free_slot(const unsigned char[::1] slot_active,
                                        Py_ssize_t n_slots) nogil:
     """Index of first inactive slot, or -1 if full."""
     cdef Py_ssize_t k
@@ -105,6 +120,18 @@ cdef inline Py_ssize_t _find_free_slot(const unsigned char[:] slot_active,
     return -1
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline bint _no_open_slots(const unsigned char[::1] slot_active,
+                                Py_ssize_t n_slots) nogil:
+    """True iff every slot is inactive."""
+    cdef Py_ssize_t k
+    for k in range(n_slots):
+        if slot_active[k] != 0:
+            return 0
+    return 1
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cdef inline void _enter_position(
@@ -120,8 +147,8 @@ cdef inline void _enter_position(
     double commission_cost,
     double spread_cost,
     double slippage_cost,
-    double[:, :] open_positions,
-    unsigned char[:] slot_active,
+    double[:, ::1] open_positions,
+    unsigned char[::1] slot_active,
 ) nogil:
     """Populate open_positions[slot_idx] and flip slot_active on."""
     open_positions[slot_idx, F_DIRECTION]     = direction
@@ -158,12 +185,12 @@ cdef inline Py_ssize_t _exit_position(
     double exit_commission,
     double exit_spread,
     double exit_slippage,
-    double[:, :] open_positions,
-    unsigned char[:] slot_active,
-    double[:, :] closed_trades,
+    double[:, ::1] open_positions,
+    unsigned char[::1] slot_active,
+    double[::1, :] closed_trades,
     Py_ssize_t n_closed,
     Py_ssize_t closed_capacity,
-    int[:] overflow_flag,
+    int[::1] overflow_flag,
 ) nogil:
     """
     Finalise exit fields, copy row to closed_trades[n_closed], clear slot.
@@ -204,35 +231,32 @@ cdef inline Py_ssize_t _exit_position(
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def inner_loop_fast(
-    const double[:] o,
-    const double[:] h,
-    const double[:] l,
-    const double[:] c,
-    const double[:] v,
-    const double[:] date_ns,               # datetime64[ns] reinterpreted as float64
-    const unsigned char[:] long_entries_shifted,
-    const unsigned char[:] long_exits_shifted,
-    const unsigned char[:] short_entries_shifted,
-    const unsigned char[:] short_exits_shifted,
+    const double[::1] o,
+    const double[::1] h,
+    const double[::1] l,
+    const double[::1] c,
+    const double[::1] v,
+    const double[::1] date_ns,               # datetime64[ns] reinterpreted as float64
+    const unsigned char[::1] signal_flags,  # shifted signals packed as SIG_* bits
     double starting_balance,
     int sizing_method_code,
     double sizing_static,
-    const double[:] sizing_array,          # empty (size 0) when unused
-    const double[:] sl_arr,
+    const double[::1] sizing_array,          # empty (size 0) when unused
+    const double[::1] sl_arr,
     double tp,
     double ts,
     double leverage,
     double commission,
-    const double[:] spread_arr,
-    const double[:] slippage_arr,
-    const double[:] long_fee_vec,
-    const double[:] short_fee_vec,
+    const double[::1] spread_arr,
+    const double[::1] slippage_arr,
+    const double[::1] long_fee_vec,
+    const double[::1] short_fee_vec,
     bint hedging,
-    double[:] cash_out,              # length n, pre-allocated
-    double[:] equity_out,            # length n, pre-allocated
-    double[:, :] open_positions,     # (n_slots, N_FIELDS)
-    unsigned char[:] slot_active,    # (n_slots,)
-    double[:, :] closed_trades,      # (n, N_FIELDS)
+    double[::1] cash_out,              # length n, pre-allocated
+    double[::1] equity_out,            # length n, pre-allocated
+    double[:, ::1] open_positions,     # (n_slots, N_FIELDS)
+    unsigned char[::1] slot_active,    # (n_slots,)
+    double[::1, :] closed_trades,      # (n, N_FIELDS)
 ):
     """
     Fast-path event-driven simulation. Semantics identical to the
@@ -244,16 +268,17 @@ def inner_loop_fast(
     cdef Py_ssize_t n_slots = open_positions.shape[0]
     cdef Py_ssize_t closed_capacity = closed_trades.shape[0]
     cdef Py_ssize_t n_closed = 0
-    cdef int[:] overflow_flag = np.zeros(1, dtype=np.intc)
+    cdef int[::1] overflow_flag = np.zeros(1, dtype=np.intc)
 
     cdef double current_cash = starting_balance
 
-    cdef Py_ssize_t i, k, kk, slot_idx
+    cdef Py_ssize_t i, j, k, kk, slot_idx
     cdef double price_o, price_h, price_l, price_c
     cdef double t_ns
     cdef double direction, entry_px, size
     cdef double ts_dist, sl_px, tp_px, ts_trigger_px
     cdef double worst_px, best_px, worst_pnl, best_pnl
+    cdef bint is_long
     cdef int exit_reason
     cdef double exit_px, exit_px_net
     cdef double exit_spread, exit_slippage, exit_commission
@@ -265,17 +290,38 @@ def inner_loop_fast(
     cdef double total_loss_budget, total_bad, share, realised_pnl
     cdef bint want_long_entry, want_short_entry
     cdef bint want_long_exit, want_short_exit
+    cdef unsigned char flags
     cdef int desired_dir
     cdef int any_active
 
     # Per-liquidation scratch: unrealised per slot.
     # Allocated here so it can be reused without touching Python in the loop.
-    cdef double[:] unrealized_by_slot = np.zeros(n_slots, dtype=np.float64)
+    cdef double[::1] unrealized_by_slot = np.zeros(n_slots, dtype=np.float64)
 
     cdef bint liquidated = 0
 
+    # TS is one scalar, so whether slots carry a trailing stop is fixed for
+    # the whole run; test it once instead of isnan() per slot per bar.
+    cdef bint has_ts = not isnan(ts)
+
     with nogil:
-        for i in range(n):
+        i = 0
+        while i < n:
+            # Flat fast-forward: with no open slot and no signal a bar
+            # changes nothing, so equity is just cash. Jump to the next bar
+            # carrying a signal and fill the gap in one pass. (Non-positive
+            # cash takes the normal path so liquidation still fires.)
+            if (signal_flags[i] == 0 and current_cash > 0.0
+                    and _no_open_slots(slot_active, n_slots)):
+                j = i + 1
+                while j < n and signal_flags[j] == 0:
+                    j += 1
+                for kk in range(i, j):
+                    cash_out[kk] = current_cash
+                    equity_out[kk] = current_cash
+                i = j
+                continue
+
             price_o = o[i]
             price_h = h[i]
             price_l = l[i]
@@ -304,60 +350,45 @@ def inner_loop_fast(
                 entry_px = open_positions[k, F_ENTRY_PRICE]
                 size = open_positions[k, F_SIZE]
 
+                # Favourable / adverse extreme of this bar for the slot's side.
+                # The selects compile to conditional moves; everything below is in
+                # direction-signed form (direction is exactly +1 or -1), so longs and
+                # shorts share one path with no data-dependent side branches.
+                is_long = direction > 0
+                best_px = price_h if is_long else price_l
+                worst_px = price_l if is_long else price_h
+
                 # Update trailing-stop peak
                 ts_dist = open_positions[k, F_TS_DIST]
-                if not isnan(ts_dist):
-                    if direction > 0 and price_h > open_positions[k, F_TS_PEAK]:
-                        open_positions[k, F_TS_PEAK] = price_h
-                    elif direction < 0 and price_l < open_positions[k, F_TS_PEAK]:
-                        open_positions[k, F_TS_PEAK] = price_l
+                if has_ts:
+                    open_positions[k, F_TS_PEAK] = direction * fmax(
+                        direction * open_positions[k, F_TS_PEAK], direction * best_px)
 
                 # MAE/MFE
-                if direction > 0:
-                    worst_px = price_l
-                    best_px = price_h
-                else:
-                    worst_px = price_h
-                    best_px = price_l
                 worst_pnl = direction * (worst_px - entry_px) * size
                 best_pnl = direction * (best_px - entry_px) * size
-                if worst_pnl < open_positions[k, F_MAE]:
-                    open_positions[k, F_MAE] = worst_pnl
-                if best_pnl > open_positions[k, F_MFE]:
-                    open_positions[k, F_MFE] = best_pnl
+                open_positions[k, F_MAE] = fmin(open_positions[k, F_MAE], worst_pnl)
+                open_positions[k, F_MFE] = fmax(open_positions[k, F_MFE], best_pnl)
 
-                # SL / TP / TS triggers — SL has priority on tie
+                # SL / TP / TS triggers — SL has priority on tie. An unset
+                # level is NaN (a NaN ts_dist makes the trigger NaN too), and
+                # every ordered comparison with NaN is false, so unset levels
+                # never fire without an explicit isnan() guard.
                 sl_px = open_positions[k, F_SL]
                 tp_px = open_positions[k, F_TP]
-                ts_trigger_px = NAN
-                if not isnan(ts_dist):
-                    if direction > 0:
-                        ts_trigger_px = open_positions[k, F_TS_PEAK] - ts_dist
-                    else:
-                        ts_trigger_px = open_positions[k, F_TS_PEAK] + ts_dist
+                ts_trigger_px = open_positions[k, F_TS_PEAK] - direction * ts_dist
 
                 exit_reason = -1
                 exit_px = NAN
-                if direction > 0:
-                    if (not isnan(sl_px)) and price_l <= sl_px:
-                        exit_reason = EXIT_SL
-                        exit_px = sl_px
-                    elif (not isnan(tp_px)) and price_h >= tp_px:
-                        exit_reason = EXIT_TP
-                        exit_px = tp_px
-                    elif (not isnan(ts_trigger_px)) and price_l <= ts_trigger_px:
-                        exit_reason = EXIT_TS
-                        exit_px = ts_trigger_px
-                else:
-                    if (not isnan(sl_px)) and price_h >= sl_px:
-                        exit_reason = EXIT_SL
-                        exit_px = sl_px
-                    elif (not isnan(tp_px)) and price_l <= tp_px:
-                        exit_reason = EXIT_TP
-                        exit_px = tp_px
-                    elif (not isnan(ts_trigger_px)) and price_h >= ts_trigger_px:
-                        exit_reason = EXIT_TS
-                        exit_px = ts_trigger_px
+                if direction * (worst_px - sl_px) <= 0.0:
+                    exit_reason = EXIT_SL
+                    exit_px = sl_px
+                elif direction * (best_px - tp_px) >= 0.0:
+                    exit_reason = EXIT_TP
+                    exit_px = tp_px
+                elif direction * (worst_px - ts_trigger_px) <= 0.0:
+                    exit_reason = EXIT_TS
+                    exit_px = ts_trigger_px
 
                 if exit_reason != -1:
                     exit_spread = spread_arr[i] * size
@@ -379,200 +410,204 @@ def inner_loop_fast(
             if n_closed < 0:
                 break
 
-            # (3) Shifted exit signals ----------------------------------
-            want_long_exit = long_exits_shifted[i] != 0
-            want_short_exit = short_exits_shifted[i] != 0
-            if want_long_exit or want_short_exit:
-                for k in range(n_slots):
-                    if slot_active[k] == 0:
-                        continue
-                    direction = open_positions[k, F_DIRECTION]
-                    if ((direction > 0 and want_long_exit) or
-                        (direction < 0 and want_short_exit)):
-                        size = open_positions[k, F_SIZE]
-                        entry_px = open_positions[k, F_ENTRY_PRICE]
-                        exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
-                        exit_commission = commission * fabs(exit_px_net * size)
-                        proceeds = direction * (exit_px_net - entry_px) * size
-                        current_cash += (size * entry_px) + proceeds
-                        current_cash -= exit_commission
-                        n_closed = _exit_position(
-                            k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
-                            exit_commission,
-                            spread_arr[i] * size,
-                            slippage_arr[i] * size,
-                            open_positions, slot_active, closed_trades,
-                            n_closed, closed_capacity, overflow_flag,
-                        )
-                        if n_closed < 0:
-                            break
-                if n_closed < 0:
-                    break
-
-            # (4) Shifted entry signals ---------------------------------
-            want_long_entry = long_entries_shifted[i] != 0
-            want_short_entry = short_entries_shifted[i] != 0
+            # Signals arrive packed one byte per bar (SIG_* bits). Most bars
+            # carry none, so one load and test skips (3) and (4) entirely.
+            flags = signal_flags[i]
+            if flags != 0:
+                # (3) Shifted exit signals ----------------------------------
+                want_long_exit = (flags & SIG_LONG_EXIT) != 0
+                want_short_exit = (flags & SIG_SHORT_EXIT) != 0
+                if want_long_exit or want_short_exit:
+                    for k in range(n_slots):
+                        if slot_active[k] == 0:
+                            continue
+                        direction = open_positions[k, F_DIRECTION]
+                        if ((direction > 0 and want_long_exit) or
+                            (direction < 0 and want_short_exit)):
+                            size = open_positions[k, F_SIZE]
+                            entry_px = open_positions[k, F_ENTRY_PRICE]
+                            exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
+                            exit_commission = commission * fabs(exit_px_net * size)
+                            proceeds = direction * (exit_px_net - entry_px) * size
+                            current_cash += (size * entry_px) + proceeds
+                            current_cash -= exit_commission
+                            n_closed = _exit_position(
+                                k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
+                                exit_commission,
+                                spread_arr[i] * size,
+                                slippage_arr[i] * size,
+                                open_positions, slot_active, closed_trades,
+                                n_closed, closed_capacity, overflow_flag,
+                            )
+                            if n_closed < 0:
+                                break
+                    if n_closed < 0:
+                        break
 
-            # Non-hedging: flatten opposite-direction positions first
-            if (not hedging) and (want_long_entry or want_short_entry):
-                desired_dir = 1 if want_long_entry else -1
-                for k in range(n_slots):
-                    if slot_active[k] == 0:
-                        continue
-                    direction = open_positions[k, F_DIRECTION]
-                    if <int>direction != desired_dir:
-                        size = open_positions[k, F_SIZE]
-                        entry_px = open_positions[k, F_ENTRY_PRICE]
-                        exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
-                        exit_commission = commission * fabs(exit_px_net * size)
-                        proceeds = direction * (exit_px_net - entry_px) * size
-                        current_cash += (size * entry_px) + proceeds
-                        current_cash -= exit_commission
-                        n_closed = _exit_position(
-                            k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
-                            exit_commission,
-                            spread_arr[i] * size,
-                            slippage_arr[i] * size,
-                            open_positions, slot_active, closed_trades,
-                            n_closed, closed_capacity, overflow_flag,
-                        )
-                        if n_closed < 0:
-                            break
-                if n_closed < 0:
-                    break
+                # (4) Shifted entry signals ---------------------------------
+                want_long_entry = (flags & SIG_LONG_ENTRY) != 0
+                want_short_entry = (flags & SIG_SHORT_ENTRY) != 0
+
+                # Non-hedging: flatten opposite-direction positions first
+                if (not hedging) and (want_long_entry or want_short_entry):
+                    desired_dir = 1 if want_long_entry else -1
+                    for k in range(n_slots):
+                        if slot_active[k] == 0:
+                            continue
+                        direction = open_positions[k, F_DIRECTION]
+                        if <int>direction != desired_dir:
+                            size = open_positions[k, F_SIZE]
+                            entry_px = open_positions[k, F_ENTRY_PRICE]
+                            exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
+                            exit_commission = commission * fabs(exit_px_net * size)
+                            proceeds = direction * (exit_px_net - entry_px) * size
+                            current_cash += (size * entry_px) + proceeds
+                            current_cash -= exit_commission
+                            n_closed = _exit_position(
+                                k, i, t_ns, exit_px_net, <double>EXIT_SIGNAL,
+                                exit_commission,
+                                spread_arr[i] * size,
+                                slippage_arr[i] * size,
+                                open_positions, slot_active, closed_trades,
+                                n_closed, closed_capacity, overflow_flag,
+                            )
+                            if n_closed < 0:
+                                break
+                    if n_closed < 0:
+                        break
 
-            # Open new positions. Unrolled for long and short separately
-            # rather than iterating `for desired_dir in (1, -1):` because
-            # tuple-iteration inside `nogil` is fragile across Cython versions.
-            # The two blocks are identical except for `desired_dir` and which
-            # `want_*_entry` flag is consulted — kept as a helper-free inline
-            # to stay fully in C.
-            if want_long_entry:
-                desired_dir = 1
-                slot_idx = _find_free_slot(slot_active, n_slots)
-                if slot_idx != -1:
-                    entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
-
-                    if sizing_method_code == SIZING_PERCENT_EQUITY:
-                        equity_now = current_cash
-                        for kk in range(n_slots):
-                            if slot_active[kk] != 0:
-                                d = open_positions[kk, F_DIRECTION]
-                                equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
-                                                 * open_positions[kk, F_SIZE])
-                        size = (sizing_static * equity_now * leverage) / entry_px_net
-                    elif sizing_method_code == SIZING_VALUE:
-                        size = (sizing_static * leverage) / entry_px_net
-                    elif sizing_method_code == SIZING_PERCENT_AT_RISK:
-                        # size = (risk_pct * equity) / sl_dist; leverage NOT applied.
-                        # Python dispatcher has already verified SL is not None;
-                        # a per-bar NaN still guards the entry here.
-                        sl_dist = sl_arr[i]
-                        if isnan(sl_dist) or sl_dist <= 0.0:
-                            size = 0.0
-                        else:
+                # Open new positions. Unrolled for long and short separately
+                # rather than iterating `for desired_dir in (1, -1):` because
+                # tuple-iteration inside `nogil` is fragile across Cython versions.
+                # The two blocks are identical except for `desired_dir` and which
+                # `want_*_entry` flag is consulted — kept as a helper-free inline
+                # to stay fully in C.
+                if want_long_entry:
+                    desired_dir = 1
+                    slot_idx = _find_free_slot(slot_active, n_slots)
+                    if slot_idx != -1:
+                        entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
+
+                        if sizing_method_code == SIZING_PERCENT_EQUITY:
                             equity_now = current_cash
                             for kk in range(n_slots):
                                 if slot_active[kk] != 0:
                                     d = open_positions[kk, F_DIRECTION]
                                     equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
                                                      * open_positions[kk, F_SIZE])
-                            size = (sizing_static * equity_now) / sl_dist
-                    else:  # SIZING_PRECOMPUTED
-                        size = sizing_array[i]
-
-                    if size > 0.0 and not isnan(size):
-                        entry_spread = spread_arr[i] * size
-                        entry_slippage = slippage_arr[i] * size
-                        entry_commission = commission * fabs(entry_px_net * size)
-                        margin = size * entry_px_net
-
-                        if current_cash >= margin + entry_commission:
-                            current_cash -= margin + entry_commission
-
+                            size = (sizing_static * equity_now * leverage) / entry_px_net
+                        elif sizing_method_code == SIZING_VALUE:
+                            size = (sizing_static * leverage) / entry_px_net
+                        elif sizing_method_code == SIZING_PERCENT_AT_RISK:
+                            # size = (risk_pct * equity) / sl_dist; leverage NOT applied.
+                            # Python dispatcher has already verified SL is not None;
+                            # a per-bar NaN still guards the entry here.
                             sl_dist = sl_arr[i]
-                            if isnan(sl_dist):
-                                sl_price = NAN
-                            else:
-                                sl_price = entry_px_net - desired_dir * sl_dist
-                            if isnan(tp):
-                                tp_price = NAN
-                            else:
-                                tp_price = entry_px_net + desired_dir * tp
-                            if isnan(ts):
-                                ts_dist_val = NAN
+                            if isnan(sl_dist) or sl_dist <= 0.0:
+                                size = 0.0
                             else:
-                                ts_dist_val = ts
-
-                            _enter_position(
-                                slot_idx, <double>desired_dir, i, t_ns,
-                                entry_px_net, size,
-                                sl_price, tp_price, ts_dist_val,
-                                entry_commission, entry_spread, entry_slippage,
-                                open_positions, slot_active,
-                            )
-
-            if want_short_entry:
-                desired_dir = -1
-                slot_idx = _find_free_slot(slot_active, n_slots)
-                if slot_idx != -1:
-                    entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
-
-                    if sizing_method_code == SIZING_PERCENT_EQUITY:
-                        equity_now = current_cash
-                        for kk in range(n_slots):
-                            if slot_active[kk] != 0:
-                                d = open_positions[kk, F_DIRECTION]
-                                equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
-                                                 * open_positions[kk, F_SIZE])
-                        size = (sizing_static * equity_now * leverage) / entry_px_net
-                    elif sizing_method_code == SIZING_VALUE:
-                        size = (sizing_static * leverage) / entry_px_net
-                    elif sizing_method_code == SIZING_PERCENT_AT_RISK:
-                        sl_dist = sl_arr[i]
-                        if isnan(sl_dist) or sl_dist <= 0.0:
-                            size = 0.0
-                        else:
+                                equity_now = current_cash
+                                for kk in range(n_slots):
+                                    if slot_active[kk] != 0:
+                                        d = open_positions[kk, F_DIRECTION]
+                                        equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
+                                                         * open_positions[kk, F_SIZE])
+                                size = (sizing_static * equity_now) / sl_dist
+                        else:  # SIZING_PRECOMPUTED
+                            size = sizing_array[i]
+
+                        if size > 0.0 and not isnan(size):
+                            entry_spread = spread_arr[i] * size
+                            entry_slippage = slippage_arr[i] * size
+                            entry_commission = commission * fabs(entry_px_net * size)
+                            margin = size * entry_px_net
+
+                            if current_cash >= margin + entry_commission:
+                                current_cash -= margin + entry_commission
+
+                                sl_dist = sl_arr[i]
+                                if isnan(sl_dist):
+                                    sl_price = NAN
+                                else:
+                                    sl_price = entry_px_net - desired_dir * sl_dist
+                                if isnan(tp):
+                                    tp_price = NAN
+                                else:
+                                    tp_price = entry_px_net + desired_dir * tp
+                                if isnan(ts):
+                                    ts_dist_val = NAN
+                                else:
+                                    ts_dist_val = ts
+
+                                _enter_position(
+                                    slot_idx, <double>desired_dir, i, t_ns,
+                                    entry_px_net, size,
+                                    sl_price, tp_price, ts_dist_val,
+                                    entry_commission, entry_spread, entry_slippage,
+                                    open_positions, slot_active,
+                                )
+
+                if want_short_entry:
+                    desired_dir = -1
+                    slot_idx = _find_free_slot(slot_active, n_slots)
+                    if slot_idx != -1:
+                        entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
+
+                        if sizing_method_code == SIZING_PERCENT_EQUITY:
                             equity_now = current_cash
                             for kk in range(n_slots):
                                 if slot_active[kk] != 0:
                                     d = open_positions[kk, F_DIRECTION]
                                     equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
                                                      * open_positions[kk, F_SIZE])
-                            size = (sizing_static * equity_now) / sl_dist
-                    else:
-                        size = sizing_array[i]
-
-                    if size > 0.0 and not isnan(size):
-                        entry_spread = spread_arr[i] * size
-                        entry_slippage = slippage_arr[i] * size
-                        entry_commission = commission * fabs(entry_px_net * size)
-                        margin = size * entry_px_net
-
-                        if current_cash >= margin + entry_commission:
-                            current_cash -= margin + entry_commission
-
+                            size = (sizing_static * equity_now * leverage) / entry_px_net
+                        elif sizing_method_code == SIZING_VALUE:
+                            size = (sizing_static * leverage) / entry_px_net
+                        elif sizing_method_code == SIZING_PERCENT_AT_RISK:
                             sl_dist = sl_arr[i]
-                            if isnan(sl_dist):
-                                sl_price = NAN
-                            else:
-                                sl_price = entry_px_net - desired_dir * sl_dist
-                            if isnan(tp):
-                                tp_price = NAN
-                            else:
-                                tp_price = entry_px_net + desired_dir * tp
-                            if isnan(ts):
-                                ts_dist_val = NAN
+                            if isnan(sl_dist) or sl_dist <= 0.0:
+                                size = 0.0
                             else:
-                                ts_dist_val = ts
-
-                            _enter_position(
-                                slot_idx, <double>desired_dir, i, t_ns,
-                                entry_px_net, size,
-                                sl_price, tp_price, ts_dist_val,
-                                entry_commission, entry_spread, entry_slippage,
-                                open_positions, slot_active,
-                            )
+                                equity_now = current_cash
+                                for kk in range(n_slots):
+                                    if slot_active[kk] != 0:
+                                        d = open_positions[kk, F_DIRECTION]
+                                        equity_now += (d * (price_c - open_positions[kk, F_ENTRY_PRICE])
+                                                         * open_positions[kk, F_SIZE])
+                                size = (sizing_static * equity_now) / sl_dist
+                        else:
+                            size = sizing_array[i]
+
+                        if size > 0.0 and not isnan(size):
+                            entry_spread = spread_arr[i] * size
+                            entry_slippage = slippage_arr[i] * size
+                            entry_commission = commission * fabs(entry_px_net * size)
+                            margin = size * entry_px_net
+
+                            if current_cash >= margin + entry_commission:
+                                current_cash -= margin + entry_commission
+
+                                sl_dist = sl_arr[i]
+                                if isnan(sl_dist):
+                                    sl_price = NAN
+                                else:
+                                    sl_price = entry_px_net - desired_dir * sl_dist
+                                if isnan(tp):
+                                    tp_price = NAN
+                                else:
+                                    tp_price = entry_px_net + desired_dir * tp
+                                if isnan(ts):
+                                    ts_dist_val = NAN
+                                else:
+                                    ts_dist_val = ts
+
+                                _enter_position(
+                                    slot_idx, <double>desired_dir, i, t_ns,
+                                    entry_px_net, size,
+                                    sl_price, tp_price, ts_dist_val,
+                                    entry_commission, entry_spread, entry_slippage,
+                                    open_positions, slot_active,
+                                )
 
             # (5) Mark-to-market ---------------------------------------
             unrealized = 0.0
@@ -644,6 +679,8 @@ def inner_loop_fast(
                 liquidated = 1
                 break
 
+            i += 1
+
         # --- end-of-data close-out (only if not liquidated) -------------
         # Any slot still active after the main loop ends normally is closed
         # at the final bar's close, with no costs. Skipped if we broke out
@@ -0,0 +1,734 @@
+"""
+_nb_inner.py — Numba fast-path inner loop and slot helpers (private JIT helper).
+
+Zero-build-step counterpart of ``_cy_inner.pyx``. Users never import this
+directly; the public dispatcher ``cython_backtester`` routes here when the
+compiled Cython extension is not available (no C compiler at install time)
+and Numba is installed. Kernels are compiled on first call and cached on
+disk (``cache=True``), so only the first run in a fresh environment pays
+the compile cost.
+
+Semantics must match backtester.py::_inner_loop exactly — see
+backtester_docs.md §2–§3. Any divergence is a bug.
+
+Signature and return convention of ``inner_loop_fast`` are identical to
+``_cy_inner.inner_loop_fast``: outputs are written in place and the final
+closed-trade count is returned, or -1 if the closed_trades pre-allocation
+was exhausted.
+
+``inner_loop_grid`` runs the same simulation for K signal sets at once,
+parallelised with ``prange`` (used by ``optimizer.run_optimization``).
+``inner_loop_grid_fused`` does the same but generates each trial's signals
+in-kernel from a user ``@njit`` signal function. ``monte_carlo_trades``
+resamples a finished run's trade P&L (used by ``monte_carlo.run_monte_carlo``).
+
+IMPORTANT — what this file does NOT handle:
+    - position_sizing='custom' (callable). Same restriction as the Cython
+      path: the dispatcher falls back to the pure-Python `_inner_loop`.
+
+``fastmath`` is deliberately left off: NaN is the "not set" sentinel for
+SL / TP / TS, and the stop checks rely on NaN comparing false, which
+fastmath's no-NaN assumption does not preserve.
+
+Performance profile — memory-bound. Per bar and open slot the loop does
+on the order of ten floating-point operations against ~80 bytes of float64
+streams (OHLC, timestamp, SL, spread, slippage, fee vectors) plus one flag
+byte, so once a run outgrows the caches it is bandwidth-dominated. Prefer
+layout and dtype wins — contiguous column streams, packed signal flags,
+float32 prices in sweeps (``optimizer`` precision="auto"), flat
+fast-forward — over FMA/SIMD work on the per-bar arithmetic, which is
+serial through the cash state and would not pay off. The vectorisable
+parts are the bulk fills (flat stretches), already plain slice stores.
+
+Field layout, exit-reason codes, and sizing codes are imported from
+backtester.py; Numba freezes module-level ints as compile-time constants.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+from .backtester import (
+    F_DIRECTION, F_ENTRY_BAR, F_ENTRY_TIME, F_ENTRY_PRICE,
+    F_EXIT_BAR, F_EXIT_TIME, F_EXIT_PRICE, F_SIZE,
+    F_SL, F_TP, F_TS_DIST, F_TS_PEAK,
+    F_COMMISSION, F_SPREAD_COST, F_SLIPPAGE_COST, F_OVERNIGHT,
+    F_MAE, F_MFE, F_EXIT_REASON, F_BARS_HELD, N_FIELDS,
+    EXIT_SIGNAL, EXIT_SL, EXIT_TP, EXIT_TS,
+    EXIT_LIQUIDATION, EXIT_END_OF_DATA,
+    SIG_LONG_ENTRY, SIG_LONG_EXIT, SIG_SHORT_ENTRY, SIG_SHORT_EXIT,
+)
+
+# Sizing method codes (must match backtester._SIZING_METHODS; custom=3 is
+# handled by the Python fallback).
+SIZING_PERCENT_EQUITY  = 0
+SIZING_VALUE           = 1
+SIZING_PRECOMPUTED     = 2
+SIZING_PERCENT_AT_RISK = 4
+
+
+# ---------------------------------------------------------------------------
+# Slot helpers
+# ---------------------------------------------------------------------------
+@njit(cache=True)
+def _find_free_slot(slot_active):
+    """Index of first inactive slot, or -1 if full."""
+    for k in range(slot_active.shape[0]):
+        if slot_active[k] == 0:
+            return k
+    return -1
+
+
+@njit(cache=True)
+def _no_open_slots(slot_active):
+    """True iff every slot is inactive."""
+    for k in range(slot_active.shape[0]):
+        if slot_active[k] != 0:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _enter_position(
+    slot_idx, direction, bar_idx, entry_time_ns, entry_price, size,
+    sl_price, tp_price, ts_dist,
+    commission_cost, spread_cost, slippage_cost,
+    open_positions, slot_active,
+):
+    """Populate open_positions[slot_idx] and flip slot_active on."""
+    open_positions[slot_idx, F_DIRECTION]     = direction
+    open_positions[slot_idx, F_ENTRY_BAR]     = bar_idx
+    open_positions[slot_idx, F_ENTRY_TIME]    = entry_time_ns
+    open_positions[slot_idx, F_ENTRY_PRICE]   = entry_price
+    open_positions[slot_idx, F_EXIT_BAR]      = np.nan
+    open_positions[slot_idx, F_EXIT_TIME]     = np.nan
+    open_positions[slot_idx, F_EXIT_PRICE]    = np.nan
+    open_positions[slot_idx, F_SIZE]          = size
+    open_positions[slot_idx, F_SL]            = sl_price
+    open_positions[slot_idx, F_TP]            = tp_price
+    open_positions[slot_idx, F_TS_DIST]       = ts_dist
+    open_positions[slot_idx, F_TS_PEAK]       = entry_price
+    open_positions[slot_idx, F_COMMISSION]    = commission_cost
+    open_positions[slot_idx, F_SPREAD_COST]   = spread_cost
+    open_positions[slot_idx, F_SLIPPAGE_COST] = slippage_cost
+    open_positions[slot_idx, F_OVERNIGHT]     = 0.0
+    open_positions[slot_idx, F_MAE]           = 0.0
+    open_positions[slot_idx, F_MFE]           = 0.0
+    open_positions[slot_idx, F_EXIT_REASON]   = np.nan
+    open_positions[slot_idx, F_BARS_HELD]     = 0.0
+    slot_active[slot_idx] = 1
+
+
+@njit(cache=True)
+def _exit_position(
+    slot_idx, bar_idx, exit_time_ns, exit_price, exit_reason,
+    exit_commission, exit_spread, exit_slippage,
+    open_positions, slot_active, closed_trades, n_closed, record_trades,
+):
+    """
+    Finalise exit fields, copy row to closed_trades[n_closed], clear slot.
+    Returns n_closed + 1 on success, or -1 on overflow.
+
+    With ``record_trades`` False the row copy (and the capacity check) is
+    skipped and only the count advances; used by the parameter-sweep
+    kernel, which keeps equity curves but not trade logs.
+    """
+    if not record_trades:
+        slot_active[slot_idx] = 0
+        return n_closed + 1
+    if n_closed >= closed_trades.shape[0]:
+        return -1
+
+    open_positions[slot_idx, F_EXIT_BAR]       = bar_idx
+    open_positions[slot_idx, F_EXIT_TIME]      = exit_time_ns
+    open_positions[slot_idx, F_EXIT_PRICE]     = exit_price
+    open_positions[slot_idx, F_EXIT_REASON]    = exit_reason
+    open_positions[slot_idx, F_COMMISSION]    += exit_commission
+    open_positions[slot_idx, F_SPREAD_COST]   += exit_spread
+    open_positions[slot_idx, F_SLIPPAGE_COST] += exit_slippage
+    open_positions[slot_idx, F_BARS_HELD] = (
+        bar_idx - int(open_positions[slot_idx, F_ENTRY_BAR])
+    )
+
+    for j in range(N_FIELDS):
+        closed_trades[n_closed, j] = open_positions[slot_idx, j]
+
+    slot_active[slot_idx] = 0
+    return n_closed + 1
+
+
+@njit(cache=True)
+def _equity_now(current_cash, price_c, open_positions, slot_active):
+    """Cash plus unrealised P&L of every open slot, marked at price_c."""
+    equity_now = current_cash
+    for kk in range(slot_active.shape[0]):
+        if slot_active[kk] != 0:
+            equity_now += (open_positions[kk, F_DIRECTION]
+                           * (price_c - open_positions[kk, F_ENTRY_PRICE])
+                           * open_positions[kk, F_SIZE])
+    return equity_now
+
+
+# ---------------------------------------------------------------------------
+# Simulation core, shared by the single-run and parameter-sweep entry points.
+# ---------------------------------------------------------------------------
+@njit(cache=True)
+def _simulate(
+    o, h, l, c, date_ns,
+    signal_flags,
+    starting_balance, sizing_method_code, sizing_static, sizing_array,
+    sl_arr, tp, ts, leverage, commission,
+    spread_arr, slippage_arr, long_fee_vec, short_fee_vec,
+    hedging,
+    cash_out, equity_out, open_positions, slot_active, closed_trades,
+    record_trades,
+):
+    """
+    Event-driven simulation. Semantics identical to the Python reference
+    in backtester.py. Returns n_closed, or -1 if closed_trades overflowed.
+    """
+    n = o.shape[0]
+    n_slots = open_positions.shape[0]
+    n_closed = 0
+    current_cash = starting_balance
+    unrealized_by_slot = np.zeros(n_slots, dtype=np.float64)
+    liquidated = False
+    # TS is one scalar, so whether slots carry a trailing stop is fixed for
+    # the whole run; test it once instead of isnan() per slot per bar.
+    has_ts = not np.isnan(ts)
+
+    i = 0
+    while i < n:
+        # Flat fast-forward: with no open slot and no signal a bar changes
+        # nothing, so equity is just cash. Jump to the next bar carrying a
+        # signal and fill the gap in one pass. (Non-positive cash takes the
+        # normal path so liquidation still fires.)
+        if signal_flags[i] == 0 and current_cash > 0.0 and _no_open_slots(slot_active):
+            j = i + 1
+            while j < n and signal_flags[j] == 0:
+                j += 1
+            cash_out[i:j] = current_cash
+            equity_out[i:j] = current_cash
+            i = j
+            continue
+
+        price_o = o[i]
+        price_h = h[i]
+        price_l = l[i]
+        price_c = c[i]
+        t_ns = date_ns[i]
+
+        # (1) Overnight financing ----------------------------------------
+        if long_fee_vec[i] != 0.0 or short_fee_vec[i] != 0.0:
+            for k in range(n_slots):
+                if slot_active[k] == 0:
+                    continue
+                notional = open_positions[k, F_SIZE] * open_positions[k, F_ENTRY_PRICE]
+                if open_positions[k, F_DIRECTION] > 0:
+                    charge = long_fee_vec[i] * notional
+                else:
+                    charge = short_fee_vec[i] * notional
+                open_positions[k, F_OVERNIGHT] += charge
+                current_cash -= charge
+
+        # (2) TS peaks, MAE/MFE, SL/TP/TS checks -------------------------
+        for k in range(n_slots):
+            if slot_active[k] == 0:
+                continue
+            direction = open_positions[k, F_DIRECTION]
+            entry_px = open_positions[k, F_ENTRY_PRICE]
+            size = open_positions[k, F_SIZE]
+
+            # Favourable / adverse extreme of this bar for the slot's side.
+            # The selects compile to conditional moves; everything below is in
+            # direction-signed form (direction is exactly +1 or -1), so longs and
+            # shorts share one path with no data-dependent side branches.
+            is_long = direction > 0
+            best_px = price_h if is_long else price_l
+            worst_px = price_l if is_long else price_h
+
+            # Update trailing-stop peak
+            ts_dist = open_positions[k, F_TS_DIST]
+            if has_ts:
+                open_positions[k, F_TS_PEAK] = direction * max(
+                    direction * open_positions[k, F_TS_PEAK], direction * best_px)
+
+            # MAE/MFE
+            worst_pnl = direction * (worst_px - entry_px) * size
+            best_pnl = direction * (best_px - entry_px) * size
+            open_positions[k, F_MAE] = min(open_positions[k, F_MAE], worst_pnl)
+            open_positions[k, F_MFE] = max(open_positions[k, F_MFE], best_pnl)
+
+            # SL / TP / TS triggers — SL has priority on tie. An unset level
+            # is NaN (a NaN ts_dist makes the trigger NaN too), and every
+            # ordered comparison with NaN is false, so unset levels never
+            # fire without an explicit isnan() guard.
+            sl_px = open_positions[k, F_SL]
+            tp_px = open_positions[k, F_TP]
+            ts_trigger_px = open_positions[k, F_TS_PEAK] - direction * ts_dist
+
+            exit_reason = -1
+            exit_px = np.nan
+            if direction * (worst_px - sl_px) <= 0.0:
+                exit_reason = EXIT_SL
+                exit_px = sl_px
+            elif direction * (best_px - tp_px) >= 0.0:
+                exit_reason = EXIT_TP
+                exit_px = tp_px
+            elif direction * (worst_px - ts_trigger_px) <= 0.0:
+                exit_reason = EXIT_TS
+                exit_px = ts_trigger_px
+
+            if exit_reason != -1:
+                exit_px_net = exit_px - direction * (spread_arr[i] + slippage_arr[i])
+                exit_commission = commission * abs(exit_px_net * size)
+                proceeds = direction * (exit_px_net - entry_px) * size
+                current_cash += (size * entry_px) + proceeds
+                current_cash -= exit_commission
+                n_closed = _exit_position(
+                    k, i, t_ns, exit_px_net, exit_reason,
+                    exit_commission, spread_arr[i] * size, slippage_arr[i] * size,
+                    open_positions, slot_active, closed_trades, n_closed,
+                    record_trades,
+                )
+                if n_closed < 0:
+                    return -1
+
+        # Signals arrive packed one byte per bar (SIG_* bits). Most bars
+        # carry none, so one load and test skips (3) and (4) entirely.
+        flags = signal_flags[i]
+        if flags != 0:
+            # (3) Shifted exit signals ---------------------------------------
+            want_long_exit = (flags & SIG_LONG_EXIT) != 0
+            want_short_exit = (flags & SIG_SHORT_EXIT) != 0
+            if want_long_exit or want_short_exit:
+                for k in range(n_slots):
+                    if slot_active[k] == 0:
+                        continue
+                    direction = open_positions[k, F_DIRECTION]
+                    if (direction > 0 and want_long_exit) or (direction < 0 and want_short_exit):
+                        size = open_positions[k, F_SIZE]
+                        entry_px = open_positions[k, F_ENTRY_PRICE]
+                        exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
+                        exit_commission = commission * abs(exit_px_net * size)
+                        proceeds = direction * (exit_px_net - entry_px) * size
+                        current_cash += (size * entry_px) + proceeds
+                        current_cash -= exit_commission
+                        n_closed = _exit_position(
+                            k, i, t_ns, exit_px_net, EXIT_SIGNAL,
+                            exit_commission, spread_arr[i] * size, slippage_arr[i] * size,
+                            open_positions, slot_active, closed_trades, n_closed,
+                            record_trades,
+                        )
+                        if n_closed < 0:
+                            return -1
+
+            # (4) Shifted entry signals --------------------------------------
+            want_long_entry = (flags & SIG_LONG_ENTRY) != 0
+            want_short_entry = (flags & SIG_SHORT_ENTRY) != 0
+
+            # Non-hedging: flatten opposite-direction positions first
+            if not hedging and (want_long_entry or want_short_entry):
+                desired_dir = 1 if want_long_entry else -1
+                for k in range(n_slots):
+                    if slot_active[k] == 0:
+                        continue
+                    direction = open_positions[k, F_DIRECTION]
+                    if direction != desired_dir:
+                        size = open_positions[k, F_SIZE]
+                        entry_px = open_positions[k, F_ENTRY_PRICE]
+                        exit_px_net = price_o - direction * (spread_arr[i] + slippage_arr[i])
+                        exit_commission = commission * abs(exit_px_net * size)
+                        proceeds = direction * (exit_px_net - entry_px) * size
+                        current_cash += (size * entry_px) + proceeds
+                        current_cash -= exit_commission
+                        n_closed = _exit_position(
+                            k, i, t_ns, exit_px_net, EXIT_SIGNAL,
+                            exit_commission, spread_arr[i] * size, slippage_arr[i] * size,
+                            open_positions, slot_active, closed_trades, n_closed,
+                            record_trades,
+                        )
+                        if n_closed < 0:
+                            return -1
+
+            # Open new positions: long first, then short (matches Python order)
+            for desired_dir in (1, -1):
+                if desired_dir == 1 and not want_long_entry:
+                    continue
+                if desired_dir == -1 and not want_short_entry:
+                    continue
+
+                slot_idx = _find_free_slot(slot_active)
+                if slot_idx == -1:
+                    continue
+
+                entry_px_net = price_o + desired_dir * (spread_arr[i] + slippage_arr[i])
+
+                if sizing_method_code == SIZING_PERCENT_EQUITY:
+                    equity_now = _equity_now(current_cash, price_c, open_positions, slot_active)
+                    size = (sizing_static * equity_now * leverage) / entry_px_net
+                elif sizing_method_code == SIZING_VALUE:
+                    size = (sizing_static * leverage) / entry_px_net
+                elif sizing_method_code == SIZING_PERCENT_AT_RISK:
+                    # size = (risk_pct * equity) / sl_dist; leverage NOT applied.
+                    sl_dist = sl_arr[i]
+                    if np.isnan(sl_dist) or sl_dist <= 0.0:
+                        continue
+                    equity_now = _equity_now(current_cash, price_c, open_positions, slot_active)
+                    size = (sizing_static * equity_now) / sl_dist
+                else:  # SIZING_PRECOMPUTED
+                    size = sizing_array[i]
+
+                if not (size > 0.0) or not np.isfinite(size):
+                    continue
+
+                entry_spread = spread_arr[i] * size
+                entry_slippage = slippage_arr[i] * size
+                entry_commission = commission * abs(entry_px_net * size)
+                margin = size * entry_px_net
+
+                if current_cash < margin + entry_commission:
+                    continue
+                current_cash -= margin + entry_commission
+
+                sl_dist = sl_arr[i]
+                if np.isnan(sl_dist):
+                    sl_price = np.nan
+                else:
+                    sl_price = entry_px_net - desired_dir * sl_dist
+                if np.isnan(tp):
+                    tp_price = np.nan
+                else:
+                    tp_price = entry_px_net + desired_dir * tp
+
+                _enter_position(
+                    slot_idx, desired_dir, i, t_ns, entry_px_net, size,
+                    sl_price, tp_price, ts,
+                    entry_commission, entry_spread, entry_slippage,
+                    open_positions, slot_active,
+                )
+
+        # (5) Mark-to-market ---------------------------------------------
+        unrealized = 0.0
+        margin_held = 0.0
+        for k in range(n_slots):
+            if slot_active[k] == 0:
+                continue
+            d = open_positions[k, F_DIRECTION]
+            unrealized += d * (price_c - open_positions[k, F_ENTRY_PRICE]) * open_positions[k, F_SIZE]
+            margin_held += open_positions[k, F_SIZE] * open_positions[k, F_ENTRY_PRICE]
+            open_positions[k, F_BARS_HELD] = i - int(open_positions[k, F_ENTRY_BAR])
+        equity_out[i] = current_cash + margin_held + unrealized
+        cash_out[i] = current_cash
+
+        # (6) Liquidation ------------------------------------------------
+        if equity_out[i] <= 0.0:
+            total_loss_budget = current_cash + margin_held
+            total_bad = 0.0
+            for k in range(n_slots):
+                if slot_active[k] == 0:
+                    unrealized_by_slot[k] = 0.0
+                    continue
+                u = (open_positions[k, F_DIRECTION]
+                     * (price_c - open_positions[k, F_ENTRY_PRICE])
+                     * open_positions[k, F_SIZE])
+                unrealized_by_slot[k] = u
+                if u < 0.0:
+                    total_bad += -u
+
+            for k in range(n_slots):
+                if slot_active[k] == 0:
+                    continue
+                direction = open_positions[k, F_DIRECTION]
+                size = open_positions[k, F_SIZE]
+                entry_px = open_positions[k, F_ENTRY_PRICE]
+                u = unrealized_by_slot[k]
+                if u >= 0.0 or total_bad == 0.0:
+                    realised_pnl = u
+                    exit_px_net = price_c
+                else:
+                    realised_pnl = -((-u) / total_bad) * total_loss_budget
+                    exit_px_net = entry_px + realised_pnl / (direction * size)
+
+                current_cash += (size * entry_px) + realised_pnl
+                n_closed = _exit_position(
+                    k, i, t_ns, exit_px_net, EXIT_LIQUIDATION,
+                    0.0, 0.0, 0.0,
+                    open_positions, slot_active, closed_trades, n_closed,
+                    record_trades,
+                )
+                if n_closed < 0:
+                    return -1
+
+            equity_out[i] = current_cash
+            cash_out[i] = current_cash
+            # Fill remaining bars with terminal equity
+            cash_out[i + 1:] = current_cash
+            equity_out[i + 1:] = current_cash
+            liquidated = True
+            break
+
+        i += 1
+
+    # --- end-of-data close-out (only if not liquidated) -----------------
+    if not liquidated and n > 0:
+        any_active = False
+        for k in range(n_slots):
+            if slot_active[k] != 0:
+                any_active = True
+                break
+        if any_active:
+            for k in range(n_slots):
+                if slot_active[k] == 0:
+                    continue
+                direction = open_positions[k, F_DIRECTION]
+                size = open_positions[k, F_SIZE]
+                entry_px = open_positions[k, F_ENTRY_PRICE]
+                realised_pnl = direction * (c[n - 1] - entry_px) * size
+                current_cash += (size * entry_px) + realised_pnl
+                n_closed = _exit_position(
+                    k, n - 1, date_ns[n - 1], c[n - 1], EXIT_END_OF_DATA,
+                    0.0, 0.0, 0.0,
+                    open_positions, slot_active, closed_trades, n_closed,
+                    record_trades,
+                )
+                if n_closed < 0:
+                    return -1
+            equity_out[n - 1] = current_cash
+            cash_out[n - 1] = current_cash
+
+    return n_closed
+
+
+# ---------------------------------------------------------------------------
+# Entry points
+# ---------------------------------------------------------------------------
+@njit(cache=True)
+def inner_loop_fast(
+    o, h, l, c, v,
+    date_ns,                   # datetime64[ns] reinterpreted as float64
+    signal_flags,              # shifted signals packed as SIG_* bits, uint8
+    starting_balance,
+    sizing_method_code,
+    sizing_static,
+    sizing_array,              # empty (size 0) when unused
+    sl_arr,
+    tp,
+    ts,
+    leverage,
+    commission,
+    spread_arr,
+    slippage_arr,
+    long_fee_vec,
+    short_fee_vec,
+    hedging,
+    cash_out,                  # length n, pre-allocated
+    equity_out,                # length n, pre-allocated
+    open_positions,            # (n_slots, N_FIELDS)
+    slot_active,               # (n_slots,) uint8
+    closed_trades,             # (n, N_FIELDS)
+):
+    """
+    Fast-path event-driven simulation; drop-in for
+    ``_cy_inner.inner_loop_fast``. Does NOT handle custom sizer.
+    Returns n_closed, or -1 if closed_trades overflowed.
+    """
+    return _simulate(
+        o, h, l, c, date_ns,
+        signal_flags,
+        starting_balance, sizing_method_code, sizing_static, sizing_array,
+        sl_arr, tp, ts, leverage, commission,
+        spread_arr, slippage_arr, long_fee_vec, short_fee_vec,
+        hedging,
+        cash_out, equity_out, open_positions, slot_active, closed_trades,
+        True,
+    )
+
+
+@njit(parallel=True, cache=True)
+def inner_loop_grid(
+    o, h, l, c,
+    date_ns,
+    flags_mat,                 # (K, n) uint8 SIG_* bits, row k = parameter set k
+    starting_balance,
+    sizing_method_code,
+    sizing_static,
+    sizing_array,
+    sl_arr,
+    tp,
+    ts,
+    leverage,
+    commission,
+    spread_arr,
+    slippage_arr,
+    long_fee_vec,
+    short_fee_vec,
+    hedging,
+    n_slots,
+    cash_out,                  # (K, n), pre-allocated
+    equity_out,                # (K, n), pre-allocated
+    n_trades_out,              # (K,) int64
+):
+    """
+    Run K independent backtests — one per signal-flag row — in parallel.
+
+    Every trial shares the same market data and cost arrays; only the
+    signals differ. Per-trial position state is allocated inside the
+    ``prange`` body so workers never share mutable state. Trade logs are
+    not kept (``record_trades=False``); ``n_trades_out[k]`` holds the
+    closed-trade count of trial k.
+
+    Matrices are trial-major (K, n) and C-contiguous, so every per-trial
+    row slice is itself contiguous and Numba compiles ``_simulate`` for
+    contiguous ('C') arrays, the same specialisation as ``inner_loop_fast``.
+    """
+    n_trials = flags_mat.shape[0]
+    no_trades = np.empty((0, N_FIELDS), dtype=np.float64)
+    for k in prange(n_trials):
+        open_positions = np.full((n_slots, N_FIELDS), np.nan)
+        slot_active = np.zeros(n_slots, dtype=np.uint8)
+        n_trades_out[k] = _simulate(
+            o, h, l, c, date_ns,
+            flags_mat[k],
+            starting_balance, sizing_method_code, sizing_static, sizing_array,
+            sl_arr, tp, ts, leverage, commission,
+            spread_arr, slippage_arr, long_fee_vec, short_fee_vec,
+            hedging,
+            cash_out[k], equity_out[k], open_positions, slot_active,
+            no_trades,
+            False,
+        )
+
+
+@njit(cache=True)
+def _pack_shifted(le, lx, se, sx, out):
+    """
+    Shift four signal arrays forward one bar and pack them as SIG_* bits
+    into the uint8 buffer ``out`` (in-kernel twin of
+    ``cython_backtester._pack_signal_flags``).
+    """
+    out[0] = 0
+    for i in range(1, out.shape[0]):
+        f = 0
+        if le[i - 1]:
+            f |= SIG_LONG_ENTRY
+        if lx[i - 1]:
+            f |= SIG_LONG_EXIT
+        if se[i - 1]:
+            f |= SIG_SHORT_ENTRY
+        if sx[i - 1]:
+            f |= SIG_SHORT_EXIT
+        out[i] = f
+
+
+@njit(parallel=True)
+def inner_loop_grid_fused(
+    signal_fn,                 # @njit (o, h, l, c, v, params) -> 4 bool arrays
+    o, h, l, c, v,
+    date_ns,
+    param_mat,                 # (K, P) float64, row k = parameter set k
+    extra_args,                # () or (features,) from preprocess_fn
+    starting_balance,
+    sizing_method_code,
+    sizing_static,
+    sizing_array,
+    sl_arr,
+    tp,
+    ts,
+    leverage,
+    commission,
+    spread_arr,
+    slippage_arr,
+    long_fee_vec,
+    short_fee_vec,
+    hedging,
+    n_slots,
+    cash_out,                  # (K, n), pre-allocated
+    equity_out,                # (K, n), pre-allocated
+    n_trades_out,              # (K,) int64
+):
+    """
+    ``inner_loop_grid`` with signal generation fused into the same kernel.
+
+    Each ``prange`` worker calls the jitted ``signal_fn`` for its parameter
+    row and feeds the result straight into the simulation, so no (K, n)
+    signal matrices are materialised and the indicator math never returns
+    to the interpreter. Not disk-cached: the kernel is specialised on the
+    type of ``signal_fn``, which Numba keys on the dispatcher object, so
+    ``cache=True`` would miss in every new process (and append a cache
+    entry each time). The ~3 s JIT per ``signal_fn`` is why
+    ``run_optimization(fuse="auto")`` only routes large sweeps here.
+
+    ``extra_args`` is splatted after the parameter row: ``()`` normally,
+    ``(features,)`` when a ``preprocess_fn`` is in use. Being a tuple, its
+    length is part of the kernel's type, so the call resolves at compile
+    time.
+
+    ``n_trades_out[k]`` is -1 when trial k's signals had the wrong length.
+    """
+    n = o.shape[0]
+    n_trials = param_mat.shape[0]
+    no_trades = np.empty((0, N_FIELDS), dtype=np.float64)
+    for k in prange(n_trials):
+        le, lx, se, sx = signal_fn(o, h, l, c, v, param_mat[k], *extra_args)
+        # Raising inside prange would serialise the loop; flag the trial
+        # with -1 instead and let the caller raise.
+        if (le.shape[0] != n or lx.shape[0] != n
+                or se.shape[0] != n or sx.shape[0] != n):
+            n_trades_out[k] = -1
+        else:
+            flags = np.empty(n, dtype=np.uint8)
+            _pack_shifted(le, lx, se, sx, flags)
+
+            open_positions = np.full((n_slots, N_FIELDS), np.nan)
+            slot_active = np.zeros(n_slots, dtype=np.uint8)
+            n_trades_out[k] = _simulate(
+                o, h, l, c, date_ns,
+                flags,
+                starting_balance, sizing_method_code, sizing_static, sizing_array,
+                sl_arr, tp, ts, leverage, commission,
+                spread_arr, slippage_arr, long_fee_vec, short_fee_vec,
+                hedging,
+                cash_out[k], equity_out[k], open_positions, slot_active,
+                no_trades,
+                False,
+            )
+
+
+# ---------------------------------------------------------------------------
+# Monte Carlo resampling of a trade-P&L sequence
+# ---------------------------------------------------------------------------
+@njit(parallel=True, cache=True)
+def monte_carlo_trades(
+    pnl,                       # (n_trades,) net P&L per closed trade
+    start_equity,
+    seeds,                     # (K,) uint32, one independent seed per path
+    shuffle,                   # True: permute trades; False: bootstrap
+    final_out,                 # (K,) float64, pre-allocated
+    mdd_out,                   # (K,) float64, pre-allocated
+):
+    """
+    Build K resampled equity paths in parallel and record each path's final
+    equity and peak-to-trough drawdown (negative fraction).
+
+    Numba's RNG state is per thread, so reseeding at the top of every
+    ``prange`` iteration makes path k depend only on ``seeds[k]`` — results
+    are reproducible regardless of thread count or scheduling.
+    """
+    n_trades = pnl.shape[0]
+    for k in prange(seeds.shape[0]):
+        np.random.seed(seeds[k])
+        order = np.arange(n_trades)
+        if shuffle:
+            np.random.shuffle(order)
+        equity = start_equity
+        peak = start_equity
+        mdd = 0.0
+        for j in range(n_trades):
+            if shuffle:
+                equity += pnl[order[j]]
+            else:
+                equity += pnl[np.random.randint(0, n_trades)]
+            peak = max(peak, equity)
+            mdd = min(mdd, (equity - peak) / peak)
+        final_out[k] = equity
+        mdd_out[k] = mdd
@@ -5,7 +5,9 @@ Note on @njit: profiling showed a pure numpy Python loop running ~10x faster
 than an @njit-compiled equivalent on ~10 years of daily data. @njit is
 therefore left off by default. Apply it to the inner loop only if/when
 moving to much larger datasets (e.g. minute data) or large parameter sweeps
-where JIT compile cost amortizes.
+where JIT compile cost amortizes. A straight @njit port of the loop
+lives in _nb_inner.py; cython_backtester uses it only when the Cython
+extension is not built.
 """
 
 from typing import Callable, Optional, Union
@@ -49,6 +51,13 @@ EXIT_TS           = 3
 EXIT_LIQUIDATION  = 4
 EXIT_END_OF_DATA  = 5
 
+# Signal-flag bits. The compiled kernels take the four shifted signal arrays
+# packed into one uint8 per bar (see cython_backtester._pack_signal_flags).
+SIG_LONG_ENTRY  = 1
+SIG_LONG_EXIT   = 2
+SIG_SHORT_ENTRY = 4
+SIG_SHORT_EXIT  = 8
+
 _EXIT_REASON_NAMES = {
     EXIT_SIGNAL:      "signal",
     EXIT_SL:          "sl",
@@ -58,6 +67,20 @@ _EXIT_REASON_NAMES = {
     EXIT_END_OF_DATA: "end_of_data",
 }
 
+# Code-indexed lookup table; the trailing slot catches unknown / NaN codes.
+_EXIT_REASON_LABELS = np.array(
+    [_EXIT_REASON_NAMES[k] for k in sorted(_EXIT_REASON_NAMES)] + ["unknown"],
+    dtype=object,
+)
+
+
+def _exit_reason_labels(codes: np.ndarray) -> np.ndarray:
+    """Map float exit-reason codes to their string labels in one gather."""
+    n_known = _EXIT_REASON_LABELS.size - 1
+    valid = (codes >= 0) & (codes < n_known)  # NaN compares False
+    idx = np.where(valid, codes, n_known).astype(np.int64)
+    return _EXIT_REASON_LABELS[idx]
+
 
 # ---------------------------------------------------------------------------
 # INTERNAL HELPERS — position-array bookkeeping.
@@ -191,6 +214,7 @@ def run_single_backtest(
     hedging: bool = False,
     timeframe: str = "1d",
     *args,
+    validate: bool = True,
 ) -> "Result":
     """
     Run a single backtest over OHLCV and signal arrays.
@@ -199,23 +223,98 @@ def run_single_backtest(
     applied to all open positions regardless of direction; the borrow is the
     direction-dependent component (typically +/- depending on long vs short).
 
+    validate=False skips the NaN / inf / zero scans of the OHLCV values, for
+    data that has already been checked (e.g. repeated runs on one dataset).
+
     Returns a Result object holding timeseries of cash, equity, and all trades.
     """
-    # --- strip & validate OHLCV ----------------------------------------
-    date, o_arr, h_arr, l_arr, c_arr, v_arr = _process_series(o, h, l, c, v)
-    n = o_arr.size
+    inputs = _prepare_inputs(
+        o, h, l, c, v,
+        pip_equals=pip_equals,
+        starting_balance=starting_balance,
+        position_sizing=position_sizing,
+        position_percent_equity=position_percent_equity,
+        position_value=position_value,
+        position_sizes=position_sizes,
+        position_sizing_fn=position_sizing_fn,
+        position_percent_at_risk=position_percent_at_risk,
+        SL=SL, TP=TP, TS=TS,
+        leverage=leverage,
+        commission=commission,
+        spread=spread,
+        slippage=slippage,
+        overnight_charge=overnight_charge,
+        max_positions=max_positions,
+        timeframe=timeframe,
+        validate=validate,
+    )
+    n = inputs["o"].size
 
     # --- signals (shift by +1: close-of-bar signal → next-bar-open fill) ---
-    def _shift(arr):
-        out = np.zeros(n, dtype=bool)
-        if arr.size > 0:
-            out[1:] = arr[:-1]
-        return out
+    long_entries_v  = _shift_signal(long_entries,  n, "long_entries")
+    long_exits_v    = _shift_signal(long_exits,    n, "long_exits")
+    short_entries_v = _shift_signal(short_entries, n, "short_entries")
+    short_exits_v   = _shift_signal(short_exits,   n, "short_exits")
+
+    # --- run ------------------------------------------------------------
+    cash, equity, closed = _inner_loop(
+        **inputs,
+        long_entries_shifted=long_entries_v,
+        long_exits_shifted=long_exits_v,
+        short_entries_shifted=short_entries_v,
+        short_exits_shifted=short_exits_v,
+        hedging=bool(hedging),
+    )
+
+    return Result(cash, equity, closed, timeframe, inputs["date"])
+
+
+def _prepare_inputs(
+    o: pd.Series,
+    h: pd.Series,
+    l: pd.Series,
+    c: pd.Series,
+    v: pd.Series,
+    pip_equals: float = 0.0001,
+    starting_balance: float = 10_000.0,
+    position_sizing: str = "percent_equity",
+    position_percent_equity: Optional[float] = 1.0,
+    position_value: Optional[float] = None,
+    position_sizes: Optional[np.ndarray] = None,
+    position_sizing_fn: Optional[Callable] = None,
+    position_percent_at_risk: Optional[float] = None,
+    SL: Optional[Union[float, np.ndarray]] = None,
+    TP: Optional[float] = None,
+    TS: Optional[float] = None,
+    leverage: float = 1.0,
+    commission: float = 0.0,
+    spread: Union[float, np.ndarray, pd.Series] = 0.0,
+    slippage: Union[float, np.ndarray, pd.Series] = 0.0,
+    overnight_charge: tuple = (0.0, 0.0),
+    max_positions: int = 1,
+    timeframe: str = "1d",
+    validate: bool = True,
+) -> dict:
+    """
+    INTERNAL HELPER — validate and preprocess every non-signal input of
+    ``run_single_backtest`` once.
+
+    Shared by both ``run_single_backtest`` implementations and by
+    ``optimizer.run_optimization``, which prepares the market data a single
+    time and then reuses it across every parameter set.
 
-    long_entries_v  = _shift(_process_signals(long_entries,  n, "long_entries"))
-    long_exits_v    = _shift(_process_signals(long_exits,    n, "long_exits"))
-    short_entries_v = _shift(_process_signals(short_entries, n, "short_entries"))
-    short_exits_v   = _shift(_process_signals(short_exits,   n, "short_exits"))
+    Returns
+    -------
+    dict
+        Keyed by the ``_inner_loop`` parameter names (everything except the
+        four shifted signal arrays and ``hedging``), so callers can pass it
+        straight through as ``_inner_loop(**inputs, ...)``.
+    """
+    # --- strip & validate OHLCV ----------------------------------------
+    date, o_arr, h_arr, l_arr, c_arr, v_arr = _process_series(
+        o, h, l, c, v, validate=validate,
+    )
+    n = o_arr.size
 
     # --- cost-distance inputs are taken from the user in PIPS -----------
     # SL, TP, TS, spread, and slippage are all supplied in pip units for a
@@ -235,7 +334,7 @@ def run_single_backtest(
     # TP and TS are scalars by current design.
     if SL is None:
         sl_arr = np.full(n, np.nan, dtype=np.float64)
-    elif isinstance(SL, (int, float, np.integer, np.floating)):
+    elif isinstance(SL, _SCALAR_TYPES):
         sl_arr = np.full(n, float(SL) * pip_equals, dtype=np.float64)
     else:
         sl_arr = _process_spread_slippage(SL, n, "SL") * pip_equals
@@ -285,13 +384,14 @@ def run_single_backtest(
                 "position_sizing='percent_at_risk' requires a non-None SL "
                 "(the stop defines the risk denominator)."
             )
-        valid_sl = sl_arr[~np.isnan(sl_arr)]
-        if valid_sl.size == 0:
+        # fmin skips NaN without building a masked copy of the SL array;
+        # it only returns NaN when every element is NaN (or there are none).
+        min_sl_dist = float(np.fmin.reduce(sl_arr, initial=np.nan))
+        if np.isnan(min_sl_dist):
             raise ValueError(
                 "position_sizing='percent_at_risk' requires at least one "
                 "non-NaN SL value; the provided SL array is entirely NaN."
             )
-        min_sl_dist = float(valid_sl.min())
         ref_price = float(np.median(c_arr))
         required_leverage = static_size * ref_price / min_sl_dist
         if required_leverage > leverage:
@@ -305,20 +405,37 @@ def run_single_backtest(
                 f"Reduce risk %, widen SL, or increase leverage."
             )
 
-    # --- run ------------------------------------------------------------
-    cash, equity, closed = _inner_loop(
-        date, o_arr, h_arr, l_arr, c_arr, v_arr,
-        long_entries_v, long_exits_v, short_entries_v, short_exits_v,
-        float(starting_balance),
-        method_code, static_size, sizes_array, sizing_fn,
-        sl_arr, tp_val, ts_val,
-        float(leverage), float(commission),
-        spread_arr, slippage_arr,
-        long_fee_vec, short_fee_vec,
-        int(max_positions), bool(hedging),
-    )
+    return {
+        "date": date,
+        "o": o_arr, "h": h_arr, "l": l_arr, "c": c_arr, "v": v_arr,
+        "starting_balance": float(starting_balance),
+        "sizing_method_code": method_code,
+        "sizing_static": static_size,
+        "sizing_array": sizes_array,
+        "sizing_fn": sizing_fn,
+        "sl_arr": sl_arr,
+        "tp": tp_val,
+        "ts": ts_val,
+        "leverage": float(leverage),
+        "commission": float(commission),
+        "spread_arr": spread_arr,
+        "slippage_arr": slippage_arr,
+        "long_fee_vec": long_fee_vec,
+        "short_fee_vec": short_fee_vec,
+        "max_positions": int(max_positions),
+    }
+
+
+def _require_finite(arr: np.ndarray, label: str) -> None:
+    """
+    Raise ValueError if ``arr`` holds any NaN or inf.
 
-    return Result(cash, equity, closed, timeframe, date)
+    A single ``isfinite`` pass covers both cases; the array is only scanned
+    again, to say which one it was, when the check has already failed.
+    """
+    if not np.isfinite(arr).all():
+        kind = "NaN" if np.isnan(arr).any() else "inf"
+        raise ValueError(f"{label} contains {kind} values")
 
 
 def _process_series(
@@ -327,6 +444,8 @@ def _process_series(
     l: pd.Series,
     c: pd.Series,
     v: pd.Series,
+    *,
+    validate: bool = True,
 ) -> tuple:
     """
     Validate 5 OHLCV pandas Series and strip to aligned numpy arrays.
@@ -336,7 +455,8 @@ def _process_series(
         - All 5 have the same length.
         - All 5 share identical indexes (required for correctness of the
           single ``date`` output returned).
-        - No NaN, no inf, no zero values in any series.
+        - No NaN, no inf, no zero values in any series (skipped when
+          ``validate=False``, for data the caller has already checked).
         - Values cast to contiguous float64.
 
     Returns
@@ -380,21 +500,25 @@ def _process_series(
     # Extract date array (shared across all series)
     date = np.asarray(ref_index.values, dtype="datetime64[ns]")
 
-    # Extract + validate each value array
+    # Extract + validate each value array. float64 Series come back as views
+    # of their own buffer; only other dtypes pay for a converting copy.
     arrays = {}
     for name, s in inputs.items():
-        arr = np.ascontiguousarray(s.to_numpy(dtype=np.float64))
-        if np.any(np.isnan(arr)):
-            raise ValueError(f"{name!r} contains NaN values")
-        if np.any(np.isinf(arr)):
-            raise ValueError(f"{name!r} contains inf values")
-        if np.any(arr == 0):
-            raise ValueError(f"{name!r} contains zero values")
+        arr = np.ascontiguousarray(s.to_numpy(dtype=np.float64, copy=False))
+        if validate:
+            _require_finite(arr, repr(name))
+            if not arr.all():
+                raise ValueError(f"{name!r} contains zero values")
         arrays[name] = arr
 
     return date, arrays["o"], arrays["h"], arrays["l"], arrays["c"], arrays["v"]
 
 
+# Scalar types accepted wherever a number may stand in for a per-bar array.
+# Built once here rather than as a fresh tuple at every isinstance call;
+# array inputs are tested first since they are the common case in sweeps.
+_SCALAR_TYPES = (int, float, np.integer, np.floating)
+
 _SIZING_METHODS = ("percent_equity", "value", "precomputed", "custom", "percent_at_risk")
 _SIZING_CODES = {name: i for i, name in enumerate(_SIZING_METHODS)}
 
@@ -438,10 +562,10 @@ def _process_signals(
     if signals is None:
         return np.zeros(n, dtype=bool)
 
-    if isinstance(signals, pd.Series):
-        arr = signals.to_numpy()
-    elif isinstance(signals, np.ndarray):
+    if isinstance(signals, np.ndarray):
         arr = signals
+    elif isinstance(signals, pd.Series):
+        arr = signals.to_numpy()
     else:
         raise TypeError(
             f"{name} must be np.ndarray, pd.Series, or None, "
@@ -455,7 +579,34 @@ def _process_signals(
             f"{name} length {arr.size} does not match required {n}"
         )
 
-    return np.ascontiguousarray(arr.astype(bool))
+    return np.ascontiguousarray(arr, dtype=bool)
+
+
+def _shift_signal(
+    signals: Optional[Union[np.ndarray, pd.Series]],
+    n: int,
+    name: str = "signals",
+) -> np.ndarray:
+    """
+    INTERNAL HELPER — validate a signal input via ``_process_signals`` and
+    shift it by +1 bar (close-of-bar signal → next-bar-open fill).
+
+    The shifted copy is the only allocation: bool input is not copied by
+    ``_process_signals``, and ``None`` goes straight to a single all-False
+    array. The caller's array is never written to.
+
+    Returns
+    -------
+    np.ndarray
+        Length-n, contiguous, dtype=bool, with ``out[0] = False``.
+    """
+    if signals is None:
+        return np.zeros(n, dtype=bool)
+    arr = _process_signals(signals, n, name)
+    out = np.empty(n, dtype=bool)
+    out[:1] = False
+    out[1:] = arr[:-1]
+    return out
 
 
 def _process_position_sizing(
@@ -534,7 +685,7 @@ def _process_position_sizing(
             raise ValueError(
                 "position_sizing='percent_equity' requires position_percent_equity"
             )
-        if not isinstance(position_percent_equity, (int, float, np.integer, np.floating)):
+        if not isinstance(position_percent_equity, _SCALAR_TYPES):
             raise TypeError("position_percent_equity must be a number")
         if not np.isfinite(position_percent_equity) or position_percent_equity <= 0:
             raise ValueError(
@@ -548,7 +699,7 @@ def _process_position_sizing(
             raise ValueError(
                 "position_sizing='value' requires position_value"
             )
-        if not isinstance(position_value, (int, float, np.integer, np.floating)):
+        if not isinstance(position_value, _SCALAR_TYPES):
             raise TypeError("position_value must be a number")
         if not np.isfinite(position_value) or position_value <= 0:
             raise ValueError(
@@ -562,10 +713,10 @@ def _process_position_sizing(
             raise ValueError(
                 "position_sizing='precomputed' requires position_sizes"
             )
-        if isinstance(position_sizes, pd.Series):
-            arr = np.ascontiguousarray(position_sizes.to_numpy(dtype=np.float64))
-        elif isinstance(position_sizes, np.ndarray):
+        if isinstance(position_sizes, np.ndarray):
             arr = np.ascontiguousarray(position_sizes, dtype=np.float64)
+        elif isinstance(position_sizes, pd.Series):
+            arr = np.ascontiguousarray(position_sizes.to_numpy(dtype=np.float64))
         else:
             raise TypeError(
                 f"position_sizes must be np.ndarray or pd.Series, "
@@ -577,10 +728,7 @@ def _process_position_sizing(
             raise ValueError(
                 f"position_sizes length {arr.size} does not match n={n}"
             )
-        if np.any(np.isnan(arr)):
-            raise ValueError("position_sizes contains NaN values")
-        if np.any(np.isinf(arr)):
-            raise ValueError("position_sizes contains inf values")
+        _require_finite(arr, "position_sizes")
         if np.any(arr < 0):
             raise ValueError("position_sizes contains negative values")
         sizes_array = arr
@@ -599,8 +747,7 @@ def _process_position_sizing(
             raise ValueError(
                 "position_sizing='percent_at_risk' requires position_percent_at_risk"
             )
-        if not isinstance(position_percent_at_risk,
-                          (int, float, np.integer, np.floating)):
+        if not isinstance(position_percent_at_risk, _SCALAR_TYPES):
             raise TypeError("position_percent_at_risk must be a number")
         if (not np.isfinite(position_percent_at_risk)
                 or position_percent_at_risk <= 0
@@ -648,16 +795,16 @@ def _process_spread_slippage(
         On wrong length, NaN, or inf.
     """
     # Scalar path
-    if isinstance(value, (int, float, np.integer, np.floating)):
+    if isinstance(value, _SCALAR_TYPES):
         if not np.isfinite(value):
             raise ValueError(f"{name} scalar must be finite, got {value!r}")
         return np.full(n, float(value), dtype=np.float64)
 
     # Array-like path
-    if isinstance(value, pd.Series):
-        arr = np.ascontiguousarray(value.to_numpy(dtype=np.float64))
-    elif isinstance(value, np.ndarray):
+    if isinstance(value, np.ndarray):
         arr = np.ascontiguousarray(value, dtype=np.float64)
+    elif isinstance(value, pd.Series):
+        arr = np.ascontiguousarray(value.to_numpy(dtype=np.float64))
     else:
         raise TypeError(
             f"{name} must be a scalar, numpy array, or pandas Series, "
@@ -670,10 +817,7 @@ def _process_spread_slippage(
         raise ValueError(
             f"{name} array length {arr.size} does not match required {n}"
         )
-    if np.any(np.isnan(arr)):
-        raise ValueError(f"{name} contains NaN values")
-    if np.any(np.isinf(arr)):
-        raise ValueError(f"{name} contains inf values")
+    _require_finite(arr, name)
 
     return arr
 
@@ -792,9 +936,10 @@ def _process_overnight_charge(
     if isinstance(date, pd.Series):
         date_arr = np.ascontiguousarray(date.to_numpy(dtype="datetime64[ns]"))
     elif isinstance(date, pd.DatetimeIndex):
-        date_arr = np.ascontiguousarray(date.values.astype("datetime64[ns]"))
+        date_arr = np.ascontiguousarray(
+            date.values.astype("datetime64[ns]", copy=False))
     elif isinstance(date, np.ndarray):
-        date_arr = np.ascontiguousarray(date.astype("datetime64[ns]"))
+        date_arr = np.ascontiguousarray(date.astype("datetime64[ns]", copy=False))
     else:
         raise TypeError(
             f"date must be np.ndarray, pd.Series, or pd.DatetimeIndex, "
@@ -833,7 +978,7 @@ def _process_overnight_charge(
     ).astype(np.float64)
 
     # ---- bucket into bars ------------------------------------------------
-    rollover_ns = rollovers.values.astype("datetime64[ns]")
+    rollover_ns = rollovers.values.astype("datetime64[ns]", copy=False)
     bar_idx = np.searchsorted(date_arr, rollover_ns, side="left")
 
     # drop any that fall past the last bar (shouldn't happen given t_end
@@ -843,10 +988,10 @@ def _process_overnight_charge(
     weights = weights[valid]
 
     # ---- accumulate into per-bar vectors --------------------------------
-    long_vec = np.zeros(n, dtype=np.float64)
-    short_vec = np.zeros(n, dtype=np.float64)
-    np.add.at(long_vec, bar_idx, weights * long_daily)
-    np.add.at(short_vec, bar_idx, weights * short_daily)
+    # bincount sums in one buffered pass; np.add.at is unbuffered and far
+    # slower on long intraday series.
+    long_vec = np.bincount(bar_idx, weights * long_daily, minlength=n)
+    short_vec = np.bincount(bar_idx, weights * short_daily, minlength=n)
 
     return long_vec, short_vec
 
@@ -972,16 +1117,48 @@ def _inner_loop(
     # See _exit_position for the overflow caveat. n_bars is the memory-
     # efficient upper bound for typical use; runtime check guards against
     # pathological cases.
-    closed_trades = np.full((n, N_FIELDS), np.nan, dtype=np.float64)
+    #
+    # Column-major (order="F") so the trade log is a struct-of-arrays: each
+    # F_* field is one contiguous column. Writes happen once per closed
+    # trade; reads in Result are whole-column (t[:, F_X]) on every metric,
+    # so the layout favours the reader.
+    #
+    # np.empty, not np.full: every row is written whole by _exit_position
+    # before n_closed moves past it, and only [:n_closed] is returned, so
+    # a NaN fill would be an n x N_FIELDS memset nobody reads.
+    closed_trades = np.empty((n, N_FIELDS), dtype=np.float64, order="F")
     n_closed = 0
 
     current_cash = starting_balance
 
-    # Convenience: date as int64 ns for fast assignment into float rows
-    date_ns = date.astype("datetime64[ns]").astype(np.int64)
+    # Convenience: date as int64 ns for fast assignment into float rows.
+    # A view, not a copy — the bits of datetime64[ns] already are int64 ns.
+    date_ns = date.astype("datetime64[ns]", copy=False).view(np.int64)
+
+    # Bars carrying any signal; everything else is skippable while flat
+    has_signal = (long_entries_shifted | long_exits_shifted
+                  | short_entries_shifted | short_exits_shifted)
+    signal_bars = np.flatnonzero(has_signal)
+
+    # TS is one scalar, so whether slots carry a trailing stop is fixed for
+    # the whole run; test it once instead of per slot per bar.
+    has_ts = not np.isnan(ts)
 
     # --- main loop ------------------------------------------------------
-    for i in range(n):
+    i = 0
+    while i < n:
+        # Flat fast-forward: with no open slot and no signal a bar changes
+        # nothing, so equity is just cash. Jump to the next bar carrying a
+        # signal and fill the gap with one slice assignment. (Non-positive
+        # cash takes the normal path so liquidation still fires.)
+        if not has_signal[i] and current_cash > 0 and not slot_active.any():
+            pos = np.searchsorted(signal_bars, i)
+            j = int(signal_bars[pos]) if pos < signal_bars.size else n
+            cash[i:j] = current_cash
+            equity[i:j] = current_cash
+            i = j
+            continue
+
         price_o = o[i]
         price_h = h[i]
         price_l = l[i]
@@ -1013,7 +1190,7 @@ def _inner_loop(
 
             # Update trailing-stop peak
             ts_dist = row[F_TS_DIST]
-            if not np.isnan(ts_dist):
+            if has_ts:
                 if direction > 0 and price_h > row[F_TS_PEAK]:
                     row[F_TS_PEAK] = price_h
                 elif direction < 0 and price_l < row[F_TS_PEAK]:
@@ -1032,36 +1209,37 @@ def _inner_loop(
                 row[F_MFE] = best_pnl
 
             # SL / TP / TS checks. SL wins if both SL and TP would hit.
+            # Unset levels are NaN (a NaN ts_dist makes the trigger NaN too)
+            # and any ordered comparison with NaN is False, so they never
+            # fire and need no isnan() guard.
             sl_px = row[F_SL]
             tp_px = row[F_TP]
-            ts_trigger_px = np.nan
-            if not np.isnan(ts_dist):
-                if direction > 0:
-                    ts_trigger_px = row[F_TS_PEAK] - ts_dist
-                else:
-                    ts_trigger_px = row[F_TS_PEAK] + ts_dist
+            if direction > 0:
+                ts_trigger_px = row[F_TS_PEAK] - ts_dist
+            else:
+                ts_trigger_px = row[F_TS_PEAK] + ts_dist
 
             # Determine which (if any) fires. SL has priority over TP.
             exit_reason = -1
             exit_px = np.nan
             if direction > 0:
-                if not np.isnan(sl_px) and price_l <= sl_px:
+                if price_l <= sl_px:
                     exit_reason = EXIT_SL
                     exit_px = sl_px
-                elif not np.isnan(tp_px) and price_h >= tp_px:
+                elif price_h >= tp_px:
                     exit_reason = EXIT_TP
                     exit_px = tp_px
-                elif not np.isnan(ts_trigger_px) and price_l <= ts_trigger_px:
+                elif price_l <= ts_trigger_px:
                     exit_reason = EXIT_TS
                     exit_px = ts_trigger_px
             else:  # short
-                if not np.isnan(sl_px) and price_h >= sl_px:
+                if price_h >= sl_px:
                     exit_reason = EXIT_SL
                     exit_px = sl_px
-                elif not np.isnan(tp_px) and price_l <= tp_px:
+                elif price_l <= tp_px:
                     exit_reason = EXIT_TP
                     exit_px = tp_px
-                elif not np.isnan(ts_trigger_px) and price_h >= ts_trigger_px:
+                elif price_h >= ts_trigger_px:
                     exit_reason = EXIT_TS
                     exit_px = ts_trigger_px
 
@@ -1296,6 +1474,8 @@ def _inner_loop(
                 equity[i + 1:] = current_cash
             break
 
+        i += 1
+
     # --- end-of-data close-out -----------------------------------------
     # Any position still open when we run out of bars is closed at the
     # final bar's close price, with exit_reason = EXIT_END_OF_DATA.
@@ -1395,7 +1575,8 @@ class Result:
 
     ``self.trades`` is a 2D float64 ndarray of shape (n_trades, N_FIELDS).
     Column layout matches the F_* constants at module top. Empty trades
-    (zero rows) are valid.
+    (zero rows) are valid. The inner loops emit it column-major, so each
+    ``trades[:, F_X]`` field slice is contiguous.
 
     Convention: ``risk_free`` and Omega ``threshold`` are ANNUAL rates,
     converted to per-bar internally using ``self.timeframe``.
@@ -1812,13 +1993,39 @@ class Result:
                 "commission", "spread_cost", "slippage_cost", "overnight",
                 "mae", "mfe", "exit_reason", "bars_held", "pnl",
             ])
-        df = pd.DataFrame({
+        return pd.DataFrame(self._trade_columns())
+
+    def trades_to_polars(self):
+        """
+        Return the trade log as a polars DataFrame, with the same columns
+        and dtypes as ``trades_to_dataframe``.
+
+        Built straight from the column-major trade log (each field is one
+        contiguous column), with no pandas intermediate. Requires polars
+        (``pip install "chronoton[polars]"``).
+        """
+        try:
+            import polars as pl
+        except ImportError as exc:
+            raise ImportError(
+                "trades_to_polars requires polars; install it with "
+                "pip install \"chronoton[polars]\""
+            ) from exc
+        cols = self._trade_columns()
+        cols["exit_reason"] = cols["exit_reason"].astype(str)
+        return pl.DataFrame(cols)
+
+    def _trade_columns(self) -> dict:
+        """Trade-log fields as named numpy columns, shared by the exporters."""
+        t = self.trades
+        ns = "datetime64[ns]"
+        return {
             "direction":       t[:, F_DIRECTION].astype(np.int8),
             "entry_bar":       t[:, F_ENTRY_BAR].astype(np.int64),
-            "entry_time":      pd.to_datetime(t[:, F_ENTRY_TIME].astype(np.int64)),
+            "entry_time":      t[:, F_ENTRY_TIME].astype(np.int64).view(ns),
             "entry_price":     t[:, F_ENTRY_PRICE],
             "exit_bar":        t[:, F_EXIT_BAR].astype(np.int64),
-            "exit_time":       pd.to_datetime(t[:, F_EXIT_TIME].astype(np.int64)),
+            "exit_time":       t[:, F_EXIT_TIME].astype(np.int64).view(ns),
             "exit_price":      t[:, F_EXIT_PRICE],
             "size":            t[:, F_SIZE],
             "sl":              t[:, F_SL],
@@ -1831,14 +2038,10 @@ class Result:
             "overnight":       t[:, F_OVERNIGHT],
             "mae":             t[:, F_MAE],
             "mfe":             t[:, F_MFE],
-            "exit_reason":     [
-                _EXIT_REASON_NAMES.get(int(c), "unknown")
-                for c in t[:, F_EXIT_REASON]
-            ],
+            "exit_reason":     _exit_reason_labels(t[:, F_EXIT_REASON]),
             "bars_held":       t[:, F_BARS_HELD].astype(np.int64),
             "pnl":             self._pnl(),
-        })
-        return df
+        }
 
     # ------------------------------------------------------------------ #
     # Plotting helpers                                                   #
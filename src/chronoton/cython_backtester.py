@@ -1,26 +1,38 @@
 """
-cython_backtester1.py — public dispatcher for the Cython-accelerated backtester.
+cython_backtester.py — public dispatcher for the compiled backtester.
 
-Same public API as ``backtester.run_single_backtest``, but routes through the
-compiled fast-path (``_cy_inner.so``/``pyd``) when possible and falls back to
-the pure-Python ``_inner_loop`` in ``backtester.py`` for the custom-sizer
-path. All validation, preprocessing, and Result-wrapping logic is reused
-from ``backtester.py`` — this file is a thin shim.
+Same public API as ``backtester.run_single_backtest``, but routes through a
+compiled fast path when possible and falls back to the pure-Python
+``_inner_loop`` in ``backtester.py`` for the custom-sizer path. All
+validation, preprocessing, and Result-wrapping logic is reused from
+``backtester.py`` — this file is a thin shim.
+
+Fast-path kernels, in order of preference:
+    1. ``_cy_inner``  — Cython extension, compiled ahead of time on install.
+    2. ``_nb_inner``  — Numba JIT port of the same loop. Needs no C compiler;
+                        used only when the Cython build is missing. Imported
+                        lazily so Numba's import cost is never paid when the
+                        Cython extension is present.
 
 Public API:
     run_single_backtest(...)   # drop-in replacement for backtester.run_single_backtest
     Result                      # re-exported for convenience
+    cython_available(), cython_import_error()
+    numba_available(), numba_import_error(), numba_precompile()
 
 Private:
-    _inner_loop_cy(...)         # wrapper that adapts dtypes and calls _cy_inner
+    _inner_loop_cy(...)         # wrapper that adapts dtypes and calls a compiled kernel
+    _pack_signal_flags(...)     # four signal arrays -> one uint8 SIG_* flag array
     _should_use_fast_path(...)  # tiny heuristic
+    _run_prepared(...)          # dispatch prepared inputs to the chosen loop
 
 The import graph:
 
-    cython_backtester1.py   ← public API
+    cython_backtester.py    ← public API
         │
         ├── backtester (all preprocessors, Result, constants, Python loop)
-        └── _cy_inner           ← compiled .so; fast path only
+        ├── _cy_inner           ← compiled .so; preferred fast path
+        └── _nb_inner           ← Numba JIT; fast path when _cy_inner is absent
 """
 
 from __future__ import annotations
@@ -37,8 +49,10 @@ from .backtester import (
     # Public
     Result,
     # Preprocessors
+    _prepare_inputs,
     _process_series,
     _process_signals,
+    _shift_signal,
     _process_spread_slippage,
     _process_position_sizing,
     _process_overnight_charge,
@@ -51,6 +65,7 @@ from .backtester import (
     _exit_position,
     # Misc helpers used by tests
     _longest_run_of_true,
+    _exit_reason_labels,
     # Field layout & exit-reason constants (re-exported for test suites)
     F_DIRECTION, F_ENTRY_BAR, F_ENTRY_TIME, F_ENTRY_PRICE,
     F_EXIT_BAR, F_EXIT_TIME, F_EXIT_PRICE, F_SIZE,
@@ -60,6 +75,7 @@ from .backtester import (
     EXIT_SIGNAL, EXIT_SL, EXIT_TP, EXIT_TS,
     EXIT_LIQUIDATION, EXIT_END_OF_DATA,
     _EXIT_REASON_NAMES,
+    SIG_LONG_ENTRY, SIG_LONG_EXIT, SIG_SHORT_ENTRY, SIG_SHORT_EXIT,
 )
 
 try:
@@ -69,10 +85,61 @@ except ImportError as exc:
     _CYTHON_AVAILABLE = False
     _CYTHON_IMPORT_ERROR = exc
 
+# The Numba kernel is resolved on first use (see _load_numba_kernel).
+_NUMBA_KERNEL = None
+_NUMBA_IMPORT_ERROR = None
+
+
+def _load_numba_kernel():
+    """
+    Import the Numba fast path on first call and cache the outcome.
+    Returns the ``inner_loop_fast`` kernel, or None if Numba is unavailable.
+    """
+    global _NUMBA_KERNEL, _NUMBA_IMPORT_ERROR
+    if _NUMBA_KERNEL is None and _NUMBA_IMPORT_ERROR is None:
+        try:
+            from ._nb_inner import inner_loop_fast
+            _NUMBA_KERNEL = inner_loop_fast
+        except ImportError as exc:
+            _NUMBA_IMPORT_ERROR = exc
+    return _NUMBA_KERNEL
+
 
 # ---------------------------------------------------------------------------
 # Fast-path wrapper
 # ---------------------------------------------------------------------------
+def _readonly(arr, dtype=np.float64) -> np.ndarray:
+    """
+    ``arr`` as a contiguous ``dtype`` array behind a read-only view (no copy
+    if already so). Numba compiles one specialisation per argument
+    writability, and pandas hands back read-only views of float64 data but
+    writable copies of anything it casts, so every kernel input goes in
+    read-only to keep to the signatures ``numba_precompile`` built.
+    """
+    view = np.ascontiguousarray(arr, dtype=dtype).view()
+    view.flags.writeable = False
+    return view
+
+
+def _pack_signal_flags(
+    long_entries: np.ndarray,
+    long_exits: np.ndarray,
+    short_entries: np.ndarray,
+    short_exits: np.ndarray,
+) -> np.ndarray:
+    """
+    Pack four same-shape bool signal arrays into one uint8 array of SIG_*
+    bits (``long_entries | long_exits << 1 | short_entries << 2 |
+    short_exits << 3``). Works for 1-D arrays and for (K, n) matrices.
+    """
+    flags = np.zeros(np.shape(long_entries), dtype=np.uint8)
+    for sig, bit in ((long_entries, SIG_LONG_ENTRY), (long_exits, SIG_LONG_EXIT),
+                     (short_entries, SIG_SHORT_ENTRY), (short_exits, SIG_SHORT_EXIT)):
+        # bool and uint8 are both one byte, so the view is free.
+        flags |= np.ascontiguousarray(sig, dtype=bool).view(np.uint8) * np.uint8(bit)
+    return flags
+
+
 def _inner_loop_cy(
     date: np.ndarray,
     o: np.ndarray, h: np.ndarray, l: np.ndarray,
@@ -96,11 +163,14 @@ def _inner_loop_cy(
     short_fee_vec: np.ndarray,
     max_positions: int,
     hedging: bool,
+    *,
+    kernel: Optional[Callable] = None,
 ) -> tuple:
     """
-    Wrap the compiled ``inner_loop_fast``: allocate output buffers, convert
-    bool signal arrays to uint8 (required by the ``unsigned char[:]``
-    memoryview contract on the Cython side), call the compiled loop,
+    Wrap a compiled ``inner_loop_fast`` (Cython if built, else Numba;
+    ``kernel`` overrides the choice):
+    allocate output buffers, pack the four bool signal arrays into one
+    uint8 flag array (``_pack_signal_flags``), call the compiled loop,
     trim the trade-log to the returned row count, and return
     ``(cash, equity, closed_trades)``.
 
@@ -119,52 +189,55 @@ def _inner_loop_cy(
     equity_out = np.empty(n, dtype=np.float64)
     open_positions = np.full((n_slots, N_FIELDS), np.nan, dtype=np.float64)
     slot_active = np.zeros(n_slots, dtype=np.uint8)
-    # Matches pure-Python convention: n rows is a safe upper bound
-    closed_trades = np.full((n, N_FIELDS), np.nan, dtype=np.float64)
-
-    # Signal arrays: bool → uint8 (memoryview type contract)
-    long_entries_u8 = long_entries_shifted.astype(np.uint8, copy=False)
-    long_exits_u8   = long_exits_shifted.astype(np.uint8, copy=False)
-    short_entries_u8 = short_entries_shifted.astype(np.uint8, copy=False)
-    short_exits_u8   = short_exits_shifted.astype(np.uint8, copy=False)
+    # Matches pure-Python convention: n rows is a safe upper bound, stored
+    # column-major so Result reads each field as a contiguous column.
+    # Uninitialised: rows are written whole on close and trimmed to n_closed.
+    closed_trades = np.empty((n, N_FIELDS), dtype=np.float64, order="F")
+
+    # One flag byte per bar instead of four signal arrays: the kernels
+    # load and test a single byte, and skip all signal handling when it is 0.
+    signal_flags = _pack_signal_flags(
+        long_entries_shifted, long_exits_shifted,
+        short_entries_shifted, short_exits_shifted,
+    )
 
     # date is datetime64[ns]; view as int64 then cast to float64 so it
-    # fits into a double-typed memoryview. Precision loss is negligible
+    # fits into a double-typed memoryview. The view is free, so the float
+    # cast is the only copy. Precision loss is negligible
     # for the nanosecond range covered by practical backtest horizons
     # (~±292 years from 1970 before float64 starts losing ns precision).
-    date_ns = date.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    date_ns = date.astype("datetime64[ns]", copy=False).view(np.int64).astype(np.float64)
 
     # Empty sentinel array when sizing_array isn't used, so the memoryview
     # binding still succeeds with a zero-length view.
     if sizing_array is None or sizing_array.size == 0:
         sizing_array = np.empty(0, dtype=np.float64)
-    else:
-        sizing_array = np.ascontiguousarray(sizing_array, dtype=np.float64)
-
-    n_closed = _inner_loop_fast_raw(
-        np.ascontiguousarray(o, dtype=np.float64),
-        np.ascontiguousarray(h, dtype=np.float64),
-        np.ascontiguousarray(l, dtype=np.float64),
-        np.ascontiguousarray(c, dtype=np.float64),
-        np.ascontiguousarray(v, dtype=np.float64),
-        np.ascontiguousarray(date_ns, dtype=np.float64),
-        np.ascontiguousarray(long_entries_u8, dtype=np.uint8),
-        np.ascontiguousarray(long_exits_u8, dtype=np.uint8),
-        np.ascontiguousarray(short_entries_u8, dtype=np.uint8),
-        np.ascontiguousarray(short_exits_u8, dtype=np.uint8),
+
+    # Inputs go in read-only (``_readonly``); the Cython kernel takes them
+    # as const memoryviews, so either backend accepts them.
+    if kernel is None:
+        kernel = _inner_loop_fast_raw if _CYTHON_AVAILABLE else _load_numba_kernel()
+    n_closed = kernel(
+        _readonly(o),
+        _readonly(h),
+        _readonly(l),
+        _readonly(c),
+        _readonly(v),
+        _readonly(date_ns),
+        _readonly(signal_flags, np.uint8),
         float(starting_balance),
         int(sizing_method_code),
         float(sizing_static),
-        sizing_array,
-        np.ascontiguousarray(sl_arr, dtype=np.float64),
+        _readonly(sizing_array),
+        _readonly(sl_arr),
         float(tp),
         float(ts),
         float(leverage),
         float(commission),
-        np.ascontiguousarray(spread_arr, dtype=np.float64),
-        np.ascontiguousarray(slippage_arr, dtype=np.float64),
-        np.ascontiguousarray(long_fee_vec, dtype=np.float64),
-        np.ascontiguousarray(short_fee_vec, dtype=np.float64),
+        _readonly(spread_arr),
+        _readonly(slippage_arr),
+        _readonly(long_fee_vec),
+        _readonly(short_fee_vec),
         bool(hedging),
         cash_out,
         equity_out,
@@ -175,7 +248,7 @@ def _inner_loop_cy(
 
     if n_closed < 0:
         raise RuntimeError(
-            "closed_trades pre-allocation exhausted in Cython inner loop. "
+            "closed_trades pre-allocation exhausted in compiled inner loop. "
             "Very short trades with high max_positions can exceed the default "
             "n_bars cap."
         )
@@ -189,11 +262,13 @@ def _inner_loop_cy(
 def _should_use_fast_path(sizing_method_code: int) -> bool:
     """
     Fast path applies when:
-        - The compiled extension is available.
+        - A compiled kernel is available (Cython extension, or Numba).
         - Sizing is not 'custom' (method_code != 3); a Python callable can't
           cross the nogil boundary.
     """
-    return _CYTHON_AVAILABLE and sizing_method_code != 3
+    if sizing_method_code == 3:
+        return False
+    return _CYTHON_AVAILABLE or _load_numba_kernel() is not None
 
 
 # ---------------------------------------------------------------------------
@@ -231,126 +306,81 @@ def run_single_backtest(
     hedging: bool = False,
     timeframe: str = "1d",
     *args,
+    validate: bool = True,
 ) -> Result:
     """
     Run a single backtest. Drop-in replacement for
     ``backtester.run_single_backtest``. Routes through the compiled Cython
-    fast path when possible; falls back to the pure-Python loop for the
-    custom-sizer case or when the extension is not built.
+    fast path when possible, then the Numba JIT port; falls back to the
+    pure-Python loop for the custom-sizer case or when neither is available.
 
     See ``backtester.run_single_backtest`` for full parameter semantics.
     """
-    # --- strip & validate OHLCV ---------------------------------------
-    date, o_arr, h_arr, l_arr, c_arr, v_arr = _process_series(o, h, l, c, v)
-    n = o_arr.size
-
-    # --- signals (shift by +1) ---------------------------------------
-    def _shift(arr):
-        out = np.zeros(n, dtype=bool)
-        if arr.size > 0:
-            out[1:] = arr[:-1]
-        return out
-
-    long_entries_v  = _shift(_process_signals(long_entries,  n, "long_entries"))
-    long_exits_v    = _shift(_process_signals(long_exits,    n, "long_exits"))
-    short_entries_v = _shift(_process_signals(short_entries, n, "short_entries"))
-    short_exits_v   = _shift(_process_signals(short_exits,   n, "short_exits"))
-
-    # --- cost-distance inputs are taken from the user in PIPS -----------
-    # SL, TP, TS, spread, and slippage are all supplied in pip units and
-    # converted to price-unit distances here. See backtester.py for detail.
-
-    # --- spread / slippage (pips → price units) ----------------------
-    spread_arr   = _process_spread_slippage(spread,   n, "spread")   * pip_equals
-    slippage_arr = _process_spread_slippage(slippage, n, "slippage") * pip_equals
-
-    # --- SL / TP / TS (pips → price units) ---------------------------
-    if SL is None:
-        sl_arr = np.full(n, np.nan, dtype=np.float64)
-    elif isinstance(SL, (int, float, np.integer, np.floating)):
-        sl_arr = np.full(n, float(SL) * pip_equals, dtype=np.float64)
-    else:
-        sl_arr = _process_spread_slippage(SL, n, "SL") * pip_equals
-
-    tp_val = float("nan") if TP is None else float(TP) * pip_equals
-    ts_val = float("nan") if TS is None else float(TS) * pip_equals
-
-    # --- position sizing ---------------------------------------------
-    method_code, static_size, sizes_array, sizing_fn = _process_position_sizing(
-        position_sizing, position_percent_equity, position_value,
-        position_sizes, position_sizing_fn, n,
+    inputs = _prepare_inputs(
+        o, h, l, c, v,
+        pip_equals=pip_equals,
+        starting_balance=starting_balance,
+        position_sizing=position_sizing,
+        position_percent_equity=position_percent_equity,
+        position_value=position_value,
+        position_sizes=position_sizes,
+        position_sizing_fn=position_sizing_fn,
         position_percent_at_risk=position_percent_at_risk,
+        SL=SL, TP=TP, TS=TS,
+        leverage=leverage,
+        commission=commission,
+        spread=spread,
+        slippage=slippage,
+        overnight_charge=overnight_charge,
+        max_positions=max_positions,
+        timeframe=timeframe,
+        validate=validate,
     )
+    n = inputs["o"].size
 
-    # --- overnight financing -----------------------------------------
-    long_fee_vec, short_fee_vec = _process_overnight_charge(
-        overnight_charge, timeframe, date,
+    # --- signals (shift by +1) ---------------------------------------
+    long_entries_v  = _shift_signal(long_entries,  n, "long_entries")
+    long_exits_v    = _shift_signal(long_exits,    n, "long_exits")
+    short_entries_v = _shift_signal(short_entries, n, "short_entries")
+    short_exits_v   = _shift_signal(short_exits,   n, "short_exits")
+
+    cash, equity, closed = _run_prepared(
+        inputs,
+        long_entries_v, long_exits_v, short_entries_v, short_exits_v,
+        hedging,
     )
+    return Result(cash, equity, closed, timeframe, inputs["date"])
 
-    # --- scalar validation -------------------------------------------
-    if leverage <= 0 or not np.isfinite(leverage):
-        raise ValueError(f"leverage must be positive finite, got {leverage!r}")
-    if commission < 0 or not np.isfinite(commission):
-        raise ValueError(f"commission must be non-negative finite, got {commission!r}")
-    if starting_balance <= 0 or not np.isfinite(starting_balance):
-        raise ValueError("starting_balance must be positive finite")
-    if not isinstance(max_positions, (int, np.integer)) or max_positions < 1:
-        raise ValueError("max_positions must be an int >= 1")
-
-    # --- percent_at_risk sanity check (see backtester.py for detail) -
-    if method_code == 4:  # percent_at_risk
-        if SL is None:
-            raise ValueError(
-                "position_sizing='percent_at_risk' requires a non-None SL "
-                "(the stop defines the risk denominator)."
-            )
-        valid_sl = sl_arr[~np.isnan(sl_arr)]
-        if valid_sl.size == 0:
-            raise ValueError(
-                "position_sizing='percent_at_risk' requires at least one "
-                "non-NaN SL value; the provided SL array is entirely NaN."
-            )
-        min_sl_dist = float(valid_sl.min())
-        ref_price = float(np.median(c_arr))
-        required_leverage = static_size * ref_price / min_sl_dist
-        if required_leverage > leverage:
-            min_sl_pips = min_sl_dist / pip_equals
-            raise ValueError(
-                f"percent_at_risk={static_size} with tightest SL={min_sl_dist:.6f} "
-                f"({min_sl_pips:.2f} pips at pip_equals={pip_equals}) "
-                f"at reference price {ref_price:.4f} requires leverage "
-                f">= {required_leverage:.1f}, but leverage={leverage}. "
-                f"Reduce risk %, widen SL, or increase leverage."
-            )
-
-    # --- dispatch -----------------------------------------------------
-    if _should_use_fast_path(method_code):
-        cash, equity, closed = _inner_loop_cy(
-            date, o_arr, h_arr, l_arr, c_arr, v_arr,
-            long_entries_v, long_exits_v, short_entries_v, short_exits_v,
-            float(starting_balance),
-            method_code, static_size, sizes_array,
-            sl_arr, tp_val, ts_val,
-            float(leverage), float(commission),
-            spread_arr, slippage_arr,
-            long_fee_vec, short_fee_vec,
-            int(max_positions), bool(hedging),
-        )
-    else:
-        # Pure-Python fallback: custom sizer, OR compiled extension unavailable
-        cash, equity, closed = _inner_loop_py(
-            date, o_arr, h_arr, l_arr, c_arr, v_arr,
-            long_entries_v, long_exits_v, short_entries_v, short_exits_v,
-            float(starting_balance),
-            method_code, static_size, sizes_array, sizing_fn,
-            sl_arr, tp_val, ts_val,
-            float(leverage), float(commission),
-            spread_arr, slippage_arr,
-            long_fee_vec, short_fee_vec,
-            int(max_positions), bool(hedging),
-        )
 
-    return Result(cash, equity, closed, timeframe, date)
+# ---------------------------------------------------------------------------
+# Dispatch on already-prepared inputs. Shared with optimizer.py, which
+# prepares the market data once and then runs many signal sets through it.
+# ---------------------------------------------------------------------------
+def _run_prepared(
+    inputs: dict,
+    long_entries_shifted: np.ndarray,
+    long_exits_shifted: np.ndarray,
+    short_entries_shifted: np.ndarray,
+    short_exits_shifted: np.ndarray,
+    hedging: bool,
+) -> tuple:
+    """
+    Run one simulation on the output of ``backtester._prepare_inputs`` and
+    already-shifted signals, via the fastest available loop. Returns
+    ``(cash, equity, closed_trades)``.
+    """
+    signals = dict(
+        long_entries_shifted=long_entries_shifted,
+        long_exits_shifted=long_exits_shifted,
+        short_entries_shifted=short_entries_shifted,
+        short_exits_shifted=short_exits_shifted,
+        hedging=bool(hedging),
+    )
+    if _should_use_fast_path(inputs["sizing_method_code"]):
+        compiled_inputs = {k: val for k, val in inputs.items() if k != "sizing_fn"}
+        return _inner_loop_cy(**compiled_inputs, **signals)
+    # Pure-Python fallback: custom sizer, OR no compiled kernel available
+    return _inner_loop_py(**inputs, **signals)
 
 
 # ---------------------------------------------------------------------------
@@ -364,3 +394,56 @@ def cython_available() -> bool:
 def cython_import_error() -> Optional[ImportError]:
     """Return the ImportError encountered at module load, or None."""
     return None if _CYTHON_AVAILABLE else _CYTHON_IMPORT_ERROR
+
+
+def numba_available() -> bool:
+    """Return True iff the Numba fast path (``_nb_inner``) is importable."""
+    return _load_numba_kernel() is not None
+
+
+def numba_import_error() -> Optional[ImportError]:
+    """Return the ImportError raised importing the Numba path, or None."""
+    _load_numba_kernel()
+    return _NUMBA_IMPORT_ERROR
+
+
+def numba_precompile() -> bool:
+    """
+    Compile every Numba kernel now instead of on first use.
+
+    The kernels are ``cache=True``: the first compile in an environment
+    writes machine code next to ``_nb_inner.py`` and any later process only
+    loads it. Call this once in the parent before fanning backtests or
+    ``run_optimization`` sweeps out to worker processes, so no worker pays
+    the JIT itself. Covers the single-run kernel, the grid kernel at both
+    ``precision`` settings, and ``monte_carlo_trades``. The wrappers pass
+    every kernel input read-only (``_readonly``), so later calls reuse
+    these signatures whatever the dtype or writability of the caller's
+    data. The fused grid kernel is specialised on each user ``signal_fn``
+    and cannot be built ahead.
+
+    Returns False, doing nothing, when Numba is not installed.
+    """
+    kernel = _load_numba_kernel()
+    if kernel is None:
+        return False
+    from ._nb_inner import monte_carlo_trades
+    from .optimizer import _PRECISIONS, _run_grid_numba
+
+    # A tiny flat market pushed through the real wrappers, so every kernel
+    # is compiled for exactly the argument types production calls pass.
+    idx = pd.date_range("2000-01-03", periods=4, freq="D")
+    bar = pd.Series(np.ones(idx.size), index=idx)
+    inputs = _prepare_inputs(bar, bar, bar, bar, bar)
+    no_signal = np.zeros(idx.size, dtype=bool)
+    compiled_inputs = {k: val for k, val in inputs.items() if k != "sizing_fn"}
+    _inner_loop_cy(**compiled_inputs,
+                   long_entries_shifted=no_signal, long_exits_shifted=no_signal,
+                   short_entries_shifted=no_signal, short_exits_shifted=no_signal,
+                   hedging=False, kernel=kernel)
+    flags_mat = np.zeros((1, idx.size), dtype=np.uint8)
+    for price_dtype in _PRECISIONS.values():
+        _run_grid_numba(inputs, flags_mat, False, price_dtype)
+    monte_carlo_trades(np.zeros(1), 1.0, np.zeros(1, dtype=np.uint32), False,
+                       np.empty(1), np.empty(1))
+    return True
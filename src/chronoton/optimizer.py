@@ -0,0 +1,695 @@
+"""
+optimizer.py — parameter sweeps over one market-data set.
+
+``run_optimization`` evaluates a strategy over many parameter sets and
+ranks them by an equity-curve objective. The market data and every
+non-signal input are validated and preprocessed once
+(``backtester._prepare_inputs``); only the signals change per trial.
+
+Execution:
+
+    Numba installed     → all K trials in one ``_nb_inner.inner_loop_grid``
+                          call, parallelised across cores with ``prange``.
+                          Signals are packed into one (K, n_bars) flag
+                          matrix, and only equity / cash curves are kept
+                          per trial.
+    otherwise           → serial loop over ``cython_backtester._run_prepared``
+                          (Cython kernel if built, else pure Python).
+
+When ``signal_fn`` is itself an ``@njit`` function it can be called from
+inside ``_nb_inner.inner_loop_grid_fused`` instead, so indicator
+computation and position tracking run in one compiled kernel without any
+(K, n_bars) signal matrices. That kernel is specialised on each
+``signal_fn`` and cannot be disk-cached, so fusing costs a few seconds of
+JIT per new ``signal_fn`` per process, against a saving of a few ns per
+trial-bar (the serial signal calls and flag packing the array path does
+on one core). ``fuse="auto"`` therefore fuses only from
+``_FUSE_MIN_CELLS`` trial-bars up, or when this process already compiled
+the kernel for ``signal_fn``; smaller sweeps call the jitted
+``signal_fn`` once per trial and take the array path.
+
+Indicators that many trials share (say one moving average per window in the
+grid) can be built once per sweep by ``preprocess_fn``; its result is handed
+to every ``signal_fn`` call instead of being recomputed per trial.
+
+The grid kernels are memory-bound (see ``_nb_inner``), so the sweep is
+tuned for bandwidth rather than arithmetic:
+
+    precision="auto"    → the trials' price streams (o, h, l, c) go in as
+                          float32 once a trial's working set no longer fits
+                          in the last-level cache, float64 otherwise. Numba
+                          compiles a separate float32 specialisation of each
+                          kernel; arithmetic still promotes to float64
+                          against the cost arrays and equity state. The
+                          leading trials are re-scored in float64 (below)
+                          and the choice is recorded in
+                          ``scores.attrs["precision"]``.
+    threads             → ``prange`` runs on at most one thread per physical
+                          core (psutil when installed, else ``os.cpu_count``):
+                          SMT siblings share the core's load ports and
+                          caches, so they add contention, not bandwidth.
+
+A float32 sweep then re-scores its ``_RESCORE_TOP`` leading trials in
+float64, in one parallel grid call, and picks the winner among them; those
+rows head the table and every row's ``precision`` column says which dtype
+scored it. The winning parameter set is re-run once through the
+single-backtest path, always in float64, so the returned ``Result`` carries
+a full trade log and matches the top row.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import itertools
+import os
+from typing import Callable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .backtester import (
+    Result, _prepare_inputs, _shift_signal,
+    SIG_LONG_ENTRY, SIG_LONG_EXIT, SIG_SHORT_ENTRY, SIG_SHORT_EXIT,
+)
+from .cython_backtester import (
+    _pack_signal_flags, _readonly, _run_prepared, numba_available,
+)
+
+
+_SIGNAL_KEYS = ("long_entries", "long_exits", "short_entries", "short_exits")
+_SIGNAL_BITS = (SIG_LONG_ENTRY, SIG_LONG_EXIT, SIG_SHORT_ENTRY, SIG_SHORT_EXIT)
+
+# Price dtype fed to the Numba grid kernels, by ``precision`` name.
+_PRECISIONS = {"f32": np.float32, "f64": np.float64}
+
+# float64 arrays a grid trial streams every bar: OHLC, timestamps, SL,
+# spread, slippage and the two overnight-fee vectors. Sizes "auto" precision.
+_STREAMED_F64_ARRAYS = 10
+
+# Last-level cache assumed when the OS does not report one.
+_DEFAULT_L3_BYTES = 8 * 1024 * 1024
+
+# Leading trials of a float32 sweep re-scored in float64 (one grid call).
+_RESCORE_TOP = 16
+
+# Trial-bars (K * n_bars) from which fuse="auto" fuses an @njit signal_fn
+# it has not compiled yet. Measured with a moving-average crossover: the
+# fused kernel takes ~3 s to JIT and saves ~3 ns per trial-bar once the
+# signal calls run in parallel, so it breaks even near 1e9 trial-bars.
+# Heavier indicators save more per bar and break even sooner.
+_FUSE_MIN_CELLS = 1_000_000_000
+
+# Objectives are restricted to equity-curve metrics: the grid kernel does
+# not keep per-trial trade logs.
+_OBJECTIVES = {
+    "sharpe":        lambda r: r._calculate_sharpe(),
+    "log_sharpe":    lambda r: r._calculate_log_sharpe(),
+    "sortino":       lambda r: r._calculate_sortino(),
+    "log_sortino":   lambda r: r._calculate_log_sortino(),
+    "calmar":        lambda r: r._calculate_calmar(),
+    "cagr":          lambda r: r._calculate_cagr(),
+    "max_drawdown":  lambda r: r._calculate_max_drawdown(),
+    "ulcer_index":   lambda r: r._calculate_ulcer_index(),
+    "k_ratio_1996":  lambda r: r._calculate_k_ratio_1996(),
+    "k_ratio_2003":  lambda r: r._calculate_k_ratio_2003(),
+    "k_ratio_2013":  lambda r: r._calculate_k_ratio_2013(),
+    "omega_ratio":   lambda r: r._calculate_omega_ratio(),
+    "total_return":  lambda r: (
+        float(r.equity[-1] / r.equity[0] - 1.0)
+        if r.equity.size >= 2 and r.equity[0] > 0 else 0.0
+    ),
+    "final_equity":  lambda r: float(r.equity[-1]) if r.equity.size else 0.0,
+}
+
+
+# ---------------------------------------------------------------------------
+# Public entry point
+# ---------------------------------------------------------------------------
+def run_optimization(
+    o: pd.Series,
+    h: pd.Series,
+    l: pd.Series,
+    c: pd.Series,
+    v: pd.Series,
+    signal_fn: Callable[[dict], dict],
+    param_grid: Union[dict, list],
+    objective: Union[str, Callable[["Result"], float]] = "sharpe",
+    maximize: bool = True,
+    hedging: bool = False,
+    timeframe: str = "1d",
+    precision: str = "auto",
+    preprocess_fn: Optional[Callable] = None,
+    fuse: Union[str, bool] = "auto",
+    **backtest_kwargs,
+) -> tuple:
+    """
+    Grid-search strategy parameters and rank them by ``objective``.
+
+    Parameters
+    ----------
+    o, h, l, c, v : pd.Series
+        OHLCV, exactly as for ``run_single_backtest``.
+    signal_fn : callable
+        ``signal_fn(params) -> dict`` returning any of ``long_entries``,
+        ``long_exits``, ``short_entries``, ``short_exits`` as bool arrays of
+        length n. Missing keys mean "no signal". Signals are shifted +1 bar
+        internally, as in ``run_single_backtest``.
+
+        Alternatively an ``@njit`` function
+        ``signal_fn(o, h, l, c, v, params) -> (long_entries, long_exits,
+        short_entries, short_exits)`` taking price arrays in the sweep's
+        ``precision`` (float32 under ``"f32"``) and a float64 vector of the
+        parameter values (in ``param_grid`` key order). Its calls can then
+        be fused into the parallel grid kernel (see ``fuse``). The winner's
+        re-run calls it
+        again on float64 prices, so its signals, and hence ``best_result``,
+        can differ from its float32 trial.
+    param_grid : dict or list of dict
+        A dict of ``name -> list of values`` is expanded to its cartesian
+        product; a list of dicts is used as-is.
+    objective : str or callable
+        One of the equity-curve metrics in ``calculate_metrics`` (``sharpe``,
+        ``sortino``, ``calmar``, ``cagr``, ``max_drawdown``, ...), or a
+        callable ``f(Result) -> float``. Trade-level metrics are not
+        available: the trials' Results carry no trade log, and a callable
+        that reads ``trades`` raises ``ValueError``.
+    maximize : bool
+        Rank higher scores first (default). Set False for e.g. ``ulcer_index``.
+    precision : {"auto", "f32", "f64"}
+        Dtype of the OHLC(V) arrays streamed through the Numba grid kernels
+        (and handed to an ``@njit`` ``signal_fn``). ``"f32"`` halves the
+        bytes loaded per bar, but rounding the prices can flip a near-tie
+        stop or signal, after which a trial's trade path diverges from a
+        float64 run: its score can move by whole percent and its trade
+        count change, not just in the last digits. The ``_RESCORE_TOP``
+        (16) best float32 trials are therefore re-scored in float64 in one
+        grid call, the winner is picked among them, and they head the
+        table; the rows below keep their float32 scores and are labelled
+        so. Use ``"f64"`` for scores that all match
+        ``run_single_backtest`` exactly. ``"auto"`` (default) picks
+        ``"f32"`` only when a trial's streamed arrays outgrow the L3 cache,
+        i.e. when the run is bound by DRAM bandwidth, with the same batched
+        float64 re-score of the leaders; ``scores.attrs["precision"]`` says
+        which was used. The choice depends on the host's cache size, so
+        pass ``"f32"`` or ``"f64"`` explicitly when tables must be
+        identical across machines. Ignored on the serial (non-Numba) path, and never applied
+        to ``best_result``.
+    preprocess_fn : callable, optional
+        ``preprocess_fn(o, h, l, c, v) -> features``, called once per sweep
+        on the OHLCV Series. ``features`` is then passed to every
+        ``signal_fn`` call as an extra last argument —
+        ``signal_fn(params, features)``, or
+        ``signal_fn(o, h, l, c, v, params, features)`` for an ``@njit``
+        function, in which case ``features`` must be Numba-typable (an
+        array or a tuple of arrays). Use it for indicators shared across
+        parameter sets.
+    fuse : {"auto", True, False}
+        For an ``@njit`` ``signal_fn`` only: whether to call it from inside
+        the parallel grid kernel (``inner_loop_grid_fused``) rather than
+        once per trial into a signal-flag matrix. The fused kernel cannot
+        be disk-cached, so its first sweep per ``signal_fn`` in a process
+        pays ~3 s of JIT. ``"auto"`` (default) fuses only when the sweep
+        spans at least ``_FUSE_MIN_CELLS`` (1e9) trial-bars, where fusion
+        wins it back, or when the kernel is already compiled for
+        ``signal_fn``. Results are the same either way.
+    hedging, timeframe, **backtest_kwargs
+        Forwarded to the backtest (``starting_balance``, ``position_sizing``,
+        ``SL``, ``commission``, ...). ``position_sizing='custom'`` is not
+        supported.
+
+    Returns
+    -------
+    (best_params, best_result, scores)
+        ``best_params`` is the winning dict, ``best_result`` its full
+        ``Result`` (including trades), and ``scores`` a DataFrame with one
+        row per parameter set — parameter columns, ``score``, ``n_trades``
+        and ``precision`` (the dtype that scored the row) — sorted best
+        first, float64-scored rows ahead of float32 ones.
+        ``scores.attrs["precision"]``
+        records the precision the sweep actually ran at (``"f32"`` or
+        ``"f64"``), which ``"auto"`` resolves per run.
+    """
+    param_sets = _expand_grid(param_grid)
+    score_fn = _resolve_objective(objective)
+    if precision != "auto" and precision not in _PRECISIONS:
+        raise ValueError(
+            f"precision must be 'auto' or one of {list(_PRECISIONS)}, "
+            f"got {precision!r}"
+        )
+    if fuse not in ("auto", True, False):
+        raise ValueError(f"fuse must be 'auto', True or False, got {fuse!r}")
+
+    for key in _SIGNAL_KEYS:
+        if key in backtest_kwargs:
+            raise ValueError(
+                f"{key!r} is produced by signal_fn and cannot be passed to "
+                f"run_optimization directly."
+            )
+    if backtest_kwargs.get("position_sizing") == "custom":
+        raise ValueError(
+            "run_optimization does not support position_sizing='custom'; "
+            "use 'precomputed' sizes instead."
+        )
+
+    inputs = _prepare_inputs(o, h, l, c, v, timeframe=timeframe, **backtest_kwargs)
+    n = inputs["o"].size
+    n_trials = len(param_sets)
+    features = None if preprocess_fn is None else preprocess_fn(o, h, l, c, v)
+    price_dtype = _PRECISIONS[_resolve_precision(precision, n)]
+    if not numba_available():
+        price_dtype = np.float64    # the serial loop is float64 throughout
+
+    njit_fn = _is_njit(signal_fn)
+    if njit_fn:
+        param_mat = _param_matrix(param_sets)
+        ohlcv_f64 = _prices(inputs, "ohlcv", np.float64)
+
+        def njit_signals(k, ohlcv):
+            sigs = signal_fn(*ohlcv, param_mat[k], *_extra_args(features))
+            return dict(zip(_SIGNAL_KEYS, sigs))
+
+        def trial_signals(k):
+            sigs = njit_signals(k, ohlcv_f64)
+            return [_shift_signal(np.asarray(sigs[key]), n, key)
+                    for key in _SIGNAL_KEYS]
+
+    if njit_fn and (fuse is True or (
+            fuse == "auto" and _fusion_pays(signal_fn, n_trials, n))):
+        # --- fused: signals generated inside the grid kernel -----------
+        cash_mat, equity_mat, n_trades = _run_grid_fused(
+            signal_fn, inputs, param_mat, hedging, price_dtype, features,
+        )
+    else:
+        # --- materialise the (K, n) signal-flag matrix ------------------
+        # Trial-major so each trial's flags are one contiguous row; one
+        # uint8 per bar carries all four signals (SIG_* bits). An @njit
+        # signal_fn sees the sweep's price dtype, as it would when fused.
+        flags_mat = np.zeros((n_trials, n), dtype=np.uint8)
+        if njit_fn:
+            ohlcv_sweep = _prices(inputs, "ohlcv", price_dtype)
+        for k, params in enumerate(param_sets):
+            if njit_fn:
+                sigs = _checked_length(njit_signals(k, ohlcv_sweep), n, k)
+            else:
+                sigs = _call_signal_fn(signal_fn, params, features)
+            flags_mat[k] = _pack_signal_flags(
+                *(_shift_signal(sigs.get(key), n, key) for key in _SIGNAL_KEYS)
+            )
+
+        if not njit_fn:
+            def trial_signals(k):
+                return [(flags_mat[k] & bit) != 0 for bit in _SIGNAL_BITS]
+
+        # --- run every trial --------------------------------------------
+        if numba_available():
+            cash_mat, equity_mat, n_trades = _run_grid_numba(
+                inputs, flags_mat, hedging, price_dtype,
+            )
+        else:
+            cash_mat, equity_mat, n_trades = _grid_outputs(n_trials, n)
+            for k in range(n_trials):
+                cash_k, equity_k, closed_k = _run_prepared(
+                    inputs, *trial_signals(k), hedging,
+                )
+                cash_mat[k] = cash_k
+                equity_mat[k] = equity_k
+                n_trades[k] = closed_k.shape[0]
+
+    # --- score ------------------------------------------------------------
+    scores = _score_trials(score_fn, cash_mat, equity_mat, timeframe,
+                           inputs["date"])
+    label = "f32" if price_dtype == np.float32 else "f64"
+    row_precision = np.full(n_trials, label, dtype=object)
+
+    # --- re-score the float32 leaders in float64 -------------------------
+    # Float32 prices can flip near-tie stop hits, so a trial's whole trade
+    # path can diverge from float64, not just its rounding. The top
+    # _RESCORE_TOP trials are re-run together in one float64 grid call
+    # (identical flag rows once) and ranked ahead of the rest, so the
+    # winner is chosen on exact scores and every row is labelled.
+    if price_dtype == np.float32:
+        leaders = _ranking(scores, maximize)[:_RESCORE_TOP]
+        leader_flags = np.stack([_pack_signal_flags(*trial_signals(k))
+                                 for k in leaders])
+        unique_flags, row_of = np.unique(leader_flags, axis=0,
+                                         return_inverse=True)
+        cash64, equity64, n_trades64 = _run_grid_numba(
+            inputs, unique_flags, hedging, np.float64,
+        )
+        scores64 = _score_trials(score_fn, cash64, equity64, timeframe,
+                                 inputs["date"])
+        row_of = row_of.ravel()
+        scores[leaders] = scores64[row_of]
+        n_trades[leaders] = n_trades64[row_of]
+        row_precision[leaders] = "f64"
+
+    # --- re-run the winner in float64 with a full trade log -------------
+    order = _ranking(scores, maximize, first=row_precision == "f64")
+    best_k = int(order[0])
+    cash, equity, closed = _run_prepared(inputs, *trial_signals(best_k),
+                                         hedging)
+    best_result = Result(cash, equity, closed, timeframe, inputs["date"])
+
+    table = pd.DataFrame(param_sets)
+    table["score"] = scores
+    table["n_trades"] = n_trades
+    table["precision"] = row_precision
+    table = table.iloc[order].reset_index(drop=True)
+    table.attrs["precision"] = label
+    return dict(param_sets[best_k]), best_result, table
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+def _expand_grid(param_grid: Union[dict, list]) -> list:
+    """Normalise ``param_grid`` to a non-empty list of parameter dicts."""
+    if isinstance(param_grid, dict):
+        names = list(param_grid)
+        for name in names:
+            if isinstance(param_grid[name], (str, bytes)) or not hasattr(
+                    param_grid[name], "__iter__"):
+                raise TypeError(
+                    f"param_grid[{name!r}] must be a list of values, "
+                    f"got {type(param_grid[name]).__name__}"
+                )
+        param_sets = [dict(zip(names, combo))
+                      for combo in itertools.product(*param_grid.values())]
+    elif isinstance(param_grid, (list, tuple)):
+        param_sets = [dict(p) for p in param_grid]
+    else:
+        raise TypeError(
+            f"param_grid must be a dict of lists or a list of dicts, "
+            f"got {type(param_grid).__name__}"
+        )
+    if not param_sets:
+        raise ValueError("param_grid is empty")
+    return param_sets
+
+
+def _resolve_objective(objective) -> Callable[["Result"], float]:
+    if callable(objective):
+        return objective
+    if objective not in _OBJECTIVES:
+        raise ValueError(
+            f"Unknown objective {objective!r}; expected a callable or one of "
+            f"{sorted(_OBJECTIVES)}"
+        )
+    return _OBJECTIVES[objective]
+
+
+class _TrialResult(Result):
+    """
+    A grid trial's ``Result``: cash and equity only. The grid kernels keep
+    no trade log, so reading ``trades`` raises rather than handing an
+    objective an empty log that would score every trial alike.
+    """
+
+    def __init__(self, cash: np.ndarray, equity: np.ndarray,
+                 timeframe: str, date: Optional[np.ndarray]):
+        super().__init__(cash, equity, None, timeframe, date)
+
+    @property
+    def trades(self) -> np.ndarray:
+        raise ValueError(
+            "objective needs trades; grid kernels do not record them. "
+            "Use an equity-curve objective."
+        )
+
+    @trades.setter
+    def trades(self, value) -> None:
+        pass    # Result.__init__ assigns it; there is no log to keep
+
+
+def _call_signal_fn(signal_fn: Callable, params: dict, features=None) -> dict:
+    """
+    Call ``signal_fn`` (with ``features`` when a ``preprocess_fn`` produced
+    them) and validate that it returned known signal keys.
+    """
+    out = signal_fn(params, *_extra_args(features))
+    if not isinstance(out, dict):
+        raise TypeError(
+            f"signal_fn must return a dict of signal arrays, "
+            f"got {type(out).__name__}"
+        )
+    unknown = set(out) - set(_SIGNAL_KEYS)
+    if unknown:
+        raise ValueError(
+            f"signal_fn returned unknown keys {sorted(unknown)}; "
+            f"expected a subset of {list(_SIGNAL_KEYS)}"
+        )
+    return {key: sig for key, sig in out.items() if sig is not None}
+
+
+def _checked_length(sigs: dict, n: int, k: int) -> dict:
+    """
+    An ``@njit`` ``signal_fn``'s four signals, validated as the fused
+    kernel does.
+    """
+    if any(np.shape(sig) != (n,) for sig in sigs.values()):
+        raise ValueError(
+            f"signal_fn must return four arrays of length {n}; "
+            f"parameter row {k} did not"
+        )
+    return sigs
+
+
+def _fusion_pays(signal_fn, n_trials: int, n: int) -> bool:
+    """
+    ``fuse="auto"``: fuse when the sweep is big enough to earn back the
+    fused kernel's JIT (``_FUSE_MIN_CELLS``), or when that JIT is already
+    paid for ``signal_fn`` in this process.
+    """
+    if n_trials * n >= _FUSE_MIN_CELLS:
+        return True
+    from numba import typeof
+    from ._nb_inner import inner_loop_grid_fused
+
+    fn_type = typeof(signal_fn)
+    return any(sig[0] == fn_type for sig in inner_loop_grid_fused.signatures)
+
+
+def _score_trials(score_fn: Callable, cash_mat: np.ndarray,
+                  equity_mat: np.ndarray, timeframe: str,
+                  date: np.ndarray) -> np.ndarray:
+    """``score_fn`` of each grid row's ``_TrialResult``."""
+    scores = np.empty(cash_mat.shape[0], dtype=np.float64)
+    for k in range(scores.size):
+        trial = _TrialResult(cash_mat[k], equity_mat[k], timeframe, date)
+        scores[k] = float(score_fn(trial))
+    return scores
+
+
+def _ranking(scores: np.ndarray, maximize: bool,
+             first: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Trial indices best first. Stable, and NaN scores always rank last,
+    whichever direction is optimised. Trials flagged in ``first`` (the
+    float64-re-scored leaders of a float32 sweep) rank ahead of the rest.
+    """
+    order = pd.Series(scores).sort_values(ascending=not maximize,
+                                          na_position="last", kind="stable")
+    order = order.index.to_numpy()
+    if first is None:
+        return order
+    return np.concatenate([order[first[order]], order[~first[order]]])
+
+
+def _resolve_precision(precision: str, n: int) -> str:
+    """
+    Map ``precision="auto"`` to ``"f32"`` when one trial's float64 streams
+    overflow the last-level cache (DRAM-bound), else ``"f64"``.
+    """
+    if precision != "auto":
+        return precision
+    working_set = n * 8 * _STREAMED_F64_ARRAYS
+    return "f32" if working_set > _l3_cache_bytes() else "f64"
+
+
+@functools.lru_cache(maxsize=None)
+def _l3_cache_bytes() -> int:
+    """Last-level (L3) cache size in bytes, or ``_DEFAULT_L3_BYTES``."""
+    try:
+        size = os.sysconf("SC_LEVEL3_CACHE_SIZE")
+        if size > 0:
+            return int(size)
+    except (AttributeError, ValueError, OSError):
+        pass
+    # Linux without the glibc sysconf extension (e.g. musl): read sysfs.
+    try:
+        with open("/sys/devices/system/cpu/cpu0/cache/index3/size") as fh:
+            text = fh.read().strip()
+        units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+        if text[-1:] in units:
+            return int(text[:-1]) * units[text[-1]]
+        return int(text)
+    except (OSError, ValueError):
+        return _DEFAULT_L3_BYTES
+
+
+@functools.lru_cache(maxsize=None)
+def _physical_cores() -> int:
+    """Physical core count via psutil when installed, else ``os.cpu_count()``."""
+    try:
+        import psutil
+        cores = psutil.cpu_count(logical=False)
+    except ImportError:
+        cores = None
+    return cores or os.cpu_count() or 1
+
+
+@contextlib.contextmanager
+def _physical_core_threads():
+    """
+    Cap Numba's ``prange`` thread count at the physical core count for the
+    duration of a grid-kernel call. Never raises a lower limit the caller set.
+    """
+    import numba
+
+    saved = numba.get_num_threads()
+    numba.set_num_threads(max(1, min(saved, _physical_cores())))
+    try:
+        yield
+    finally:
+        numba.set_num_threads(saved)
+
+
+def _extra_args(features) -> tuple:
+    """Trailing ``signal_fn`` arguments: ``(features,)``, or none at all."""
+    return () if features is None else (features,)
+
+
+def _is_njit(fn) -> bool:
+    """True iff ``fn`` is a Numba ``@njit`` dispatcher."""
+    try:
+        from numba.core.registry import CPUDispatcher
+    except ImportError:
+        return False
+    return isinstance(fn, CPUDispatcher)
+
+
+def _param_matrix(param_sets: list) -> np.ndarray:
+    """
+    Pack parameter dicts into a (K, P) float64 matrix for a jitted
+    ``signal_fn``. Column order is the key order of the first set.
+    """
+    names = list(param_sets[0])
+    for params in param_sets:
+        if list(params) != names:
+            raise ValueError(
+                "an @njit signal_fn needs every parameter set to have the "
+                f"same keys in the same order; got {list(params)} vs {names}"
+            )
+    try:
+        return np.array([[float(params[name]) for name in names]
+                         for params in param_sets], dtype=np.float64)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(
+            f"an @njit signal_fn needs numeric parameter values: {exc}"
+        ) from None
+
+
+def _grid_outputs(n_trials: int, n: int) -> tuple:
+    """Allocate trial-major ``(cash_mat, equity_mat, n_trades)``."""
+    cash_mat = np.empty((n_trials, n), dtype=np.float64)
+    equity_mat = np.empty((n_trials, n), dtype=np.float64)
+    n_trades = np.zeros(n_trials, dtype=np.int64)
+    return cash_mat, equity_mat, n_trades
+
+
+def _grid_cost_args(inputs: dict, hedging: bool) -> tuple:
+    """
+    The market-independent arguments shared by both grid kernels, from
+    ``starting_balance`` through ``n_slots``, in kernel order.
+    """
+    # Same sizing-array and read-only conventions as
+    # cython_backtester._inner_loop_cy.
+    sizing_array = inputs["sizing_array"]
+    if sizing_array is None or sizing_array.size == 0:
+        sizing_array = np.empty(0, dtype=np.float64)
+    max_positions = inputs["max_positions"]
+    n_slots = max_positions * 2 if hedging else max_positions
+    return (
+        float(inputs["starting_balance"]),
+        int(inputs["sizing_method_code"]),
+        float(inputs["sizing_static"]),
+        _readonly(sizing_array),
+        _readonly(inputs["sl_arr"]),
+        float(inputs["tp"]),
+        float(inputs["ts"]),
+        float(inputs["leverage"]),
+        float(inputs["commission"]),
+        _readonly(inputs["spread_arr"]),
+        _readonly(inputs["slippage_arr"]),
+        _readonly(inputs["long_fee_vec"]),
+        _readonly(inputs["short_fee_vec"]),
+        bool(hedging),
+        int(n_slots),
+    )
+
+
+def _date_ns(inputs: dict) -> np.ndarray:
+    """Bar timestamps as float64 ns, as cython_backtester._inner_loop_cy does."""
+    date = inputs["date"].astype("datetime64[ns]", copy=False)
+    return _readonly(date.view(np.int64).astype(np.float64))
+
+
+def _prices(inputs: dict, fields: str, dtype) -> list:
+    """
+    The named price arrays as read-only contiguous ``dtype`` (no copy if
+    already so), whatever the caller's dtype and writability.
+    """
+    return [_readonly(inputs[f], dtype) for f in fields]
+
+
+def _run_grid_numba(inputs: dict, flags_mat: np.ndarray, hedging: bool,
+                    price_dtype=np.float64) -> tuple:
+    """
+    Run every signal-flag row through ``_nb_inner.inner_loop_grid`` in one
+    call, with OHLC cast to ``price_dtype``. Returns
+    ``(cash_mat, equity_mat, n_trades)``.
+    """
+    from ._nb_inner import inner_loop_grid
+
+    outputs = _grid_outputs(*flags_mat.shape)
+    with _physical_core_threads():
+        inner_loop_grid(
+            *_prices(inputs, "ohlc", price_dtype),
+            _date_ns(inputs),
+            _readonly(flags_mat, np.uint8),
+            *_grid_cost_args(inputs, hedging),
+            *outputs,
+        )
+    return outputs
+
+
+def _run_grid_fused(signal_fn, inputs: dict, param_mat: np.ndarray,
+                    hedging: bool, price_dtype=np.float64,
+                    features=None) -> tuple:
+    """
+    Run every parameter row through ``_nb_inner.inner_loop_grid_fused``,
+    which calls the jitted ``signal_fn`` inside the kernel, with OHLCV cast
+    to ``price_dtype`` and ``features`` (if any) as its last argument.
+    Returns ``(cash_mat, equity_mat, n_trades)``.
+    """
+    from ._nb_inner import inner_loop_grid_fused
+
+    outputs = _grid_outputs(param_mat.shape[0], inputs["o"].size)
+    with _physical_core_threads():
+        inner_loop_grid_fused(
+            signal_fn,
+            *_prices(inputs, "ohlcv", price_dtype),
+            _date_ns(inputs),
+            _readonly(param_mat),
+            _extra_args(features),
+            *_grid_cost_args(inputs, hedging),
+            *outputs,
+        )
+    bad = np.flatnonzero(outputs[2] < 0)
+    if bad.size:
+        raise ValueError(
+            f"signal_fn must return four arrays of length {inputs['o'].size}; "
+            f"parameter row {int(bad[0])} did not"
+        )
+    return outputs
@@ -81,6 +81,12 @@ def _make_ohlcv(close_prices, start="2024-01-01", freq="D", spread_hl=0.5,
     return o, h, l, c, v
 
 
+def _random_walk_ohlcv(rng, n):
+    """Random-walk OHLCV (daily bars stamped 23:00) drawn from ``rng``."""
+    prices = 100 + np.cumsum(rng.normal(0, 0.8, n))
+    return _make_ohlcv(prices, start="2024-01-01 23:00", spread_hl=0.6)
+
+
 def _flat_ohlcv(price=100.0, n=10):
     return _make_ohlcv(np.full(n, price), spread_hl=0.5, c_offset=0.0)
 
@@ -160,6 +166,29 @@ def test_process_series_rejects_nan():
         assert "nan" in str(e).lower()
 
 
+def test_process_series_rejects_inf():
+    o, h, l, c, v = _uptrend(n=5)
+    h2 = h.copy(); h2.iloc[3] = np.inf
+    try:
+        bt._process_series(o, h2, l, c, v)
+        assert False
+    except ValueError as e:
+        assert "inf" in str(e).lower()
+
+
+def test_process_series_validate_false_skips_value_scans():
+    o, h, l, c, v = _uptrend(n=5)
+    c2 = c.copy(); c2.iloc[2] = np.nan
+    _, _, _, _, ca, _ = bt._process_series(o, h, l, c2, v, validate=False)
+    assert np.isnan(ca[2])
+    # Structural checks still run
+    try:
+        bt._process_series(o, h, l, c, v.iloc[:3], validate=False)
+        assert False
+    except ValueError:
+        pass
+
+
 def test_process_series_rejects_index_mismatch():
     o, h, l, c, v = _uptrend(n=5)
     l2 = pd.Series(l.values, index=pd.date_range("2030-01-01", periods=5, freq="D"))
@@ -217,6 +246,28 @@ def test_signals_list_rejected():
         pass
 
 
+def test_signals_shift_moves_forward_one_bar():
+    raw = _signal(5, 0, 3, 4)
+    out = bt._shift_signal(raw, 5, "x")
+    assert out.dtype == bool
+    assert list(out) == [False, True, False, False, True]
+    # Caller's array is untouched
+    assert list(raw) == [True, False, False, True, True]
+
+
+def test_signals_shift_none_all_false():
+    out = bt._shift_signal(None, 4, "x")
+    assert out.dtype == bool and out.shape == (4,) and not out.any()
+
+
+def test_signals_shift_validates_input():
+    try:
+        bt._shift_signal(np.zeros(3, dtype=bool), 4, "x")
+        assert False, "should have raised ValueError"
+    except ValueError:
+        pass
+
+
 # ===========================================================================
 # _process_spread_slippage
 # ===========================================================================
@@ -1101,6 +1152,21 @@ def test_percent_at_risk_all_nan_sl_array_rejected():
         assert "NaN" in str(e) or "nan" in str(e).lower()
 
 
+def test_percent_at_risk_empty_input_readable_error():
+    # Zero bars: the tightest-stop reduction must not hit numpy's
+    # "zero-size array" error; the library's own message is raised instead.
+    o, h, l, c, v = _make_ohlcv(np.empty(0))
+    try:
+        bt.run_single_backtest(
+            o, h, l, c, v, starting_balance=10_000,
+            position_sizing="percent_at_risk", position_percent_at_risk=0.01,
+            SL=50.0, pip_equals=1.0,
+        )
+        assert False, "expected ValueError for empty input"
+    except ValueError as e:
+        assert "non-NaN SL value" in str(e)
+
+
 # ===========================================================================
 # Result class — metrics & export
 # ===========================================================================
@@ -1180,6 +1246,36 @@ def test_trades_to_dataframe_empty():
     assert "pnl" in df.columns and "exit_reason" in df.columns
 
 
+def test_trades_to_dataframe_columns_contiguous():
+    # Trade log is column-major: every F_* field slice is a contiguous array.
+    r = _run_small_backtest()
+    assert r.trades[:, bt.F_SIZE].flags["C_CONTIGUOUS"]
+    assert r.trades[:, bt.F_EXIT_REASON].flags["C_CONTIGUOUS"]
+
+
+def test_trades_to_dataframe_exit_reason_unknown():
+    codes = np.array([0.0, 1.0, 5.0, 9.0, -1.0, np.nan])
+    labels = bt._exit_reason_labels(codes)
+    assert list(labels) == ["signal", "sl", "end_of_data",
+                            "unknown", "unknown", "unknown"]
+
+
+def test_trades_to_polars_matches_dataframe():
+    try:
+        import polars  # noqa: F401
+    except ImportError:
+        return
+    r = _run_small_backtest()
+    pl_df = r.trades_to_polars()
+    pd_df = r.trades_to_dataframe()
+    assert pl_df.columns == list(pd_df.columns)
+    assert pl_df.shape == pd_df.shape
+    assert pl_df["exit_reason"].to_list() == list(pd_df["exit_reason"])
+    assert np.array_equal(pl_df["pnl"].to_numpy(), pd_df["pnl"].to_numpy())
+    assert np.array_equal(pl_df["entry_time"].to_numpy(),
+                          pd_df["entry_time"].to_numpy())
+
+
 def test_pnl_matches_equity_change_roughly():
     # With no other costs, sum of trade PnL should equal final equity change.
     r = _run_small_backtest()
@@ -8,7 +8,7 @@ How this works:
     - Runs every `test_*` function from `tests` through the dispatcher.
     - Adds Cython-specific tests at the end.
 
-The 90 pure-Python tests cover every API surface, so the big value here
+The 99 pure-Python tests cover every API surface, so the big value here
 is CONFIRMING THE DISPATCHER IS A DROP-IN REPLACEMENT. If any of the
 reused tests fail, the dispatcher has diverged from the pure-Python API.
 
@@ -184,6 +184,22 @@ def test_parity_hedging_and_pyramiding():
     assert r_py.trades.shape == r_cy.trades.shape
 
 
+def test_pack_signal_flags_bits():
+    """Each signal lands on its own SIG_* bit; 1-D and (K, n) inputs."""
+    le = np.array([1, 0, 0, 0, 1], dtype=bool)
+    lx = np.array([0, 1, 0, 0, 1], dtype=bool)
+    se = np.array([0, 0, 1, 0, 1], dtype=bool)
+    sx = np.array([0, 0, 0, 0, 1], dtype=bool)
+    flags = bt_cy._pack_signal_flags(le, lx, se, sx)
+    assert flags.dtype == np.uint8
+    assert flags.tolist() == [bt_py.SIG_LONG_ENTRY, bt_py.SIG_LONG_EXIT,
+                              bt_py.SIG_SHORT_ENTRY, 0, 15]
+    mat = bt_cy._pack_signal_flags(*(np.stack([a, a[::-1]]) for a in (le, lx, se, sx)))
+    assert mat.shape == (2, 5)
+    assert mat[0].tolist() == flags.tolist()
+    assert mat[1].tolist() == flags[::-1].tolist()
+
+
 # ---------------------------------------------------------------------------
 # Run everything
 # ---------------------------------------------------------------------------
@@ -0,0 +1,143 @@
+"""
+tests_monte_carlo.py — tests for ``run_monte_carlo`` trade resampling.
+
+Checks run against whichever backend is active (the parallel Numba kernel
+when Numba is installed) and against the numpy fallback, forced by masking
+Numba off.
+
+Usage:
+    python tests_monte_carlo.py
+
+    # or under pytest
+    pytest tests_monte_carlo.py -v
+
+The script exits 0 on success, 1 on any failure.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import inspect
+import sys
+
+import numpy as np
+import pandas as pd
+
+import tests as py_tests
+import chronoton.backtester as bt_py
+import chronoton.monte_carlo as mc
+from chronoton import run_monte_carlo
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+def _result(n: int = 200, seed: int = 0):
+    """A backtest with a few dozen closed trades."""
+    rng = np.random.default_rng(seed)
+    o, h, l, c, v = py_tests._random_walk_ohlcv(rng, n)
+    return bt_py.run_single_backtest(
+        o, h, l, c, v, starting_balance=10_000,
+        long_entries=rng.random(n) < 0.15, long_exits=rng.random(n) < 0.15,
+        position_sizing="value", position_value=2_000.0, commission=0.0005,
+    )
+
+
+# The real backend probe, captured before any test patches it.
+_NUMBA_AVAILABLE = mc.numba_available
+
+
+@contextlib.contextmanager
+def _numpy_backend():
+    """Mask Numba off inside ``run_monte_carlo`` for the with-block."""
+    mc.numba_available = lambda: False
+    try:
+        yield
+    finally:
+        mc.numba_available = _NUMBA_AVAILABLE
+
+
+def _both_backends(fn):
+    """``[fn()]`` on the active backend, then on the numpy fallback."""
+    active = fn()
+    with _numpy_backend():
+        fallback = fn()
+    assert mc.numba_available is _NUMBA_AVAILABLE, "backend patch leaked"
+    return [active, fallback]
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+def test_monte_carlo_shape_and_columns():
+    r = _result()
+    for df in _both_backends(lambda: run_monte_carlo(r, n_sims=50, seed=1)):
+        assert list(df.columns) == ["final_equity", "total_return", "max_drawdown"]
+        assert len(df) == 50
+        assert np.all(df["max_drawdown"] <= 0)
+        assert np.allclose(df["total_return"], df["final_equity"] / r.equity[0] - 1)
+
+
+def test_monte_carlo_reproducible_with_seed():
+    r = _result()
+    for a, b in zip(_both_backends(lambda: run_monte_carlo(r, 30, seed=7)),
+                    _both_backends(lambda: run_monte_carlo(r, 30, seed=7))):
+        pd.testing.assert_frame_equal(a, b)
+    a = run_monte_carlo(r, 30, seed=7)
+    b = run_monte_carlo(r, 30, seed=8)
+    assert not np.allclose(a["final_equity"], b["final_equity"])
+
+
+def test_monte_carlo_shuffle_preserves_final_equity():
+    r = _result()
+    expected = r.equity[0] + r._pnl().sum()
+    for df in _both_backends(
+            lambda: run_monte_carlo(r, 20, seed=3, method="shuffle")):
+        assert np.allclose(df["final_equity"], expected)
+        # Shuffled paths can't all be drawdown-free unless every trade won
+        assert df["max_drawdown"].min() < 0
+
+
+def test_monte_carlo_rejects_bad_inputs():
+    r = _result()
+    empty = bt_py.Result(r.cash, r.equity, r.trades[:0], r.timeframe, r.date)
+    for args, kwargs in [
+        ((r,), dict(method="jackknife")),
+        ((r,), dict(n_sims=0)),
+        ((empty,), {}),
+    ]:
+        try:
+            run_monte_carlo(*args, **kwargs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"expected ValueError for {kwargs or 'no trades'}")
+
+
+# ---------------------------------------------------------------------------
+# Run everything
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    run_test = py_tests.run_test
+    py_tests._FAILURES = []
+    py_tests._PASSED = 0
+
+    local = sys.modules[__name__]
+    mc_tests = [
+        fn for name, fn in inspect.getmembers(local, inspect.isfunction)
+        if name.startswith("test_")
+    ]
+
+    for t in mc_tests:
+        run_test(t)
+
+    total = py_tests._PASSED + len(py_tests._FAILURES)
+    print(f"\n{'─' * 64}")
+    print(f"Passed: {py_tests._PASSED} / {total}")
+    if py_tests._FAILURES:
+        print(f"\nFailed tests:\n")
+        for name, tb in py_tests._FAILURES:
+            print(f"── {name} ──")
+            print(tb)
+        sys.exit(1)
+    sys.exit(0)
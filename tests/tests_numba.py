@@ -0,0 +1,227 @@
+"""
+tests_numba.py — parity checks for the Numba fast path (``_nb_inner``).
+
+The dispatcher only routes to Numba when the Cython extension is missing,
+so these tests force that route by temporarily flagging Cython as
+unavailable, then compare every output against the pure-Python reference
+loop in ``backtester.py``. Any mismatch means ``_nb_inner`` has diverged.
+
+If Numba is not installed every test here passes trivially (there is
+nothing to compare), mirroring how tests_cython.py behaves without a
+compiled extension.
+
+Usage:
+    python tests_numba.py
+
+    # or under pytest
+    pytest tests_numba.py -v
+
+The script exits 0 on success, 1 on any failure.
+"""
+
+from __future__ import annotations
+
+import inspect
+import sys
+
+import numpy as np
+
+import tests as py_tests
+import chronoton.cython_backtester as bt_cy
+import chronoton.backtester as bt_py
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+def _run_numba(*args, **kwargs):
+    """run_single_backtest through the dispatcher with Cython masked off."""
+    saved = bt_cy._CYTHON_AVAILABLE
+    bt_cy._CYTHON_AVAILABLE = False
+    try:
+        return bt_cy.run_single_backtest(*args, **kwargs)
+    finally:
+        bt_cy._CYTHON_AVAILABLE = saved
+
+
+def _assert_parity(r_py, r_nb):
+    assert np.allclose(r_py.cash, r_nb.cash, atol=1e-9), "cash mismatch"
+    assert np.allclose(r_py.equity, r_nb.equity, atol=1e-9), "equity mismatch"
+    assert r_py.trades.shape == r_nb.trades.shape, \
+        f"trade-log shape mismatch: {r_py.trades.shape} vs {r_nb.trades.shape}"
+    assert np.allclose(r_py.trades, r_nb.trades, atol=1e-9, equal_nan=True), \
+        "trade-log field mismatch"
+
+
+def _walk(n: int = 60, seed: int = 0):
+    """Random-walk OHLCV with a few long / short signals sprinkled in."""
+    rng = np.random.default_rng(seed)
+    o, h, l, c, v = py_tests._random_walk_ohlcv(rng, n)
+    le = rng.random(n) < 0.12
+    lx = rng.random(n) < 0.08
+    se = rng.random(n) < 0.10
+    sx = rng.random(n) < 0.08
+    return o, h, l, c, v, le, lx, se, sx
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+def test_numba_available_diagnostic():
+    assert isinstance(bt_cy.numba_available(), bool)
+    if bt_cy.numba_available():
+        assert bt_cy.numba_import_error() is None
+    else:
+        assert bt_cy.numba_import_error() is not None
+
+
+def test_numba_precompile():
+    if not bt_cy.numba_available():
+        assert bt_cy.numba_precompile() is False
+        return
+    from chronoton import _nb_inner, run_optimization
+    kernels = (_nb_inner.inner_loop_fast, _nb_inner.inner_loop_grid,
+               _nb_inner.monte_carlo_trades)
+    assert bt_cy.numba_precompile() is True
+    compiled = [len(k.signatures) for k in kernels]
+    assert all(compiled)
+
+    # Real calls must reuse those specialisations whatever the caller's
+    # data: pandas gives read-only views of float64 Series but writable
+    # copies of int and float32 ones.
+    o, h, l, c, v, le, lx, _, _ = _walk(seed=6)
+
+    def signal_fn(p):
+        return {"long_entries": le, "long_exits": lx}
+
+    for cast in (np.float64, np.float32, np.int64):
+        series = [s.round().astype(cast) for s in (o, h, l, c, v)]
+        _run_numba(*series, long_entries=le, long_exits=lx, SL=150.0,
+                   pip_equals=0.01)
+        for precision in ("f32", "f64"):
+            run_optimization(*series, signal_fn, [{}], precision=precision,
+                             SL=150.0, pip_equals=0.01)
+    assert [len(k.signatures) for k in kernels] == compiled
+
+
+def test_numba_parity_percent_equity_with_stops():
+    if not bt_cy.numba_available():
+        return
+    o, h, l, c, v, le, lx, se, sx = _walk()
+    kwargs = dict(
+        starting_balance=10_000,
+        long_entries=le, long_exits=lx, short_entries=se, short_exits=sx,
+        position_sizing="percent_equity", position_percent_equity=0.5,
+        commission=0.0005, spread=2.0, slippage=1.0, pip_equals=0.01,
+        SL=150.0, TP=300.0, TS=200.0, overnight_charge=(0.05, 0.02),
+    )
+    _assert_parity(bt_py.run_single_backtest(o, h, l, c, v, **kwargs),
+                   _run_numba(o, h, l, c, v, **kwargs))
+
+
+def test_numba_parity_percent_at_risk():
+    if not bt_cy.numba_available():
+        return
+    o, h, l, c, v, le, lx, _, _ = _walk(seed=1)
+    kwargs = dict(
+        starting_balance=10_000,
+        long_entries=le, long_exits=lx,
+        position_sizing="percent_at_risk", position_percent_at_risk=0.01,
+        SL=100.0, pip_equals=0.01, leverage=5.0,
+    )
+    _assert_parity(bt_py.run_single_backtest(o, h, l, c, v, **kwargs),
+                   _run_numba(o, h, l, c, v, **kwargs))
+
+
+def test_numba_parity_hedging_and_pyramiding():
+    if not bt_cy.numba_available():
+        return
+    o, h, l, c, v, le, lx, se, sx = _walk(seed=2)
+    kwargs = dict(
+        starting_balance=20_000,
+        long_entries=le, long_exits=lx, short_entries=se, short_exits=sx,
+        position_sizing="value", position_value=500.0,
+        hedging=True, max_positions=3,
+        commission=0.0005, spread=1.0, slippage=0.5, pip_equals=0.01,
+    )
+    _assert_parity(bt_py.run_single_backtest(o, h, l, c, v, **kwargs),
+                   _run_numba(o, h, l, c, v, **kwargs))
+
+
+def test_numba_parity_precomputed_sizes():
+    if not bt_cy.numba_available():
+        return
+    o, h, l, c, v, le, lx, se, sx = _walk(seed=3)
+    sizes = np.linspace(1.0, 20.0, le.size)
+    kwargs = dict(
+        starting_balance=10_000,
+        long_entries=le, long_exits=lx, short_entries=se, short_exits=sx,
+        position_sizing="precomputed", position_sizes=sizes,
+        max_positions=2,
+    )
+    _assert_parity(bt_py.run_single_backtest(o, h, l, c, v, **kwargs),
+                   _run_numba(o, h, l, c, v, **kwargs))
+
+
+def test_numba_parity_liquidation():
+    if not bt_cy.numba_available():
+        return
+    # Short at $1 that rockets to $100 — same scenario as tests.py.
+    prices = np.array([1., 1., 1., 1., 100., 100., 100., 100., 100., 100.])
+    o, h, l, c, v = py_tests._make_ohlcv(prices, spread_hl=0.05, c_offset=0.0)
+    kwargs = dict(
+        starting_balance=500,
+        short_entries=py_tests._signal(prices.size, 1),
+        position_sizing="value", position_value=500,
+    )
+    r_py = bt_py.run_single_backtest(o, h, l, c, v, **kwargs)
+    r_nb = _run_numba(o, h, l, c, v, **kwargs)
+    _assert_parity(r_py, r_nb)
+    assert int(r_nb.trades[0, bt_py.F_EXIT_REASON]) == bt_py.EXIT_LIQUIDATION
+
+
+def test_numba_custom_sizer_still_uses_python():
+    o, h, l, c, v, le, lx, _, _ = _walk(seed=4)
+
+    def sizer(*_args):
+        return 3.0
+
+    r = _run_numba(o, h, l, c, v, long_entries=le, long_exits=lx,
+                   position_sizing="custom", position_sizing_fn=sizer)
+    assert r.trades.shape[0] > 0
+    assert np.all(r.trades[:, bt_py.F_SIZE] == 3.0)
+
+
+# ---------------------------------------------------------------------------
+# Run everything
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    run_test = py_tests.run_test
+    py_tests._FAILURES = []
+    py_tests._PASSED = 0
+
+    local = sys.modules[__name__]
+    nb_tests = [
+        fn for name, fn in inspect.getmembers(local, inspect.isfunction)
+        if name.startswith("test_")
+    ]
+
+    if bt_cy.numba_available():
+        print("✓ Numba available — parity tests active.\n")
+    else:
+        print("⚠  Numba NOT available — parity tests are no-ops.")
+        print(f"    Import error: {bt_cy.numba_import_error()}\n")
+
+    for t in nb_tests:
+        run_test(t)
+
+    total = py_tests._PASSED + len(py_tests._FAILURES)
+    print(f"\n{'─' * 64}")
+    print(f"Passed: {py_tests._PASSED} / {total}")
+    if py_tests._FAILURES:
+        print(f"\nFailed tests:\n")
+        for name, tb in py_tests._FAILURES:
+            print(f"── {name} ──")
+            print(tb)
+        sys.exit(1)
+    sys.exit(0)
@@ -0,0 +1,512 @@
+"""
+tests_optimizer.py — tests for ``run_optimization`` parameter sweeps.
+
+Every trial of a sweep must reproduce the equity curve of the equivalent
+``run_single_backtest`` call, whichever execution path is active (the
+parallel Numba grid kernel when Numba is installed, the serial dispatcher
+loop otherwise). The serial path is also exercised directly by masking
+Numba off.
+
+Usage:
+    python tests_optimizer.py
+
+    # or under pytest
+    pytest tests_optimizer.py -v
+
+The script exits 0 on success, 1 on any failure.
+"""
+
+from __future__ import annotations
+
+import inspect
+import sys
+
+import numpy as np
+import pandas as pd
+
+import tests as py_tests
+import chronoton.backtester as bt_py
+import chronoton.optimizer as opt
+from chronoton import run_optimization
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+def _walk(n: int = 120, seed: int = 0):
+    """Random-walk OHLCV."""
+    return py_tests._random_walk_ohlcv(np.random.default_rng(seed), n)
+
+
+def _crossover(c):
+    """signal_fn factory: moving-average crossover, long and short."""
+    def signal_fn(p):
+        fast = c.rolling(p["fast"]).mean()
+        slow = c.rolling(p["slow"]).mean()
+        up = (fast > slow).to_numpy()
+        down = (fast < slow).to_numpy()
+        return {"long_entries": up, "long_exits": down,
+                "short_entries": down, "short_exits": up}
+    return signal_fn
+
+
+def _serial(fn):
+    """Run ``fn`` with the Numba grid kernel masked off."""
+    saved = opt.numba_available
+    opt.numba_available = lambda: False
+    try:
+        return fn()
+    finally:
+        opt.numba_available = saved
+
+
+_KWARGS = dict(
+    starting_balance=10_000,
+    position_sizing="percent_equity", position_percent_equity=0.5,
+    commission=0.0005, spread=1.0, pip_equals=0.01,
+    SL=150.0, TS=200.0, overnight_charge=(0.05, 0.02),
+)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+def test_optimization_matches_single_backtests():
+    o, h, l, c, v = _walk()
+    fn = _crossover(c)
+    grid = {"fast": [3, 5, 8], "slow": [15, 25]}
+    best, best_res, scores = run_optimization(
+        o, h, l, c, v, fn, grid, objective="final_equity", precision="f64",
+        **_KWARGS,
+    )
+    assert len(scores) == 6
+    for _, row in scores.iterrows():
+        params = {"fast": int(row["fast"]), "slow": int(row["slow"])}
+        ref = bt_py.run_single_backtest(o, h, l, c, v, **fn(params), **_KWARGS)
+        assert np.isclose(row["score"], ref.equity[-1], atol=1e-9)
+        assert row["n_trades"] == ref.trades.shape[0]
+    ref = bt_py.run_single_backtest(o, h, l, c, v, **fn(best), **_KWARGS)
+    assert np.allclose(best_res.equity, ref.equity, atol=1e-9)
+    assert np.allclose(best_res.trades, ref.trades, atol=1e-9, equal_nan=True)
+
+
+def test_optimization_serial_path_matches_grid():
+    o, h, l, c, v = _walk(seed=1)
+    fn = _crossover(c)
+    grid = {"fast": [3, 6], "slow": [12, 20, 30]}
+    _, _, fast_scores = run_optimization(o, h, l, c, v, fn, grid,
+                                         precision="f64", **_KWARGS)
+    _, _, slow_scores = _serial(
+        lambda: run_optimization(o, h, l, c, v, fn, grid, **_KWARGS))
+    pd.testing.assert_frame_equal(fast_scores, slow_scores)
+
+
+def test_optimization_f32_close_to_f64():
+    o, h, l, c, v = _walk(seed=5)
+    fn = _crossover(c)
+    grid = {"fast": [3, 5, 8], "slow": [15, 25]}
+    _, _, s64 = run_optimization(o, h, l, c, v, fn, grid,
+                                 objective="final_equity", precision="f64",
+                                 **_KWARGS)
+    best, best_res, s32 = run_optimization(o, h, l, c, v, fn, grid,
+                                           objective="final_equity",
+                                           precision="f32", **_KWARGS)
+    merged = s64.merge(s32, on=["fast", "slow"], suffixes=("_64", "_32"))
+    assert np.allclose(merged["score_64"], merged["score_32"], rtol=1e-4)
+    # The winner is always re-run in float64.
+    ref = bt_py.run_single_backtest(o, h, l, c, v, **fn(best), **_KWARGS)
+    assert np.allclose(best_res.equity, ref.equity, atol=1e-9)
+    try:
+        run_optimization(o, h, l, c, v, fn, grid, precision="f16")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown precision should raise")
+
+
+def test_optimization_f32_table_matches_best_result():
+    # 50k minute bars around 4000 with 0.1 pips: long enough for float32
+    # stop hits to flip and trade paths to diverge from float64.
+    rng = np.random.default_rng(0)
+    prices = np.round(4000.17 + np.cumsum(rng.normal(0, 0.7, 50_000)), 2)
+    o, h, l, c, v = py_tests._make_ohlcv(prices, freq="min", spread_hl=0.7,
+                                         c_offset=0.0)
+    fn = _crossover(c)
+    grid = {"fast": [5, 10, 20], "slow": [60, 120]}
+    kwargs = dict(starting_balance=10_000, position_sizing="percent_equity",
+                  position_percent_equity=0.5, SL=30.0, pip_equals=0.1,
+                  timeframe="1m")
+    best, best_res, scores = run_optimization(
+        o, h, l, c, v, fn, grid, objective="final_equity", precision="f32",
+        **kwargs)
+    assert scores.attrs["precision"] == ("f32" if opt.numba_available()
+                                         else "f64")
+    assert best == {"fast": int(scores.loc[0, "fast"]),
+                    "slow": int(scores.loc[0, "slow"])}
+    assert np.isclose(scores.loc[0, "score"], best_res.equity[-1],
+                      rtol=0, atol=1e-9)
+    assert scores.loc[0, "n_trades"] == best_res.trades.shape[0]
+    assert np.all(np.diff(scores["score"].to_numpy()) <= 0)
+    ref = bt_py.run_single_backtest(o, h, l, c, v, **fn(best), **kwargs)
+    assert np.allclose(best_res.equity, ref.equity, atol=1e-9)
+
+
+def test_optimization_f32_leaders_rescored_in_one_batch():
+    if not opt.numba_available():
+        return
+    o, h, l, c, v = _walk(n=400, seed=9)
+    fn = _crossover(c)
+    # "unused" never reaches the signals: its trials tie in pairs.
+    grid = {"fast": [3, 5, 8], "slow": [15, 25, 40], "unused": [0, 1]}
+    grid_rows, prepared_calls = [], []
+    saved = opt._run_grid_numba, opt._run_prepared, opt._RESCORE_TOP
+
+    def run_grid(inputs, flags_mat, *args):
+        grid_rows.append(flags_mat.shape[0])
+        return saved[0](inputs, flags_mat, *args)
+
+    def run_prepared(*args):
+        prepared_calls.append(1)
+        return saved[1](*args)
+
+    opt._run_grid_numba, opt._run_prepared = run_grid, run_prepared
+    opt._RESCORE_TOP = 6
+    try:
+        best, best_res, s32 = run_optimization(
+            o, h, l, c, v, fn, grid, objective="final_equity",
+            maximize=False, precision="f32", **_KWARGS)
+    finally:
+        opt._run_grid_numba, opt._run_prepared, opt._RESCORE_TOP = saved
+    _, _, s64 = run_optimization(o, h, l, c, v, fn, grid,
+                                 objective="final_equity", maximize=False,
+                                 precision="f64", **_KWARGS)
+
+    # One sweep call, one float64 call over the six leaders' three distinct
+    # flag rows, and a single serial re-run for the winner's trade log.
+    assert grid_rows == [18, 3]
+    assert len(prepared_calls) == 1
+    assert list(s32["precision"]) == ["f64"] * 6 + ["f32"] * 12
+    for block in (s32.iloc[:6], s32.iloc[6:]):
+        assert np.all(np.diff(block["score"].to_numpy()) >= 0)
+    keys = ["fast", "slow", "unused"]
+    exact = s32.iloc[:6].merge(s64, on=keys, suffixes=("_32", "_64"))
+    assert np.allclose(exact["score_32"], exact["score_64"], rtol=0, atol=1e-9)
+    assert (exact["n_trades_32"] == exact["n_trades_64"]).all()
+    assert best == {k: int(s32.loc[0, k]) for k in keys}
+    assert np.isclose(s32.loc[0, "score"], best_res.equity[-1], atol=1e-9)
+    assert (s64["precision"] == "f64").all()
+
+
+def test_optimization_auto_precision():
+    assert opt._resolve_precision("f64", 10**9) == "f64"
+    assert opt._resolve_precision("f32", 10) == "f32"
+    assert opt._l3_cache_bytes() > 0
+    # A few hundred bars sit in cache; a billion bars cannot.
+    assert opt._resolve_precision("auto", 300) == "f64"
+    assert opt._resolve_precision("auto", 10**9) == "f32"
+
+
+def test_optimization_auto_precision_pinned_and_deterministic():
+    # auto is resolved from the host's cache size; pinning that size pins
+    # the choice, and the same choice always yields the same table.
+    o, h, l, c, v = _walk(n=300, seed=4)
+    fn = _crossover(c)
+    grid = {"fast": [3, 5, 8], "slow": [15, 25, 40]}
+
+    def sweep(cache_bytes, **kwargs):
+        saved = opt._l3_cache_bytes
+        opt._l3_cache_bytes = lambda: cache_bytes
+        try:
+            return run_optimization(o, h, l, c, v, fn, grid,
+                                    objective="final_equity", **kwargs,
+                                    **_KWARGS)
+        finally:
+            opt._l3_cache_bytes = saved
+
+    f32 = "f32" if opt.numba_available() else "f64"
+    for cache_bytes, resolved in ((1, f32), (1 << 40, "f64")):
+        best, best_res, scores = sweep(cache_bytes)
+        again = sweep(cache_bytes)
+        explicit = sweep(cache_bytes, precision=resolved)
+        assert scores.attrs["precision"] == resolved
+        pd.testing.assert_frame_equal(scores, again[2])
+        pd.testing.assert_frame_equal(scores, explicit[2])
+        assert best == again[0] == explicit[0]
+        assert np.isclose(scores.loc[0, "score"], best_res.equity[-1],
+                          atol=1e-9)
+    _, _, serial = _serial(lambda: sweep(1))
+    assert serial.attrs["precision"] == "f64"
+    assert (serial["precision"] == "f64").all()
+
+
+def test_optimization_threads_capped_and_restored():
+    try:
+        import numba
+    except ImportError:
+        return
+    before = numba.get_num_threads()
+    with opt._physical_core_threads():
+        assert 1 <= numba.get_num_threads() <= min(before, opt._physical_cores())
+    assert numba.get_num_threads() == before
+
+
+def test_optimization_sorted_best_first():
+    o, h, l, c, v = _walk(seed=2)
+    fn = _crossover(c)
+    grid = {"fast": [2, 4, 6], "slow": [10, 20]}
+    best, _, scores = run_optimization(o, h, l, c, v, fn, grid,
+                                       objective="max_drawdown", maximize=False,
+                                       **_KWARGS)
+    s = scores["score"].to_numpy()
+    assert np.all(np.diff(s) >= 0)
+    assert best == {"fast": int(scores.loc[0, "fast"]),
+                    "slow": int(scores.loc[0, "slow"])}
+
+
+def test_optimization_list_of_dicts_and_callable_objective():
+    o, h, l, c, v = _walk(seed=3)
+    fn = _crossover(c)
+    grid = [{"fast": 3, "slow": 10}, {"fast": 5, "slow": 30}]
+    _, _, scores = run_optimization(o, h, l, c, v, fn, grid,
+                                    objective=lambda r: r.equity.size,
+                                    **_KWARGS)
+    assert list(scores["score"]) == [120.0, 120.0]
+
+
+def test_optimization_trade_objective_raises():
+    # Trials carry no trade log; a trade-count objective must not quietly
+    # score every trial 0.0.
+    o, h, l, c, v = _walk(seed=3)
+    fn = _crossover(c)
+    grid = {"fast": [3, 5], "slow": [10, 30]}
+    for run in (run_optimization, lambda *a, **kw: _serial(
+            lambda: run_optimization(*a, **kw))):
+        try:
+            run(o, h, l, c, v, fn, grid,
+                objective=lambda r: r.trades.shape[0], **_KWARGS)
+        except ValueError as exc:
+            assert "trades" in str(exc)
+        else:
+            raise AssertionError("trade-level objective should raise")
+
+
+def _njit_crossover():
+    """@njit signal_fn equivalent to ``_crossover``, or None without Numba."""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit
+    def sma(x, w):
+        out = np.full(x.size, np.nan)
+        acc = 0.0
+        for i in range(x.size):
+            acc += x[i]
+            if i >= w:
+                acc -= x[i - w]
+            if i >= w - 1:
+                out[i] = acc / w
+        return out
+
+    @njit
+    def signal_fn(o, h, l, c, v, p):
+        fast = sma(c, int(p[0]))
+        slow = sma(c, int(p[1]))
+        up = fast > slow
+        down = fast < slow
+        return up, down, down, up
+
+    return signal_fn
+
+
+def test_optimization_njit_signal_fn_matches_python():
+    nb_fn = _njit_crossover()
+    if nb_fn is None:
+        return
+    o, h, l, c, v = _walk(seed=4)
+    grid = {"fast": [3, 5, 8], "slow": [15, 25]}
+    best_nb, res_nb, scores_nb = run_optimization(o, h, l, c, v, nb_fn, grid,
+                                                  precision="f64", **_KWARGS)
+    best_py, res_py, scores_py = run_optimization(o, h, l, c, v, _crossover(c),
+                                                  grid, precision="f64", **_KWARGS)
+    assert best_nb == best_py
+    pd.testing.assert_frame_equal(scores_nb, scores_py, check_exact=False)
+    assert np.allclose(res_nb.trades, res_py.trades, atol=1e-9, equal_nan=True)
+
+
+def test_optimization_njit_signal_fn_wrong_length():
+    try:
+        from numba import njit
+    except ImportError:
+        return
+
+    @njit
+    def short_fn(o, h, l, c, v, p):
+        s = np.zeros(c.size - 1, dtype=np.bool_)
+        return s, s, s, s
+
+    o, h, l, c, v = _walk()
+    for fuse in (True, False):
+        try:
+            run_optimization(o, h, l, c, v, short_fn, {"x": [1.0, 2.0]},
+                             fuse=fuse)
+        except ValueError as exc:
+            assert "parameter row 0" in str(exc)
+        else:
+            raise AssertionError("wrong-length njit signals should raise")
+
+
+def test_optimization_njit_fused_matches_array_path():
+    nb_fn = _njit_crossover()
+    if nb_fn is None:
+        return
+    o, h, l, c, v = _walk(seed=7)
+    grid = {"fast": [3, 5, 8], "slow": [15, 25]}
+    for precision in ("f32", "f64"):
+        runs = [run_optimization(o, h, l, c, v, nb_fn, grid, fuse=fuse,
+                                 precision=precision, **_KWARGS)
+                for fuse in (False, True)]
+        (best_a, res_a, scores_a), (best_f, res_f, scores_f) = runs
+        assert best_a == best_f
+        pd.testing.assert_frame_equal(scores_a, scores_f)
+        assert np.allclose(res_a.equity, res_f.equity, atol=1e-9)
+    try:
+        run_optimization(o, h, l, c, v, nb_fn, grid, fuse="always")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown fuse should raise")
+
+
+def test_optimization_fuse_auto_break_even():
+    nb_fn = _njit_crossover()
+    if nb_fn is None:
+        return
+    # A fresh signal_fn only fuses once the sweep can earn back the JIT...
+    cells = opt._FUSE_MIN_CELLS
+    assert not opt._fusion_pays(nb_fn, 10, 100_000)
+    assert not opt._fusion_pays(nb_fn, 1, cells - 1)
+    assert opt._fusion_pays(nb_fn, 1, cells)
+    assert opt._fusion_pays(nb_fn, 1_000, cells // 1_000)
+    # ...and any sweep fuses once the kernel is compiled for it.
+    o, h, l, c, v = _walk(seed=8)
+    run_optimization(o, h, l, c, v, nb_fn, {"fast": [3], "slow": [15]},
+                     fuse=True, precision="f64", **_KWARGS)
+    assert opt._fusion_pays(nb_fn, 10, 100_000)
+    assert not opt._fusion_pays(_njit_crossover(), 10, 100_000)
+
+
+def _sma_table(o, h, l, c, v):
+    """preprocess_fn: every moving average the test grids need, once."""
+    return np.vstack([np.full(c.size, np.nan)]
+                     + [c.rolling(w).mean().to_numpy() for w in range(1, 31)])
+
+
+def test_optimization_preprocess_fn_matches_per_trial():
+    o, h, l, c, v = _walk(seed=6)
+    grid = {"fast": [3, 5, 8], "slow": [15, 25]}
+    calls = []
+
+    def preprocess(*ohlcv):
+        calls.append(1)
+        return _sma_table(*ohlcv)
+
+    def signal_fn(p, sma):
+        fast, slow = sma[p["fast"]], sma[p["slow"]]
+        return {"long_entries": fast > slow, "long_exits": fast < slow,
+                "short_entries": fast < slow, "short_exits": fast > slow}
+
+    best, res, scores = run_optimization(o, h, l, c, v, signal_fn, grid,
+                                         preprocess_fn=preprocess,
+                                         precision="f64", **_KWARGS)
+    ref_best, ref_res, ref_scores = run_optimization(o, h, l, c, v,
+                                                     _crossover(c), grid,
+                                                     precision="f64", **_KWARGS)
+    assert len(calls) == 1
+    assert best == ref_best
+    pd.testing.assert_frame_equal(scores, ref_scores)
+    assert np.allclose(res.trades, ref_res.trades, atol=1e-9, equal_nan=True)
+
+
+def test_optimization_preprocess_fn_njit_signal_fn():
+    try:
+        from numba import njit
+    except ImportError:
+        return
+
+    @njit
+    def signal_fn(o, h, l, c, v, p, sma):
+        fast = sma[int(p[0])]
+        slow = sma[int(p[1])]
+        return fast > slow, fast < slow, fast < slow, fast > slow
+
+    o, h, l, c, v = _walk(seed=7)
+    grid = {"fast": [3, 5, 8], "slow": [15, 25]}
+    best, res, scores = run_optimization(o, h, l, c, v, signal_fn, grid,
+                                         preprocess_fn=_sma_table,
+                                         precision="f64", **_KWARGS)
+    ref_best, ref_res, ref_scores = run_optimization(o, h, l, c, v,
+                                                     _crossover(c), grid,
+                                                     precision="f64", **_KWARGS)
+    assert best == ref_best
+    pd.testing.assert_frame_equal(scores, ref_scores, check_exact=False)
+    assert np.allclose(res.trades, ref_res.trades, atol=1e-9, equal_nan=True)
+
+
+def test_optimization_rejects_bad_inputs():
+    o, h, l, c, v = _walk()
+    fn = _crossover(c)
+    grid = {"fast": [3], "slow": [10]}
+    for kwargs, err in [
+        (dict(objective="winrate"), ValueError),
+        (dict(position_sizing="custom", position_sizing_fn=lambda *a: 1.0), ValueError),
+        (dict(long_entries=np.zeros(c.size, dtype=bool)), ValueError),
+    ]:
+        try:
+            run_optimization(o, h, l, c, v, fn, grid, **kwargs)
+        except err:
+            pass
+        else:
+            raise AssertionError(f"expected {err.__name__} for {kwargs}")
+    try:
+        run_optimization(o, h, l, c, v, lambda p: {"buy": np.ones(c.size)}, grid)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown signal key should raise")
+    try:
+        run_optimization(o, h, l, c, v, fn, [])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("empty grid should raise")
+
+
+# ---------------------------------------------------------------------------
+# Run everything
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    run_test = py_tests.run_test
+    py_tests._FAILURES = []
+    py_tests._PASSED = 0
+
+    local = sys.modules[__name__]
+    opt_tests = [
+        fn for name, fn in inspect.getmembers(local, inspect.isfunction)
+        if name.startswith("test_")
+    ]
+
+    for t in opt_tests:
+        run_test(t)
+
+    total = py_tests._PASSED + len(py_tests._FAILURES)
+    print(f"\n{'─' * 64}")
+    print(f"Passed: {py_tests._PASSED} / {total}")
+    if py_tests._FAILURES:
+        print(f"\nFailed tests:\n")
+        for name, tb in py_tests._FAILURES:
+            print(f"── {name} ──")
+            print(tb)
+        sys.exit(1)
+    sys.exit(0)